@@ -0,0 +1,41 @@
+"""Add embedding_hash column next to points_of_interest.embedding.
+
+Every POI create/update (and text-relevant autosave) used to rebuild the
+searchable text and make a TEI call, even when no embedded field changed, and
+``backfill_embeddings.py --force`` re-embedded the whole catalog. This column
+stores the sha256 of (embedding model id + ``build_searchable_text`` output)
+that produced the stored vector, so the embed-on-write path and the backfill
+can skip the TEI round-trip when the fingerprint still matches.
+
+Like ``embedding`` itself the column is NOT ORM-mapped — it is read and written
+with raw SQL alongside the vector, so clone/reschedule paths that copy mapped
+columns can never carry a stale hash onto a row without a matching vector.
+
+Nullable + additive: existing rows get NULL, which never matches, so the first
+write after deploy re-embeds once and records the hash. IF NOT EXISTS keeps it
+idempotent.
+
+Revision ID: n_embedding_hash_001
+Revises: m_payphone_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'n_embedding_hash_001'
+down_revision = 'm_payphone_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE points_of_interest ADD COLUMN IF NOT EXISTS embedding_hash VARCHAR(64)"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE points_of_interest DROP COLUMN IF EXISTS embedding_hash"
+    )
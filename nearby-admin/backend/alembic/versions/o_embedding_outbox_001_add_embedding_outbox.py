@@ -0,0 +1,49 @@
+"""Add the embedding_outbox table.
+
+POI create/update/autosave used to call TEI synchronously after committing,
+so every save paid an embedding round-trip and a crash or TEI outage between
+the commit and the vector write silently lost the re-embed until the next
+manual backfill. Writes now enqueue the POI here in the SAME transaction as the
+user's data; ``scripts/embedding_worker.py`` drains the table in batches.
+
+One row per POI (primary key ``poi_id``, CASCADE on POI delete). ``generation``
+is bumped on every re-enqueue so the worker only deletes a row it claimed if no
+newer save arrived meanwhile. ``next_attempt_at`` is indexed for the claim scan.
+
+Existing POIs are not enqueued — ``backfill_embeddings.py`` already covers rows
+with ``embedding IS NULL``.
+
+Revision ID: o_embedding_outbox_001
+Revises: n_embedding_hash_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'o_embedding_outbox_001'
+down_revision = 'n_embedding_hash_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS embedding_outbox (
+            poi_id UUID PRIMARY KEY
+                REFERENCES points_of_interest(id) ON DELETE CASCADE,
+            generation INTEGER NOT NULL DEFAULT 1,
+            enqueued_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_embedding_outbox_next_attempt_at "
+        "ON embedding_outbox (next_attempt_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS embedding_outbox")
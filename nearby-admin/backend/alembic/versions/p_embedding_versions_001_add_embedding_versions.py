@@ -0,0 +1,64 @@
+"""Side-by-side embedding model versions.
+
+Changing ``EMBEDDING_MODEL`` used to invalidate every stored vector at once:
+until a full backfill finished, queries from the new model were compared with
+documents from the old one. This adds what is needed to migrate side by side:
+
+* ``points_of_interest.embedding_model`` — tags each live vector with the
+  model that produced it (unmapped, like ``embedding`` / ``embedding_hash``).
+* ``poi_embedding_shadow`` — one vector per POI for the model being
+  backfilled, with its own content hash and HNSW index.
+* ``embedding_models`` — ``role`` ('live' / 'shadow') -> model id. Empty means
+  versioning is not in use and the live store serves every model as before.
+
+Existing vectors stay untagged (NULL); ``scripts/embedding_versions.py
+start-shadow`` tags them with the live model when a migration begins.
+
+Revision ID: p_embedding_versions_001
+Revises: o_embedding_outbox_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'p_embedding_versions_001'
+down_revision = 'o_embedding_outbox_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE points_of_interest ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(200)"
+    )
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS embedding_models (
+            role VARCHAR(16) PRIMARY KEY,
+            model VARCHAR(200) NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS poi_embedding_shadow (
+            poi_id UUID PRIMARY KEY
+                REFERENCES points_of_interest(id) ON DELETE CASCADE,
+            model VARCHAR(200) NOT NULL,
+            embedding vector(768) NOT NULL,
+            embedding_hash VARCHAR(64),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS poi_embedding_shadow_hnsw_idx "
+        "ON poi_embedding_shadow USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m=16, ef_construction=64)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS poi_embedding_shadow")
+    op.execute("DROP TABLE IF EXISTS embedding_models")
+    op.execute(
+        "ALTER TABLE points_of_interest DROP COLUMN IF EXISTS embedding_model"
+    )
@@ -0,0 +1,35 @@
+"""Add a geography GiST index on points_of_interest.location.
+
+The public ``GET /api/nearby`` endpoint ordered every published POI by
+``ST_Distance(location::geography, point)`` — a full scan plus a spheroid
+distance per row, on the homepage. It now orders candidates with the KNN
+``<->`` operator on ``geography(location)`` (and filters with
+``ST_DWithin`` for an optional radius); both need an index on that exact
+expression. The existing ``idx_points_of_interest_location`` is on the
+geometry column and cannot serve geography distance ordering.
+
+IF NOT EXISTS keeps it idempotent.
+
+Revision ID: q_poi_geog_knn_001
+Revises: p_embedding_versions_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'q_poi_geog_knn_001'
+down_revision = 'p_embedding_versions_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_points_of_interest_location_geog "
+        "ON points_of_interest USING gist (geography(location))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_points_of_interest_location_geog")
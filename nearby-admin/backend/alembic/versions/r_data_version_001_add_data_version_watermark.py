@@ -0,0 +1,77 @@
+"""Add the data_version watermark table and its bump triggers.
+
+Public read endpoints such as the nearby-app category listing aggregate over the
+whole catalog on every page load. ``data_version`` lets them cache the result
+until the data actually changes: a single row whose ``version`` is incremented
+by a statement-level trigger on every write to the tables public responses are
+built from (see ``shared/utils/data_version.py``).
+
+The bump runs inside the writing transaction, so the new version becomes
+visible atomically with the data. It takes the row lock on ``data_version``
+until commit, which serializes concurrent writers to these tables for that
+window — acceptable at admin write volume.
+
+The initial version is a microsecond timestamp so a restored database never
+reuses a version an app process has already cached.
+
+Revision ID: r_data_version_001
+Revises: q_poi_geog_knn_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'r_data_version_001'
+down_revision = 'q_poi_geog_knn_001'
+branch_labels = None
+depends_on = None
+
+TABLES = (
+    "points_of_interest",
+    "businesses",
+    "parks",
+    "trails",
+    "events",
+    "categories",
+    "poi_categories",
+    "images",
+)
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS data_version (
+            id SMALLINT PRIMARY KEY CHECK (id = 1),
+            version BIGINT NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        INSERT INTO data_version (id, version)
+        VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint)
+        ON CONFLICT (id) DO NOTHING
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_data_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE data_version SET version = version + 1, updated_at = now()
+            WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_data_version ON {table}")
+        op.execute(
+            f"CREATE TRIGGER {table}_bump_data_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_data_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_data_version()")
+    op.execute("DROP TABLE IF EXISTS data_version")
@@ -0,0 +1,34 @@
+"""Add a covering partial index for the public POI counts.
+
+GET /api/pois/counts computes every homepage tile (counts by type and by
+amenity, optionally broken down by city, county, or category) in one
+``count(*) FILTER (...)`` statement over the published POIs. This index covers
+every column that statement reads, so it is an index-only scan of the
+published rows instead of a heap scan of the whole table.
+
+Revision ID: s_poi_counts_idx_001
+Revises: r_data_version_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 's_poi_counts_idx_001'
+down_revision = 'r_data_version_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_points_of_interest_published_counts
+        ON points_of_interest (poi_type)
+        INCLUDE (icon_pet_friendly, icon_wheelchair_accessible,
+                 address_city, address_county, id)
+        WHERE publication_status = 'published'
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_points_of_interest_published_counts")
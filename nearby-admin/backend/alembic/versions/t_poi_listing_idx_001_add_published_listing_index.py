@@ -0,0 +1,31 @@
+"""Add a partial index for keyset-paged POI listings.
+
+GET /api/pois/by-type/{type} now returns published POIs ordered by
+``(name, id)`` and pages with ``(name, id) > (:after_name, :after_id)``.
+This index serves both the filter and the order, so each page reads only its
+own rows instead of sorting the whole type.
+
+Revision ID: t_poi_listing_idx_001
+Revises: s_poi_counts_idx_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 't_poi_listing_idx_001'
+down_revision = 's_poi_counts_idx_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_points_of_interest_published_type_name
+        ON points_of_interest (poi_type, name, id)
+        WHERE publication_status = 'published'
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_points_of_interest_published_type_name")
@@ -0,0 +1,160 @@
+"""Add public_poi_documents, its rebuild outbox, and the enqueue triggers.
+
+nearby-app serializes a POI's public detail and card JSON on every read. The
+worker in ``nearby-app/backend/scripts/public_document_worker.py`` now stores
+those encoded bodies in ``public_poi_documents`` so reads can return the bytes
+directly; readers check them against the live detail ETag (or, for cards, the
+POI's ``last_updated``) and fall back to serializing when they are stale.
+
+Rebuilds are queued in ``public_document_outbox`` by row-level triggers rather
+than by the admin endpoints, so no write path can forget one:
+
+* ``points_of_interest`` insert, or update of ``last_updated`` /
+  ``publication_status`` -> the POI plus every event hosted at it (venue
+  inheritance copies venue fields into the event payload). Embedding writes
+  touch neither column, so they do not queue rebuilds.
+* any change to ``businesses``, ``parks``, ``trails``, ``events``, ``images``
+  or ``poi_categories`` -> the owning POI.
+* update of ``categories`` -> every POI assigned to the category.
+
+Only ids still present in ``points_of_interest`` are queued, so cascaded
+deletes of child rows do not trip the foreign key. Existing POIs are not
+queued here; run ``public_document_worker.py --rebuild-all`` once after
+deploying.
+
+Revision ID: u_public_docs_001
+Revises: t_poi_listing_idx_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'u_public_docs_001'
+down_revision = 't_poi_listing_idx_001'
+branch_labels = None
+depends_on = None
+
+CHILD_TABLES = (
+    "businesses",
+    "parks",
+    "trails",
+    "events",
+    "images",
+    "poi_categories",
+)
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS public_poi_documents (
+            poi_id UUID PRIMARY KEY
+                REFERENCES points_of_interest(id) ON DELETE CASCADE,
+            etag VARCHAR(80) NOT NULL,
+            poi_last_updated TIMESTAMPTZ,
+            detail_json BYTEA,
+            card_json BYTEA NOT NULL,
+            built_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS public_document_outbox (
+            poi_id UUID PRIMARY KEY
+                REFERENCES points_of_interest(id) ON DELETE CASCADE,
+            generation INTEGER NOT NULL DEFAULT 1,
+            enqueued_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            attempts INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_public_document_outbox_next_attempt_at "
+        "ON public_document_outbox (next_attempt_at)"
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION enqueue_public_documents(poi_ids UUID[]) RETURNS void AS $$
+            INSERT INTO public_document_outbox (poi_id)
+            SELECT p.id FROM points_of_interest p WHERE p.id = ANY(poi_ids)
+            ON CONFLICT (poi_id) DO UPDATE
+                SET generation = public_document_outbox.generation + 1,
+                    next_attempt_at = now(),
+                    attempts = 0
+        $$ LANGUAGE sql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION public_document_poi_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM enqueue_public_documents(
+                ARRAY[NEW.id] || ARRAY(SELECT e.poi_id FROM events e WHERE e.venue_poi_id = NEW.id)
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION public_document_child_changed() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM enqueue_public_documents(ARRAY[OLD.poi_id]);
+            ELSIF TG_OP = 'UPDATE' THEN
+                PERFORM enqueue_public_documents(ARRAY[OLD.poi_id, NEW.poi_id]);
+            ELSE
+                PERFORM enqueue_public_documents(ARRAY[NEW.poi_id]);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION public_document_category_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM enqueue_public_documents(ARRAY(
+                SELECT pc.poi_id FROM poi_categories pc WHERE pc.category_id = NEW.id
+            ));
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS points_of_interest_public_document_insert ON points_of_interest")
+    op.execute(
+        "CREATE TRIGGER points_of_interest_public_document_insert "
+        "AFTER INSERT ON points_of_interest "
+        "FOR EACH ROW EXECUTE FUNCTION public_document_poi_changed()"
+    )
+    op.execute("DROP TRIGGER IF EXISTS points_of_interest_public_document_update ON points_of_interest")
+    op.execute(
+        "CREATE TRIGGER points_of_interest_public_document_update "
+        "AFTER UPDATE ON points_of_interest FOR EACH ROW "
+        "WHEN (OLD.last_updated IS DISTINCT FROM NEW.last_updated "
+        "OR OLD.publication_status IS DISTINCT FROM NEW.publication_status) "
+        "EXECUTE FUNCTION public_document_poi_changed()"
+    )
+    for table in CHILD_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_public_document ON {table}")
+        op.execute(
+            f"CREATE TRIGGER {table}_public_document "
+            f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION public_document_child_changed()"
+        )
+    op.execute("DROP TRIGGER IF EXISTS categories_public_document ON categories")
+    op.execute(
+        "CREATE TRIGGER categories_public_document "
+        "AFTER UPDATE ON categories "
+        "FOR EACH ROW EXECUTE FUNCTION public_document_category_changed()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS categories_public_document ON categories")
+    for table in CHILD_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_public_document ON {table}")
+    op.execute("DROP TRIGGER IF EXISTS points_of_interest_public_document_update ON points_of_interest")
+    op.execute("DROP TRIGGER IF EXISTS points_of_interest_public_document_insert ON points_of_interest")
+    op.execute("DROP FUNCTION IF EXISTS public_document_category_changed()")
+    op.execute("DROP FUNCTION IF EXISTS public_document_child_changed()")
+    op.execute("DROP FUNCTION IF EXISTS public_document_poi_changed()")
+    op.execute("DROP FUNCTION IF EXISTS enqueue_public_documents(UUID[])")
+    op.execute("DROP TABLE IF EXISTS public_document_outbox")
+    op.execute("DROP TABLE IF EXISTS public_poi_documents")
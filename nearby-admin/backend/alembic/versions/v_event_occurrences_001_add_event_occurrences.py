@@ -0,0 +1,43 @@
+"""Add event_occurrences, the materialized calendar of every event.
+
+``/events/in-range`` in nearby-app used to load every published event and
+expand repeating ones with ``dateutil.rrule`` per request. The admin event
+write paths now store each concrete occurrence here (see
+``app/crud/crud_event_occurrence.py``), so a date range is one scan of
+``ix_event_occurrences_occurs_at``.
+
+Expansion needs ``shared.utils.recurring_events``, so existing events are not
+backfilled in SQL; run ``scripts/rebuild_event_occurrences.py`` once after
+deploying.
+
+Revision ID: v_event_occurrences_001
+Revises: u_public_docs_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'v_event_occurrences_001'
+down_revision = 'u_public_docs_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS event_occurrences (
+            poi_id UUID NOT NULL
+                REFERENCES points_of_interest(id) ON DELETE CASCADE,
+            occurs_at TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (poi_id, occurs_at)
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_event_occurrences_occurs_at "
+        "ON event_occurrences (occurs_at, poi_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS event_occurrences")
@@ -0,0 +1,39 @@
+"""Add poi_open_intervals, the resolved "open now" index of published POIs.
+
+nearby-app's public document worker resolves each POI's ``hours`` JSON into
+concrete open spans (yesterday through a week ahead, in the POI's timezone)
+and stores them here whenever the POI is queued for a document rebuild, and
+re-extends every POI's horizon once a day. Listings filter ``open_now=true``
+with an ``EXISTS`` probe on the primary key ``(poi_id, opens_at)``.
+
+The worker fills the table for every published POI on startup; nothing to
+backfill here.
+
+Revision ID: w_open_intervals_001
+Revises: v_event_occurrences_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'w_open_intervals_001'
+down_revision = 'v_event_occurrences_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS poi_open_intervals (
+            poi_id UUID NOT NULL
+                REFERENCES points_of_interest(id) ON DELETE CASCADE,
+            opens_at TIMESTAMPTZ NOT NULL,
+            closes_at TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (poi_id, opens_at)
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS poi_open_intervals")
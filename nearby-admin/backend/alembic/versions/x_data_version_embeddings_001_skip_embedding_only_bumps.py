@@ -0,0 +1,83 @@
+"""Stop embedding-only updates of points_of_interest from bumping data_version.
+
+The embedding worker rewrites ``embedding`` / ``embedding_hash`` /
+``embedding_model`` on every re-embed (and ``cutover`` rewrites them for the
+whole table). No public response cached on ``data_version`` includes those
+columns, but the statement trigger from ``r_data_version_001`` bumped the
+version for them anyway, so each re-embed batch threw away the cached
+category and count aggregates and changed their ETags.
+
+``points_of_interest`` now has two triggers:
+
+* ``points_of_interest_bump_data_version`` — INSERT / DELETE / TRUNCATE, as
+  before.
+* ``points_of_interest_bump_data_version_update`` — UPDATE, with transition
+  tables. It bumps only if some row differs in a column other than the
+  embedding columns (compared as ``jsonb`` without them, so columns added
+  later are covered without touching this trigger).
+
+Postgres allows transition tables only on single-event triggers, hence the
+split. The other tables keep the original trigger.
+
+Revision ID: x_data_version_embeddings_001
+Revises: w_open_intervals_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'x_data_version_embeddings_001'
+down_revision = 'w_open_intervals_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_data_version_unless_embedding_only() RETURNS trigger AS $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1
+                FROM new_rows n
+                LEFT JOIN old_rows o ON o.id = n.id
+                WHERE o.id IS NULL
+                   OR to_jsonb(n) - ARRAY['embedding', 'embedding_hash', 'embedding_model']
+                      IS DISTINCT FROM
+                      to_jsonb(o) - ARRAY['embedding', 'embedding_hash', 'embedding_model']
+            ) THEN
+                UPDATE data_version SET version = version + 1, updated_at = now()
+                WHERE id = 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS points_of_interest_bump_data_version ON points_of_interest")
+    op.execute(
+        "CREATE TRIGGER points_of_interest_bump_data_version "
+        "AFTER INSERT OR DELETE OR TRUNCATE ON points_of_interest "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS points_of_interest_bump_data_version_update ON points_of_interest"
+    )
+    op.execute(
+        "CREATE TRIGGER points_of_interest_bump_data_version_update "
+        "AFTER UPDATE ON points_of_interest "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version_unless_embedding_only()"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS points_of_interest_bump_data_version_update ON points_of_interest"
+    )
+    op.execute("DROP TRIGGER IF EXISTS points_of_interest_bump_data_version ON points_of_interest")
+    op.execute(
+        "CREATE TRIGGER points_of_interest_bump_data_version "
+        "AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON points_of_interest "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()"
+    )
+    op.execute("DROP FUNCTION IF EXISTS bump_data_version_unless_embedding_only()")
@@ -0,0 +1,42 @@
+"""Add poi_open_hours_coverage, what each POI's poi_open_intervals rows cover.
+
+``poi_open_intervals`` is only filled by nearby-app's public document worker.
+If the worker falls behind or stops, a POI's rows describe old ``hours`` or
+run out at the end of their horizon, and the ``open_now`` listing filter used
+to trust them anyway. The worker now writes one coverage row per POI next to
+its intervals: the POI's ``last_updated`` when they were resolved and the
+window ``[covered_from, covered_until)`` they are complete for. Listings trust
+the intervals only when that row matches the POI and covers the instant, and
+resolve the POI's ``hours`` directly otherwise.
+
+Nothing to backfill: POIs without a row fall back to their ``hours`` until the
+worker's next refresh (on startup) writes one.
+
+Revision ID: y_open_hours_coverage_001
+Revises: x_data_version_embeddings_001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = 'y_open_hours_coverage_001'
+down_revision = 'x_data_version_embeddings_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS poi_open_hours_coverage (
+            poi_id UUID PRIMARY KEY
+                REFERENCES points_of_interest(id) ON DELETE CASCADE,
+            poi_last_updated TIMESTAMPTZ,
+            covered_from TIMESTAMPTZ NOT NULL,
+            covered_until TIMESTAMPTZ NOT NULL
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS poi_open_hours_coverage")
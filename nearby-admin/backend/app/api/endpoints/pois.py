@@ -12,6 +12,9 @@ from app.core.security import get_current_user
 from app.core.permissions import require_admin_or_editor
 from app.utils.autosave_whitelist import AUTOSAVE_ALLOWED_FIELDS, AUTOSAVE_DENIED_FIELDS
 from app.crud.crud_poi import apply_phase1_computed
+from app.crud.crud_embedding_outbox import enqueue_reembed
+from app.crud.crud_event_occurrence import OCCURRENCE_FIELDS, replace_occurrences
+from app.crud.embedding_writer import should_reembed
 from app.schemas._coercers import coerce_empty_literals
 
 router = APIRouter()
@@ -209,18 +212,19 @@ def autosave_poi(
                 setattr(sub, k, merged[k])
                 break
 
-    db.commit()
+    # Embed-on-write (A7): only queue a re-embed when a field that feeds the
+    # searchable text actually changed, in the same transaction as the save.
+    # Debounced so a typing burst becomes one embed once the editor pauses.
+    if should_reembed(set(filtered.keys())):
+        enqueue_reembed(db, [poi_id], debounce=True)
+
+    # Schedule fields saved here must move the calendar rows with them.
+    if poi.event is not None and not OCCURRENCE_FIELDS.isdisjoint(filtered):
+        db.flush()
+        db.refresh(poi.event)  # expand from stored values, not raw JSON strings
+        replace_occurrences(db, poi.id, poi.event)
 
-    # Best-effort embed-on-write (A7): AFTER the commit above, never before.
-    # Only re-embed when a field that feeds the searchable text actually changed
-    # (so a keystroke-batch that only touched irrelevant fields skips the TEI
-    # round-trip). Fully contained — a writer bug must never break an autosave.
-    try:
-        from app.crud.embedding_writer import should_reembed, write_embedding_best_effort
-        if should_reembed(set(filtered.keys())):
-            write_embedding_best_effort(db, poi_id)
-    except Exception:
-        pass
+    db.commit()
 
     return {
         "status": "ok",
@@ -429,11 +433,15 @@ def reschedule_event(
 
     new_event = models.Event(poi_id=new_poi_id, **event_data)
     db.add(new_event)
+    replace_occurrences(db, new_poi_id, new_event)
 
     # Update original event status
     db_poi.event.event_status = 'Rescheduled'
     db_poi.event.new_event_link = str(new_poi_id)
 
+    # The clone starts without a vector (embedding is not ORM-mapped).
+    enqueue_reembed(db, [new_poi_id])
+
     db.commit()
     db.refresh(new_poi)
     return new_poi
@@ -29,6 +29,12 @@ class Settings(BaseSettings):
     TEST_DATABASE_URL: Optional[str] = None
     TESTING: bool = False
 
+    # Autosave re-embed debounce: a POI is embedded once its autosaves have been
+    # quiet for EMBEDDING_DEBOUNCE_SECONDS, but never later than
+    # EMBEDDING_MAX_STALENESS_SECONDS after the first pending change.
+    EMBEDDING_DEBOUNCE_SECONDS: int = 20
+    EMBEDDING_MAX_STALENESS_SECONDS: int = 300
+
     # Third-party API keys
     what3words_api_key: Optional[str] = None
 
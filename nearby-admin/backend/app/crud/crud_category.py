@@ -4,6 +4,11 @@ from typing import List, Dict
 import uuid
 
 from app import models, schemas
+from app.crud.crud_embedding_outbox import enqueue_category_fan_out
+
+# Category fields that change the searchable text (or its applicability) of
+# every POI assigned to the category.
+EMBED_FAN_OUT_FIELDS = {"name", "applicable_to"}
 
 def get_all_categories(db: Session) -> List[models.Category]:
     return db.query(models.Category).order_by(models.Category.name).all()
@@ -92,9 +97,18 @@ def update_category(db: Session, category_id: uuid.UUID, category_update: schema
     # Update fields that are provided
     update_data = category_update.model_dump(exclude_unset=True)
 
+    fan_out = any(
+        field in EMBED_FAN_OUT_FIELDS and getattr(db_category, field) != value
+        for field, value in update_data.items()
+    )
+
     for field, value in update_data.items():
         setattr(db_category, field, value)
 
+    if fan_out:
+        # Re-embed only the POIs linked to this category, in the same transaction.
+        enqueue_category_fan_out(db, db_category.id)
+
     db.commit()
     db.refresh(db_category)
     return db_category
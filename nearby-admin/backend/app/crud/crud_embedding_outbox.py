@@ -0,0 +1,188 @@
+"""Enqueue / claim / settle rows of the ``embedding_outbox`` table.
+
+Write side: ``enqueue_reembed`` is called by the POI write paths BEFORE their
+commit, so the re-embed request lands atomically with the user's data. It never
+commits on its own. Autosave passes ``debounce=True`` so a burst of keystroke
+saves becomes one embed after the burst settles (bounded by a max-staleness cap
+measured from the first pending change).
+
+Worker side: ``claim_batch`` leases due rows (bumping ``next_attempt_at`` by the
+lease so a crashed worker's claim expires on its own), ``complete`` deletes the
+rows whose claimed generation is still current, and ``fail`` schedules a retry
+with exponential backoff.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.core.config import settings
+from app.models.category import poi_category_association
+from app.models.embedding_outbox import EmbeddingOutbox
+
+logger = logging.getLogger(__name__)
+
+# Seconds a claimed row stays invisible to other workers before it is retried.
+CLAIM_LEASE_SECONDS = 120
+# Retry backoff: BASE * 2**(attempts-1), capped at MAX.
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 15 * 60
+# POIs enqueued per INSERT when fanning out a category change.
+FAN_OUT_BATCH_SIZE = 500
+
+
+def enqueue_reembed(db: Session, poi_ids: Iterable, debounce: bool = False) -> None:
+    """Queue a re-embed for each POI in ``poi_ids`` within ``db``'s transaction.
+
+    Idempotent per POI: an already-pending row is reset with a fresh attempt
+    budget and its ``generation`` bumped, so N saves in a row still produce ONE
+    embedding job. ``enqueued_at`` keeps the time of the FIRST pending change.
+
+    Without ``debounce`` the row is due immediately. With ``debounce`` it is
+    due ``EMBEDDING_DEBOUNCE_SECONDS`` after this call — each new autosave
+    pushes it out again — but never later than ``enqueued_at +
+    EMBEDDING_MAX_STALENESS_SECONDS``, so a long editing session still
+    refreshes its vector.
+    """
+    rows = [{"poi_id": poi_id} for poi_id in dict.fromkeys(poi_ids) if poi_id]
+    if not rows:
+        return
+    if debounce:
+        quiet = timedelta(seconds=settings.EMBEDDING_DEBOUNCE_SECONDS)
+        cap = timedelta(seconds=settings.EMBEDDING_MAX_STALENESS_SECONDS)
+        for row in rows:
+            row["next_attempt_at"] = func.now() + quiet
+        next_attempt_at = func.least(
+            func.now() + quiet, EmbeddingOutbox.enqueued_at + cap
+        )
+    else:
+        next_attempt_at = func.now()
+    stmt = insert(EmbeddingOutbox).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[EmbeddingOutbox.poi_id],
+        set_={
+            "generation": EmbeddingOutbox.generation + 1,
+            "next_attempt_at": next_attempt_at,
+            "attempts": 0,
+            "last_error": None,
+        },
+    )
+    db.execute(stmt)
+
+
+def enqueue_category_fan_out(
+    db: Session,
+    category_id,
+    batch_size: int = FAN_OUT_BATCH_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """Queue a re-embed for every POI assigned to ``category_id``.
+
+    The searchable text carries ``Categories: ...``, so renaming a category
+    (or changing where it applies) stales exactly the POIs linked to it through
+    ``poi_categories`` — not the whole catalog. Ids are enqueued in chunks of
+    ``batch_size``; ``progress(done, total)`` is called after each chunk.
+    Runs in ``db``'s transaction like ``enqueue_reembed``. Returns the number
+    of POIs enqueued.
+    """
+    poi_ids = [
+        row[0]
+        for row in db.query(poi_category_association.c.poi_id)
+        .filter(poi_category_association.c.category_id == category_id)
+        .all()
+    ]
+    total = len(poi_ids)
+    for start in range(0, total, batch_size):
+        enqueue_reembed(db, poi_ids[start:start + batch_size])
+        done = min(start + batch_size, total)
+        if progress is not None:
+            progress(done, total)
+        else:
+            logger.info("category %s re-embed fan-out: %d/%d POIs queued", category_id, done, total)
+    return total
+
+
+def pending_count(db: Session) -> int:
+    """Rows still waiting in the outbox (due or not)."""
+    return db.query(func.count(EmbeddingOutbox.poi_id)).scalar() or 0
+
+
+def claim_batch(db: Session, limit: int) -> List[Tuple[str, int, int]]:
+    """Lease up to ``limit`` due rows; returns ``[(poi_id, generation, attempts)]``.
+
+    ``FOR UPDATE SKIP LOCKED`` lets several workers drain concurrently without
+    double-claiming. The lease is committed immediately so the row lock is NOT
+    held across the TEI call (which would block admin saves re-enqueueing it).
+    ``enqueued_at`` restarts at the claim: a change re-enqueued while the batch
+    is in flight is only as stale as the snapshot the worker is embedding.
+    """
+    rows = db.execute(
+        text(
+            "UPDATE embedding_outbox o "
+            "SET next_attempt_at = now() + make_interval(secs => :lease), "
+            "    enqueued_at = now() "
+            "WHERE o.poi_id IN ("
+            "    SELECT poi_id FROM embedding_outbox "
+            "    WHERE next_attempt_at <= now() "
+            "    ORDER BY next_attempt_at "
+            "    LIMIT :limit "
+            "    FOR UPDATE SKIP LOCKED"
+            ") "
+            "RETURNING o.poi_id::text, o.generation, o.attempts"
+        ),
+        {"lease": CLAIM_LEASE_SECONDS, "limit": limit},
+    ).fetchall()
+    db.commit()
+    return [(row[0], row[1], row[2]) for row in rows]
+
+
+def complete(db: Session, claimed: Iterable[Tuple[str, int]]) -> None:
+    """Delete settled rows, unless they were re-enqueued after being claimed."""
+    for poi_id, generation in claimed:
+        db.execute(
+            text(
+                "DELETE FROM embedding_outbox "
+                "WHERE poi_id = CAST(:poi_id AS uuid) AND generation = :generation"
+            ),
+            {"poi_id": poi_id, "generation": generation},
+        )
+    db.commit()
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before attempt number ``attempts + 1``."""
+    exponent = max(attempts - 1, 0)
+    return timedelta(seconds=min(RETRY_BASE_SECONDS * (2 ** exponent), RETRY_MAX_SECONDS))
+
+
+def fail(db: Session, failed: Iterable[Tuple[str, int, int]], error: str) -> None:
+    """Record a failed attempt and push ``next_attempt_at`` out by the backoff.
+
+    A row re-enqueued while in flight (generation moved on) is left alone — it
+    is already due again with a fresh attempt budget.
+    """
+    for poi_id, generation, attempts in failed:
+        delay = retry_delay(attempts + 1)
+        db.execute(
+            text(
+                "UPDATE embedding_outbox "
+                "SET attempts = attempts + 1, "
+                "    last_error = :error, "
+                "    next_attempt_at = now() + make_interval(secs => :delay) "
+                "WHERE poi_id = CAST(:poi_id AS uuid) AND generation = :generation"
+            ),
+            {
+                "poi_id": poi_id,
+                "generation": generation,
+                "error": (error or "")[:500],
+                "delay": delay.total_seconds(),
+            },
+        )
+    db.commit()
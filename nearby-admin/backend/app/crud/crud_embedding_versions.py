@@ -0,0 +1,173 @@
+"""Start, inspect, cut over, and abort a side-by-side embedding model migration.
+
+See ``shared/embeddings/versions.py`` for the store layout. The lifecycle is:
+
+1. ``start_shadow`` registers the current model as ``live`` (tagging untagged
+   vectors with it) and the new model as ``shadow``.
+2. The embedding worker keeps both stores current for edited POIs, and
+   ``backfill_embeddings.py --shadow`` fills the shadow store for the rest.
+3. ``cutover`` — once ``coverage`` reports every POI embedded by the shadow
+   model — swaps the two stores and their roles in one transaction.
+4. ``abort`` drops the shadow store and its registration.
+
+Both stores are fixed-size pgvector columns (768 dimensions, migration
+``p_embedding_versions_001``), so only a model producing vectors of that size
+can be a shadow; ``start_shadow`` refuses any other. Changing the dimension
+needs a schema migration rather than a side-by-side switch.
+
+Every function commits its own work; errors are ``ValueError`` for the CLI to
+print.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from shared.embeddings.versions import LIVE, SHADOW, registered_models
+
+
+def shadow_store_dim(db: Session) -> int | None:
+    """Dimension of the ``poi_embedding_shadow.embedding`` column (pgvector typmod)."""
+    dim = db.execute(
+        text(
+            "SELECT atttypmod FROM pg_attribute "
+            "WHERE attrelid = 'poi_embedding_shadow'::regclass AND attname = 'embedding'"
+        )
+    ).scalar()
+    return dim if dim and dim > 0 else None
+
+
+def start_shadow(
+    db: Session, shadow_model: str, live_model: str, shadow_dim: int | None = None
+) -> None:
+    """Register ``shadow_model`` next to the live ``live_model``.
+
+    ``shadow_dim`` is the length of the vectors ``shadow_model`` produces;
+    when given it must match the shadow store's column.
+    """
+    if shadow_model == live_model:
+        raise ValueError("The shadow model must differ from the live model.")
+    if shadow_dim is not None:
+        store_dim = shadow_store_dim(db)
+        if store_dim is not None and shadow_dim != store_dim:
+            raise ValueError(
+                f"{shadow_model!r} produces {shadow_dim}-dim vectors but the "
+                f"embedding stores hold {store_dim}-dim vectors; a model of a "
+                "different dimension needs a schema migration, not a shadow."
+            )
+
+    roles = registered_models(db)
+    if roles.get(LIVE) not in (None, live_model):
+        raise ValueError(
+            f"The live store belongs to {roles[LIVE]!r}, not {live_model!r}."
+        )
+    if roles.get(SHADOW) not in (None, shadow_model):
+        # Switching to a different candidate: its vectors are useless now.
+        db.execute(text("DELETE FROM poi_embedding_shadow"))
+
+    db.execute(
+        text(
+            "INSERT INTO embedding_models (role, model) VALUES (:role, :model) "
+            "ON CONFLICT (role) DO UPDATE SET model = EXCLUDED.model, updated_at = now()"
+        ),
+        [{"role": LIVE, "model": live_model}, {"role": SHADOW, "model": shadow_model}],
+    )
+    # Vectors written before versioning existed came from the live model.
+    db.execute(
+        text(
+            "UPDATE points_of_interest SET embedding_model = :model "
+            "WHERE embedding IS NOT NULL AND embedding_model IS NULL"
+        ),
+        {"model": live_model},
+    )
+    db.commit()
+
+
+def coverage(db: Session) -> dict:
+    """Counts of POIs embedded by the live and the shadow model."""
+    roles = registered_models(db)
+    row = db.execute(
+        text(
+            "SELECT "
+            "  (SELECT count(*) FROM points_of_interest), "
+            "  (SELECT count(*) FROM points_of_interest "
+            "    WHERE embedding IS NOT NULL "
+            "      AND (embedding_model = :live OR embedding_model IS NULL)), "
+            "  (SELECT count(*) FROM poi_embedding_shadow WHERE model = :shadow)"
+        ),
+        {"live": roles.get(LIVE), "shadow": roles.get(SHADOW)},
+    ).fetchone()
+    return {
+        "live_model": roles.get(LIVE),
+        "shadow_model": roles.get(SHADOW),
+        "total": row[0],
+        "live": row[1],
+        "shadow": row[2],
+    }
+
+
+def cutover(db: Session, force: bool = False) -> dict:
+    """Atomically make the shadow model live and the live model the shadow.
+
+    Refuses unless every POI has a shadow vector (``force`` overrides; POIs
+    without one simply drop out of semantic results until re-embedded).
+    Returns the ``coverage`` taken before the swap.
+    """
+    roles = registered_models(db)
+    if SHADOW not in roles:
+        raise ValueError("No shadow model registered; run start-shadow first.")
+    old_live, new_live = roles.get(LIVE), roles[SHADOW]
+
+    # Serialize with concurrent writers for the duration of the swap.
+    db.execute(text("LOCK TABLE embedding_models IN ACCESS EXCLUSIVE MODE"))
+    db.execute(text("LOCK TABLE poi_embedding_shadow IN EXCLUSIVE MODE"))
+    stats = coverage(db)
+    if stats["shadow"] < stats["total"] and not force:
+        db.rollback()
+        raise ValueError(
+            f"Shadow coverage is {stats['shadow']}/{stats['total']}; "
+            "finish the backfill or pass --force."
+        )
+
+    db.execute(text(
+        "CREATE TEMP TABLE _previous_live ON COMMIT DROP AS "
+        "SELECT id, embedding, embedding_hash, embedding_model "
+        "FROM points_of_interest WHERE embedding IS NOT NULL"
+    ))
+    db.execute(
+        text(
+            "UPDATE points_of_interest p "
+            "SET embedding = s.embedding, "
+            "    embedding_hash = s.embedding_hash, "
+            "    embedding_model = s.model "
+            "FROM poi_embedding_shadow s "
+            "WHERE s.poi_id = p.id AND s.model = :new_live"
+        ),
+        {"new_live": new_live},
+    )
+    db.execute(text("DELETE FROM poi_embedding_shadow"))
+    db.execute(
+        text(
+            "INSERT INTO poi_embedding_shadow (poi_id, model, embedding, embedding_hash) "
+            "SELECT id, COALESCE(embedding_model, :old_live), embedding, embedding_hash "
+            "FROM _previous_live "
+            "WHERE COALESCE(embedding_model, :old_live) IS NOT NULL"
+        ),
+        {"old_live": old_live},
+    )
+    db.execute(text("DELETE FROM embedding_models"))
+    db.execute(
+        text("INSERT INTO embedding_models (role, model) VALUES (:role, :model)"),
+        [{"role": LIVE, "model": new_live}]
+        + ([{"role": SHADOW, "model": old_live}] if old_live else []),
+    )
+    db.commit()
+    return stats
+
+
+def abort(db: Session) -> None:
+    """Drop the shadow store and its registration; the live model is untouched."""
+    db.execute(text("DELETE FROM poi_embedding_shadow"))
+    db.execute(text("DELETE FROM embedding_models WHERE role = :role"), {"role": SHADOW})
+    db.commit()
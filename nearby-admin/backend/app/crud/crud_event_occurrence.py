@@ -0,0 +1,67 @@
+"""Keep ``event_occurrences`` in step with each event's schedule.
+
+``replace_occurrences`` is called by the event write paths BEFORE their commit,
+so an event's occurrences always change atomically with the fields they are
+expanded from (``OCCURRENCE_FIELDS``). It never commits on its own.
+``rebuild_all`` re-expands every event; ``scripts/rebuild_event_occurrences.py``
+runs it once after the table is created, or after changing the expansion rules.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.event_occurrence import EventOccurrence
+from app.models.poi import Event
+from shared.utils.recurring_events import event_occurrences
+
+logger = logging.getLogger(__name__)
+
+# Event columns the occurrences are expanded from; writes touching none of
+# them leave the stored occurrences valid.
+OCCURRENCE_FIELDS = frozenset({
+    "start_datetime",
+    "is_repeating",
+    "repeat_pattern",
+    "excluded_dates",
+    "manual_dates",
+    "recurrence_end_date",
+})
+
+# Events re-expanded per transaction by ``rebuild_all``.
+REBUILD_BATCH_SIZE = 200
+
+
+def replace_occurrences(db: Session, poi_id, event: Event) -> int:
+    """Replace the stored occurrences of ``event`` (of POI ``poi_id``); returns the count."""
+    db.execute(delete(EventOccurrence).where(EventOccurrence.poi_id == poi_id))
+    occurrences = event_occurrences(
+        start_datetime=event.start_datetime,
+        is_repeating=event.is_repeating,
+        repeat_pattern=event.repeat_pattern,
+        excluded_dates=event.excluded_dates,
+        manual_dates=event.manual_dates,
+        recurrence_end_date=event.recurrence_end_date,
+    )
+    if occurrences:
+        db.execute(
+            insert(EventOccurrence),
+            [{"poi_id": poi_id, "occurs_at": occurs_at} for occurs_at in occurrences],
+        )
+    return len(occurrences)
+
+
+def rebuild_all(db: Session, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """Re-expand every event, committing every ``batch_size`` events; returns the event count."""
+    poi_ids = db.execute(select(Event.poi_id).order_by(Event.poi_id)).scalars().all()
+    for start in range(0, len(poi_ids), batch_size):
+        chunk = poi_ids[start:start + batch_size]
+        events = db.execute(select(Event).where(Event.poi_id.in_(chunk))).scalars().all()
+        for event in events:
+            replace_occurrences(db, event.poi_id, event)
+        db.commit()
+        logger.info("Rebuilt event occurrences for %d/%d events", start + len(chunk), len(poi_ids))
+    return len(poi_ids)
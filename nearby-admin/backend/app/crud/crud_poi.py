@@ -8,6 +8,8 @@ from typing import Dict, Any
 
 from app import models, schemas
 from app.crud.crud_category import get_category
+from app.crud.crud_embedding_outbox import enqueue_reembed
+from app.crud.crud_event_occurrence import OCCURRENCE_FIELDS, replace_occurrences
 from app.utils.html_sanitizer import sanitize_poi_fields
 from geoalchemy2.types import Geography
 from shared.constants.field_options import EVENT_STATUS_EXPLANATION_REQUIRED
@@ -430,6 +432,12 @@ def create_poi(db: Session, poi: schemas.PointOfInterestCreate):
 
     try:
         db.add(db_poi)
+        db.flush()
+        if db_poi.event is not None:
+            replace_occurrences(db, db_poi.id, db_poi.event)
+        # Embed-on-write (A7): queue the embedding in the SAME transaction as
+        # the POI so the request can't be lost; the embedding worker drains it.
+        enqueue_reembed(db, [db_poi.id])
         db.commit()
         db.refresh(db_poi)
     except IntegrityError as e:
@@ -439,14 +447,6 @@ def create_poi(db: Session, poi: schemas.PointOfInterestCreate):
         db.rollback()
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
-    # Best-effort embed-on-write (A7): AFTER the commit above, never before.
-    # Fully contained — a writer bug must never break a successful POI create.
-    try:
-        from app.crud.embedding_writer import write_embedding_best_effort
-        write_embedding_best_effort(db, db_poi.id)
-    except Exception:
-        pass
-
     return db_poi
 
 
@@ -518,8 +518,10 @@ def update_poi(db: Session, *, db_obj: models.PointOfInterest, obj_in: schemas.P
         else:
             db_obj.trail = models.Trail(**trail_data)
 
+    schedule_changed = False
     if 'event' in update_data and poi_type_str == 'EVENT':
         event_data = update_data.pop('event')
+        schedule_changed = db_obj.event is None or not OCCURRENCE_FIELDS.isdisjoint(event_data)
         # Task 157: Date Change Guard
         date_changing = event_data.get('start_datetime') or event_data.get('end_datetime')
         current_status = getattr(db_obj.event, 'event_status', None) if db_obj.event else None
@@ -657,20 +659,17 @@ def update_poi(db: Session, *, db_obj: models.PointOfInterest, obj_in: schemas.P
 
     try:
         db.add(db_obj)
+        if schedule_changed:
+            replace_occurrences(db, db_obj.id, db_obj.event)
+        # Embed-on-write (A7): queued in the update's own transaction. The
+        # worker skips the TEI call when the searchable text is unchanged.
+        enqueue_reembed(db, [db_obj.id])
         db.commit()
         db.refresh(db_obj)
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"An error occurred during update: {e}")
 
-    # Best-effort embed-on-write (A7): AFTER the commit above, never before.
-    # Fully contained — a writer bug must never break a successful POI update.
-    try:
-        from app.crud.embedding_writer import write_embedding_best_effort
-        write_embedding_best_effort(db, db_obj.id)
-    except Exception:
-        pass
-
     return db_obj
 
 
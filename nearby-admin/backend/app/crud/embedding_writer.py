@@ -1,41 +1,64 @@
-"""Best-effort embed-on-write (Phase A7).
+"""Embed-on-write (Phase A7), driven by the embedding outbox.
 
 When a POI is created, updated, or autosaved in nearby-admin, this module
 (re)generates its document embedding through the shared TEI client and stores
 it on ``points_of_interest.embedding``.
 
-Hard guarantees (this is the whole point of the module):
+Contract with the write paths:
 
-* **It NEVER breaks or slow-fails a POI save.** Every public entry point is
-  wrapped so that any exception — import error, DB error, TEI hiccup — is
-  swallowed and logged, never re-raised. The caller has already committed the
-  user's data before we run; we only ever ADD an embedding.
-* **It self-heals.** If the TEI service is unconfigured or down, the write is a
-  clean no-op; the A6 backfill (``scripts/backfill_embeddings.py``) re-embeds
-  anything with ``embedding IS NULL`` later.
-* **It uses its OWN transaction and only touches the ``embedding`` column.** The
-  reload session and the UPDATE connection are independent of the caller's
-  already-committed session, so a failure here cannot roll back or corrupt the
-  POI row's user data.
+* **Enqueue inside the save.** Admin writes never call TEI. They call
+  ``crud_embedding_outbox.enqueue_reembed`` in their own transaction, so the
+  outbox row commits (or rolls back) together with the user's data and a save
+  can neither be slowed nor broken by the embedding service.
+* **The worker does the rest.** The embedding worker (``app/services/
+  embedding_worker.py``) claims due outbox rows, calls ``embed_pois`` for the
+  batch, then completes the settled rows and fails the others with a backoff
+  retry. ``embed_pois`` lets DB errors propagate for that retry;
+  ``write_embedding_best_effort`` is a single-POI entry point for one-off
+  callers and swallows everything.
+* **Only the embedding columns are written.** POIs are read on a fresh session
+  and vectors written on their own connection, touching only ``embedding`` /
+  ``embedding_hash`` / ``embedding_model`` (or the shadow store), never the
+  POI's user data.
+* **It self-heals.** With TEI unconfigured the worker leaves rows pending; the
+  A6 backfill (``scripts/backfill_embeddings.py``) re-embeds anything with
+  ``embedding IS NULL``.
+
+Vectors are routed by model (``shared/embeddings/versions.py``): the live
+model writes ``points_of_interest.embedding`` (tagged ``embedding_model``), and
+during a side-by-side model migration the shadow model writes
+``poi_embedding_shadow``.
 
 The ``embedding`` column is intentionally NOT mapped on the ORM model (so
 ordinary SELECTs don't break where pgvector is absent), so the vector is written
 with raw SQL: ``UPDATE ... SET embedding = CAST(:embedding AS vector)`` — the
 same statement the A6 backfill uses, keeping write-time and backfill text +
 storage byte-identical.
+
+**It skips unchanged text.** Alongside the vector we store ``embedding_hash`` —
+``searchable_text_hash(text, model)`` of the text that produced it. Most admin
+saves touch fields that never reach the searchable text, so when the freshly
+built text hashes to the stored value (and a vector is present) the TEI call
+and the UPDATE are skipped entirely.
 """
 
 from __future__ import annotations
 
 import logging
-import uuid
+from typing import Dict, Iterable, List, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.orm import joinedload
 
 from app import models
 from app.database import SessionLocal, engine
-from shared.embeddings import build_searchable_text_from_orm, get_embedding_client
+from shared.embeddings import (
+    build_searchable_text_from_orm,
+    get_embedding_client,
+    get_shadow_embedding_client,
+    searchable_text_hash,
+)
+from shared.embeddings.versions import LIVE, SHADOW, resolve_embedding_store
 
 logger = logging.getLogger(__name__)
 
@@ -96,47 +119,127 @@ EMBED_RELEVANT_FIELDS: set[str] = {
 }
 
 
-def _load_poi_with_joins(db, poi_id):
-    """Load a POI with the same joins ``get_poi`` uses so the text builder sees
+def _poi_query_with_joins(db):
+    """POI query with the same joins ``get_poi`` uses so the text builder sees
     the trail/event/business/category enrichment."""
+    return db.query(models.PointOfInterest).options(
+        joinedload(models.PointOfInterest.business),
+        joinedload(models.PointOfInterest.park),
+        joinedload(models.PointOfInterest.trail),
+        joinedload(models.PointOfInterest.event),
+        joinedload(models.PointOfInterest.categories),
+    )
+
+
+def _load_poi_with_joins(db, poi_id):
+    """Load one POI with the text-builder joins."""
     return (
-        db.query(models.PointOfInterest)
-        .options(
-            joinedload(models.PointOfInterest.business),
-            joinedload(models.PointOfInterest.park),
-            joinedload(models.PointOfInterest.trail),
-            joinedload(models.PointOfInterest.event),
-            joinedload(models.PointOfInterest.categories),
-        )
+        _poi_query_with_joins(db)
         .filter(models.PointOfInterest.id == poi_id)
         .first()
     )
 
 
+def _stored_hashes(db, poi_ids, model, store) -> Dict[str, str]:
+    """Return ``{poi_id: embedding_hash}`` of the stored vectors of ``model``.
+
+    POIs without a vector in ``store`` are absent (a hash without a vector must
+    never short-circuit the write). The ids are bound as text and cast to
+    ``uuid[]`` so the key lookup stays on the primary-key index.
+    """
+    if store == SHADOW:
+        sql = (
+            "SELECT poi_id::text, embedding_hash FROM poi_embedding_shadow "
+            "WHERE poi_id = ANY(CAST(:ids AS uuid[])) AND model = :model"
+        )
+    else:
+        sql = (
+            "SELECT id::text, embedding_hash FROM points_of_interest "
+            "WHERE id = ANY(CAST(:ids AS uuid[])) AND embedding IS NOT NULL"
+        )
+    rows = db.execute(
+        text(sql), {"ids": [str(poi_id) for poi_id in poi_ids], "model": model}
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def _store_vector(connection, poi_id, vec, content_hash, model=None, store=LIVE) -> None:
+    """Raw-SQL write of a vector, its model tag, and the hash of its text."""
+    params = {
+        "embedding": str(vec),
+        "embedding_hash": content_hash,
+        "model": model,
+        "id": str(poi_id),
+    }
+    if store == SHADOW:
+        connection.execute(
+            text(
+                "INSERT INTO poi_embedding_shadow (poi_id, model, embedding, embedding_hash) "
+                "VALUES (:id, :model, CAST(:embedding AS vector), :embedding_hash) "
+                "ON CONFLICT (poi_id) DO UPDATE SET "
+                "model = EXCLUDED.model, embedding = EXCLUDED.embedding, "
+                "embedding_hash = EXCLUDED.embedding_hash, updated_at = now()"
+            ),
+            params,
+        )
+        return
+    connection.execute(
+        text(
+            "UPDATE points_of_interest "
+            "SET embedding = CAST(:embedding AS vector), "
+            "embedding_hash = :embedding_hash, "
+            "embedding_model = :model "
+            "WHERE id = :id"
+        ),
+        params,
+    )
+
+
+def _enabled_clients():
+    """The primary client plus, during a model migration, the shadow one."""
+    clients = [get_embedding_client(), get_shadow_embedding_client()]
+    return [client for client in clients if client.enabled]
+
+
 def write_embedding_best_effort(db, poi_id) -> None:
-    """(Re)generate and store the embedding for ``poi_id``. Best-effort: never
-    raises, no-ops cleanly when the TEI service is unconfigured or down.
-
-    Call this AFTER the caller has committed the POI's user data. The argument
-    ``db`` is accepted for call-site symmetry but is NOT written through — the
-    reload happens on a FRESH ``SessionLocal`` session and the UPDATE runs on its
-    own ``engine.connect()`` transaction, so this can never roll back or corrupt
-    the already-committed POI row.
+    """(Re)generate and store the embedding for ``poi_id`` outside the outbox.
+
+    Best-effort: never raises, and no-ops cleanly when the TEI service is
+    unconfigured or down. Admin saves do not call this — they enqueue with
+    ``enqueue_reembed`` and the worker runs ``embed_pois``. It reads whatever
+    is committed: ``db`` is accepted for call-site symmetry but not used; the
+    POI is reloaded on a fresh ``SessionLocal`` session and the vector written
+    on its own ``engine.connect()`` transaction.
+
+    When the rebuilt searchable text (under the current model) hashes to the
+    stored ``embedding_hash``, the TEI call is skipped — the vector is current.
+    The vector goes to whichever store (live / shadow) holds the primary
+    client's model.
     """
     try:
         client = get_embedding_client()
         if not client.enabled:
             # TEI service not configured -> no-op; the A6 backfill handles it.
             return
+        model = getattr(client, "model", None)
 
-        # Reload on a fresh session so we read the post-commit state with the
+        # Reload on a fresh session so we read the committed state with the
         # joins loaded, fully decoupled from the caller's session/transaction.
         reload_db = SessionLocal()
         try:
+            store = resolve_embedding_store(reload_db, model)
+            if store is None:
+                # This model owns no store (mid-migration config drift).
+                return
             poi = _load_poi_with_joins(reload_db, poi_id)
             if poi is None:
                 return
             searchable_text = build_searchable_text_from_orm(poi)
+            content_hash = searchable_text_hash(searchable_text, model)
+            stored = _stored_hashes(reload_db, [poi_id], model, store)
+            if stored.get(str(poi_id)) == content_hash:
+                # Nothing embedded changed since the stored vector was written.
+                return
         finally:
             reload_db.close()
 
@@ -148,14 +251,7 @@ def write_embedding_best_effort(db, poi_id) -> None:
         # The embedding column is intentionally NOT ORM-mapped, so write it with
         # raw SQL in its OWN transaction (same statement as the A6 backfill).
         with engine.connect() as connection:
-            connection.execute(
-                text(
-                    "UPDATE points_of_interest "
-                    "SET embedding = CAST(:embedding AS vector) "
-                    "WHERE id = :id"
-                ),
-                {"embedding": str(vec), "id": str(poi_id)},
-            )
+            _store_vector(connection, poi_id, vec, content_hash, model, store)
             connection.commit()
     except Exception as exc:  # noqa: BLE001 — best-effort by contract, never raise
         logger.warning(
@@ -166,6 +262,60 @@ def write_embedding_best_effort(db, poi_id) -> None:
         return
 
 
+def embed_pois(poi_ids: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Batch (re)embed for the outbox worker; returns ``(settled, failed)``.
+
+    ``settled`` holds the ids whose vector is now current — freshly written,
+    skipped because the stored hash still matches, or gone (deleted POI).
+    ``failed`` holds the ids TEI returned ``None`` for. Stale texts go to TEI
+    in ONE ``embed_batch`` call per model: the live model and, while a model
+    migration is running, the shadow model too, so edits made during the
+    shadow backfill are never missing from the next model. Unlike
+    ``write_embedding_best_effort`` this lets DB errors propagate so the worker
+    can back off and retry.
+    """
+    poi_ids = [str(poi_id) for poi_id in poi_ids]
+    texts: Dict[str, str] = {}
+    jobs = []
+    db = SessionLocal()
+    try:
+        pois = (
+            _poi_query_with_joins(db)
+            .filter(models.PointOfInterest.id.in_(poi_ids))
+            .all()
+        )
+        texts = {str(poi.id): build_searchable_text_from_orm(poi) for poi in pois}
+        for client in _enabled_clients():
+            model = getattr(client, "model", None)
+            store = resolve_embedding_store(db, model)
+            if store is None:
+                continue
+            stored = _stored_hashes(db, list(texts), model, store)
+            work = []
+            for poi_id, searchable_text in texts.items():
+                content_hash = searchable_text_hash(searchable_text, model)
+                if stored.get(poi_id) != content_hash:
+                    work.append((poi_id, searchable_text, content_hash))
+            if work:
+                jobs.append((client, model, store, work))
+    finally:
+        db.close()
+
+    failed = set()
+    for client, model, store, work in jobs:
+        vectors = client.embed_batch([item[1] for item in work], kind="document")
+        with engine.connect() as connection:
+            for (poi_id, _text, content_hash), vec in zip(work, vectors):
+                if vec is None:
+                    failed.add(poi_id)
+                    continue
+                _store_vector(connection, poi_id, vec, content_hash, model, store)
+            connection.commit()
+
+    settled = [poi_id for poi_id in poi_ids if poi_id not in failed]
+    return settled, [poi_id for poi_id in poi_ids if poi_id in failed]
+
+
 def should_reembed(changed_keys) -> bool:
     """Return True if any changed field affects the searchable text.
 
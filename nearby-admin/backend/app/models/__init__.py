@@ -9,4 +9,9 @@ from .primary_type import PrimaryType
 from .attribute import Attribute
 from .user import User
 from .image import Image, ImageType, IMAGE_TYPE_CONFIG
+from .embedding_outbox import EmbeddingOutbox
+from .public_poi_document import PublicPoiDocument, PublicDocumentOutbox
+from .event_occurrence import EventOccurrence
+from .poi_open_interval import PoiOpenHoursCoverage, PoiOpenInterval
+from .embedding_model import EmbeddingModel
 from app.database import Base
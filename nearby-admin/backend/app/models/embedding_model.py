@@ -0,0 +1,20 @@
+"""Registry of which embedding model owns which vector store.
+
+At most two rows, keyed by ``role``: ``live`` (``points_of_interest.embedding``)
+and ``shadow`` (``poi_embedding_shadow``, the next model being backfilled).
+Empty until a side-by-side model migration is started; see
+``shared/embeddings/versions.py`` and ``app/crud/crud_embedding_versions.py``.
+"""
+
+from sqlalchemy import Column, String, TIMESTAMP
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class EmbeddingModel(Base):
+    __tablename__ = "embedding_models"
+
+    role = Column(String(16), primary_key=True)  # 'live' | 'shadow'
+    model = Column(String(200), nullable=False)
+    updated_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,40 @@
+"""Durable outbox of POIs whose embedding must be (re)generated.
+
+POI writes enqueue a row here in the SAME transaction as the user's data, so a
+committed save can never lose its re-embed request. The embedding worker
+(``app/services/embedding_worker.py``) drains the table in batches through the
+TEI client and deletes rows once their vector is current.
+
+One row per POI (``poi_id`` is the primary key): repeated enqueues for the same
+POI collapse into one pending job and bump ``generation``, so a row claimed by
+the worker is only deleted if nobody re-enqueued it while the batch was in
+flight.
+"""
+
+from sqlalchemy import Column, ForeignKey, Integer, Text, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class EmbeddingOutbox(Base):
+    __tablename__ = "embedding_outbox"
+
+    poi_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("points_of_interest.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Bumped on every (re-)enqueue; the worker deletes a row only when the
+    # generation it claimed is still the current one.
+    generation = Column(Integer, nullable=False, server_default='1', default=1)
+    # First pending change; kept across re-enqueues (the debounce staleness cap
+    # is measured from here).
+    enqueued_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    # When the row next becomes claimable: now() on enqueue (now() + quiet
+    # window for debounced autosaves), now() + lease while a worker holds it,
+    # now() + backoff after a failed attempt.
+    next_attempt_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), index=True)
+    attempts = Column(Integer, nullable=False, server_default='0', default=0)
+    last_error = Column(Text)
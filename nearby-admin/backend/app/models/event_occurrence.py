@@ -0,0 +1,34 @@
+"""Materialized occurrences of every event, for calendar range queries.
+
+The public ``/events/in-range`` endpoint used to load every published event and
+expand repeating ones with ``dateutil.rrule`` on each request. Instead, the
+admin write paths (``crud_event_occurrence.replace_occurrences``) store one row
+per concrete occurrence, expanded by ``shared.utils.recurring_events`` in the
+same transaction as the event change, so a date range becomes one index range
+scan on ``occurs_at``.
+
+Rows are per event, regardless of publication or event status; readers join
+``points_of_interest`` / ``events`` for those, so status changes never need a
+rebuild.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class EventOccurrence(Base):
+    __tablename__ = "event_occurrences"
+    # Range scans return rows already in (occurs_at, poi_id) order, the
+    # calendar's sort, so LIMIT/OFFSET pages need no sort step.
+    __table_args__ = (
+        Index("ix_event_occurrences_occurs_at", "occurs_at", "poi_id"),
+    )
+
+    poi_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("points_of_interest.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    occurs_at = Column(TIMESTAMP(timezone=True), primary_key=True)
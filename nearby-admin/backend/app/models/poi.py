@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, ForeignKey, Numeric, TIMESTAMP, Boolean, Enum, CheckConstraint
+from sqlalchemy import Column, String, Text, ForeignKey, Numeric, TIMESTAMP, Boolean, Enum, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -14,6 +14,31 @@ from shared.models.enums import POIType
 class PointOfInterest(Base):
     __tablename__ = "points_of_interest"
     __table_args__ = (
+        # Geography KNN / ST_DWithin index for the public /nearby queries
+        # (migration q_poi_geog_knn_001).
+        Index(
+            "idx_points_of_interest_location_geog",
+            text("geography(location)"),
+            postgresql_using="gist",
+        ),
+        # Covering partial index: GET /api/pois/counts is an index-only scan
+        # (migration s_poi_counts_idx_001).
+        Index(
+            "idx_points_of_interest_published_counts",
+            "poi_type",
+            postgresql_include=[
+                "icon_pet_friendly", "icon_wheelchair_accessible",
+                "address_city", "address_county", "id",
+            ],
+            postgresql_where=text("publication_status = 'published'"),
+        ),
+        # Keyset pages of GET /api/pois/by-type ordered by (name, id)
+        # (migration t_poi_listing_idx_001).
+        Index(
+            "idx_points_of_interest_published_type_name",
+            "poi_type", "name", "id",
+            postgresql_where=text("publication_status = 'published'"),
+        ),
         CheckConstraint(
             "alcohol_available IS NULL OR alcohol_available IN "
             "('full_bar','beer_wine','byob','no_alcohol','seasonal','nearby')",
@@ -0,0 +1,46 @@
+"""Resolved opening intervals of each published POI over a rolling horizon.
+
+Answering "open now?" from the ``hours`` JSON means applying exceptions,
+holidays, seasons and regular hours in Python for every POI. The nearby-app
+document worker (``app/services/public_document_worker.py``) resolves them with
+``shared.utils.hours_resolution.open_intervals`` instead and stores one row per
+continuous open span, from yesterday through a week ahead in the POI's own
+timezone. It rebuilds a POI whenever the document outbox queues it (any change
+to its row, including ``hours``) and extends every POI's horizon once a day, so
+listings can filter ``open_now`` with an ``EXISTS`` probe on the primary key.
+
+``PoiOpenHoursCoverage`` records, per POI, the ``last_updated`` its intervals
+were resolved from and the window they are complete for. Listings trust the
+intervals only inside that window and while ``last_updated`` still matches;
+otherwise they resolve the POI's ``hours`` directly.
+"""
+
+from sqlalchemy import Column, ForeignKey, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class PoiOpenInterval(Base):
+    __tablename__ = "poi_open_intervals"
+
+    poi_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("points_of_interest.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    opens_at = Column(TIMESTAMP(timezone=True), primary_key=True)
+    closes_at = Column(TIMESTAMP(timezone=True), nullable=False)
+
+
+class PoiOpenHoursCoverage(Base):
+    __tablename__ = "poi_open_hours_coverage"
+
+    poi_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("points_of_interest.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    poi_last_updated = Column(TIMESTAMP(timezone=True), nullable=True)
+    covered_from = Column(TIMESTAMP(timezone=True), nullable=False)
+    covered_until = Column(TIMESTAMP(timezone=True), nullable=False)
@@ -0,0 +1,56 @@
+"""Materialized public JSON of each published POI, and its rebuild queue.
+
+The nearby-app detail and card payloads are assembled from the POI row, its
+subtype row, images, categories and (for events) the venue POI. Instead of
+repeating that on every public read, a worker in nearby-app
+(``app/services/public_document_worker.py``) serializes each POI once and
+stores the encoded bytes in ``public_poi_documents``.
+
+Rows of ``public_document_outbox`` are written by database triggers (migration
+``u_public_docs_001``) whenever any of those sources change, so every
+admin write path — form saves, image uploads, category edits, raw SQL — queues
+the rebuild in the same transaction as the change. ``generation`` works as in
+``embedding_outbox``: the worker only deletes a row it claimed if nobody
+re-enqueued it in the meantime.
+"""
+
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class PublicPoiDocument(Base):
+    __tablename__ = "public_poi_documents"
+
+    poi_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("points_of_interest.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # The detail ETag the document was built for; readers serve ``detail_json``
+    # only while it still equals the ETag of the live data.
+    etag = Column(String(80), nullable=False)
+    # ``points_of_interest.last_updated`` at build time; the card is served
+    # only while it is unchanged.
+    poi_last_updated = Column(TIMESTAMP(timezone=True))
+    # Encoded JSON bodies. ``detail_json`` is NULL when the app is not running
+    # the registry serializer; ``card_json`` omits the per-query distance.
+    detail_json = Column(LargeBinary)
+    card_json = Column(LargeBinary, nullable=False)
+    built_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+
+
+class PublicDocumentOutbox(Base):
+    __tablename__ = "public_document_outbox"
+
+    poi_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("points_of_interest.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    generation = Column(Integer, nullable=False, server_default='1', default=1)
+    enqueued_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    next_attempt_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), index=True)
+    attempts = Column(Integer, nullable=False, server_default='0', default=0)
@@ -0,0 +1,90 @@
+"""Background drain loop for the ``embedding_outbox`` table.
+
+Admin POI writes only enqueue (``crud_embedding_outbox.enqueue_reembed``) —
+the TEI round-trip happens here, off the request path. Each pass claims a
+batch of due rows, re-embeds them with ONE ``embed_batch`` call through
+``embedding_writer.embed_pois``, deletes the rows that settled and schedules
+a backoff retry for the rest.
+
+Run it with ``scripts/embedding_worker.py`` (the ``embedding-worker`` compose
+service). Several workers may run side by side: claims use
+``FOR UPDATE SKIP LOCKED`` and expire after ``CLAIM_LEASE_SECONDS``, so a
+crashed worker's batch is picked up again on its own.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from app.crud import crud_embedding_outbox
+from app.crud.embedding_writer import embed_pois
+from app.database import SessionLocal
+from shared.embeddings import get_embedding_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+def drain_once(batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Claim and process one batch; returns the number of rows claimed.
+
+    No-op (returns 0 without claiming) when the embedding client is disabled,
+    so pending rows wait in the outbox instead of burning their retries.
+    """
+    if not get_embedding_client().enabled:
+        return 0
+
+    db = SessionLocal()
+    try:
+        claimed = crud_embedding_outbox.claim_batch(db, batch_size)
+        if not claimed:
+            return 0
+        generations = {poi_id: (generation, attempts) for poi_id, generation, attempts in claimed}
+
+        try:
+            settled, failed = embed_pois(list(generations))
+            error = "embedding service returned no vector"
+        except Exception as exc:  # noqa: BLE001 — retried with backoff
+            logger.warning("embedding batch of %d failed: %s", len(claimed), exc)
+            db.rollback()
+            settled, failed = [], list(generations)
+            error = str(exc)
+
+        crud_embedding_outbox.complete(
+            db, [(poi_id, generations[poi_id][0]) for poi_id in settled]
+        )
+        if failed:
+            crud_embedding_outbox.fail(
+                db,
+                [(poi_id, *generations[poi_id]) for poi_id in failed],
+                error,
+            )
+        logger.info(
+            "embedding outbox: claimed=%d settled=%d failed=%d",
+            len(claimed), len(settled), len(failed),
+        )
+        return len(claimed)
+    finally:
+        db.close()
+
+
+def run_forever(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> None:
+    """Drain continuously; sleep ``poll_interval`` seconds whenever idle."""
+    logger.info(
+        "embedding worker started (batch_size=%d, poll_interval=%.1fs)",
+        batch_size, poll_interval,
+    )
+    while True:
+        try:
+            claimed = drain_once(batch_size)
+        except Exception as exc:  # noqa: BLE001 — keep the worker alive (DB blips)
+            logger.warning("embedding worker pass failed: %s", exc)
+            claimed = 0
+        if claimed < batch_size:
+            time.sleep(poll_interval)
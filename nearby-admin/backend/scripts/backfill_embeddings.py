@@ -16,12 +16,24 @@ image.
 
 Usage
 -----
-    python scripts/backfill_embeddings.py [--batch-size 32] [--force] [--limit N]
+    python scripts/backfill_embeddings.py [--batch-size 32] [--force]
+                                          [--ignore-hash] [--shadow]
+                                          [--limit N]
 
 Options
 -------
     --batch-size N   POIs embedded per TEI request (default: 32).
-    --force          Re-embed ALL POIs (default: only WHERE embedding IS NULL).
+    --force          Consider ALL POIs (default: only WHERE embedding IS NULL).
+                     POIs whose stored ``embedding_hash`` still matches their
+                     current text + model are skipped, so a forced run only
+                     re-embeds what actually changed.
+    --ignore-hash    With --force, re-embed every POI even when its hash
+                     matches (e.g. after TEI weights changed under the same
+                     model id).
+    --shadow         Fill the SHADOW store (``poi_embedding_shadow``) with
+                     the shadow model during a side-by-side model migration
+                     (see ``scripts/embedding_versions.py``) instead of the
+                     live ``embedding`` column.
     --limit N        Cap the number of POIs processed (testing only).
 
 Environment
@@ -29,11 +41,14 @@ Environment
     DATABASE_URL            Admin DB connection (via app.core.config.settings).
     EMBEDDING_SERVICE_URL   TEI base URL. If unset, the script exits 2 — there
                             is nothing to do without the embedding service.
+    EMBEDDING_SHADOW_SERVICE_URL / EMBEDDING_SHADOW_MODEL
+                            The shadow model's TEI server, for --shadow.
 
 The TEI client is fail-soft: if it returns ``None`` for an item (service down,
 timeout, bad dimension), that POI is SKIPPED (its existing embedding is left
 untouched) and counted as a failure. The run never crashes on a per-item
-failure; it exits non-zero only if zero embeddings succeeded.
+failure; it exits non-zero only if zero embeddings succeeded and nothing was
+skipped as already current.
 """
 
 import argparse
@@ -56,10 +71,18 @@ if _REPO_ROOT not in sys.path:
     sys.path.append(_REPO_ROOT)
 
 from app.database import engine  # admin app DB engine (built from DATABASE_URL)
-from shared.embeddings import build_searchable_text, get_embedding_client
-
-
-def fetch_pois(force: bool = False, limit: int | None = None) -> List[Tuple[str, dict]]:
+from app.crud.embedding_writer import _store_vector
+from shared.embeddings import (
+    build_searchable_text,
+    get_embedding_client,
+    get_shadow_embedding_client,
+    searchable_text_hash,
+)
+from shared.embeddings.versions import SHADOW, resolve_embedding_store
+
+
+def fetch_pois(force: bool = False, limit: int | None = None,
+               shadow_model: str | None = None) -> List[Tuple[str, dict]]:
     """Fetch POIs with related-table enrichment for richer embeddings.
 
     Ported verbatim from the legacy ``generate_embeddings.fetch_pois`` (its
@@ -67,17 +90,34 @@ def fetch_pois(force: bool = False, limit: int | None = None) -> List[Tuple[str,
     enrichment) so the document-text inputs match what the legacy script
     produced. The enrichment dicts are stashed under ``_trail`` / ``_event`` /
     ``_business`` / ``_categories`` for ``build_searchable_text``.
+
+    With ``shadow_model`` the stored vector/hash are read from
+    ``poi_embedding_shadow`` (rows of that model) instead of the live column.
     """
     with engine.connect() as connection:
-        # Default: only POIs missing an embedding. --force re-embeds everything.
-        where_clause = "" if force else "WHERE p.embedding IS NULL"
-        mode = "Force mode: regenerating ALL" if force else "Fetching POIs without"
+        # Default: only POIs missing an embedding. --force considers everything
+        # (unchanged POIs are then skipped by content hash in select_stale).
+        if shadow_model:
+            stored_join = (
+                "LEFT JOIN poi_embedding_shadow s "
+                "ON s.poi_id = p.id AND s.model = :shadow_model"
+            )
+            stored_cols = ("s.poi_id IS NOT NULL AS has_embedding, "
+                           "s.embedding_hash AS stored_embedding_hash")
+            where_clause = "" if force else "WHERE s.poi_id IS NULL"
+        else:
+            stored_join = ""
+            stored_cols = ("p.embedding IS NOT NULL AS has_embedding, "
+                           "p.embedding_hash AS stored_embedding_hash")
+            where_clause = "" if force else "WHERE p.embedding IS NULL"
+        mode = "Force mode: checking ALL" if force else "Fetching POIs without"
         print(f"[INFO] {mode} embeddings")
 
         limit_clause = f"LIMIT {int(limit)}" if limit else ""
 
         query = text(f"""
             SELECT p.*,
+                   {stored_cols},
                    t.difficulty AS trail_difficulty,
                    t.length_text AS trail_length_text,
                    t.route_type AS trail_route_type,
@@ -95,12 +135,13 @@ def fetch_pois(force: bool = False, limit: int | None = None) -> List[Tuple[str,
             LEFT JOIN trails t ON t.poi_id = p.id
             LEFT JOIN events e ON e.poi_id = p.id
             LEFT JOIN businesses b ON b.poi_id = p.id
+            {stored_join}
             {where_clause}
             ORDER BY p.id
             {limit_clause}
         """)
 
-        result = connection.execute(query)
+        result = connection.execute(query, {"shadow_model": shadow_model})
         rows = result.fetchall()
         columns = result.keys()
 
@@ -143,20 +184,71 @@ def fetch_pois(force: bool = False, limit: int | None = None) -> List[Tuple[str,
         return pois
 
 
-def backfill(pois: List[Tuple[str, dict]], batch_size: int) -> Tuple[int, int]:
-    """Embed POIs through TEI in batches and store vectors. Returns (ok, failed).
+def _searchable_text_for(poi_data: dict) -> str:
+    """Build the canonical document text — the SAME builder as embed-on-write."""
+    return build_searchable_text(
+        poi_data,
+        categories=poi_data.get('_categories'),
+        trail=poi_data.get('_trail'),
+        event=poi_data.get('_event'),
+        business=poi_data.get('_business'),
+    )
 
-    Each item that the client returns ``None`` for is skipped (its existing
-    embedding is left untouched) and counted as a failure. Vectors are stored
-    with the same raw SQL as the legacy generator:
-    ``UPDATE ... SET embedding = CAST(:embedding AS vector) WHERE id = :id``.
+
+def select_stale(
+    pois: List[Tuple[str, dict]], model: str | None, ignore_hash: bool = False
+) -> Tuple[List[Tuple[str, str, str]], int]:
+    """Build each POI's text + content hash and drop the ones already current.
+
+    Returns ``([(poi_id, searchable_text, content_hash), ...], skipped)``. A POI
+    is current when it has a stored vector AND its stored hash equals the
+    hash of its freshly built text under ``model``. ``ignore_hash`` keeps them
+    all (a true full re-embed).
     """
-    total = len(pois)
-    if total == 0:
+    stale: List[Tuple[str, str, str]] = []
+    skipped = 0
+    for poi_id, poi_data in pois:
+        searchable_text = _searchable_text_for(poi_data)
+        content_hash = searchable_text_hash(searchable_text, model)
+        if (
+            not ignore_hash
+            and poi_data.get('has_embedding')
+            and poi_data.get('stored_embedding_hash') == content_hash
+        ):
+            skipped += 1
+            continue
+        stale.append((poi_id, searchable_text, content_hash))
+    return stale, skipped
+
+
+def backfill(pois: List[Tuple[str, dict]], batch_size: int,
+             ignore_hash: bool = False, client=None,
+             store: str | None = None) -> Tuple[int, int, int]:
+    """Embed POIs through TEI in batches and store vectors.
+
+    Returns ``(ok, failed, skipped)``. POIs whose stored ``embedding_hash``
+    matches their current text are skipped without a TEI call (see
+    ``select_stale``). Each item that the client returns ``None`` for is skipped
+    (its existing embedding is left untouched) and counted as a failure. Vectors
+    are stored with the embed-on-write statement (``_store_vector``): the live
+    ``UPDATE ... SET embedding = CAST(:embedding AS vector), ...`` or, for the
+    shadow store, an upsert into ``poi_embedding_shadow``. ``client`` defaults
+    to the primary embedding client and ``store`` to the live store.
+    """
+    if not pois:
         print("[INFO] No POIs to process!")
-        return 0, 0
+        return 0, 0, 0
+
+    client = client or get_embedding_client()
+    work, skipped = select_stale(pois, client.model, ignore_hash=ignore_hash)
+    if skipped:
+        print(f"[INFO] Skipping {skipped} POIs whose embedding is already current")
+
+    total = len(work)
+    if total == 0:
+        print("[INFO] Every embedding is current — nothing to re-embed.")
+        return 0, 0, skipped
 
-    client = get_embedding_client()
     print(f"\n[EMBEDDING] Processing {total} POIs in batches of {batch_size}...")
 
     start_time = time.time()
@@ -165,39 +257,21 @@ def backfill(pois: List[Tuple[str, dict]], batch_size: int) -> Tuple[int, int]:
     processed = 0
 
     for i in range(0, total, batch_size):
-        batch = pois[i:i + batch_size]
-
-        # Build the canonical document text — the SAME builder as embed-on-write.
-        texts = [
-            build_searchable_text(
-                poi_data,
-                categories=poi_data.get('_categories'),
-                trail=poi_data.get('_trail'),
-                event=poi_data.get('_event'),
-                business=poi_data.get('_business'),
-            )
-            for _poi_id, poi_data in batch
-        ]
-        ids = [poi_id for poi_id, _poi_data in batch]
+        batch = work[i:i + batch_size]
+        texts = [searchable_text for _poi_id, searchable_text, _hash in batch]
 
         # 'document' kind applies the EmbeddingGemma document prefix. Fail-soft:
         # any failed item comes back as None; the whole call never raises.
         embeddings = client.embed_batch(texts, kind="document")
 
         with engine.connect() as connection:
-            for poi_id, embedding in zip(ids, embeddings):
+            for (poi_id, _text, content_hash), embedding in zip(batch, embeddings):
                 if embedding is None:
                     # Service failure for this item — skip, leave embedding as-is.
                     failed += 1
                     continue
-                connection.execute(
-                    text("""
-                        UPDATE points_of_interest
-                        SET embedding = CAST(:embedding AS vector)
-                        WHERE id = :id
-                    """),
-                    {"embedding": str(embedding), "id": poi_id},
-                )
+                _store_vector(connection, poi_id, embedding, content_hash,
+                              client.model, store)
                 succeeded += 1
             connection.commit()
 
@@ -211,8 +285,8 @@ def backfill(pois: List[Tuple[str, dict]], batch_size: int) -> Tuple[int, int]:
 
     total_time = time.time() - start_time
     print(f"\n[DONE] Embedded {succeeded}, failed {failed} of {total} POIs "
-          f"in {total_time:.1f}s")
-    return succeeded, failed
+          f"in {total_time:.1f}s ({skipped} already current)")
+    return succeeded, failed, skipped
 
 
 def main() -> int:
@@ -222,7 +296,12 @@ def main() -> int:
     parser.add_argument("--batch-size", type=int, default=32,
                         help="POIs embedded per TEI request (default: 32)")
     parser.add_argument("--force", action="store_true",
-                        help="Re-embed ALL POIs (default: only embedding IS NULL)")
+                        help="Consider ALL POIs (default: only embedding IS NULL); "
+                             "unchanged ones are still skipped by content hash")
+    parser.add_argument("--ignore-hash", action="store_true",
+                        help="Re-embed even when the stored content hash matches")
+    parser.add_argument("--shadow", action="store_true",
+                        help="Embed with the shadow model into poi_embedding_shadow")
     parser.add_argument("--limit", type=int, default=None,
                         help="Cap number of POIs processed (testing only)")
     args = parser.parse_args()
@@ -233,24 +312,38 @@ def main() -> int:
 
     # Nothing to do without the embedding service — a disabled client would
     # silently produce all-None and 'succeed' at embedding zero POIs.
-    if not os.environ.get("EMBEDDING_SERVICE_URL"):
-        print("[ERROR] EMBEDDING_SERVICE_URL is not set. The TEI embedding "
+    url_var = "EMBEDDING_SHADOW_SERVICE_URL" if args.shadow else "EMBEDDING_SERVICE_URL"
+    if not os.environ.get(url_var):
+        print(f"[ERROR] {url_var} is not set. The TEI embedding "
               "service is required to generate embeddings — nothing to do.")
         return 2
 
-    pois = fetch_pois(force=args.force, limit=args.limit)
+    client = get_shadow_embedding_client() if args.shadow else get_embedding_client()
+    with engine.connect() as connection:
+        store = resolve_embedding_store(connection, client.model)
+    if store is None or (args.shadow and store != SHADOW):
+        print(f"[ERROR] Model {client.model!r} is not registered for the "
+              f"{'shadow' if args.shadow else 'live'} store "
+              "(see scripts/embedding_versions.py status).")
+        return 2
+
+    pois = fetch_pois(force=args.force, limit=args.limit,
+                      shadow_model=client.model if store == SHADOW else None)
     if not pois:
         print("\n[SUCCESS] No POIs needed embedding.")
         return 0
 
-    succeeded, failed = backfill(pois, args.batch_size)
+    succeeded, failed, skipped = backfill(
+        pois, args.batch_size, ignore_hash=args.ignore_hash,
+        client=client, store=store,
+    )
 
     print("\n" + "=" * 60)
-    print(f"Summary: embedded={succeeded} failed={failed} "
-          f"total={succeeded + failed}")
+    print(f"Summary: embedded={succeeded} failed={failed} skipped={skipped} "
+          f"total={succeeded + failed + skipped}")
     print("=" * 60)
 
-    if succeeded == 0:
+    if succeeded == 0 and failed > 0:
         print("[ERROR] Zero embeddings succeeded — is the TEI service reachable?")
         return 1
     return 0
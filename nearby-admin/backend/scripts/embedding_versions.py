@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Migrate to a new embedding model side by side, with an atomic cutover.
+
+Procedure
+---------
+1. Run a TEI server for the new model and set ``EMBEDDING_SHADOW_SERVICE_URL``
+   / ``EMBEDDING_SHADOW_MODEL`` on the admin backend and embedding worker.
+2. ``python scripts/embedding_versions.py start-shadow NEW_MODEL`` — embeds a
+   probe with the shadow server and refuses a model whose vectors do not fit
+   the 768-dim stores, then registers the current ``EMBEDDING_MODEL`` as live
+   and NEW_MODEL as shadow. From now on the worker embeds edited POIs with
+   both models.
+3. ``python scripts/backfill_embeddings.py --shadow`` — fills the shadow store
+   for every other POI. ``status`` reports coverage.
+4. ``python scripts/embedding_versions.py cutover`` — once coverage is 100%,
+   swaps the stores in one transaction: NEW_MODEL is live, the old model
+   becomes the shadow (so its still-deployed query clients keep matching
+   vectors, and running ``cutover`` again rolls back).
+5. Point ``EMBEDDING_MODEL`` / ``EMBEDDING_SERVICE_URL`` at the new model on
+   both apps, then ``abort`` to drop the old model's vectors and unset the
+   shadow variables.
+
+Usage
+-----
+    python scripts/embedding_versions.py status
+    python scripts/embedding_versions.py start-shadow MODEL [--live-model MODEL]
+    python scripts/embedding_versions.py cutover [--force]
+    python scripts/embedding_versions.py abort
+"""
+
+import argparse
+import os
+import sys
+
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+_REPO_ROOT = os.path.dirname(os.path.dirname(_BACKEND_ROOT))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from app.crud import crud_embedding_versions  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from shared.embeddings import (  # noqa: E402
+    get_embedding_client,
+    get_shadow_embedding_client,
+)
+
+
+def _print_status(stats: dict) -> None:
+    total = stats["total"] or 1
+    print(f"POIs:   {stats['total']}")
+    print(f"live:   {stats['live_model'] or '(unversioned)'} — "
+          f"{stats['live']} vectors ({100 * stats['live'] / total:.1f}%)")
+    if stats["shadow_model"]:
+        print(f"shadow: {stats['shadow_model']} — "
+              f"{stats['shadow']} vectors ({100 * stats['shadow'] / total:.1f}%)")
+    else:
+        print("shadow: (none)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Side-by-side embedding model migration"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="Show live/shadow models and coverage")
+    start = sub.add_parser("start-shadow", help="Register a shadow model")
+    start.add_argument("model", help="Model id of the new (shadow) model")
+    start.add_argument("--live-model", default=None,
+                       help="Model id of the live vectors (default: EMBEDDING_MODEL)")
+    cut = sub.add_parser("cutover", help="Swap the shadow and live stores")
+    cut.add_argument("--force", action="store_true",
+                     help="Cut over even if shadow coverage is below 100%%")
+    sub.add_parser("abort", help="Drop the shadow store and its registration")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "start-shadow":
+            live_model = args.live_model or get_embedding_client().model
+            shadow_client = get_shadow_embedding_client()
+            if not shadow_client.enabled:
+                print("[ERROR] Set EMBEDDING_SHADOW_SERVICE_URL to the new model's server")
+                return 1
+            shadow_dim = shadow_client.probe_dim()
+            if shadow_dim is None:
+                print(f"[ERROR] No vector from {shadow_client.base_url}; is it running?")
+                return 1
+            crud_embedding_versions.start_shadow(db, args.model, live_model, shadow_dim)
+            print(f"[INFO] live={live_model} shadow={args.model}")
+        elif args.command == "cutover":
+            stats = crud_embedding_versions.cutover(db, force=args.force)
+            print(f"[DONE] {stats['shadow_model']} is now live "
+                  f"({stats['shadow']}/{stats['total']} POIs); "
+                  f"{stats['live_model']} is the shadow")
+        elif args.command == "abort":
+            crud_embedding_versions.abort(db)
+            print("[DONE] Shadow store dropped")
+        _print_status(crud_embedding_versions.coverage(db))
+        return 0
+    except ValueError as exc:
+        print(f"[ERROR] {exc}")
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Drain the ``embedding_outbox`` table: re-embed queued POIs through TEI.
+
+Admin POI create/update/autosave enqueue a row in ``embedding_outbox`` inside
+the same transaction as the user's data; this long-running worker is what
+actually calls the embedding service (see ``app/services/embedding_worker.py``).
+
+Usage
+-----
+    python scripts/embedding_worker.py [--batch-size 32] [--poll-interval 2]
+                                       [--once]
+
+Options
+-------
+    --batch-size N       Outbox rows claimed (and POIs embedded) per TEI
+                         request (default: 32).
+    --poll-interval S    Seconds to sleep when the outbox is idle (default: 2).
+    --once               Drain until the outbox has nothing due, then exit.
+
+Environment
+-----------
+    DATABASE_URL            Admin DB connection (via app.core.config.settings).
+    EMBEDDING_SERVICE_URL   TEI base URL. If unset, the worker exits 2 — rows
+                            stay queued until a configured worker drains them.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Same path setup as backfill_embeddings.py: backend root for `app`, repo root
+# for a top-level `shared/` in local dev.
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+_REPO_ROOT = os.path.dirname(os.path.dirname(_BACKEND_ROOT))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from app.services.embedding_worker import (  # noqa: E402
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_POLL_INTERVAL,
+    drain_once,
+    run_forever,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Drain the embedding outbox via the TEI service"
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Rows embedded per TEI request (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f"Idle sleep in seconds (default: {DEFAULT_POLL_INTERVAL:g})")
+    parser.add_argument("--once", action="store_true",
+                        help="Drain everything currently due, then exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    if not os.environ.get("EMBEDDING_SERVICE_URL"):
+        print("[ERROR] EMBEDDING_SERVICE_URL is not set. The TEI embedding "
+              "service is required to drain the outbox — nothing to do.")
+        return 2
+
+    if args.once:
+        total = 0
+        while True:
+            claimed = drain_once(args.batch_size)
+            total += claimed
+            if claimed == 0:
+                break
+        print(f"[DONE] Processed {total} outbox rows")
+        return 0
+
+    run_forever(args.batch_size, args.poll_interval)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
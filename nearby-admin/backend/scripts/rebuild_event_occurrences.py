@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Re-expand every event into the ``event_occurrences`` table.
+
+Event writes keep their own occurrences current (see
+``app/crud/crud_event_occurrence.py``); run this once after migration
+``v_event_occurrences_001`` creates the table, and again whenever the expansion
+rules in ``shared/utils/recurring_events.py`` change.
+
+Usage
+-----
+    python scripts/rebuild_event_occurrences.py [--batch-size 200]
+
+Options
+-------
+    --batch-size N    Events re-expanded per transaction (default: 200).
+
+Environment
+-----------
+    DATABASE_URL      Admin DB connection (via app.core.config.settings).
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Same path setup as backfill_embeddings.py: backend root for `app`, repo root
+# for a top-level `shared/` in local dev.
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+_REPO_ROOT = os.path.dirname(os.path.dirname(_BACKEND_ROOT))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from app.crud.crud_event_occurrence import REBUILD_BATCH_SIZE, rebuild_all  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Re-expand every event into event_occurrences"
+    )
+    parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE,
+                        help=f"Events per transaction (default: {REBUILD_BATCH_SIZE})")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    db = SessionLocal()
+    try:
+        total = rebuild_all(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"[DONE] Rebuilt occurrences for {total} events")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
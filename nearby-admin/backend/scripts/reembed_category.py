@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Queue re-embeds for the POIs assigned to one or more categories.
+
+Renaming a category through the admin API already fans out automatically
+(``crud_category.update_category``). Use this after a change that bypassed the
+API (a direct SQL rename, a bulk import) instead of a whole-catalog
+``backfill_embeddings.py --force``: only POIs linked through ``poi_categories``
+are enqueued in ``embedding_outbox``, and the embedding worker embeds them.
+
+Usage
+-----
+    python scripts/reembed_category.py CATEGORY [CATEGORY ...]
+                                       [--batch-size 500] [--wait]
+
+Arguments
+---------
+    CATEGORY          Category id or slug.
+
+Options
+-------
+    --batch-size N    POIs enqueued per INSERT (default: 500).
+    --wait            After enqueueing, poll the outbox and report progress
+                      until the embedding worker has drained it.
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+_REPO_ROOT = os.path.dirname(os.path.dirname(_BACKEND_ROOT))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from app import models  # noqa: E402
+from app.crud.crud_embedding_outbox import (  # noqa: E402
+    FAN_OUT_BATCH_SIZE,
+    enqueue_category_fan_out,
+    pending_count,
+)
+from app.database import SessionLocal  # noqa: E402
+
+
+def _resolve_category(db, ref: str):
+    try:
+        category_id = uuid.UUID(ref)
+    except ValueError:
+        return db.query(models.Category).filter(models.Category.slug == ref).first()
+    return db.query(models.Category).filter(models.Category.id == category_id).first()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Re-embed the POIs assigned to the given categories"
+    )
+    parser.add_argument("categories", nargs="+", help="Category id or slug")
+    parser.add_argument("--batch-size", type=int, default=FAN_OUT_BATCH_SIZE,
+                        help=f"POIs enqueued per INSERT (default: {FAN_OUT_BATCH_SIZE})")
+    parser.add_argument("--wait", action="store_true",
+                        help="Report progress until the worker drains the outbox")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        queued = 0
+        for ref in args.categories:
+            category = _resolve_category(db, ref)
+            if category is None:
+                print(f"[ERROR] Category not found: {ref}")
+                db.rollback()
+                return 1
+
+            def _progress(done, total, name=category.name):
+                print(f"[PROGRESS] {name}: {done}/{total} POIs queued")
+
+            count = enqueue_category_fan_out(
+                db, category.id, batch_size=args.batch_size, progress=_progress
+            )
+            print(f"[INFO] {category.name}: {count} POIs queued")
+            queued += count
+        db.commit()
+        print(f"[DONE] Queued {queued} POIs for re-embedding")
+
+        if args.wait and queued:
+            start = time.time()
+            while True:
+                remaining = pending_count(db)
+                db.rollback()  # end the read transaction so the next poll is fresh
+                print(f"[PROGRESS] outbox pending={remaining} "
+                      f"elapsed={time.time() - start:.0f}s")
+                if remaining == 0:
+                    break
+                time.sleep(5)
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
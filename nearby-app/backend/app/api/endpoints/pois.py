@@ -1,39 +1,110 @@
 # app/api/endpoints/pois.py
+import base64
+import hashlib
+import json
 import logging
 import os
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, func
 from typing import List, Optional
 from datetime import date as date_type, datetime, timezone
 import uuid
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from ... import schemas, crud, models
-from ...database import get_db
+from ...database import SessionLocal, get_db
 from ...schemas.poi import PointGeometry
 from ...models.image import Image
 from ...search import multi_signal_search
 from ...serialization.poi_serializer import (
+    DOCUMENT_FORMAT_VERSION,
     serialize_poi_detail,
     serialize_poi_card,
     structural_registry_keys_for,
 )
 from ...serialization.parity import diff_serializers
-from shared.utils.hours_resolution import get_effective_hours_for_date
+from ...serialization.detail_json import DetailEncoder
+from ...serialization.shadow import ShadowComparator
+from shared.utils.hours_resolution import (
+    get_effective_hours_batch,
+    get_effective_hours_for_date,
+    hours_timezone,
+    is_open_at,
+)
+from shared.constants.poi_registry import load_registry
+from shared.utils.data_version import DataVersionCache, current_data_version
+from shared.utils.single_flight import SingleFlight
+from shared.utils.venue_inheritance import (
+    INHERITABLE_FIELDS,
+    VenueFieldsCache,
+    resolve_venue_inheritance,
+)
+from ..http_cache import (
+    JSON_MEDIA_TYPE,
+    cached_json_response,
+    encode_json,
+    if_none_match,
+    make_etag,
+    stream_json_array,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# GET /nearby bounds: result cap, radius cap (100 km), and how many extra
+# candidates to fetch so filtered-out past/cancelled events don't shorten a page.
+NEARBY_MAX_LIMIT = 50
+NEARBY_MAX_RADIUS_M = 100_000
+NEARBY_EVENT_OVERFETCH = 12
+
+# Seconds a request waits for an identical in-flight read before running it
+# itself (see shared/utils/single_flight.py).
+READ_COALESCE_WAIT_SECONDS = 5.0
+
+# Catalog-wide aggregates (category listing, ...), recomputed once per data
+# version rather than per request; concurrent misses share one recomputation.
+# See shared/utils/data_version.py.
+_response_cache = DataVersionCache(READ_COALESCE_WAIT_SECONDS)
+
+# Identical concurrent detail reads (a viral POI, a push notification) share one
+# validator lookup and one body build.
+_read_flights = SingleFlight(READ_COALESCE_WAIT_SECONDS)
+
+# Inheritable venue columns for event detail pages, keyed by venue last_updated
+# (many events share one venue).
+_venue_cache = VenueFieldsCache()
+
+# /pois/by-type and /pois/by-category page-size cap (unpaged requests get all).
+LISTING_MAX_LIMIT = 1000
+# Rows fetched per round trip while streaming an unpaged listing.
+LISTING_YIELD_PER = 500
+
+# Most POIs resolved by one GET /pois/effective-hours call.
+EFFECTIVE_HOURS_MAX_IDS = 200
+
 # Serializer cutover flag (phase B3). Read ONCE at import.
 #   legacy   -> the original POIDetail.model_validate(all-columns) path.
 #   registry -> registry-driven serialize_poi_detail (public-only; the new default).
-#   shadow   -> build BOTH, log the parity diff, RETURN legacy (prod observation).
+#   shadow   -> RETURN legacy; diff a sample against registry off-request (prod
+#               observation; POI_SERIALIZER_SHADOW_SAMPLE_RATE, default 0.1).
 POI_SERIALIZER = os.getenv("POI_SERIALIZER", "registry").strip().lower()
 
+# POI detail caching: browsers revalidate every view (a 304 costs one validator
+# lookup); shared caches/CDNs may serve a copy for 60s and a stale one for up
+# to 10 minutes while they revalidate in the background.
+DETAIL_CACHE_CONTROL = "public, max-age=0, s-maxage=60, stale-while-revalidate=600"
+_DETAIL_ETAG_SALT = (
+    POI_SERIALIZER,
+    DOCUMENT_FORMAT_VERSION,
+    hashlib.sha256(
+        json.dumps(load_registry(), sort_keys=True).encode("utf-8")
+    ).hexdigest(),
+)
+
 # Per-IP throttle on the search surface. The semantic + hybrid endpoints run a
 # 1GB embedding model on each request, so unbounded query rates / very long
 # input strings are an easy DoS. 60/min is enough for normal page-load traffic
@@ -79,38 +150,66 @@ def _exclude_past_and_cancelled_events(pois, include_past=False, include_cancell
     return result
 
 
+# Size variants exposed per image (admin image_service generates these).
+IMAGE_VARIANT_SIZES = ("thumbnail", "medium", "large", "xlarge")
+
+
 def get_poi_images(db: Session, poi_id: uuid.UUID) -> List[dict]:
-    """Get all images for a POI, returning only original images (not variants)"""
-    # Get original images
-    images = db.query(Image).filter(
+    """Get all images for a POI with every size variant URL, in ONE query.
+
+    Each original (``parent_image_id IS NULL``) is outer-joined to its variant
+    rows, so a gallery of N photos costs one round trip instead of N + 1.
+    ``variants`` maps each available size in ``IMAGE_VARIANT_SIZES`` to its URL;
+    ``thumbnail_url`` is kept for existing clients.
+    """
+    Variant = aliased(Image)
+    rows = db.query(
+        Image.id,
+        Image.storage_url,
+        Image.image_type,
+        Image.alt_text,
+        Image.caption,
+        Image.width,
+        Image.height,
+        Variant.image_size_variant,
+        Variant.storage_url.label('variant_url'),
+    ).outerjoin(
+        Variant,
+        and_(
+            # Variants carry their original's poi_id: both sides use the
+            # (poi_id, image_type) index.
+            Variant.poi_id == poi_id,
+            Variant.parent_image_id == Image.id,
+            Variant.image_size_variant.in_(IMAGE_VARIANT_SIZES),
+            Variant.storage_url.isnot(None),
+        ),
+    ).filter(
         Image.poi_id == poi_id,
-        Image.parent_image_id.is_(None)  # Only original images, not variants
-    ).order_by(Image.display_order).all()
+        Image.parent_image_id.is_(None),  # Only original images, not variants
+        Image.storage_url.isnot(None),
+    ).order_by(Image.display_order, Image.id).all()
 
     result = []
-    for img in images:
-        if not img.storage_url:
-            continue
-
-        # Try to find thumbnail variant
-        thumbnail_url = None
-        thumbnail = db.query(Image).filter(
-            Image.parent_image_id == img.id,
-            Image.image_size_variant == 'thumbnail'
-        ).first()
-        if thumbnail and thumbnail.storage_url:
-            thumbnail_url = thumbnail.storage_url
-
-        result.append({
-            'id': str(img.id),
-            'url': img.storage_url,
-            'thumbnail_url': thumbnail_url,
-            'type': img.image_type.value if hasattr(img.image_type, 'value') else img.image_type,
-            'alt_text': img.alt_text,
-            'caption': img.caption,
-            'width': img.width,
-            'height': img.height
-        })
+    by_id = {}
+    for row in rows:
+        img = by_id.get(row.id)
+        if img is None:
+            img = by_id[row.id] = {
+                'id': str(row.id),
+                'url': row.storage_url,
+                'thumbnail_url': None,
+                'type': row.image_type.value if hasattr(row.image_type, 'value') else row.image_type,
+                'alt_text': row.alt_text,
+                'caption': row.caption,
+                'width': row.width,
+                'height': row.height,
+                'variants': {},
+            }
+            result.append(img)
+        if row.image_size_variant:
+            img['variants'][row.image_size_variant] = row.variant_url
+            if row.image_size_variant == 'thumbnail':
+                img['thumbnail_url'] = row.variant_url
 
     return result
 
@@ -213,45 +312,33 @@ def api_hybrid_search_pois(
     results = multi_signal_search(db, query=q, limit=limit, poi_type=poi_type, client=embedding_client)
     return _apply_event_search_filters(results, date_from, date_to, event_status)
 
+def _venue_fields(db: Session, venue_id) -> Optional[dict]:
+    """The venue's inheritable fields, cached until its ``last_updated`` moves."""
+    stamp = crud.crud_poi.get_venue_stamp(db, venue_id)
+    if stamp is None:
+        return None
+    return _venue_cache.get(
+        str(venue_id),
+        stamp.last_updated,
+        lambda: crud.crud_poi.get_venue_fields(db, venue_id),
+    )
+
+
 def _apply_venue_inheritance(db: Session, poi_dict: dict, event) -> dict:
     """If event has venue_poi_id, resolve venue inheritance and merge into poi_dict."""
     if not event or not getattr(event, 'venue_poi_id', None):
         return poi_dict
 
-    venue_poi = crud.crud_poi.get_poi(db, poi_id=str(event.venue_poi_id))
-    if not venue_poi:
+    venue_fields = _venue_fields(db, event.venue_poi_id)
+    if not venue_fields:
         return poi_dict
 
-    from shared.utils.venue_inheritance import resolve_venue_inheritance
-
-    venue_data = {
-        column.name: getattr(venue_poi, column.name)
-        for column in venue_poi.__table__.columns
-    }
-    event_data = {
-        column.name: getattr(poi_dict, column.name)
-        if hasattr(poi_dict, column.name)
-        else poi_dict.get(column.name)
-        for column in venue_poi.__table__.columns
-    }
-
-    # Build a simpler dict from poi_dict for the fields we care about
-    inheritable_fields = [
-        "parking_types", "parking_locations", "parking_notes", "expect_to_pay_parking",
-        # public_transit_info removed (Migration A #33 — renamed to _deprecated_public_transit_info)
-        "public_toilets", "toilet_locations", "toilet_description",
-        # wheelchair_accessible removed (Issue #45 PR2 Migration B — column dropped)
-        "wheelchair_details", "hours", "amenities",
-        "pet_options", "pet_policy", "drone_usage", "drone_policy",
-    ]
-    event_fields = {f: poi_dict.get(f) for f in inheritable_fields}
-    venue_fields = {f: getattr(venue_poi, f, None) for f in inheritable_fields}
-
+    event_fields = {f: poi_dict.get(f) for f in INHERITABLE_FIELDS}
     config = getattr(event, 'venue_inheritance', None)
     resolved = resolve_venue_inheritance(event_fields, venue_fields, config)
 
     # Merge resolved fields back into poi_dict
-    for field in inheritable_fields:
+    for field in INHERITABLE_FIELDS:
         if field in resolved:
             poi_dict[field] = resolved[field]
     if "_venue_source" in resolved:
@@ -285,6 +372,9 @@ def _attach_structural_objects(db_poi, poi_dict: dict, images: list) -> dict:
     return poi_dict
 
 
+# Registry detail bodies are encoded straight to JSON (no POIDetail round trip).
+_DETAIL_ENCODER = DetailEncoder(schemas.poi.POIDetail)
+
 # Declared top-level fields on POIDetail. Used to prune the legacy all-columns
 # dict so the legacy/shadow path NEVER leaks admin/PII columns now that POIDetail
 # carries extra="allow" (pre-B3 this pruning was implicit via extra="ignore").
@@ -337,32 +427,47 @@ def _build_registry_detail_dict(db: Session, db_poi, images: list) -> dict:
     return poi_dict
 
 
+def _shadow_compare(poi_id):
+    """Diff the legacy and registry payloads of ``poi_id`` in a fresh session."""
+    db = SessionLocal()
+    try:
+        db_poi = crud.crud_poi.get_poi(db, poi_id=str(poi_id))
+        if db_poi is None:
+            return None
+        images = get_poi_images(db, db_poi.id)
+        legacy_dict = _build_legacy_detail_dict(db, db_poi, images)
+        registry_dict = _build_registry_detail_dict(db, db_poi, images)
+        return diff_serializers(jsonable_encoder(legacy_dict), jsonable_encoder(registry_dict))
+    finally:
+        db.close()
+
+
+_shadow_comparator = ShadowComparator(_shadow_compare)
+
+
 def _serialize_detail_response(db: Session, db_poi, images: list):
     """Return the POI detail payload honoring the POI_SERIALIZER flag.
 
     * legacy   -> validate the (PII-pruned) all-columns dict through POIDetail and
       let ``response_model`` serialize it (unchanged pre-B3 wire shape).
-    * registry -> validate the public-only registry dict through POIDetail
-      (``extra="allow"`` keeps the restored public flat fields that POIDetail does
-      not declare), then return a ``JSONResponse`` of the JSON dump filtered to the
-      TOP-LEVEL keys that were actually provided.
-      Returning a Response bypasses ``response_model`` filtering so the extra
-      public keys reach the wire. The filtering is the key: POIDetail DECLARES
-      ~every POI field, so a plain ``model_dump`` / ``jsonable_encoder`` would emit
-      EVERY declared field (as ``None``) regardless of ``poi_type`` — polluting
-      the per-type response. We instead keep only ``model.model_fields_set``,
-      which in Pydantic v2 (with ``extra="allow"``) is exactly (a) declared fields
-      that were provided in the registry dict + (b) all extra (registry) keys, and
-      EXCLUDES declared-but-not-provided fields. So the response == the per-type
-      public registry keys + structural keys.
-
-      We dump with ``mode="json"`` (so datetimes -> ISO, UUID -> str,
-      PointGeometry -> ``{type, coordinates}``, nested subtype / category / image
-      sub-schemas serialize exactly as Pydantic would) and then filter at the TOP
-      LEVEL only — NOT ``exclude_unset=True``, which would also strip nested model
-      DEFAULTS (e.g. ``location.type == "Point"``, which ``PointGeometry.from_wkb``
-      leaves at its default), corrupting the structural shape.
-    * shadow   -> build BOTH, log the diff at WARNING, RETURN legacy unchanged.
+    * registry -> return a pre-encoded JSON ``Response`` of exactly the keys the
+      public-only registry dict provides: the per-type public registry keys +
+      structural keys, NOT every POIDetail-declared field as None. Returning a
+      Response bypasses ``response_model`` filtering so the extra public keys
+      reach the wire.
+
+      The body equals what validating the dict through POIDetail
+      (``extra="allow"``), dumping with ``mode="json"`` and keeping only
+      ``model_fields_set`` produced — datetimes -> ISO, UUID -> str,
+      PointGeometry -> ``{type, coordinates}``, nested subtype / category /
+      image sub-schemas with all their declared fields and defaults — but
+      ``_DETAIL_ENCODER`` writes it directly from encoders compiled from the
+      POIDetail annotations, skipping the validate + full dump of every
+      declared field (``tests/test_detail_json_parity.py`` guards the
+      equivalence).
+    * shadow   -> RETURN legacy unchanged; a sample of requests is rebuilt with
+      BOTH serializers and diffed off-request (``_shadow_compare``), with the
+      results aggregated per key (see app/serialization/shadow.py).
     """
     if POI_SERIALIZER == "legacy":
         legacy_dict = _build_legacy_detail_dict(db, db_poi, images)
@@ -370,131 +475,272 @@ def _serialize_detail_response(db: Session, db_poi, images: list):
 
     if POI_SERIALIZER == "shadow":
         legacy_dict = _build_legacy_detail_dict(db, db_poi, images)
-        try:
-            registry_dict = _build_registry_detail_dict(db, db_poi, images)
-            diff = diff_serializers(
-                jsonable_encoder(legacy_dict), jsonable_encoder(registry_dict)
-            )
-            if diff["keys_added"] or diff["keys_removed"] or diff["value_mismatches"]:
-                logger.warning(
-                    "POI serializer shadow diff poi_id=%s keys_added=%s "
-                    "keys_removed=%s value_mismatches=%s",
-                    db_poi.id,
-                    diff["keys_added"],
-                    diff["keys_removed"],
-                    [m["key"] for m in diff["value_mismatches"]],
-                )
-        except Exception:  # observation must never break the response
-            logger.exception("POI serializer shadow diff failed poi_id=%s", db_poi.id)
-        # Zero behavior change: return the legacy payload.
+        # The diff runs for a sample of requests on a background thread; the
+        # response never waits for it. Zero behavior change: return legacy.
+        _shadow_comparator.submit(db_poi.id)
         return schemas.poi.POIDetail.model_validate(legacy_dict)
 
-    # Default: registry. Validate through POIDetail (extra="allow" keeps the
-    # restored public fields) then JSON-encode so datetimes/UUIDs/geometry are
-    # serialized identically to the legacy path.
+    # Default: registry. Encode the provided keys straight to JSON with the
+    # POIDetail-derived encoders (see app/serialization/detail_json.py).
     registry_dict = _build_registry_detail_dict(db, db_poi, images)
-    model = schemas.poi.POIDetail.model_validate(registry_dict)
-    # Keep only the TOP-LEVEL keys that were actually provided (declared-provided +
-    # extra registry keys) so the wire shape is the clean per-type public registry
-    # set + structural keys, NOT every POIDetail-declared field as None. Filtering by
-    # model_fields_set (rather than exclude_unset=True) preserves nested model
-    # defaults like location.type=="Point". See the docstring above for rationale.
-    full = model.model_dump(mode="json")
-    provided = model.model_fields_set
-    content = {key: value for key, value in full.items() if key in provided}
-    return JSONResponse(content=content)
+    return Response(content=_DETAIL_ENCODER.encode(registry_dict), media_type=JSON_MEDIA_TYPE)
 
 
 @router.get("/pois/counts")
-def api_get_poi_counts(db: Session = Depends(get_db)):
-    """Return published POI counts by type and by amenity (pet-friendly / icon_wheelchair_accessible)."""
-    POI = models.poi.PointOfInterest
-    base = db.query(POI).filter(POI.publication_status == 'published')
-    by_type = {
-        t: base.filter(POI.poi_type == t).count()
-        for t in ['BUSINESS', 'PARK', 'TRAIL', 'EVENT']
-    }
-    return {
-        "by_type": by_type,
-        "by_amenity": {
-            "pet_friendly": base.filter(POI.icon_pet_friendly.is_(True)).count(),
-            "wheelchair_accessible": base.filter(POI.icon_wheelchair_accessible.is_(True)).count(),
-        },
-    }
+def api_get_poi_counts(
+    request: Request,
+    breakdown: Optional[str] = Query(
+        None, description="Also break the counts down by: city, county, or category"
+    ),
+    db: Session = Depends(get_db),
+):
+    """Return published POI counts by type and by amenity (pet-friendly / icon_wheelchair_accessible).
+
+    One ``count(*) FILTER`` statement (plus the optional breakdown in the same
+    pass), memoized per data version and served with a version ETag.
+    """
+    if breakdown is not None:
+        breakdown = breakdown.lower()
+        if breakdown not in crud.crud_poi.POI_COUNT_BREAKDOWNS:
+            raise HTTPException(status_code=400, detail="Invalid breakdown")
+
+    version = current_data_version(db)
+    body = _response_cache.get(
+        version,
+        ("poi_counts", breakdown),
+        lambda: encode_json(crud.crud_poi.count_published_pois(db, breakdown=breakdown)),
+    )
+    return cached_json_response(
+        request, make_etag("counts", breakdown or "all", version), body
+    )
 
 
-@router.get("/pois/{poi_id}", response_model=schemas.poi.POIDetail)
-def api_get_poi(poi_id: uuid.UUID, db: Session = Depends(get_db)):
-    db_poi = crud.crud_poi.get_poi(db, poi_id=str(poi_id))
-    if db_poi is None:
-        raise HTTPException(status_code=404, detail="Point of Interest not found")
+def _detail_etag(poi_id, parts) -> str:
+    """Strong ETag for a POI detail payload (see crud_poi.get_detail_validator).
+
+    Salted with the serializer mode, ``DOCUMENT_FORMAT_VERSION`` and the field
+    registry so a deploy that changes the payload shape never revalidates an
+    old representation or serves a document stored by the previous serializer.
+    """
+    digest = hashlib.sha256(
+        repr((_DETAIL_ETAG_SALT, str(poi_id), parts)).encode("utf-8")
+    ).hexdigest()
+    return make_etag("poi", digest[:32])
+
+
+def current_detail_etag(db: Session, poi_id=None, slug: str = None) -> Optional[str]:
+    """The ETag the detail of a published POI has right now, or ``None``."""
+    validator = crud.crud_poi.get_detail_validator(db, poi_id=poi_id, slug=slug)
+    return _detail_etag(*validator) if validator is not None else None
+
+
+def _detail_payload(db: Session, poi_id, etag: str, load_poi):
+    """The detail body for ``etag``: encoded bytes (registry) or a ``POIDetail``.
+
+    ``None`` when the POI disappeared after its validator was read.
+    """
+    # Pre-serialized bytes from public_poi_documents, if built for this ETag.
+    stored = crud.crud_public_document.get_detail_document(db, poi_id)
+    if stored is not None and stored[0] == etag:
+        return stored[1]
 
-    images = get_poi_images(db, poi_id)
+    db_poi = load_poi(poi_id)
+    if db_poi is None:
+        return None
+    images = get_poi_images(db, db_poi.id)
     # Honors the POI_SERIALIZER flag (legacy | registry | shadow). Registry is
     # the default and returns a public-only payload (no PII) via the registry
     # serializer; legacy/shadow preserve the pre-B3 behavior.
-    return _serialize_detail_response(db, db_poi, images)
+    result = _serialize_detail_response(db, db_poi, images)
+    return result.body if isinstance(result, Response) else result
+
+
+def _detail_response(request: Request, response: Response, db: Session, key, get_validator, load_poi):
+    """304 from the validator alone, else the serialized detail with cache headers.
+
+    ``load_poi(poi_id)`` runs only on a miss, so a repeat view of an unchanged
+    POI costs the single validator lookup. Concurrent requests share the
+    validator lookup per ``key`` (route and id or slug) and the body per route
+    and ETag (``_read_flights``) — a body is never handed to a route whose
+    ``load_poi`` did not build it. Only the 304 decision and headers are per
+    request.
+    """
+    validator = _read_flights.do(key, get_validator)
+    if validator is None:
+        raise HTTPException(status_code=404, detail="Point of Interest not found")
+    poi_id, parts = validator
+    etag = _detail_etag(poi_id, parts)
+    headers = {"ETag": etag, "Cache-Control": DETAIL_CACHE_CONTROL}
+    if if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    payload = _read_flights.do(
+        ("detail", key[0], etag), lambda: _detail_payload(db, poi_id, etag, load_poi)
+    )
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Point of Interest not found")
+    if isinstance(payload, bytes):
+        return Response(content=payload, media_type=JSON_MEDIA_TYPE, headers=headers)
+    # Legacy/shadow return a model that FastAPI serializes, merging the
+    # injected ``response`` headers.
+    response.headers.update(headers)
+    return payload
+
+
+def _card_json(db_poi) -> bytes:
+    """Encoded ``POINearbyResult`` card of ``db_poi`` without ``distance_meters``."""
+    card = schemas.poi.POINearbyResult.model_validate(serialize_poi_card(db_poi))
+    return encode_json(card.model_dump(mode="json", exclude={"distance_meters"}))
+
+
+def _with_distance(card_json: bytes, distance) -> bytes:
+    """Append the per-query ``distance_meters`` to an encoded card object."""
+    return card_json[:-1] + b',"distance_meters":' + encode_json(distance) + b"}"
+
+
+def build_public_documents(db: Session, poi_id):
+    """Serialize one POI for ``public_poi_documents``.
+
+    Returns ``(etag, last_updated, detail_json, card_json)``, or ``None`` when
+    the POI is not published. The validator is read BEFORE the POI is loaded,
+    so a concurrent write can only leave a document whose ETag is older than
+    its body — which readers treat as stale — never the reverse. The detail
+    body is only stored for the registry serializer (the one that returns
+    pre-encoded JSON); other modes keep serializing per request.
+    """
+    validator = crud.crud_poi.get_detail_validator(db, poi_id=poi_id)
+    if validator is None:
+        return None
+    db_poi = crud.crud_poi.get_poi(db, poi_id=str(poi_id))
+    if db_poi is None:
+        return None
+    detail_json = None
+    if POI_SERIALIZER == "registry":
+        images = get_poi_images(db, db_poi.id)
+        detail_json = _serialize_detail_response(db, db_poi, images).body
+    return _detail_etag(*validator), db_poi.last_updated, detail_json, _card_json(db_poi)
+
+
+# Registered before /pois/{poi_id} so "effective-hours" is not parsed as an id.
+@router.get("/pois/effective-hours")
+def api_get_effective_hours_batch(
+    ids: List[uuid.UUID] = Query(..., description="POI ids (repeat the parameter)"),
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format"),
+    at: Optional[datetime] = Query(None, description="ISO datetime (defaults to now)"),
+    db: Session = Depends(get_db),
+):
+    """Effective hours for many POIs in one call, keyed by POI id.
+
+    With ``date``, each entry is that day's effective hours. Otherwise each
+    entry is for the POI's local day at ``at`` (default now) and adds
+    ``is_open`` — the listing "Open now" badge. Unknown or unpublished ids are
+    left out.
+    """
+    if len(ids) > EFFECTIVE_HOURS_MAX_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {EFFECTIVE_HOURS_MAX_IDS} ids per request."
+        )
+    hours_by_id = crud.crud_open_hours.get_published_hours(db, ids)
+
+    if date:
+        try:
+            target_date = date_type.fromisoformat(date)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
+        resolved = get_effective_hours_batch(hours_by_id, target_date)
+        return {str(poi_id): result for poi_id, result in resolved.items()}
+
+    if at is None:
+        at = datetime.now(timezone.utc)
+    elif at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    results = {}
+    for poi_id, hours_data in hours_by_id.items():
+        local_date = at.astimezone(hours_timezone(hours_data)).date()
+        result = get_effective_hours_for_date(hours_data, local_date)
+        result["is_open"] = is_open_at(hours_data, at)
+        results[str(poi_id)] = result
+    return results
+
+
+@router.get("/pois/{poi_id}", response_model=schemas.poi.POIDetail)
+def api_get_poi(
+    poi_id: uuid.UUID, request: Request, response: Response, db: Session = Depends(get_db)
+):
+    return _detail_response(
+        request, response, db, ("poi", poi_id),
+        lambda: crud.crud_poi.get_detail_validator(db, poi_id=poi_id),
+        lambda validated_id: crud.crud_poi.get_poi(db, poi_id=str(validated_id)),
+    )
 
 @router.get("/pois/by-slug/{slug}", response_model=schemas.poi.POIDetail)
-def api_get_poi_by_slug(slug: str, db: Session = Depends(get_db)):
+def api_get_poi_by_slug(
+    slug: str, request: Request, response: Response, db: Session = Depends(get_db)
+):
     """
     Get POI by slug for SEO-friendly URLs
     Example: /api/pois/by-slug/best-coffee-shop-downtown
     """
-    db_poi = db.query(models.poi.PointOfInterest).filter(
-        models.poi.PointOfInterest.slug == slug,
-        models.poi.PointOfInterest.publication_status == 'published'
-    ).first()
-
-    if db_poi is None:
-        raise HTTPException(status_code=404, detail="Point of Interest not found")
-
-    images = get_poi_images(db, db_poi.id)
-    # Same POI_SERIALIZER flag handling as GET /pois/{id} (registry default).
-    return _serialize_detail_response(db, db_poi, images)
+    # The validator resolves the slug to an id; load through get_poi like
+    # GET /pois/{id} (and the stored documents) so both routes serve one
+    # representation (category info included) under one ETag.
+    return _detail_response(
+        request, response, db, ("poi-slug", slug),
+        lambda: crud.crud_poi.get_detail_validator(db, slug=slug),
+        lambda validated_id: crud.crud_poi.get_poi(db, poi_id=str(validated_id)),
+    )
 
 @router.get("/nearby", response_model=List[schemas.poi.POINearbyResult])
 def api_get_nearby_pois(
     latitude: float = Query(..., ge=-90, le=90),
     longitude: float = Query(..., ge=-180, le=180),
+    radius_m: Optional[float] = Query(None, gt=0, le=NEARBY_MAX_RADIUS_M, description="Only POIs within this many meters"),
+    poi_type: Optional[str] = Query(None, description="Filter by POI type (e.g. BUSINESS, PARK)"),
+    limit: int = Query(8, ge=1, le=NEARBY_MAX_LIMIT, description="Maximum results"),
     include_past_events: bool = Query(False, description="Include past events in results"),
     db: Session = Depends(get_db),
 ):
-    from sqlalchemy import literal_column
-    from sqlalchemy.orm import joinedload
-
-    # Use geography type for accurate distance in meters
-    distance_expr = literal_column(
-        f"ST_Distance(location::geography, ST_MakePoint({longitude}, {latitude})::geography)"
+    if poi_type:
+        poi_type = poi_type.upper()
+        if poi_type not in ['BUSINESS', 'PARK', 'TRAIL', 'EVENT']:
+            raise HTTPException(status_code=400, detail="Invalid POI type")
+
+    # Nearest published POIs via the geography KNN index. Over-fetch a little so
+    # past/cancelled events dropped below still leave ``limit`` results.
+    candidates = crud.crud_poi.get_pois_near_point(
+        db,
+        latitude=latitude,
+        longitude=longitude,
+        limit=limit + NEARBY_EVENT_OVERFETCH,
+        radius_m=radius_m,
+        poi_type=poi_type,
+        with_card=True,
     )
 
-    # Find the 8 nearest published POIs (fetch more to account for filtering)
-    nearby_pois_with_distance = db.query(
-        models.poi.PointOfInterest,
-        distance_expr.label('distance_meters')
-    ).options(
-        joinedload(models.poi.PointOfInterest.event)
-    ).filter(
-        models.poi.PointOfInterest.publication_status == 'published'
-    ).order_by('distance_meters').limit(20).all()
-
-    # Filter past/cancelled events, then limit to 8
-    filtered_pairs = []
-    for poi, distance in nearby_pois_with_distance:
-        filtered = _exclude_past_and_cancelled_events([poi], include_past=include_past_events)
-        if filtered:
-            filtered_pairs.append((poi, distance))
-    filtered_pairs = filtered_pairs[:8]
-
-    # Format results with distance. Card body is built by the registry-driven
-    # serialize_poi_card (public-only); the per-query distance is attached on top.
-    results = []
-    for poi, distance in filtered_pairs:
-        poi_dict = serialize_poi_card(poi)
-        poi_dict['distance_meters'] = distance
-        results.append(schemas.poi.POINearbyResult.model_validate(poi_dict))
+    # Filter past/cancelled events, then limit
+    filtered = []
+    for poi, distance, etag, card_json in candidates:
+        if _exclude_past_and_cancelled_events([poi], include_past=include_past_events):
+            filtered.append((poi, distance, etag, card_json))
+    filtered = filtered[:limit]
+
+    # A stored card is current only while its document's ETag matches the live
+    # validator (POI row, subtype row, images, categories, venue) — one batched
+    # lookup for the page.
+    validators = crud.crud_poi.get_detail_validators(
+        db, [poi.id for poi, _distance, etag, _card in filtered if etag is not None]
+    )
 
-    return results
+    # Card bodies come pre-encoded from public_poi_documents when current, else
+    # from the registry-driven serialize_poi_card (public-only); the per-query
+    # distance is appended to each.
+    items = []
+    for poi, distance, etag, card_json in filtered:
+        parts = validators.get(poi.id)
+        if card_json is None or parts is None or etag != _detail_etag(poi.id, parts):
+            card_json = _card_json(poi)
+        items.append(_with_distance(bytes(card_json), distance))
+    return Response(content=b"[" + b",".join(items) + b"]", media_type=JSON_MEDIA_TYPE)
 
 @router.get("/pois/{poi_id}/effective-hours")
 def api_get_effective_hours(
@@ -523,27 +769,51 @@ def api_get_effective_hours(
 @router.get("/pois/{poi_id}/nearby", response_model=List[schemas.poi.POINearbyResult])
 def api_get_nearby_pois_by_id(
     poi_id: uuid.UUID,
+    response: Response,
     radius_miles: float = Query(5.0, description="Search radius in miles"),
+    limit: int = Query(
+        crud.crud_poi.NEARBY_BY_POI_DEFAULT_LIMIT,
+        ge=1,
+        le=crud.crud_poi.NEARBY_BY_POI_MAX_LIMIT,
+        description="Maximum results per page",
+    ),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     include_past_events: bool = Query(False, description="Include past events in results"),
     db: Session = Depends(get_db),
 ):
-    nearby_pois = crud.crud_poi.get_nearby_pois(db, poi_id=str(poi_id), radius_miles=radius_miles)
-    nearby_pois = _exclude_past_and_cancelled_events(nearby_pois, include_past=include_past_events)
+    after_distance = after_id = None
+    if cursor:
+        try:
+            distance_part, id_part = cursor.split(",", 1)
+            after_distance, after_id = float(distance_part), uuid.UUID(id_part)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    page = crud.crud_poi.get_nearby_pois(
+        db,
+        poi_id=str(poi_id),
+        radius_miles=radius_miles,
+        limit=limit,
+        after_distance=after_distance,
+        after_id=after_id,
+    )
+    # Keyset cursor from the last DB row (before event filtering), only when the
+    # page is full — a short page means there is nothing further out.
+    if len(page) == limit:
+        last = page[-1]
+        response.headers["X-Next-Cursor"] = f"{last.distance_meters!r},{last.id}"
+    nearby_pois = _exclude_past_and_cancelled_events(page, include_past=include_past_events)
 
     # Convert location data for each POI. Card body is built by the registry-driven
     # serialize_poi_card (public-only); the per-query distance and the {id,name,slug}
-    # categories list this endpoint surfaces are attached on top.
+    # categories list this endpoint surfaces are attached on top. ``categories``
+    # was batch-loaded by get_nearby_pois, so this never lazy-loads.
     results = []
     for poi in nearby_pois:
-        # Get categories for this POI (id/name/slug shape used by the cards)
-        categories_data = []
-        if hasattr(poi, 'categories') and poi.categories:
-            for cat in poi.categories:
-                categories_data.append({
-                    'id': str(cat.id),
-                    'name': cat.name,
-                    'slug': cat.slug
-                })
+        categories_data = [
+            {'id': str(cat.id), 'name': cat.name, 'slug': cat.slug}
+            for cat in poi.categories
+        ]
 
         poi_dict = serialize_poi_card(poi)
         poi_dict['distance_meters'] = poi.distance_meters
@@ -553,40 +823,124 @@ def api_get_nearby_pois_by_id(
     return results
 
 @router.get("/categories")
-def api_get_categories(db: Session = Depends(get_db)):
-    """Get all active categories with POI counts"""
-    # Get all active main categories (parent categories only)
-    categories = db.query(models.poi.Category).filter(
-        models.poi.Category.is_active == True,
-        models.poi.Category.parent_id == None
-    ).order_by(models.poi.Category.sort_order, models.poi.Category.name).all()
+def api_get_categories(request: Request, db: Session = Depends(get_db)):
+    """Get all active categories with POI counts.
 
-    result = []
-    for cat in categories:
-        # Count published POIs for this category
-        poi_count = db.query(models.poi.PointOfInterest).join(
-            models.poi.poi_category_association
-        ).filter(
-            models.poi.poi_category_association.c.category_id == cat.id,
-            models.poi.PointOfInterest.publication_status == 'published'
-        ).count()
-
-        category_data = {
-            'id': str(cat.id),
-            'name': cat.name,
-            'slug': cat.slug,
-            'poi_count': poi_count,
-            'is_main_category': cat.parent_id is None,
-            'sort_order': cat.sort_order
-        }
-        result.append(category_data)
+    One aggregated query, computed at most once per data version and served
+    with an ETag derived from that version (``If-None-Match`` -> 304).
+    """
+    version = current_data_version(db)
+
+    def _build() -> bytes:
+        result = []
+        for cat, poi_count in crud.crud_poi.list_categories_with_counts(db):
+            result.append({
+                'id': str(cat.id),
+                'name': cat.name,
+                'slug': cat.slug,
+                'poi_count': poi_count,
+                'is_main_category': cat.parent_id is None,
+                'sort_order': cat.sort_order
+            })
+        return encode_json(result)
+
+    body = _response_cache.get(version, "categories", _build)
+    return cached_json_response(request, make_etag("categories", version), body)
+
+def _encode_listing_cursor(row) -> str:
+    """Opaque keyset cursor for the ``(name, id)`` ordering of the listings."""
+    raw = json.dumps([row.name, str(row.id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_listing_cursor(cursor: Optional[str]):
+    """``(after_name, after_id)`` from a listing cursor; ``(None, None)`` without one."""
+    if not cursor:
+        return None, None
+    try:
+        name, poi_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return name, uuid.UUID(poi_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _listing_location(row):
+    if row.longitude is None:
+        return None
+    return {'type': 'Point', 'coordinates': [row.longitude, row.latitude]}
+
+
+def _stream_listing(rows, limit, to_item, prefix=b"", suffix=b"", encode_cursor=_encode_listing_cursor):
+    """StreamingResponse of the listing; ``X-Next-Cursor`` when the page is full."""
+    headers = {}
+    if limit is not None and len(rows) == limit:
+        headers["X-Next-Cursor"] = encode_cursor(rows[-1])
+    return StreamingResponse(
+        stream_json_array((to_item(row) for row in rows), prefix=prefix, suffix=suffix),
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+def _listing_response(db: Session, query, limit, to_items, prefix=b"", suffix=b""):
+    """Streamed listing of a ``published_cards_query``.
+
+    ``to_items(db, rows)`` turns a batch of rows into response items. A page
+    (``limit``) is loaded in the request's session and carries
+    ``X-Next-Cursor`` when full. An unpaged listing is read from a
+    ``yield_per`` cursor on a session of its own (the request's is released
+    before the body is sent, as for the sitemaps), so at most
+    ``LISTING_YIELD_PER`` rows are held however large the catalog.
+    """
+    if limit is not None:
+        rows = query.all()
+        headers = {"X-Next-Cursor": _encode_listing_cursor(rows[-1])} if len(rows) == limit else {}
+        return StreamingResponse(
+            stream_json_array(to_items(db, rows), prefix=prefix, suffix=suffix),
+            media_type=JSON_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    def _items():
+        stream_db = SessionLocal()
+        try:
+            batch = []
+            for row in query.with_session(stream_db).yield_per(LISTING_YIELD_PER):
+                batch.append(row)
+                if len(batch) >= LISTING_YIELD_PER:
+                    yield from to_items(stream_db, batch)
+                    batch = []
+            if batch:
+                yield from to_items(stream_db, batch)
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(
+        stream_json_array(_items(), prefix=prefix, suffix=suffix),
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def _open_rows_only(to_items, open_at):
+    """``to_items`` for a listing filtered with ``open_at``: drops the rows not open then.
+
+    The cursor still follows the unfiltered rows, so a page can come back
+    short while the open-hours index is behind.
+    """
+    if open_at is None:
+        return to_items
+    return lambda items_db, rows: to_items(
+        items_db, crud.crud_open_hours.keep_open_rows(rows, open_at)
+    )
 
-    return result
 
 @router.get("/pois/by-category/{category_slug}")
 def api_get_pois_by_category(
     category_slug: str,
     include_past_events: bool = Query(False, description="Include past events in results"),
+    limit: Optional[int] = Query(None, ge=1, le=LISTING_MAX_LIMIT, description="Page size (default: all)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    open_now: bool = Query(False, description="Only POIs open right now"),
     db: Session = Depends(get_db),
 ):
     """Get all POIs for a specific category"""
@@ -599,62 +953,75 @@ def api_get_pois_by_category(
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
-    # Get all published POIs for this category
-    from sqlalchemy.orm import joinedload
-    pois = db.query(models.poi.PointOfInterest).options(
-        joinedload(models.poi.PointOfInterest.event)
-    ).join(
-        models.poi.poi_category_association
-    ).filter(
-        models.poi.poi_category_association.c.category_id == category.id,
-        models.poi.PointOfInterest.publication_status == 'published'
-    ).all()
-
-    # Filter past/cancelled events
-    pois = _exclude_past_and_cancelled_events(pois, include_past=include_past_events)
+    # Published POIs for this category, projected to the listing fields (past /
+    # cancelled events are filtered in SQL), ordered by (name, id).
+    POI = models.poi.PointOfInterest
+    Event = models.poi.Event
+    after_name, after_id = _decode_listing_cursor(cursor)
+    open_at = datetime.now(timezone.utc) if open_now else None
+    query = crud.crud_poi.published_cards_query(
+        db,
+        columns=[
+            POI.id, POI.name, POI.poi_type, POI.address_city, POI.address_street,
+            POI.description_short, POI.hours,
+            *crud.crud_poi.location_columns(),
+            Event.poi_id.label('event_poi_id'),
+            Event.start_datetime, Event.end_datetime, Event.is_repeating,
+            Event.event_status, Event.organizer_name, Event.venue_poi_id, Event.cost_type,
+        ],
+        category_id=category.id,
+        include_past_events=include_past_events,
+        excluded_event_statuses=_EXCLUDED_EVENT_STATUSES,
+        limit=limit,
+        after_name=after_name,
+        after_id=after_id,
+        open_at=open_at,
+    )
 
-    # Format results
-    results = []
-    for poi in pois:
+    def _item(row):
         poi_dict = {
-            'id': poi.id,
-            'name': poi.name,
-            'poi_type': poi.poi_type.value if hasattr(poi.poi_type, 'value') else poi.poi_type,
-            'address_city': poi.address_city,
-            'address_street': poi.address_street,
-            'description_short': poi.description_short,
-            'location': PointGeometry.from_wkb(poi.location) if poi.location else None,
-            'hours': poi.hours,
+            'id': row.id,
+            'name': row.name,
+            'poi_type': row.poi_type.value if hasattr(row.poi_type, 'value') else row.poi_type,
+            'address_city': row.address_city,
+            'address_street': row.address_street,
+            'description_short': row.description_short,
+            'location': _listing_location(row),
+            'hours': row.hours,
             # wheelchair_accessible removed (Issue #45 PR2 Migration B — column dropped)
         }
 
         # Add event-specific data if it's an event
-        if poi.event:
+        if row.event_poi_id is not None:
             poi_dict['event'] = {
-                'start_datetime': poi.event.start_datetime.isoformat() if poi.event.start_datetime else None,
-                'end_datetime': poi.event.end_datetime.isoformat() if poi.event.end_datetime else None,
-                'is_repeating': poi.event.is_repeating,
-                'event_status': poi.event.event_status,
-                'organizer_name': poi.event.organizer_name,
-                'venue_poi_id': str(poi.event.venue_poi_id) if poi.event.venue_poi_id else None,
-                'cost_type': poi.event.cost_type,
+                'start_datetime': row.start_datetime.isoformat() if row.start_datetime else None,
+                'end_datetime': row.end_datetime.isoformat() if row.end_datetime else None,
+                'is_repeating': row.is_repeating,
+                'event_status': row.event_status,
+                'organizer_name': row.organizer_name,
+                'venue_poi_id': str(row.venue_poi_id) if row.venue_poi_id else None,
+                'cost_type': row.cost_type,
             }
+        return poi_dict
 
-        results.append(poi_dict)
-
-    return {
-        'category': {
-            'id': str(category.id),
-            'name': category.name,
-            'slug': category.slug
-        },
-        'pois': results
-    }
+    category_json = encode_json({
+        'id': str(category.id),
+        'name': category.name,
+        'slug': category.slug
+    })
+    return _listing_response(
+        db, query, limit, _open_rows_only(lambda _db, rows: map(_item, rows), open_at),
+        prefix=b'{"category":' + category_json + b',"pois":',
+        suffix=b'}',
+    )
 
 @router.get("/pois/by-type/{poi_type}")
 def api_get_pois_by_type(
     poi_type: str,
     include_past_events: bool = Query(False, description="Include past events in results"),
+    limit: Optional[int] = Query(None, ge=1, le=LISTING_MAX_LIMIT, description="Page size (default: all)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    open_now: bool = Query(False, description="Only POIs open right now"),
     db: Session = Depends(get_db),
 ):
     """Get all POIs for a specific type (BUSINESS, PARK, TRAIL, EVENT)"""
@@ -663,64 +1030,92 @@ def api_get_pois_by_type(
     if poi_type.upper() not in valid_types:
         raise HTTPException(status_code=400, detail="Invalid POI type")
 
-    # Get all published POIs for this type
-    from sqlalchemy.orm import joinedload
-    pois = db.query(models.poi.PointOfInterest).options(
-        joinedload(models.poi.PointOfInterest.event)
-    ).filter(
-        models.poi.PointOfInterest.poi_type == poi_type.upper(),
-        models.poi.PointOfInterest.publication_status == 'published'
-    ).all()
-
-    # Filter past/cancelled events
-    pois = _exclude_past_and_cancelled_events(pois, include_past=include_past_events)
-
-    # Format results
-    results = []
-    for poi in pois:
-        # Categories — list[{id,name,slug}] for client-side category-name rendering on cards.
-        categories_data = []
-        if hasattr(poi, 'categories') and poi.categories:
-            for cat in poi.categories:
-                categories_data.append({
-                    'id': str(cat.id),
-                    'name': cat.name,
-                    'slug': cat.slug,
-                })
+    # Published POIs of this type, projected to the card fields (past /
+    # cancelled events are filtered in SQL), ordered by (name, id).
+    POI = models.poi.PointOfInterest
+    after_name, after_id = _decode_listing_cursor(cursor)
+    open_at = datetime.now(timezone.utc) if open_now else None
+    query = crud.crud_poi.published_cards_query(
+        db,
+        columns=[
+            POI.id, POI.name, POI.slug, POI.poi_type,
+            POI.address_city, POI.address_state, POI.address_county, POI.address_street,
+            POI.description_short, POI.hours, POI.pet_options, POI.wifi_options,
+            POI.public_toilets,
+            *crud.crud_poi.location_columns(),
+        ],
+        poi_type=poi_type.upper(),
+        include_past_events=include_past_events,
+        excluded_event_statuses=_EXCLUDED_EVENT_STATUSES,
+        limit=limit,
+        after_name=after_name,
+        after_id=after_id,
+        open_at=open_at,
+    )
 
-        poi_dict = {
-            'id': str(poi.id),
-            'name': poi.name,
-            'slug': poi.slug,
-            'poi_type': poi.poi_type.value if hasattr(poi.poi_type, 'value') else poi.poi_type,
-            'address_city': poi.address_city,
-            'address_state': poi.address_state,
-            'address_county': poi.address_county,
-            'address_street': poi.address_street,
-            'description_short': poi.description_short,
-            'location': PointGeometry.from_wkb(poi.location) if poi.location else None,
-            'hours': poi.hours,
-            'pet_options': poi.pet_options,
-            'wifi_options': poi.wifi_options,
+    def _item(row, categories):
+        return {
+            'id': str(row.id),
+            'name': row.name,
+            'slug': row.slug,
+            'poi_type': row.poi_type.value if hasattr(row.poi_type, 'value') else row.poi_type,
+            'address_city': row.address_city,
+            'address_state': row.address_state,
+            'address_county': row.address_county,
+            'address_street': row.address_street,
+            'description_short': row.description_short,
+            'location': _listing_location(row),
+            'hours': row.hours,
+            'pet_options': row.pet_options,
+            'wifi_options': row.wifi_options,
             # wheelchair_accessible removed (Issue #45 PR2 Migration B — column dropped)
-            'public_toilets': poi.public_toilets,
-            'categories': categories_data,
+            'public_toilets': row.public_toilets,
+            'categories': [
+                {'id': str(cat.id), 'name': cat.name, 'slug': cat.slug}
+                for _is_main, cat in categories.get(row.id, [])
+            ],
         }
-        results.append(poi_dict)
 
-    return results
+    def _items(items_db, rows):
+        # Categories — list[{id,name,slug}] for client-side category-name
+        # rendering on cards, loaded for each batch of rows in one query.
+        categories = crud.crud_poi.categories_by_poi(items_db, [row.id for row in rows])
+        return (_item(row, categories) for row in rows)
+
+    return _listing_response(db, query, limit, _open_rows_only(_items, open_at))
+
+
+def _encode_occurrence_cursor(row) -> str:
+    """Opaque keyset cursor for the ``(occurs_at, id)`` ordering of the calendar."""
+    raw = json.dumps([row.occurs_at.isoformat(), str(row.id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_occurrence_cursor(cursor: Optional[str]):
+    """``(after_at, after_id)`` from a calendar cursor; ``(None, None)`` without one."""
+    if not cursor:
+        return None, None
+    try:
+        occurs_at, poi_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(occurs_at), uuid.UUID(poi_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.get("/events/in-range")
 def api_get_events_in_range(
     date_from: str = Query(..., description="Start date (YYYY-MM-DD)"),
     date_to: str = Query(..., description="End date (YYYY-MM-DD)"),
+    limit: Optional[int] = Query(None, ge=1, le=LISTING_MAX_LIMIT, description="Page size (default: all)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     db: Session = Depends(get_db),
 ):
-    """Get all events (including expanded recurring instances) within a date range."""
-    from shared.utils.recurring_events import expand_recurring_dates
-    from sqlalchemy.orm import joinedload
+    """Get all events (including expanded recurring instances) within a date range.
 
+    Served from the materialized ``event_occurrences`` table, ordered by
+    ``(occurrence_datetime, id)`` in SQL; cancelled/rescheduled events are
+    filtered there too.
+    """
     try:
         dt_from = datetime.strptime(date_from, "%Y-%m-%d").replace(tzinfo=timezone.utc)
         dt_to = datetime.strptime(date_to, "%Y-%m-%d").replace(
@@ -729,53 +1124,28 @@ def api_get_events_in_range(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
 
-    # Query all published, non-cancelled EVENT POIs
-    pois = db.query(models.poi.PointOfInterest).options(
-        joinedload(models.poi.PointOfInterest.event)
-    ).filter(
-        models.poi.PointOfInterest.poi_type == "EVENT",
-        models.poi.PointOfInterest.publication_status == "published",
-    ).all()
-
-    # Filter cancelled/rescheduled
-    pois = _exclude_past_and_cancelled_events(pois, include_past=True)
-
-    results = []
-    for poi in pois:
-        event = poi.event
-        if not event:
-            continue
-
-        if event.is_repeating and event.repeat_pattern:
-            dates = expand_recurring_dates(
-                start_datetime=event.start_datetime,
-                repeat_pattern=event.repeat_pattern,
-                date_from=dt_from,
-                date_to=dt_to,
-                excluded_dates=event.excluded_dates,
-                manual_dates=event.manual_dates,
-                recurrence_end_date=event.recurrence_end_date,
-            )
-        else:
-            # Non-repeating: check if start_datetime is in range
-            if dt_from <= event.start_datetime <= dt_to:
-                dates = [event.start_datetime]
-            else:
-                dates = []
+    after_at, after_id = _decode_occurrence_cursor(cursor)
+    rows = crud.crud_poi.list_event_occurrences(
+        db,
+        dt_from,
+        dt_to,
+        excluded_event_statuses=_EXCLUDED_EVENT_STATUSES,
+        limit=limit,
+        after_at=after_at,
+        after_id=after_id,
+    )
 
-        for occurrence_dt in dates:
-            results.append({
-                "id": str(poi.id),
-                "name": poi.name,
-                "slug": poi.slug,
-                "occurrence_datetime": occurrence_dt.isoformat(),
-                "address_city": poi.address_city,
-                "event_status": event.event_status,
-            })
+    def _item(row):
+        return {
+            "id": str(row.id),
+            "name": row.name,
+            "slug": row.slug,
+            "occurrence_datetime": row.occurs_at.isoformat(),
+            "address_city": row.address_city,
+            "event_status": row.event_status,
+        }
 
-    # Sort by occurrence datetime
-    results.sort(key=lambda r: r["occurrence_datetime"])
-    return results
+    return _stream_listing(rows, limit, _item, encode_cursor=_encode_occurrence_cursor)
 
 
 @router.get("/pois/{poi_id}/vendors")
@@ -1,18 +1,41 @@
 # app/api/endpoints/sitemap.py
-"""Sitemap endpoints for SEO."""
-
-from fastapi import APIRouter, Depends
-from fastapi.responses import Response
-from sqlalchemy.orm import Session, joinedload
+"""Sitemap endpoints for SEO.
+
+POI sitemaps select only the columns the XML needs and stream it from a
+``yield_per`` cursor. A section with more than ``SITEMAP_MAX_URLS`` URLs is
+split into numbered files (``sitemap-places.xml``, ``sitemap-places-2.xml``,
+...), all listed by ``/sitemap.xml``. Each response carries an ``ETag`` and
+``Last-Modified`` derived from the section's URL count and newest
+``last_updated``, so a revalidating crawler costs one aggregate query and a
+``304``.
+"""
+
+import math
+import zlib
 from datetime import datetime, timezone
-from ...database import get_db
+from typing import NamedTuple, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+from ...database import SessionLocal, get_db
 from ... import models
+from ..http_cache import http_date, make_etag, not_modified
 
 router = APIRouter()
 
 _EXCLUDED_STATUSES = ("Canceled", "Rescheduled")
 _BASE_URL = "https://nearbynearby.com"
 
+# Sitemap protocol limit of URLs per file.
+SITEMAP_MAX_URLS = 50_000
+# Rows fetched per round trip (and URLs per chunk) while streaming.
+SITEMAP_YIELD_PER = 1000
+XML_MEDIA_TYPE = "application/xml"
+# Crawlers revalidate every time; a CDN may answer from its copy for 10 minutes.
+SITEMAP_CACHE_CONTROL = "public, max-age=0, s-maxage=600, stale-while-revalidate=86400"
+
 _STATIC_PAGES = [
     ("", "weekly", "1.0"),
     ("explore", "daily", "0.9"),
@@ -23,14 +46,36 @@ _STATIC_PAGES = [
     ("services", "monthly", "0.5"),
 ]
 
-_TYPE_PREFIX = {
-    "BUSINESS": "places",
-    "SERVICES": "places",
-    "PARK": "parks",
-    "TRAIL": "trails",
+
+class _Section(NamedTuple):
+    poi_types: tuple
+    changefreq: str
+    priority: str
+
+
+# URL prefix (also the sitemap name) -> the published POI types listed in it.
+# Event priority/changefreq apply to upcoming events; past ones get monthly/0.4.
+_SECTIONS = {
+    "places": _Section(("BUSINESS", "SERVICES"), "weekly", "0.7"),
+    "parks": _Section(("PARK",), "monthly", "0.7"),
+    "trails": _Section(("TRAIL",), "monthly", "0.7"),
+    "events": _Section(("EVENT",), "daily", "0.8"),
 }
 
 
+class _SectionStats(NamedTuple):
+    count: int
+    last_modified: Optional[datetime]
+    upcoming: int  # events only: drives priority, so it is part of the ETag
+
+
+_URLSET_OPEN = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+_URLSET_CLOSE = '</urlset>'
+
+
 def _url_tag(loc: str, changefreq: str, priority: str, lastmod: str = None) -> str:
     lastmod_tag = f"\n    <lastmod>{lastmod}</lastmod>" if lastmod else ""
     return (
@@ -42,156 +87,182 @@ def _url_tag(loc: str, changefreq: str, priority: str, lastmod: str = None) -> s
     )
 
 
-def _xml_response(urls: list[str]) -> Response:
-    xml = (
-        '<?xml version="1.0" encoding="UTF-8"?>\n'
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        + "\n".join(urls) + "\n"
-        + '</urlset>'
+def _sitemap_file(name: str, page: int = 1) -> str:
+    return f"sitemap-{name}.xml" if page == 1 else f"sitemap-{name}-{page}.xml"
+
+
+def _section_query(db: Session, name: str, *columns):
+    """Published POIs of section ``name`` (events: not Canceled/Rescheduled)."""
+    POI = models.poi.PointOfInterest
+    query = db.query(*columns).select_from(POI).filter(
+        POI.poi_type.in_(_SECTIONS[name].poi_types),
+        POI.publication_status == "published",
+    )
+    if name == "events":
+        Event = models.poi.Event
+        query = query.join(Event, Event.poi_id == POI.id).filter(or_(
+            Event.event_status.is_(None),
+            Event.event_status.notin_(_EXCLUDED_STATUSES),
+        ))
+    return query
+
+
+def _section_stats(db: Session, name: str, now: datetime) -> _SectionStats:
+    POI = models.poi.PointOfInterest
+    columns = [func.count(POI.id), func.max(POI.last_updated)]
+    if name == "events":
+        Event = models.poi.Event
+        end = func.coalesce(Event.end_datetime, Event.start_datetime)
+        columns.append(func.count(POI.id).filter(end > now))
+    row = _section_query(db, name, *columns).one()
+    return _SectionStats(row[0], row[1], row[2] if name == "events" else 0)
+
+
+def _page_count(stats: _SectionStats) -> int:
+    return max(1, math.ceil(stats.count / SITEMAP_MAX_URLS))
+
+
+def _stamp(moment: Optional[datetime]) -> int:
+    return int(moment.timestamp() * 1_000_000) if moment else 0
+
+
+def _xml_response(request: Request, etag: str, last_modified: Optional[datetime], body) -> Response:
+    """``304`` when the crawler's copy is current, else ``body`` (str or chunk iterator)."""
+    headers = {"ETag": etag, "Cache-Control": SITEMAP_CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    if not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    if isinstance(body, str):
+        return Response(content=body, media_type=XML_MEDIA_TYPE, headers=headers)
+    return StreamingResponse(body, media_type=XML_MEDIA_TYPE, headers=headers)
+
+
+def _poi_url_tag(name: str, row, now: datetime) -> str:
+    section = _SECTIONS[name]
+    changefreq, priority = section.changefreq, section.priority
+    if name == "events":
+        end_dt = row.end_datetime or row.start_datetime
+        if not (end_dt and end_dt > now):
+            changefreq, priority = "monthly", "0.4"
+    return _url_tag(
+        loc=f"{_BASE_URL}/{name}/{row.slug or row.id}",
+        changefreq=changefreq,
+        priority=priority,
+        lastmod=row.last_updated.strftime("%Y-%m-%d") if row.last_updated else None,
     )
-    return Response(content=xml, media_type="application/xml")
+
+
+def _stream_section(name: str, page: int, now: datetime):
+    """Yield one sitemap file in chunks, reading through its own session.
+
+    The request's session is released once the endpoint returns, before the
+    body is sent, so the stream opens (and closes) a session of its own.
+    """
+    POI = models.poi.PointOfInterest
+    columns = [POI.id, POI.slug, POI.last_updated]
+    if name == "events":
+        Event = models.poi.Event
+        columns += [Event.start_datetime, Event.end_datetime]
+    db = SessionLocal()
+    try:
+        rows = (
+            _section_query(db, name, *columns)
+            .order_by(POI.id)
+            .offset((page - 1) * SITEMAP_MAX_URLS)
+            .limit(SITEMAP_MAX_URLS)
+            .yield_per(SITEMAP_YIELD_PER)
+        )
+        yield _URLSET_OPEN
+        chunk = []
+        for row in rows:
+            chunk.append(_poi_url_tag(name, row, now))
+            if len(chunk) >= SITEMAP_YIELD_PER:
+                yield "\n".join(chunk) + "\n"
+                chunk.clear()
+        if chunk:
+            yield "\n".join(chunk) + "\n"
+        yield _URLSET_CLOSE
+    finally:
+        db.close()
 
 
 # ── Sitemap index ─────────────────────────────────────────────────────────────
 
 @router.get("/sitemap.xml")
-def sitemap_index():
-    """Master sitemap index pointing to all sub-sitemaps."""
-    sitemaps = [
-        "sitemap-pages.xml",
-        "sitemap-places.xml",
-        "sitemap-parks.xml",
-        "sitemap-trails.xml",
-        "sitemap-events.xml",
-    ]
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    entries = "\n".join(
-        f"  <sitemap>\n"
-        f"    <loc>{_BASE_URL}/{s}</loc>\n"
-        f"    <lastmod>{today}</lastmod>\n"
-        f"  </sitemap>"
-        for s in sitemaps
-    )
+def sitemap_index(request: Request, db: Session = Depends(get_db)):
+    """Master sitemap index pointing to all sub-sitemaps (numbered past 50k URLs)."""
+    now = datetime.now(timezone.utc)
+    stats = {name: _section_stats(db, name, now) for name in _SECTIONS}
+
+    entries = [f"  <sitemap>\n    <loc>{_BASE_URL}/{_sitemap_file('pages')}</loc>\n  </sitemap>"]
+    for name, section_stats in stats.items():
+        lastmod = section_stats.last_modified
+        lastmod_tag = f"\n    <lastmod>{lastmod.strftime('%Y-%m-%d')}</lastmod>" if lastmod else ""
+        for page in range(1, _page_count(section_stats) + 1):
+            entries.append(
+                f"  <sitemap>\n"
+                f"    <loc>{_BASE_URL}/{_sitemap_file(name, page)}</loc>{lastmod_tag}\n"
+                f"  </sitemap>"
+            )
     xml = (
         '<?xml version="1.0" encoding="UTF-8"?>\n'
         '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        + entries + "\n"
+        + "\n".join(entries) + "\n"
         + '</sitemapindex>'
     )
-    return Response(content=xml, media_type="application/xml")
+
+    last_modified = max((s.last_modified for s in stats.values() if s.last_modified), default=None)
+    etag = make_etag("sitemap", *(f"{s.count}.{s.upcoming}.{_stamp(s.last_modified)}" for s in stats.values()))
+    return _xml_response(request, etag, last_modified, xml)
 
 
 # ── Static pages ──────────────────────────────────────────────────────────────
 
-@router.get("/sitemap-pages.xml")
-def sitemap_pages():
-    """Sitemap for static/non-POI pages."""
-    urls = [
+_PAGES_XML = (
+    _URLSET_OPEN
+    + "\n".join(
         _url_tag(
             loc=f"{_BASE_URL}/{path}" if path else _BASE_URL,
             changefreq=changefreq,
             priority=priority,
         )
         for path, changefreq, priority in _STATIC_PAGES
-    ]
-    return _xml_response(urls)
-
-
-# ── Places (businesses) ───────────────────────────────────────────────────────
-
-@router.get("/sitemap-places.xml")
-def sitemap_places(db: Session = Depends(get_db)):
-    """Sitemap for published business/service POIs."""
-    pois = db.query(models.poi.PointOfInterest).filter(
-        models.poi.PointOfInterest.poi_type.in_(["BUSINESS", "SERVICES"]),
-        models.poi.PointOfInterest.publication_status == "published",
-    ).all()
-
-    urls = [
-        _url_tag(
-            loc=f"{_BASE_URL}/places/{poi.slug or poi.id}",
-            changefreq="weekly",
-            priority="0.7",
-            lastmod=poi.last_updated.strftime("%Y-%m-%d") if poi.last_updated else None,
-        )
-        for poi in pois
-    ]
-    return _xml_response(urls)
-
-
-# ── Parks ─────────────────────────────────────────────────────────────────────
-
-@router.get("/sitemap-parks.xml")
-def sitemap_parks(db: Session = Depends(get_db)):
-    """Sitemap for published park POIs."""
-    pois = db.query(models.poi.PointOfInterest).filter(
-        models.poi.PointOfInterest.poi_type == "PARK",
-        models.poi.PointOfInterest.publication_status == "published",
-    ).all()
-
-    urls = [
-        _url_tag(
-            loc=f"{_BASE_URL}/parks/{poi.slug or poi.id}",
-            changefreq="monthly",
-            priority="0.7",
-            lastmod=poi.last_updated.strftime("%Y-%m-%d") if poi.last_updated else None,
-        )
-        for poi in pois
-    ]
-    return _xml_response(urls)
-
-
-# ── Trails ────────────────────────────────────────────────────────────────────
+    )
+    + "\n" + _URLSET_CLOSE
+)
+_PAGES_ETAG = make_etag("sitemap", "pages", format(zlib.crc32(_PAGES_XML.encode()), "x"))
 
-@router.get("/sitemap-trails.xml")
-def sitemap_trails(db: Session = Depends(get_db)):
-    """Sitemap for published trail POIs."""
-    pois = db.query(models.poi.PointOfInterest).filter(
-        models.poi.PointOfInterest.poi_type == "TRAIL",
-        models.poi.PointOfInterest.publication_status == "published",
-    ).all()
 
-    urls = [
-        _url_tag(
-            loc=f"{_BASE_URL}/trails/{poi.slug or poi.id}",
-            changefreq="monthly",
-            priority="0.7",
-            lastmod=poi.last_updated.strftime("%Y-%m-%d") if poi.last_updated else None,
-        )
-        for poi in pois
-    ]
-    return _xml_response(urls)
+@router.get("/sitemap-pages.xml")
+def sitemap_pages(request: Request):
+    """Sitemap for static/non-POI pages."""
+    return _xml_response(request, _PAGES_ETAG, None, _PAGES_XML)
 
 
-# ── Events ────────────────────────────────────────────────────────────────────
+# ── POI sections (places, parks, trails, events) ─────────────────────────────
 
-@router.get("/sitemap-events.xml")
-def sitemap_events(db: Session = Depends(get_db)):
-    """Sitemap for published event POIs."""
+def _section_sitemap(request: Request, db: Session, name: str, page: int) -> Response:
+    if name not in _SECTIONS:
+        raise HTTPException(status_code=404, detail="Sitemap not found")
     now = datetime.now(timezone.utc)
-
-    pois = db.query(models.poi.PointOfInterest).options(
-        joinedload(models.poi.PointOfInterest.event)
-    ).filter(
-        models.poi.PointOfInterest.poi_type == "EVENT",
-        models.poi.PointOfInterest.publication_status == "published",
-    ).all()
-
-    urls = []
-    for poi in pois:
-        event = poi.event
-        if not event:
-            continue
-        if getattr(event, 'event_status', None) in _EXCLUDED_STATUSES:
-            continue
-
-        end_dt = event.end_datetime or event.start_datetime
-        is_upcoming = end_dt and end_dt > now
-
-        urls.append(_url_tag(
-            loc=f"{_BASE_URL}/events/{poi.slug or poi.id}",
-            changefreq="daily" if is_upcoming else "monthly",
-            priority="0.8" if is_upcoming else "0.4",
-        ))
-
-    return _xml_response(urls)
+    stats = _section_stats(db, name, now)
+    if page > _page_count(stats):
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    etag = make_etag("sitemap", name, page, stats.count, stats.upcoming, _stamp(stats.last_modified))
+    return _xml_response(request, etag, stats.last_modified, _stream_section(name, page, now))
+
+
+# Registered first: {name} would otherwise swallow "places-2".
+@router.get("/sitemap-{name}-{page:int}.xml")
+def sitemap_section_page(name: str, page: int, request: Request, db: Session = Depends(get_db)):
+    """Numbered continuation of a POI section, e.g. ``/sitemap-places-2.xml``."""
+    if page < 2:
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    return _section_sitemap(request, db, name, page)
+
+
+@router.get("/sitemap-{name}.xml")
+def sitemap_section(name: str, request: Request, db: Session = Depends(get_db)):
+    """First (often only) sitemap file of a POI section, e.g. ``/sitemap-places.xml``."""
+    return _section_sitemap(request, db, name, 1)
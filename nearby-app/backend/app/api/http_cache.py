@@ -0,0 +1,102 @@
+"""Response helpers: ETag / conditional GET for cacheable responses, streamed JSON."""
+
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Browsers and CDNs may keep the body but must revalidate (a cheap 304) first.
+REVALIDATE = "public, max-age=0, must-revalidate"
+
+
+def encode_json(content) -> bytes:
+    """Encode ``content`` exactly as ``JSONResponse`` would, once, for caching."""
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the given parts, e.g. ``make_etag("categories", version)``."""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """True when the request's ``If-None-Match`` already names ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 §13.1.2): a W/ prefix still matches.
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def http_date(moment: datetime) -> str:
+    """``moment`` as an HTTP date (``Last-Modified``), e.g. ``Tue, 03 Mar 2026 14:00:00 GMT``."""
+    return format_datetime(moment.astimezone(timezone.utc), usegmt=True)
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime = None) -> bool:
+    """True when a conditional GET may be answered with ``304``.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only
+    consulted when it is absent (RFC 9110 §13.2.2), at one-second precision.
+    """
+    if request.headers.get("if-none-match"):
+        return if_none_match(request, etag)
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def cached_json_response(
+    request: Request,
+    etag: str,
+    body: bytes,
+    cache_control: str = REVALIDATE,
+) -> Response:
+    """``304`` if the client holds ``etag``, else ``body`` (pre-encoded JSON)."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def stream_json_array(items, prefix: bytes = b"", suffix: bytes = b""):
+    """Yield ``prefix + [item, ...] + suffix`` as JSON in ~64 KB chunks.
+
+    Each item is encoded as it is consumed, so a large listing is never held
+    as one Python list of dicts or one encoded string.
+    """
+    buffer = bytearray(prefix + b"[")
+    first = True
+    for item in items:
+        if not first:
+            buffer += b","
+        buffer += encode_json(item)
+        first = False
+        if len(buffer) >= STREAM_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]" + suffix
+    yield bytes(buffer)
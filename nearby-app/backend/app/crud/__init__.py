@@ -1,3 +1,5 @@
 # app/crud/__init__.py
 from . import crud_poi
 from . import crud_waitlist
+from . import crud_public_document
+from . import crud_open_hours
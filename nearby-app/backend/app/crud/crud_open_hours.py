@@ -0,0 +1,156 @@
+# app/crud/crud_open_hours.py
+"""Rebuild and query ``poi_open_intervals``, the resolved "open now" index.
+
+The public document worker rebuilds a POI's intervals whenever the document
+outbox queues it (``rebuild_for_poi``) and rolls every POI's horizon forward
+once a day (``refresh_all``). Each POI covers ``OPEN_INTERVAL_DAYS`` local
+days starting yesterday in its own timezone, so "open at t" for any t up to a
+week ahead is one ``EXISTS`` probe (``open_at_clause``).
+
+Next to the intervals the worker stamps ``poi_open_hours_coverage`` with the
+POI's ``last_updated`` and the window the intervals are complete for. A POI
+whose stamp is missing, out of date or does not cover t (the worker is behind
+or stopped) is not decided by its intervals: ``open_at_clause`` lets it
+through and ``keep_open_rows`` resolves its ``hours`` in Python. A stalled
+worker therefore costs speed, not correctness.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, delete, exists, insert, not_, or_
+from sqlalchemy.orm import Session
+
+from .. import models
+from shared.utils.hours_resolution import hours_timezone, is_open_at, open_intervals
+
+# Local days stored per POI: yesterday, today and a week ahead.
+OPEN_INTERVAL_DAYS = 9
+# Published POIs re-resolved per transaction by ``refresh_all``.
+REFRESH_BATCH_SIZE = 500
+
+
+def replace_open_intervals(
+    db: Session, poi_id, hours: Optional[dict], now: datetime = None, last_updated=None,
+) -> int:
+    """Replace the stored intervals of one POI from its ``hours`` JSON (caller commits).
+
+    ``last_updated`` is the POI's ``last_updated`` the ``hours`` were read with.
+    """
+    Interval = models.poi_open_interval.PoiOpenInterval
+    Coverage = models.poi_open_interval.PoiOpenHoursCoverage
+    now = now or datetime.now(timezone.utc)
+    clear_open_intervals(db, poi_id)
+    tz = hours_timezone(hours)
+    date_from = now.astimezone(tz).date() - timedelta(days=1)
+    intervals = open_intervals(hours, date_from, OPEN_INTERVAL_DAYS) if hours else []
+    if intervals:
+        db.execute(insert(Interval), [
+            {"poi_id": poi_id, "opens_at": opens_at, "closes_at": closes_at}
+            for opens_at, closes_at in intervals
+        ])
+    # Complete from today's local midnight (yesterday's rows may lack a span
+    # carried over from the day before) to the end of the last day.
+    today, end = date_from + timedelta(days=1), date_from + timedelta(days=OPEN_INTERVAL_DAYS)
+    db.execute(insert(Coverage), [{
+        "poi_id": poi_id,
+        "poi_last_updated": last_updated,
+        "covered_from": datetime(today.year, today.month, today.day, tzinfo=tz),
+        "covered_until": datetime(end.year, end.month, end.day, tzinfo=tz),
+    }])
+    return len(intervals)
+
+
+def clear_open_intervals(db: Session, poi_id) -> None:
+    """Delete one POI's intervals and coverage stamp (caller commits)."""
+    Interval = models.poi_open_interval.PoiOpenInterval
+    Coverage = models.poi_open_interval.PoiOpenHoursCoverage
+    db.execute(delete(Interval).where(Interval.poi_id == poi_id))
+    db.execute(delete(Coverage).where(Coverage.poi_id == poi_id))
+
+
+def rebuild_for_poi(db: Session, poi_id, now: datetime = None) -> int:
+    """Re-resolve one POI; unpublished or deleted POIs lose their intervals (caller commits)."""
+    POI = models.poi.PointOfInterest
+    row = db.query(POI.hours, POI.last_updated).filter(
+        POI.id == poi_id, POI.publication_status == 'published'
+    ).first()
+    if row is None:
+        clear_open_intervals(db, poi_id)
+        return 0
+    return replace_open_intervals(db, poi_id, row.hours, now, row.last_updated)
+
+
+def refresh_all(db: Session, now: datetime = None, batch_size: int = REFRESH_BATCH_SIZE) -> int:
+    """Roll every published POI's horizon forward, committing per batch; returns the POI count."""
+    POI = models.poi.PointOfInterest
+    Interval = models.poi_open_interval.PoiOpenInterval
+    Coverage = models.poi_open_interval.PoiOpenHoursCoverage
+    now = now or datetime.now(timezone.utc)
+    # Intervals of POIs that are no longer published.
+    for table in (Interval, Coverage):
+        db.execute(delete(table).where(~exists().where(
+            POI.id == table.poi_id, POI.publication_status == 'published'
+        )))
+    db.commit()
+    poi_ids = [row.id for row in db.query(POI.id).filter(
+        POI.publication_status == 'published'
+    ).order_by(POI.id)]
+    for start in range(0, len(poi_ids), batch_size):
+        chunk = poi_ids[start:start + batch_size]
+        for row in db.query(POI.id, POI.hours, POI.last_updated).filter(POI.id.in_(chunk)):
+            replace_open_intervals(db, row.id, row.hours, now, row.last_updated)
+        db.commit()
+    return len(poi_ids)
+
+
+def hours_resolved_clause(at):
+    """``EXISTS`` test: the outer POI's stored intervals are current and cover ``at``."""
+    POI = models.poi.PointOfInterest
+    Coverage = models.poi_open_interval.PoiOpenHoursCoverage
+    return exists().where(
+        Coverage.poi_id == POI.id,
+        Coverage.poi_last_updated.is_not_distinct_from(POI.last_updated),
+        Coverage.covered_from <= at,
+        Coverage.covered_until > at,
+    )
+
+
+def open_at_clause(at):
+    """Filter: the outer ``points_of_interest`` row may be open at ``at``.
+
+    Exact for POIs whose intervals are current (``hours_resolved_clause``);
+    every other POI with ``hours`` passes and must be checked with
+    ``keep_open_rows``.
+    """
+    POI = models.poi.PointOfInterest
+    Interval = models.poi_open_interval.PoiOpenInterval
+    resolved = hours_resolved_clause(at)
+    open_interval = exists().where(
+        Interval.poi_id == POI.id,
+        Interval.opens_at <= at,
+        Interval.closes_at > at,
+    )
+    return or_(
+        and_(resolved, open_interval),
+        and_(not_(resolved), POI.hours.isnot(None)),
+    )
+
+
+def keep_open_rows(rows, at) -> List:
+    """The rows open at ``at`` among rows filtered by ``open_at_clause``.
+
+    Rows need ``hours`` and an ``hours_resolved`` column
+    (``hours_resolved_clause``); unresolved rows are checked against their
+    ``hours`` here.
+    """
+    return [row for row in rows if row.hours_resolved or is_open_at(row.hours, at)]
+
+
+def get_published_hours(db: Session, poi_ids: Iterable) -> Dict:
+    """``{poi_id: hours JSON}`` of the published POIs among ``poi_ids``."""
+    POI = models.poi.PointOfInterest
+    rows = db.query(POI.id, POI.hours).filter(
+        POI.id.in_(list(poi_ids)), POI.publication_status == 'published'
+    )
+    return {row.id: row.hours for row in rows}
@@ -1,9 +1,10 @@
 # app/crud/crud_poi.py
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, func, literal_column, select, and_
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy import or_, func, select, and_, bindparam, text, tuple_
 from geoalchemy2 import Geography
 from .. import models
 from ..schemas.poi import PointGeometry
+from shared.utils.venue_inheritance import INHERITABLE_FIELDS
 
 def _enrich_poi_with_category_info(db: Session, poi: models.poi.PointOfInterest) -> None:
     """
@@ -58,40 +59,492 @@ def get_poi(db: Session, poi_id: str):
 
     return poi
 
-def get_nearby_pois(db: Session, poi_id: str, radius_miles: float = 5.0):
-    from geoalchemy2.shape import to_shape
+def _geography_point(longitude: float, latitude: float):
+    """Bound-parameter WGS84 point as geography (no SQL string building)."""
+    return func.geography(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326))
 
-    origin_poi = db.query(models.poi.PointOfInterest).filter(models.poi.PointOfInterest.id == poi_id).first()
-    if not origin_poi:
-        return []
 
-    # Extract coordinates from origin POI
-    origin_point = to_shape(origin_poi.location)
-    origin_lon = origin_point.x
-    origin_lat = origin_point.y
+def get_pois_near_point(
+    db: Session,
+    latitude: float,
+    longitude: float,
+    limit: int,
+    radius_m: float = None,
+    poi_type: str = None,
+    with_card: bool = False,
+):
+    """Return up to ``limit`` published ``(poi, distance_meters)`` pairs, nearest first.
+
+    Candidates are ordered by the KNN ``<->`` operator on ``geography(location)``
+    so the GiST index ``idx_points_of_interest_location_geog`` walks them in
+    distance order and stops after ``limit`` rows; ``radius_m`` becomes an
+    index-assisted ``ST_DWithin``. The exact (spheroid) ``ST_Distance`` is only
+    computed for the returned rows.
+
+    ``with_card`` adds two columns from ``public_poi_documents``: the stored
+    document's ETag and card JSON (``None`` when none was built). The card is
+    only current while that ETag matches the live one
+    (``get_detail_validators``); the caller checks.
+    """
+    POI = models.poi.PointOfInterest
+    poi_geog = func.geography(POI.location)
+    point = _geography_point(longitude, latitude)
+
+    query = db.query(
+        POI,
+        func.ST_Distance(poi_geog, point).label('distance_meters'),
+    ).options(
+        joinedload(POI.event)
+    ).filter(
+        POI.publication_status == 'published'
+    )
+    if poi_type:
+        query = query.filter(POI.poi_type == poi_type)
+    if radius_m is not None:
+        query = query.filter(func.ST_DWithin(poi_geog, point, radius_m))
+    if with_card:
+        Document = models.public_poi_document.PublicPoiDocument
+        query = query.add_columns(Document.etag, Document.card_json).outerjoin(
+            Document, Document.poi_id == POI.id,
+        )
+
+    return query.order_by(poi_geog.op('<->')(point)).limit(limit).all()
+
+
+def categories_by_poi(db: Session, poi_ids) -> dict:
+    """``{poi_id: [(is_main, category), ...]}`` for ALL ``poi_ids`` in one query.
+
+    Categories are ordered by name; POIs without categories are absent.
+    """
+    from ..models.poi import poi_category_association, Category
+
+    if not poi_ids:
+        return {}
+    rows = db.query(
+        poi_category_association.c.poi_id,
+        poi_category_association.c.is_main,
+        Category,
+    ).join(
+        Category, Category.id == poi_category_association.c.category_id
+    ).filter(
+        poi_category_association.c.poi_id.in_(poi_ids)
+    ).order_by(Category.name).all()
+
+    by_poi = {}
+    for poi_id, is_main, category in rows:
+        by_poi.setdefault(poi_id, []).append((is_main, category))
+    return by_poi
+
+
+def attach_categories(db: Session, pois) -> None:
+    """Load categories for ALL ``pois`` in one query.
+
+    Batched replacement for calling ``_enrich_poi_with_category_info`` (two
+    queries) and then lazily loading ``poi.categories`` per POI: sets
+    ``main_category`` / ``secondary_categories`` the same way and marks the
+    ``categories`` relationship as loaded so serialization never lazy-loads it.
+    """
+    from sqlalchemy.orm.attributes import set_committed_value
+
+    by_poi = categories_by_poi(db, [poi.id for poi in pois])
+    for poi in pois:
+        assigned = by_poi.get(poi.id, [])
+        main = next((cat for is_main, cat in assigned if is_main), None)
+        poi.__dict__['main_category'] = main
+        poi.__dict__['secondary_categories'] = [cat for is_main, cat in assigned if not is_main]
+        set_committed_value(poi, 'categories', [cat for _is_main, cat in assigned])
+
+
+NEARBY_BY_POI_DEFAULT_LIMIT = 100
+NEARBY_BY_POI_MAX_LIMIT = 500
+
+
+def get_nearby_pois(
+    db: Session,
+    poi_id: str,
+    radius_miles: float = 5.0,
+    limit: int = NEARBY_BY_POI_DEFAULT_LIMIT,
+    after_distance: float = None,
+    after_id=None,
+):
+    """Published POIs within ``radius_miles`` of ``poi_id``, nearest first.
+
+    ``ST_DWithin`` on ``geography(location)`` is answered by the geography GiST
+    index, so only POIs inside the radius are ever distance-ranked. Results are
+    capped at ``limit`` and ordered by ``(distance_meters, id)``; pass the last
+    row's pair as ``after_distance`` / ``after_id`` for the next page (keyset
+    pagination). Categories are loaded for the whole page in one query.
+    """
+    POI = models.poi.PointOfInterest
+
+    # Origin geography as a scalar subquery: no extra round trip, no SQL strings.
+    origin_poi = aliased(POI)
+    origin = select(func.geography(origin_poi.location)).where(
+        origin_poi.id == poi_id
+    ).scalar_subquery()
+    poi_geog = func.geography(POI.location)
 
     # Convert miles to meters (1 mile = 1609.34 meters)
     radius_meters = radius_miles * 1609.34
+    distance = func.ST_Distance(poi_geog, origin)
 
-    # Use geography type for accurate distance in meters
-    distance_expr = literal_column(
-        f"ST_Distance(location::geography, ST_MakePoint({origin_lon}, {origin_lat})::geography)"
+    query = db.query(
+        POI,
+        distance.label('distance_meters'),
+    ).options(
+        joinedload(POI.event),
+        joinedload(POI.trail),
+    ).filter(
+        POI.id != poi_id,
+        POI.publication_status == 'published',
+        func.ST_DWithin(poi_geog, origin, radius_meters),
     )
+    if after_distance is not None:
+        if after_id is not None:
+            query = query.filter(tuple_(distance, POI.id) > tuple_(after_distance, after_id))
+        else:
+            query = query.filter(distance > after_distance)
 
-    nearby_pois_with_distance = db.query(
-        models.poi.PointOfInterest,
-        distance_expr.label('distance_meters')
-    ).filter(
-        models.poi.PointOfInterest.id != poi_id,
-        models.poi.PointOfInterest.publication_status == 'published',
-        distance_expr <= radius_meters
-    ).order_by('distance_meters').all()
+    rows = query.order_by(distance, POI.id).limit(limit).all()
 
-    # The query returns tuples of (PointOfInterest, distance), so we need to format them.
     results = []
-    for poi, distance in nearby_pois_with_distance:
-        poi.distance_meters = distance
-        _enrich_poi_with_category_info(db, poi)
+    for poi, distance_meters in rows:
+        poi.distance_meters = distance_meters
         results.append(poi)
+    attach_categories(db, results)
+    return results
+
+
+def list_categories_with_counts(db: Session):
+    """Active top-level categories with their published-POI counts, in ONE query.
+
+    ``LEFT JOIN`` keeps categories with no published POIs (count 0); the
+    publication filter sits in the join condition so it doesn't drop them.
+    Returns ``(category, poi_count)`` pairs ordered by ``sort_order, name``.
+    """
+    from ..models.poi import poi_category_association, Category
+
+    POI = models.poi.PointOfInterest
+    return db.query(
+        Category,
+        func.count(POI.id).label('poi_count'),
+    ).outerjoin(
+        poi_category_association,
+        poi_category_association.c.category_id == Category.id,
+    ).outerjoin(
+        POI,
+        and_(
+            POI.id == poi_category_association.c.poi_id,
+            POI.publication_status == 'published',
+        ),
+    ).filter(
+        Category.is_active == True,
+        Category.parent_id == None,
+    ).group_by(
+        Category.id
+    ).order_by(
+        Category.sort_order, Category.name
+    ).all()
+
+
+POI_COUNT_TYPES = ('BUSINESS', 'PARK', 'TRAIL', 'EVENT')
+POI_COUNT_BREAKDOWNS = ('city', 'county', 'category')
+
+
+def count_published_pois(db: Session, breakdown: str = None) -> dict:
+    """Published POI counts by type and amenity, in ONE statement.
+
+    Every count is a ``count(*) FILTER (WHERE ...)`` over a single scan of the
+    published rows (covered by ``idx_points_of_interest_published_counts``).
+    With ``breakdown`` (one of ``POI_COUNT_BREAKDOWNS``) the same statement
+    groups by ``GROUPING SETS ((), (dimension))``, so the overall totals and the
+    per-city / per-county / per-category counts come from the same pass. POIs
+    with no value for the dimension only appear in the totals.
+
+    Returns ``{"by_type": {...}, "by_amenity": {...}}`` plus, with a breakdown,
+    ``"by_<breakdown>": {value: {"by_type": ..., "by_amenity": ...}}``
+    (categories are keyed by slug).
+    """
+    from ..models.poi import poi_category_association, Category
+
+    POI = models.poi.PointOfInterest
+    if breakdown is not None and breakdown not in POI_COUNT_BREAKDOWNS:
+        raise ValueError(f"Unknown breakdown: {breakdown}")
+
+    # A POI in several categories joins once per category; count it once in
+    # the totals row.
+    if breakdown == 'category':
+        counted = func.count(POI.id.distinct())
+    else:
+        counted = func.count()
+    columns = [counted.filter(POI.poi_type == t) for t in POI_COUNT_TYPES] + [
+        counted.filter(POI.icon_pet_friendly.is_(True)),
+        counted.filter(POI.icon_wheelchair_accessible.is_(True)),
+    ]
+
+    dimension = None
+    query = db.query(*columns).filter(POI.publication_status == 'published')
+    if breakdown == 'city':
+        dimension = POI.address_city
+    elif breakdown == 'county':
+        dimension = POI.address_county
+    elif breakdown == 'category':
+        dimension = Category.slug
+        query = query.outerjoin(
+            poi_category_association, poi_category_association.c.poi_id == POI.id
+        ).outerjoin(
+            Category, Category.id == poi_category_association.c.category_id
+        )
+    if dimension is not None:
+        query = query.add_columns(dimension, func.grouping(dimension)).group_by(
+            func.grouping_sets(tuple_(), tuple_(dimension))
+        )
+
+    def _counts(row):
+        return {
+            "by_type": dict(zip(POI_COUNT_TYPES, row[:len(POI_COUNT_TYPES)])),
+            "by_amenity": {
+                "pet_friendly": row[len(POI_COUNT_TYPES)],
+                "wheelchair_accessible": row[len(POI_COUNT_TYPES) + 1],
+            },
+        }
+
+    if dimension is None:
+        return _counts(query.one())
+
+    n = len(columns)
+    result = None
+    groups = {}
+    for row in query.all():
+        value, is_total = row[n], row[n + 1]
+        if is_total:
+            result = _counts(row)
+        elif value is not None:
+            groups[value] = _counts(row)
+    result[f"by_{breakdown}"] = dict(sorted(groups.items()))
+    return result
+
+
+def _visible_event_clause(include_past_events: bool, excluded_event_statuses):
+    """SQL form of the browse filter: drop cancelled/rescheduled and past events.
+
+    Non-event POIs (and events without an ``events`` row) always pass; an event
+    is past when ``COALESCE(end_datetime, start_datetime)`` is before now.
+    Expects ``events`` to be outer-joined.
+    """
+    Event = models.poi.Event
+    conditions = []
+    if excluded_event_statuses:
+        conditions.append(or_(
+            Event.event_status.is_(None),
+            Event.event_status.notin_(excluded_event_statuses),
+        ))
+    if not include_past_events:
+        ref = func.coalesce(Event.end_datetime, Event.start_datetime)
+        conditions.append(or_(ref.is_(None), ref >= func.now()))
+    if not conditions:
+        return None
+    return or_(
+        models.poi.PointOfInterest.poi_type != 'EVENT',
+        Event.poi_id.is_(None),
+        and_(*conditions),
+    )
+
+
+def published_cards_query(
+    db: Session,
+    columns,
+    poi_type: str = None,
+    category_id=None,
+    include_past_events: bool = False,
+    excluded_event_statuses=(),
+    limit: int = None,
+    after_name: str = None,
+    after_id=None,
+    open_at=None,
+):
+    """Published POIs as projected rows, ordered by ``(name, id)``.
+
+    Selects only ``columns`` (labelled column expressions over
+    ``points_of_interest`` and the outer-joined ``events``) instead of full ORM
+    rows, and applies the past/cancelled event filter in SQL so every page is
+    full. ``limit`` plus ``after_name`` / ``after_id`` (the last row of the
+    previous page) give keyset pagination, served by
+    ``idx_points_of_interest_published_type_name`` for type listings.
+    ``open_at`` keeps POIs that may be open at that instant
+    (``crud_open_hours.open_at_clause``) and adds an ``hours_resolved``
+    column; pass the rows through ``crud_open_hours.keep_open_rows``.
+
+    Returns the query unexecuted: a page is loaded with ``.all()``, an unpaged
+    listing is streamed with ``yield_per``.
+    """
+    from ..models.poi import poi_category_association
+
+    POI = models.poi.PointOfInterest
+    Event = models.poi.Event
+    query = db.query(*columns).select_from(POI).outerjoin(
+        Event, Event.poi_id == POI.id
+    ).filter(POI.publication_status == 'published')
+    if poi_type:
+        query = query.filter(POI.poi_type == poi_type)
+    if category_id is not None:
+        query = query.join(
+            poi_category_association, poi_category_association.c.poi_id == POI.id
+        ).filter(poi_category_association.c.category_id == category_id)
+    visible = _visible_event_clause(include_past_events, excluded_event_statuses)
+    if visible is not None:
+        query = query.filter(visible)
+    if open_at is not None:
+        from .crud_open_hours import hours_resolved_clause, open_at_clause
+        query = query.add_columns(
+            hours_resolved_clause(open_at).label('hours_resolved')
+        ).filter(open_at_clause(open_at))
+    if after_id is not None:
+        query = query.filter(tuple_(POI.name, POI.id) > tuple_(after_name, after_id))
+    query = query.order_by(POI.name, POI.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def list_event_occurrences(
+    db: Session,
+    date_from,
+    date_to,
+    excluded_event_statuses=(),
+    limit: int = None,
+    after_at=None,
+    after_id=None,
+):
+    """Occurrences of published events in ``[date_from, date_to]``, ordered by ``(occurs_at, id)``.
+
+    One range scan of ``ix_event_occurrences_occurs_at`` joined to the POI and
+    event rows by primary key; recurring events are already expanded into
+    ``event_occurrences`` by the admin write path. ``limit`` plus ``after_at`` /
+    ``after_id`` (the last row of the previous page) give keyset pagination.
+    """
+    Occurrence = models.event_occurrence.EventOccurrence
+    POI = models.poi.PointOfInterest
+    Event = models.poi.Event
+    query = db.query(
+        Occurrence.poi_id.label('id'), Occurrence.occurs_at,
+        POI.name, POI.slug, POI.address_city, Event.event_status,
+    ).select_from(Occurrence).join(
+        POI, POI.id == Occurrence.poi_id
+    ).join(
+        Event, Event.poi_id == Occurrence.poi_id
+    ).filter(
+        Occurrence.occurs_at >= date_from,
+        Occurrence.occurs_at <= date_to,
+        POI.poi_type == 'EVENT',
+        POI.publication_status == 'published',
+    )
+    if excluded_event_statuses:
+        query = query.filter(or_(
+            Event.event_status.is_(None),
+            Event.event_status.notin_(excluded_event_statuses),
+        ))
+    if after_id is not None:
+        query = query.filter(
+            tuple_(Occurrence.occurs_at, Occurrence.poi_id) > tuple_(after_at, after_id)
+        )
+    query = query.order_by(Occurrence.occurs_at, Occurrence.poi_id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
 
-    return results
\ No newline at end of file
+
+def location_columns():
+    """``longitude`` / ``latitude`` computed in SQL, so rows skip WKB decoding."""
+    POI = models.poi.PointOfInterest
+    return [
+        func.ST_X(POI.location).label('longitude'),
+        func.ST_Y(POI.location).label('latitude'),
+    ]
+
+
+# Everything the public detail payload of one POI is built from, in one
+# statement of primary-key / poi_id index lookups. Subtype and category rows
+# have no timestamp, so their content is hashed instead (md5 of the row text).
+_DETAIL_VALIDATOR_SQL = """
+    SELECT p.id,
+           p.last_updated,
+           (SELECT md5(b::text) FROM businesses b WHERE b.poi_id = p.id),
+           (SELECT md5(k::text) FROM parks k WHERE k.poi_id = p.id),
+           (SELECT md5(t::text) FROM trails t WHERE t.poi_id = p.id),
+           (SELECT md5(e::text) FROM events e WHERE e.poi_id = p.id),
+           (SELECT count(*) || '@' || coalesce(max(coalesce(i.updated_at, i.created_at))::text, '')
+              FROM images i WHERE i.poi_id = p.id),
+           (SELECT md5(string_agg(c::text || pc.is_main::text, ',' ORDER BY c.id))
+              FROM poi_categories pc JOIN categories c ON c.id = pc.category_id
+             WHERE pc.poi_id = p.id),
+           (SELECT v.last_updated FROM events e
+              JOIN points_of_interest v ON v.id = e.venue_poi_id
+             WHERE e.poi_id = p.id)
+      FROM points_of_interest p
+     WHERE p.publication_status = 'published' AND {where}
+"""
+
+
+def get_detail_validator(db: Session, poi_id=None, slug: str = None):
+    """Return ``(poi_id, parts)`` identifying the current detail payload, or ``None``.
+
+    ``parts`` changes whenever the POI row (``last_updated``), its subtype row,
+    its images, its categories or — for events — its venue POI change, so it
+    can back a strong ETag checked BEFORE the POI is loaded and serialized.
+    ``None`` means no published POI matches.
+    """
+    if poi_id is not None:
+        sql, params = _DETAIL_VALIDATOR_SQL.format(where="p.id = :poi_id"), {"poi_id": poi_id}
+    else:
+        sql, params = _DETAIL_VALIDATOR_SQL.format(where="p.slug = :slug"), {"slug": slug}
+    row = db.execute(text(sql), params).first()
+    if row is None:
+        return None
+    return row[0], tuple(row[1:])
+
+
+def get_detail_validators(db: Session, poi_ids) -> dict:
+    """``{poi_id: parts}`` of ``get_detail_validator`` for many POIs in one query.
+
+    Unpublished or missing POIs are absent.
+    """
+    poi_ids = list(poi_ids)
+    if not poi_ids:
+        return {}
+    stmt = text(_DETAIL_VALIDATOR_SQL.format(where="p.id IN :poi_ids")).bindparams(
+        bindparam("poi_ids", expanding=True)
+    )
+    return {row[0]: tuple(row[1:]) for row in db.execute(stmt, {"poi_ids": poi_ids})}
+
+
+def get_venue_stamp(db: Session, venue_id):
+    """Return the published venue's ``(last_updated,)`` row, or ``None``.
+
+    A single primary-key lookup, used to validate cached venue fields.
+    """
+    POI = models.poi.PointOfInterest
+    return db.execute(
+        select(POI.last_updated).where(
+            POI.id == venue_id,
+            POI.publication_status == 'published',
+        )
+    ).first()
+
+
+def get_venue_fields(db: Session, venue_id):
+    """Return only the venue's inheritable columns as a dict, or ``None``.
+
+    Event venue inheritance reads ~15 columns; this skips the relationship
+    joins and category queries ``get_poi`` pays for.
+    """
+    POI = models.poi.PointOfInterest
+    row = db.execute(
+        select(*(getattr(POI, field) for field in INHERITABLE_FIELDS)).where(
+            POI.id == venue_id,
+            POI.publication_status == 'published',
+        )
+    ).first()
+    if row is None:
+        return None
+    return dict(zip(INHERITABLE_FIELDS, row))
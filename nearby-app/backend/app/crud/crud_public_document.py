@@ -0,0 +1,148 @@
+# app/crud/crud_public_document.py
+"""Read, rebuild-queue and write the stored public POI documents.
+
+``public_document_outbox`` is filled by database triggers on every change to a
+POI, its subtype row, images, categories or venue (admin migration
+``u_public_docs_001``). The document worker claims rows with a lease (same
+scheme as admin's ``crud_embedding_outbox``), rebuilds the documents, and
+deletes the rows whose claimed generation is still current.
+"""
+
+from datetime import timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from ..models.public_poi_document import PublicPoiDocument
+
+# Seconds a claimed row stays invisible to other workers before it is retried.
+CLAIM_LEASE_SECONDS = 120
+# Retry backoff: BASE * 2**(attempts-1), capped at MAX.
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 15 * 60
+
+
+def get_detail_document(db: Session, poi_id) -> Optional[Tuple[str, bytes]]:
+    """``(etag, detail_json)`` stored for ``poi_id``, or ``None``."""
+    row = db.query(
+        PublicPoiDocument.etag, PublicPoiDocument.detail_json
+    ).filter(PublicPoiDocument.poi_id == poi_id).first()
+    if row is None or row.detail_json is None:
+        return None
+    return row.etag, bytes(row.detail_json)
+
+
+def upsert_document(
+    db: Session,
+    poi_id,
+    etag: str,
+    poi_last_updated,
+    detail_json: Optional[bytes],
+    card_json: bytes,
+) -> None:
+    """Insert or replace the stored documents of one POI (caller commits)."""
+    values = {
+        "etag": etag,
+        "poi_last_updated": poi_last_updated,
+        "detail_json": detail_json,
+        "card_json": card_json,
+        "built_at": func.now(),
+    }
+    stmt = insert(PublicPoiDocument).values(poi_id=poi_id, **values)
+    db.execute(stmt.on_conflict_do_update(index_elements=[PublicPoiDocument.poi_id], set_=values))
+
+
+def delete_documents(db: Session, poi_ids: Iterable) -> None:
+    """Drop the stored documents of POIs that are no longer public (caller commits)."""
+    poi_ids = list(poi_ids)
+    if poi_ids:
+        db.query(PublicPoiDocument).filter(
+            PublicPoiDocument.poi_id.in_(poi_ids)
+        ).delete(synchronize_session=False)
+
+
+def enqueue_all_published(db: Session) -> int:
+    """Queue a rebuild of every published POI and drop orphaned documents.
+
+    Used once after deploying the tables, and after a change that alters every
+    payload (serializer, field registry). Returns the number of POIs queued.
+    """
+    queued = db.execute(text(
+        "INSERT INTO public_document_outbox (poi_id) "
+        "SELECT id FROM points_of_interest WHERE publication_status = 'published' "
+        "ON CONFLICT (poi_id) DO UPDATE "
+        "SET generation = public_document_outbox.generation + 1, "
+        "    next_attempt_at = now(), attempts = 0"
+    )).rowcount
+    db.execute(text(
+        "DELETE FROM public_poi_documents d USING points_of_interest p "
+        "WHERE p.id = d.poi_id AND p.publication_status <> 'published'"
+    ))
+    db.commit()
+    return queued
+
+
+def claim_batch(db: Session, limit: int) -> List[Tuple[str, int, int]]:
+    """Lease up to ``limit`` due rows; returns ``[(poi_id, generation, attempts)]``.
+
+    The lease is committed immediately so the row lock is not held while the
+    documents are built (it would block the admin write re-enqueueing them).
+    """
+    rows = db.execute(
+        text(
+            "UPDATE public_document_outbox o "
+            "SET next_attempt_at = now() + make_interval(secs => :lease) "
+            "WHERE o.poi_id IN ("
+            "    SELECT poi_id FROM public_document_outbox "
+            "    WHERE next_attempt_at <= now() "
+            "    ORDER BY next_attempt_at "
+            "    LIMIT :limit "
+            "    FOR UPDATE SKIP LOCKED"
+            ") "
+            "RETURNING o.poi_id::text, o.generation, o.attempts"
+        ),
+        {"lease": CLAIM_LEASE_SECONDS, "limit": limit},
+    ).fetchall()
+    db.commit()
+    return [(row[0], row[1], row[2]) for row in rows]
+
+
+def complete(db: Session, claimed: Iterable[Tuple[str, int]]) -> None:
+    """Delete settled rows, unless they were re-enqueued after being claimed."""
+    for poi_id, generation in claimed:
+        db.execute(
+            text(
+                "DELETE FROM public_document_outbox "
+                "WHERE poi_id = CAST(:poi_id AS uuid) AND generation = :generation"
+            ),
+            {"poi_id": poi_id, "generation": generation},
+        )
+    db.commit()
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before attempt number ``attempts + 1``."""
+    exponent = max(attempts - 1, 0)
+    return timedelta(seconds=min(RETRY_BASE_SECONDS * (2 ** exponent), RETRY_MAX_SECONDS))
+
+
+def fail(db: Session, failed: Iterable[Tuple[str, int, int]]) -> None:
+    """Push ``next_attempt_at`` of failed rows out by the backoff."""
+    for poi_id, generation, attempts in failed:
+        db.execute(
+            text(
+                "UPDATE public_document_outbox "
+                "SET attempts = attempts + 1, "
+                "    next_attempt_at = now() + make_interval(secs => :delay) "
+                "WHERE poi_id = CAST(:poi_id AS uuid) AND generation = :generation"
+            ),
+            {
+                "poi_id": poi_id,
+                "generation": generation,
+                "delay": retry_delay(attempts + 1).total_seconds(),
+            },
+        )
+    db.commit()
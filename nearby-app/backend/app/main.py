@@ -11,11 +11,12 @@ from .api.endpoints import (
     pois, waitlist, community_interest, contact, feedback, business_claims,
     event_suggestions, sitemap,
 )
-from .database import engine, get_db
+from .database import engine, SessionLocal
+from .seo import POI_PAGE_PREFIXES, SITE_BASE_URL, MetaTagCache, SpaShell, lookup_meta_tags
+from .prerender import local_store, page_is_current
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 import os
-import re
 from pathlib import Path
 from . import models
 
@@ -152,6 +153,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type", "X-Requested-With", "Accept"],
+    expose_headers=["X-Next-Cursor"],
     max_age=600,
 )
 
@@ -213,99 +215,30 @@ STATIC_DIR = BASE_DIR / "static"
 if STATIC_DIR.exists():
     app.mount("/assets", StaticFiles(directory=str(STATIC_DIR / "assets")), name="assets")
 
-def get_poi_from_path(path: str, db: Session):
-    """Extract POI identifier from path and fetch POI data"""
-    # Match patterns: /places/{slug}, /parks/{slug}, /trails/{slug}, /events/{slug}, /poi/{uuid}
-    patterns = [
-        (r'^places/(.+)$', 'slug'),
-        (r'^parks/(.+)$', 'slug'),
-        (r'^trails/(.+)$', 'slug'),
-        (r'^events/(.+)$', 'slug'),
-        (r'^poi/([a-f0-9-]{36})$', 'uuid'),
-    ]
-
-    for pattern, id_type in patterns:
-        match = re.match(pattern, path)
-        if match:
-            identifier = match.group(1)
-            if id_type == 'uuid':
-                return db.query(models.poi.PointOfInterest).filter(
-                    models.poi.PointOfInterest.id == identifier,
-                    models.poi.PointOfInterest.publication_status == 'published'
-                ).first()
-            else:
-                return db.query(models.poi.PointOfInterest).filter(
-                    models.poi.PointOfInterest.slug == identifier,
-                    models.poi.PointOfInterest.publication_status == 'published'
-                ).first()
-    return None
-
-
-def generate_og_meta_tags(poi, base_url: str) -> str:
-    """Generate Open Graph meta tags for a POI"""
-    title = f"{poi.name} | NearbyNearby"
-    description = (
-        poi.teaser_paragraph or
-        poi.description_short or
-        (poi.description_long[:150] + '...' if poi.description_long and len(poi.description_long) > 150 else poi.description_long) or
-        f"Discover {poi.name} in {poi.address_city or 'your area'}. Find local businesses, parks, trails, and events on NearbyNearby."
-    )
-    # Strip HTML tags from description
-    description = re.sub(r'<[^>]+>', '', description or '')
-
-    # Determine URL based on slug or fallback to UUID
-    if poi.slug:
-        type_prefixes = {
-            'BUSINESS': 'places',
-            'SERVICES': 'places',
-            'PARK': 'parks',
-            'TRAIL': 'trails',
-            'EVENT': 'events',
-        }
-        prefix = type_prefixes.get(poi.poi_type.value if hasattr(poi.poi_type, 'value') else poi.poi_type, 'places')
-        url = f"{base_url}/{prefix}/{poi.slug}"
-    else:
-        url = f"{base_url}/poi/{poi.id}"
-
-    # Get image URL (featured image or default logo)
-    image_url = poi.featured_image if poi.featured_image else f"{base_url}/Logo.png"
-
-    return f'''
-    <!-- Open Graph / Facebook -->
-    <meta property="og:type" content="website" />
-    <meta property="og:url" content="{url}" />
-    <meta property="og:title" content="{title}" />
-    <meta property="og:description" content="{description}" />
-    <meta property="og:image" content="{image_url}" />
-    <meta property="og:image:width" content="1200" />
-    <meta property="og:image:height" content="630" />
-    <meta property="og:site_name" content="NearbyNearby" />
-
-    <!-- Twitter Card -->
-    <meta name="twitter:card" content="summary_large_image" />
-    <meta name="twitter:url" content="{url}" />
-    <meta name="twitter:title" content="{title}" />
-    <meta name="twitter:description" content="{description}" />
-    <meta name="twitter:image" content="{image_url}" />
-    <meta name="twitter:site" content="@itsnearbynearby" />
-
-    <!-- Standard Meta -->
-    <meta name="description" content="{description}" />
-    <title>{title}</title>
-'''
-
-
-def inject_meta_tags(html: str, meta_tags: str) -> str:
-    """Inject meta tags into HTML, replacing defaults"""
-    # Remove existing OG tags, Twitter tags, and title
-    html = re.sub(r'<meta property="og:[^"]*"[^>]*>', '', html)
-    html = re.sub(r'<meta name="twitter:[^"]*"[^>]*>', '', html)
-    html = re.sub(r'<meta name="description"[^>]*>', '', html)
-    html = re.sub(r'<title>[^<]*</title>', '', html)
-
-    # Inject new meta tags after <head>
-    html = html.replace('<head>', f'<head>{meta_tags}', 1)
-    return html
+# index.html parsed once, and meta tags rendered once per POI version.
+_spa_shell = SpaShell(STATIC_DIR / "index.html")
+_meta_cache = MetaTagCache()
+# Pre-rendered POI pages (PRERENDER_DIR), written by the public document worker.
+_page_store = local_store()
+
+
+def _current_page(page_file: Path, full_path: str):
+    """The pre-rendered page's bytes if its stamp still matches the POI, else None."""
+    page = page_file.read_bytes()
+    db = SessionLocal()
+    try:
+        return page if page_is_current(db, full_path, page) else None
+    finally:
+        db.close()
+
+
+def _poi_meta_tags(full_path: str):
+    """Meta tags for a POI page; blocking DB work, run in the threadpool."""
+    db = SessionLocal()
+    try:
+        return lookup_meta_tags(db, full_path, SITE_BASE_URL, _meta_cache)
+    finally:
+        db.close()
 
 
 # Health check endpoint for ECS/ALB. Return only the minimum signal needed
@@ -361,28 +294,25 @@ async def serve_spa(full_path: str):
         return {"message": "Frontend not built yet. Run 'npm run build' in the app directory."}
 
     # Check if this is a POI page that needs dynamic meta tags
-    poi_patterns = ['places/', 'parks/', 'trails/', 'events/', 'poi/']
-    is_poi_page = any(full_path.startswith(p) for p in poi_patterns)
-
-    if is_poi_page:
-        # Get database session
-        db = next(get_db())
+    if full_path.startswith(POI_PAGE_PREFIXES):
+        # Pre-rendered for the current frontend build: sent after one stamp
+        # lookup; a stale page (missed or failed rewrite) renders per request.
+        if _page_store is not None:
+            page_file = _page_store.page_file(_spa_shell.build_id, full_path)
+            if page_file is not None:
+                try:
+                    page = await run_in_threadpool(_current_page, page_file, full_path)
+                    if page is not None:
+                        return HTMLResponse(content=page)
+                except Exception as e:
+                    print(f"[ERROR] Failed to validate pre-rendered page: {e}")
         try:
-            poi = get_poi_from_path(full_path, db)
-            if poi:
-                # Read HTML and inject dynamic meta tags
-                with open(index_file, 'r') as f:
-                    html = f.read()
-
-                base_url = "https://nearbynearby.com"
-                meta_tags = generate_og_meta_tags(poi, base_url)
-                html = inject_meta_tags(html, meta_tags)
-
-                return HTMLResponse(content=html)
+            # The lookup is sync SQLAlchemy; keep it off the event loop.
+            meta_tags = await run_in_threadpool(_poi_meta_tags, full_path)
+            if meta_tags:
+                return HTMLResponse(content=_spa_shell.render(meta_tags))
         except Exception as e:
             print(f"[ERROR] Failed to generate meta tags: {e}")
-        finally:
-            db.close()
 
     # Default: serve index.html for client-side routing
     return FileResponse(str(index_file))
\ No newline at end of file
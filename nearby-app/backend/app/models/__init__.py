@@ -6,3 +6,6 @@ from . import community_interest
 from . import contact
 from . import feedback
 from . import business_claim
+from . import public_poi_document
+from . import event_occurrence
+from . import poi_open_interval
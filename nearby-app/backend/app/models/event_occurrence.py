@@ -0,0 +1,18 @@
+# app/models/event_occurrence.py
+"""Materialized event occurrences (mirror of admin's event_occurrences table).
+
+Admin owns the schema (migration ``v_event_occurrences_001``) and writes the
+rows alongside every event change; nearby-app only reads them.
+"""
+
+from sqlalchemy import Column, ForeignKey, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+
+from ..database import Base
+
+
+class EventOccurrence(Base):
+    __tablename__ = "event_occurrences"
+
+    poi_id = Column(UUID(as_uuid=True), ForeignKey("points_of_interest.id", ondelete="CASCADE"), primary_key=True)
+    occurs_at = Column(TIMESTAMP(timezone=True), primary_key=True)
@@ -0,0 +1,29 @@
+# app/models/poi_open_interval.py
+"""Resolved opening intervals (mirror of admin's poi_open_intervals table).
+
+Admin owns the schema (migration ``w_open_intervals_001``); nearby-app's
+document worker writes the rows and the listings read them for ``open_now``,
+trusting them only where ``PoiOpenHoursCoverage`` says they are current.
+"""
+
+from sqlalchemy import Column, ForeignKey, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+
+from ..database import Base
+
+
+class PoiOpenInterval(Base):
+    __tablename__ = "poi_open_intervals"
+
+    poi_id = Column(UUID(as_uuid=True), ForeignKey("points_of_interest.id", ondelete="CASCADE"), primary_key=True)
+    opens_at = Column(TIMESTAMP(timezone=True), primary_key=True)
+    closes_at = Column(TIMESTAMP(timezone=True), nullable=False)
+
+
+class PoiOpenHoursCoverage(Base):
+    __tablename__ = "poi_open_hours_coverage"
+
+    poi_id = Column(UUID(as_uuid=True), ForeignKey("points_of_interest.id", ondelete="CASCADE"), primary_key=True)
+    poi_last_updated = Column(TIMESTAMP(timezone=True), nullable=True)
+    covered_from = Column(TIMESTAMP(timezone=True), nullable=False)
+    covered_until = Column(TIMESTAMP(timezone=True), nullable=False)
@@ -0,0 +1,33 @@
+# app/models/public_poi_document.py
+"""Stored public POI JSON (mirror of admin's public_poi_documents tables).
+
+Admin owns the schema and the triggers that fill the outbox (migration
+``u_public_docs_001``); nearby-app's document worker writes the documents.
+"""
+
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class PublicPoiDocument(Base):
+    __tablename__ = "public_poi_documents"
+
+    poi_id = Column(UUID(as_uuid=True), ForeignKey("points_of_interest.id", ondelete="CASCADE"), primary_key=True)
+    etag = Column(String(80), nullable=False)
+    poi_last_updated = Column(TIMESTAMP(timezone=True))
+    detail_json = Column(LargeBinary)
+    card_json = Column(LargeBinary, nullable=False)
+    built_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+
+
+class PublicDocumentOutbox(Base):
+    __tablename__ = "public_document_outbox"
+
+    poi_id = Column(UUID(as_uuid=True), ForeignKey("points_of_interest.id", ondelete="CASCADE"), primary_key=True)
+    generation = Column(Integer, nullable=False, server_default='1')
+    enqueued_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    next_attempt_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    attempts = Column(Integer, nullable=False, server_default='0')
@@ -0,0 +1,328 @@
+# app/prerender.py
+"""Static pre-rendered POI landing pages.
+
+Every published POI gets a finished ``index.html`` variant — the SPA shell with
+its Open Graph / Twitter tags and, optionally, its detail response embedded as
+``<script type="application/json" id="poi-detail">`` — written at its canonical
+path (``parks/{slug}/index.html``). The public document worker rewrites a POI's
+page whenever the outbox reports a change and deletes it when the POI stops
+being published; ``scripts/prerender_pages.py`` regenerates every page on
+deploy.
+
+Pages live under ``{build_id}/`` (a hash of the SPA's ``index.html``), so a
+page never outlives the asset URLs it references: after a frontend deploy the
+new build's directory is empty until it is regenerated, and ``serve_spa``
+falls back to rendering meta tags per request in the meantime. Each build
+also keeps ``_poi/{poi_id}`` markers naming a POI's current page, so a slug or
+type change removes the old page.
+
+Storage is a local directory (``PRERENDER_DIR``, served by ``serve_spa``) or
+an S3-compatible bucket (``PRERENDER_S3_PREFIX`` in the ``AWS_S3_BUCKET`` of
+``app/core/s3.py``, for a CDN to serve). Neither set disables pre-rendering.
+
+Freshness: every page carries a stamp of what it was rendered from — the
+detail ETag when it embeds the detail body, else the POI's ``last_updated``
+— in the same atomic write as its content. ``serve_spa`` checks the stamp
+against the database (``page_is_current``, one indexed lookup) and renders
+per request when the page is stale or the POI is no longer published, so a
+stopped worker or a failed write costs the pre-render, not correctness. Pages
+a CDN serves from S3 are not checked per request: they are as current as the
+worker's last write plus ``PAGE_CACHE_CONTROL``.
+"""
+
+from __future__ import annotations
+
+import html
+import logging
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from . import models
+from .seo import (
+    SITE_BASE_URL,
+    SpaShell,
+    detail_json_script,
+    generate_og_meta_tags,
+    meta_columns,
+    parse_page_path,
+    poi_page_path,
+)
+
+logger = logging.getLogger(__name__)
+
+PRERENDER_DIR = os.getenv("PRERENDER_DIR")
+PRERENDER_S3_PREFIX = os.getenv("PRERENDER_S3_PREFIX")
+PRERENDER_EMBED_DETAIL = os.getenv("PRERENDER_EMBED_DETAIL", "").lower() in ("1", "true", "yes")
+
+INDEX_FILE = Path(__file__).resolve().parent.parent / "static" / "index.html"
+# Browsers revalidate; a CDN may keep an object for 5 minutes.
+PAGE_CACHE_CONTROL = "public, max-age=0, s-maxage=300"
+REGENERATE_YIELD_PER = 500
+
+# Page paths a pre-rendered file may exist for (also guards the filesystem).
+_PAGE_PATH = re.compile(
+    r'^(?:(?:places|parks|trails|events)/[\w-]+|poi/[a-f0-9-]{36})$'
+)
+_MARKER_DIR = "_poi"
+# ``<meta>`` carrying the page's stamp: ``detail:<etag>`` or ``poi:<last_updated>``.
+_STAMP_META = '<meta name="nearby:prerender" content="{}" />'
+_STAMP_PATTERN = re.compile(rb'<meta name="nearby:prerender" content="([^"]*)" />')
+
+
+def is_page_path(path: str) -> bool:
+    return bool(_PAGE_PATH.match(path))
+
+
+def page_stamp(page: bytes) -> Optional[str]:
+    """The stamp a pre-rendered page was written with, or ``None``."""
+    match = _STAMP_PATTERN.search(page)
+    return html.unescape(match.group(1).decode("utf-8")) if match else None
+
+
+def page_is_current(db: Session, path: str, page: bytes) -> bool:
+    """True when ``page`` (at ``path``) still matches its published POI."""
+    stamp, parsed = page_stamp(page), parse_page_path(path)
+    if stamp is None or parsed is None:
+        return False
+    kind, _, value = stamp.partition(":")
+    id_type, identifier = parsed
+    if kind == "detail":
+        from .api.endpoints.pois import current_detail_etag
+
+        lookup = {"poi_id": identifier} if id_type == "uuid" else {"slug": identifier}
+        return current_detail_etag(db, **lookup) == value
+    if kind == "poi":
+        POI = models.poi.PointOfInterest
+        column = POI.id if id_type == "uuid" else POI.slug
+        row = db.query(POI.last_updated).filter(
+            column == identifier, POI.publication_status == "published"
+        ).first()
+        return row is not None and _iso(row.last_updated) == value
+    return False
+
+
+def _iso(value) -> str:
+    return value.isoformat() if value is not None else ""
+
+
+class LocalPageStore:
+    """Pages as files under ``root``; writes are atomic (temp file + rename)."""
+
+    def __init__(self, root) -> None:
+        self.root = Path(root)
+
+    def _file(self, key: str) -> Path:
+        return self.root / key
+
+    def read(self, key: str) -> Optional[bytes]:
+        try:
+            return self._file(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write(self, key: str, body: bytes) -> None:
+        target = self._file(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(body)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            self._file(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def page_file(self, build_id: str, path: str) -> Optional[Path]:
+        """The pre-rendered file for page ``path`` of ``build_id``, if written."""
+        if not is_page_path(path):
+            return None
+        page = self._file(f"{build_id}/{path}/index.html")
+        return page if page.is_file() else None
+
+    def prune(self, keep_build_id: str) -> int:
+        """Delete the pages of every other build; returns the builds removed."""
+        removed = 0
+        if self.root.is_dir():
+            for child in self.root.iterdir():
+                if child.is_dir() and child.name != keep_build_id:
+                    shutil.rmtree(child)
+                    removed += 1
+        return removed
+
+
+class S3PageStore:
+    """Pages as objects under ``prefix`` in the configured S3 bucket."""
+
+    def __init__(self, client, bucket: str, prefix: str) -> None:
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def read(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=self._key(key))["Body"].read()
+        except self.client.exceptions.NoSuchKey:
+            return None
+
+    def write(self, key: str, body: bytes) -> None:
+        content_type = "text/html; charset=utf-8" if key.endswith(".html") else "text/plain"
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(key),
+            Body=body,
+            ContentType=content_type,
+            CacheControl=PAGE_CACHE_CONTROL,
+        )
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+
+def local_store() -> Optional[LocalPageStore]:
+    """The ``PRERENDER_DIR`` store ``serve_spa`` reads from, or ``None``."""
+    return LocalPageStore(PRERENDER_DIR) if PRERENDER_DIR else None
+
+
+def configured_store():
+    """The store pages are written to, or ``None`` when pre-rendering is off."""
+    if PRERENDER_DIR:
+        return LocalPageStore(PRERENDER_DIR)
+    if PRERENDER_S3_PREFIX is not None:
+        from .core.s3 import s3_client
+        if s3_client is None:
+            logger.warning("PRERENDER_S3_PREFIX is set but S3 is not configured; pre-rendering is off")
+            return None
+        return S3PageStore(s3_client.client, s3_client.config.bucket_name, PRERENDER_S3_PREFIX)
+    return None
+
+
+class PagePrerenderer:
+    """Write and remove the pre-rendered pages of POIs in ``store``."""
+
+    def __init__(
+        self,
+        store,
+        shell: SpaShell,
+        base_url: str = SITE_BASE_URL,
+        embed_detail: bool = PRERENDER_EMBED_DETAIL,
+    ) -> None:
+        self.store = store
+        self.shell = shell
+        self.base_url = base_url
+        self.embed_detail = embed_detail
+
+    def render(self, poi, detail_json: Optional[bytes] = None, etag: Optional[str] = None) -> bytes:
+        """The page of ``poi`` (a row with the ``meta_columns`` fields and ``last_updated``).
+
+        The detail body is embedded only together with its ``etag``, which
+        then stamps the page; otherwise ``last_updated`` does.
+        """
+        head = generate_og_meta_tags(poi, self.base_url)
+        if self.embed_detail and detail_json and etag:
+            head += detail_json_script(detail_json)
+            stamp = f"detail:{etag}"
+        else:
+            stamp = f"poi:{_iso(poi.last_updated)}"
+        head += "    " + _STAMP_META.format(html.escape(stamp, quote=True)) + "\n"
+        return self.shell.render(head).encode("utf-8")
+
+    def write(self, poi, detail_json: Optional[bytes] = None, etag: Optional[str] = None) -> Optional[str]:
+        """Write the page of ``poi``, replacing a page at a previous path.
+
+        Returns the page path, or ``None`` (old page removed) when the slug
+        cannot be a single URL segment.
+        """
+        build_id = self.shell.build_id
+        marker = f"{build_id}/{_MARKER_DIR}/{poi.id}"
+        path = poi_page_path(poi)
+        previous = self.store.read(marker)
+        if previous is not None and previous.decode("utf-8") != path:
+            self.store.delete(f"{build_id}/{previous.decode('utf-8')}/index.html")
+        if not is_page_path(path):
+            self.store.delete(marker)
+            return None
+        self.store.write(f"{build_id}/{path}/index.html", self.render(poi, detail_json, etag))
+        self.store.write(marker, path.encode("utf-8"))
+        return path
+
+    def remove(self, poi_id) -> None:
+        """Delete the page of a POI that is gone or no longer published."""
+        marker = f"{self.shell.build_id}/{_MARKER_DIR}/{poi_id}"
+        previous = self.store.read(marker)
+        if previous is not None:
+            self.store.delete(f"{self.shell.build_id}/{previous.decode('utf-8')}/index.html")
+            self.store.delete(marker)
+
+    def publish(
+        self, db: Session, poi_id, detail_json: Optional[bytes] = None, etag: Optional[str] = None,
+    ) -> Optional[str]:
+        """Re-render one POI from the database (removing its page if unpublished).
+
+        ``detail_json`` and its ``etag`` come from ``build_public_documents``.
+        """
+        POI = models.poi.PointOfInterest
+        poi = db.query(*meta_columns(), POI.last_updated).filter(
+            POI.id == poi_id, POI.publication_status == "published"
+        ).first()
+        if poi is None:
+            self.remove(poi_id)
+            return None
+        return self.write(poi, detail_json, etag)
+
+
+def _published_pages(db: Session, with_detail: bool) -> Iterator:
+    POI = models.poi.PointOfInterest
+    columns = [*meta_columns(), POI.last_updated]
+    query = db.query(*columns)
+    if with_detail:
+        Document = models.public_poi_document.PublicPoiDocument
+        query = db.query(*columns, Document.etag, Document.detail_json).outerjoin(
+            Document, Document.poi_id == POI.id
+        )
+    return query.filter(POI.publication_status == "published").yield_per(REGENERATE_YIELD_PER)
+
+
+def regenerate_all(db: Session, prerenderer: PagePrerenderer) -> int:
+    """Write the page of every published POI; returns the number written.
+
+    The embedded detail body is the worker's stored document, stamped with
+    its ETag (pages of POIs without one are written without the payload; a
+    stored document that is already stale only makes its page fall back).
+    """
+    written = 0
+    for row in _published_pages(db, prerenderer.embed_detail):
+        detail_json = row.detail_json if prerenderer.embed_detail else None
+        etag = row.etag if prerenderer.embed_detail else None
+        if prerenderer.write(row, bytes(detail_json) if detail_json else None, etag):
+            written += 1
+    return written
+
+
+_default = None
+
+
+def get_prerenderer() -> Optional[PagePrerenderer]:
+    """The process-wide prerenderer from the environment, or ``None`` when off."""
+    global _default
+    if _default is None:
+        store = configured_store()
+        if store is None:
+            return None
+        _default = PagePrerenderer(store, SpaShell(INDEX_FILE))
+    return _default
@@ -1,6 +1,6 @@
 # app/schemas/poi.py
 from pydantic import BaseModel, ConfigDict, field_validator
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 import uuid
 from datetime import datetime
 from geoalchemy2.elements import WKBElement
@@ -106,6 +106,9 @@ class POIImage(BaseModel):
     id: str
     url: str
     thumbnail_url: Optional[str] = None  # Smaller variant for grid display
+    # Every available size variant, e.g. {"thumbnail": url, "medium": url,
+    # "large": url, "xlarge": url}, for responsive srcset selection.
+    variants: Dict[str, str] = {}
     type: str
     alt_text: Optional[str] = None
     caption: Optional[str] = None
@@ -11,6 +11,13 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
+from shared.embeddings.versions import (
+    LIVE,
+    SHADOW,
+    registered_models,
+    resolve_embedding_store,
+)
+
 from .query_processor import parse_query, ParsedQuery
 from .constants import (
     SIGNAL_WEIGHTS,
@@ -258,24 +265,53 @@ def _signal_semantic(
         db.rollback()
         return {}
 
+    # Only compare against vectors produced by the SAME model as the query
+    # vector: the live store, or the shadow store mid model-migration.
+    model = getattr(client, "model", None)
+    try:
+        roles = registered_models(db)
+        store = resolve_embedding_store(db, model, roles)
+    except Exception:
+        db.rollback()
+        roles, store = {}, LIVE
+    if store is None:
+        return {}
+
     # The shared client is fail-soft: it returns None (never raises) on a
     # disabled client, transport error, or bad vector. Bail to keyword search.
     query_embedding = client.embed(query, kind="query")
     if query_embedding is None:
         return {}
 
-    type_filter = "AND poi_type = :poi_type" if poi_type else ""
-    sql = text(f"""
-        SELECT id::text,
-               1 - (embedding <=> cast(:query_embedding as vector)) AS similarity
-        FROM points_of_interest
-        WHERE publication_status = 'published'
-        AND embedding IS NOT NULL
-        {type_filter}
-        ORDER BY embedding <=> cast(:query_embedding as vector)
-        LIMIT 30
-    """)
-    params = {"query_embedding": str(list(query_embedding))}
+    type_filter = "AND p.poi_type = :poi_type" if poi_type else ""
+    if store == SHADOW:
+        sql = text(f"""
+            SELECT p.id::text,
+                   1 - (s.embedding <=> cast(:query_embedding as vector)) AS similarity
+            FROM poi_embedding_shadow s
+            JOIN points_of_interest p ON p.id = s.poi_id
+            WHERE p.publication_status = 'published'
+            AND s.model = :model
+            {type_filter}
+            ORDER BY s.embedding <=> cast(:query_embedding as vector)
+            LIMIT 30
+        """)
+    else:
+        # Untagged vectors predate versioning; once models are registered
+        # every live vector carries its model id.
+        model_filter = "AND p.embedding_model = :model" if roles else ""
+        sql = text(f"""
+            SELECT p.id::text,
+                   1 - (p.embedding <=> cast(:query_embedding as vector)) AS similarity
+            FROM points_of_interest p
+            WHERE p.publication_status = 'published'
+            AND p.embedding IS NOT NULL
+            {model_filter}
+            {type_filter}
+            ORDER BY p.embedding <=> cast(:query_embedding as vector)
+            LIMIT 30
+        """)
+    params = {"query_embedding": str(list(query_embedding)), "model": model}
     if poi_type:
         params["poi_type"] = poi_type
     try:
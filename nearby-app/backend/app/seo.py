@@ -0,0 +1,244 @@
+# app/seo.py
+"""Server-side meta tags for POI pages of the SPA (social crawlers, first load).
+
+``serve_spa`` answers ``/places|parks|trails|events/{slug}`` and ``/poi/{uuid}``
+with ``index.html`` carrying the POI's Open Graph / Twitter tags. The shell is
+parsed once (``SpaShell``): the default tags are stripped and the document is
+split at ``<head>``, so a page is ``prefix + meta + suffix``. Rendered tags are
+cached per path (``MetaTagCache``) under the POI's ``last_updated``, so an
+edited POI is re-rendered on its next view.
+
+The same rendering feeds the static pre-render pipeline
+(``app/prerender.py``), which writes one finished page per published
+POI for ``serve_spa`` to send after a stamp check (or a CDN to send as is).
+"""
+
+import hashlib
+import re
+import threading
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from shared.utils.stamped_cache import StampedLRUCache
+
+from . import models
+
+# Match patterns: /places/{slug}, /parks/{slug}, /trails/{slug}, /events/{slug}, /poi/{uuid}
+_POI_PATH_PATTERNS = [
+    (re.compile(r'^places/(.+)$'), 'slug'),
+    (re.compile(r'^parks/(.+)$'), 'slug'),
+    (re.compile(r'^trails/(.+)$'), 'slug'),
+    (re.compile(r'^events/(.+)$'), 'slug'),
+    (re.compile(r'^poi/([a-f0-9-]{36})$'), 'uuid'),
+]
+
+POI_PAGE_PREFIXES = ('places/', 'parks/', 'trails/', 'events/', 'poi/')
+
+SITE_BASE_URL = "https://nearbynearby.com"
+
+# POI type -> URL prefix of its canonical page (default: places).
+_TYPE_PREFIXES = {
+    'BUSINESS': 'places',
+    'SERVICES': 'places',
+    'PARK': 'parks',
+    'TRAIL': 'trails',
+    'EVENT': 'events',
+}
+
+# Tags ``generate_og_meta_tags`` replaces in the built index.html.
+_DEFAULT_META_PATTERNS = [
+    re.compile(r'<meta property="og:[^"]*"[^>]*>'),
+    re.compile(r'<meta name="twitter:[^"]*"[^>]*>'),
+    re.compile(r'<meta name="description"[^>]*>'),
+    re.compile(r'<title>[^<]*</title>'),
+]
+
+
+def meta_columns():
+    """The POI columns ``generate_og_meta_tags`` reads."""
+    POI = models.poi.PointOfInterest
+    return (
+        POI.id, POI.slug, POI.poi_type, POI.name, POI.teaser_paragraph,
+        POI.description_short, POI.description_long, POI.address_city,
+        POI.featured_image,
+    )
+
+
+def parse_page_path(path: str):
+    """``('uuid' | 'slug', identifier)`` of the POI a page path names, or None."""
+    for pattern, id_type in _POI_PATH_PATTERNS:
+        match = pattern.match(path)
+        if match:
+            return id_type, match.group(1)
+    return None
+
+
+def _poi_filter(path: str):
+    """SQL filter for the published POI a page path names, or None."""
+    parsed = parse_page_path(path)
+    if parsed is None:
+        return None
+    POI = models.poi.PointOfInterest
+    id_type, identifier = parsed
+    column = POI.id if id_type == 'uuid' else POI.slug
+    return (column == identifier, POI.publication_status == 'published')
+
+
+def get_poi_from_path(path: str, db: Session):
+    """Extract POI identifier from path and fetch the fields its meta tags need"""
+    criteria = _poi_filter(path)
+    if criteria is None:
+        return None
+    return db.query(*meta_columns()).filter(*criteria).first()
+
+
+def poi_page_path(poi) -> str:
+    """Canonical page path of a POI: ``parks/{slug}``, or ``poi/{id}`` without a slug."""
+    if not poi.slug:
+        return f"poi/{poi.id}"
+    poi_type = poi.poi_type.value if hasattr(poi.poi_type, 'value') else poi.poi_type
+    return f"{_TYPE_PREFIXES.get(poi_type, 'places')}/{poi.slug}"
+
+
+def generate_og_meta_tags(poi, base_url: str) -> str:
+    """Generate Open Graph meta tags for a POI"""
+    title = f"{poi.name} | NearbyNearby"
+    description = (
+        poi.teaser_paragraph or
+        poi.description_short or
+        (poi.description_long[:150] + '...' if poi.description_long and len(poi.description_long) > 150 else poi.description_long) or
+        f"Discover {poi.name} in {poi.address_city or 'your area'}. Find local businesses, parks, trails, and events on NearbyNearby."
+    )
+    # Strip HTML tags from description
+    description = re.sub(r'<[^>]+>', '', description or '')
+
+    # Determine URL based on slug or fallback to UUID
+    url = f"{base_url}/{poi_page_path(poi)}"
+
+    # Get image URL (featured image or default logo)
+    image_url = poi.featured_image if poi.featured_image else f"{base_url}/Logo.png"
+
+    return f'''
+    <!-- Open Graph / Facebook -->
+    <meta property="og:type" content="website" />
+    <meta property="og:url" content="{url}" />
+    <meta property="og:title" content="{title}" />
+    <meta property="og:description" content="{description}" />
+    <meta property="og:image" content="{image_url}" />
+    <meta property="og:image:width" content="1200" />
+    <meta property="og:image:height" content="630" />
+    <meta property="og:site_name" content="NearbyNearby" />
+
+    <!-- Twitter Card -->
+    <meta name="twitter:card" content="summary_large_image" />
+    <meta name="twitter:url" content="{url}" />
+    <meta name="twitter:title" content="{title}" />
+    <meta name="twitter:description" content="{description}" />
+    <meta name="twitter:image" content="{image_url}" />
+    <meta name="twitter:site" content="@itsnearbynearby" />
+
+    <!-- Standard Meta -->
+    <meta name="description" content="{description}" />
+    <title>{title}</title>
+'''
+
+
+def detail_json_script(detail_json: bytes) -> str:
+    """``<script type="application/json" id="poi-detail">`` carrying a detail body.
+
+    ``<`` is escaped as ``\\u003c`` (still the same JSON) so no string in the
+    payload can close the script element.
+    """
+    payload = detail_json.decode('utf-8').replace('<', '\\u003c')
+    return f'\n    <script type="application/json" id="poi-detail">{payload}</script>\n'
+
+
+def _strip_default_meta(html: str) -> str:
+    """Remove existing OG tags, Twitter tags, description and title"""
+    for pattern in _DEFAULT_META_PATTERNS:
+        html = pattern.sub('', html)
+    return html
+
+
+def inject_meta_tags(html: str, meta_tags: str) -> str:
+    """Inject meta tags into HTML, replacing defaults"""
+    html = _strip_default_meta(html)
+    # Inject new meta tags after <head>
+    return html.replace('<head>', f'<head>{meta_tags}', 1)
+
+
+class SpaShell:
+    """``index.html`` with its default meta stripped and split after ``<head>``.
+
+    ``render(meta)`` equals ``inject_meta_tags(index_html, meta)`` without
+    re-reading the file or re-running the regexes. The file is re-parsed when
+    its mtime or size changes (a new frontend build). ``build_id`` is a short
+    hash of the file's content, so pre-rendered pages can be tied to the
+    frontend build they embed.
+    """
+
+    def __init__(self, index_file: Path) -> None:
+        self.index_file = index_file
+        self._key = None
+        self._parts = None
+        self._build_id = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        stat = self.index_file.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if self._key != key:
+                raw = self.index_file.read_bytes()
+                html = _strip_default_meta(raw.decode('utf-8'))
+                head, sep, rest = html.partition('<head>')
+                self._parts = (head + sep, rest) if sep else (html, None)
+                self._build_id = hashlib.sha256(raw).hexdigest()[:12]
+                self._key = key
+            return self._parts
+
+    @property
+    def build_id(self) -> str:
+        self._load()
+        return self._build_id
+
+    def render(self, meta_tags: str) -> str:
+        prefix, suffix = self._load()
+        if suffix is None:  # no <head>: nothing to inject into
+            return prefix
+        return prefix + meta_tags + suffix
+
+
+class MetaTagCache(StampedLRUCache):
+    """Thread-safe LRU of rendered meta tags, keyed by page path.
+
+    Each path holds one entry tagged with the POI's ``last_updated``; a lookup
+    with any other stamp re-renders and replaces it. ``get(path, stamp,
+    render)``; see ``StampedLRUCache``.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        super().__init__(maxsize)
+
+
+def lookup_meta_tags(db: Session, path: str, base_url: str, cache: MetaTagCache) -> Optional[str]:
+    """Meta tags for the POI page at ``path`` (None if it names no published POI).
+
+    A cache hit costs one indexed ``last_updated`` lookup; a miss also loads
+    the projected meta fields.
+    """
+    criteria = _poi_filter(path)
+    if criteria is None:
+        return None
+    POI = models.poi.PointOfInterest
+    current = db.query(POI.last_updated).filter(*criteria).first()
+    if current is None:
+        return None
+
+    def render():
+        poi = get_poi_from_path(path, db)
+        return generate_og_meta_tags(poi, base_url) if poi else None
+
+    return cache.get(path, current.last_updated, render)
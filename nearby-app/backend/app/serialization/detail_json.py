@@ -0,0 +1,158 @@
+"""Direct JSON encoding of the registry detail payload (no Pydantic round trip).
+
+The registry detail path used to validate its dict into ``POIDetail`` and call
+``model_dump(mode="json")``, then keep only ``model_fields_set``. That
+validates and dumps ~150 declared fields per request only to discard most of
+them. :class:`DetailEncoder` emits the same JSON directly: exactly the keys
+present in the payload dict, each declared field converted the way Pydantic
+would serialize it, and undeclared (registry) keys passed through.
+
+Encoders are compiled once per schema from the field annotations:
+
+* ``datetime``            -> ISO-8601, UTC rendered as ``Z`` (Pydantic's format)
+* ``uuid.UUID`` / ``str`` -> ``str`` for UUID values (``Event._uuid_to_str``)
+* ``float``               -> ``float`` (``Decimal`` / ``int`` columns)
+* nested ``BaseModel``    -> every declared field of the sub-schema, read from an
+                             ORM object or a dict (subtypes, categories, images,
+                             ``PointGeometry``); ``List[...]`` of those likewise
+* anything else           -> passed through (JSON-native column values)
+
+The schema is passed in rather than imported so the encoder can be exercised
+against the app's ``POIDetail`` wherever it is loaded from (see
+``tests/test_detail_json_parity.py``).
+"""
+
+from __future__ import annotations
+
+import json
+import typing
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+from pydantic import BaseModel
+
+Encoder = Callable[[Any], Any]
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _iso_datetime(value: datetime) -> str:
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _encode_datetime(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return _iso_datetime(value)
+
+
+def _encode_str(value: Any) -> Any:
+    return str(value) if isinstance(value, uuid.UUID) else value
+
+
+def _encode_float(value: Any) -> Any:
+    return None if value is None else float(value)
+
+
+def _strip_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+_MODEL_ENCODERS: Dict[type, Encoder] = {}
+
+
+def _model_encoder(model: type) -> Encoder:
+    """Encode an ORM object, dict or model instance as ``model`` would dump it."""
+    encoder = _MODEL_ENCODERS.get(model)
+    if encoder is not None:
+        return encoder
+
+    fields: List[Tuple[str, Any, Encoder]] = []
+
+    def encode(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            return {name: enc(value.get(name, default)) for name, default, enc in fields}
+        return {name: enc(getattr(value, name, default)) for name, default, enc in fields}
+
+    # Registered before the fields are compiled so self-referencing schemas resolve.
+    _MODEL_ENCODERS[model] = encode
+    for name, field in model.model_fields.items():
+        default = None if field.is_required() else field.get_default(call_default_factory=True)
+        fields.append((name, default, _field_encoder(field.annotation)))
+    return encode
+
+
+def _field_encoder(annotation: Any) -> Encoder:
+    annotation = _strip_optional(annotation)
+    origin = typing.get_origin(annotation)
+    if origin in (list, List):
+        (item,) = typing.get_args(annotation) or (Any,)
+        item_encoder = _field_encoder(item)
+        if item_encoder is _passthrough:
+            return _passthrough
+        return lambda value: None if value is None else [item_encoder(v) for v in value]
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _model_encoder(annotation)
+        if issubclass(annotation, datetime):
+            return _encode_datetime
+        if issubclass(annotation, (str, uuid.UUID)):
+            return _encode_str
+        if issubclass(annotation, float):
+            return _encode_float
+    return _passthrough
+
+
+def _json_default(value: Any) -> Any:
+    """Pydantic's JSON form for values left inside ``Any`` fields."""
+    if isinstance(value, datetime):
+        return _iso_datetime(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class DetailEncoder:
+    """Compiled JSON encoder for payload dicts shaped by ``schema`` (``POIDetail``)."""
+
+    def __init__(self, schema: type):
+        self._fields: Dict[str, Encoder] = {
+            name: _field_encoder(field.annotation)
+            for name, field in schema.model_fields.items()
+        }
+
+    def to_content(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-ready dict of the keys present in ``payload``."""
+        fields = self._fields
+        return {
+            key: fields.get(key, _passthrough)(value)
+            for key, value in payload.items()
+        }
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        """Encoded body, formatted exactly like ``JSONResponse``."""
+        return json.dumps(
+            self.to_content(payload),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=_json_default,
+        ).encode("utf-8")
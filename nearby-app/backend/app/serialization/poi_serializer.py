@@ -29,16 +29,29 @@ Tier gating ports ``nearby-app/app/src/utils/poiTier.js`` exactly: a POI is PAID
 iff ``is_sponsor is True`` OR ``listing_type`` ∈
 {``paid``, ``paid_founding``, ``community_comped``}. Entries with
 ``tier == "paid"`` are dropped for non-paid POIs.
+
+The registry is fixed for the life of the process, so the filtering, ordering,
+tier gate and source dispatch above are resolved ONCE per ``(poi_type, tier)``
+into a :class:`FieldPlan` — a tuple of ``(key, accessor)`` pairs — and a request
+only runs the accessors. ``_read_source`` remains the reference dispatch the
+plans are built to match (see ``scripts/bench_poi_serializer.py``).
 """
 
 from __future__ import annotations
 
 from decimal import Decimal
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from shared.constants.poi_registry import public_fields_for, all_entries
 
+# Version of the public document shape. Part of the detail ETag salt, so stored
+# documents (public_poi_documents, pre-rendered pages) and client/CDN copies
+# built by an older serializer stop validating on deploy. BUMP IT whenever
+# ``serialize_poi_detail``, ``serialize_poi_card`` or ``_serialize_image``
+# change their output for the same rows (2: image ``variants``).
+DOCUMENT_FORMAT_VERSION = 2
+
 # Ported verbatim from nearby-app/app/src/utils/poiTier.js (PAID_LISTING_TYPES).
 _PAID_LISTING_TYPES = frozenset({"paid", "paid_founding", "community_comped"})
 
@@ -98,8 +111,9 @@ def _serialize_image(img) -> Dict[str, Any]:
     """Serialize one image record to the POIImage-shaped dict.
 
     Accepts either the dict shape produced by ``get_poi_images`` (keys: id, url,
-    thumbnail_url, type, alt_text, caption, width, height) or an ORM Image
-    object. Returns the same shape the legacy endpoint emitted.
+    thumbnail_url, type, alt_text, caption, width, height, variants) or an ORM Image
+    object. Returns the same shape the legacy endpoint emitted. Output changes
+    must bump ``DOCUMENT_FORMAT_VERSION``.
     """
     if isinstance(img, dict):
         img_type = img.get("type")
@@ -112,6 +126,7 @@ def _serialize_image(img) -> Dict[str, Any]:
             "caption": img.get("caption"),
             "width": img.get("width"),
             "height": img.get("height"),
+            "variants": dict(img.get("variants") or {}),
         }
     img_type = getattr(img, "image_type", None)
     return {
@@ -123,6 +138,7 @@ def _serialize_image(img) -> Dict[str, Any]:
         "caption": getattr(img, "caption", None),
         "width": getattr(img, "width", None),
         "height": getattr(img, "height", None),
+        "variants": dict(getattr(img, "variants", None) or {}),
     }
 
 
@@ -175,6 +191,108 @@ def _read_source(db, poi, entry: Dict[str, Any], images: List[Any]) -> Any:
     return _coerce(getattr(poi, key, None))
 
 
+# ---------------------------------------------------------------------------
+# Compiled field plans
+# ---------------------------------------------------------------------------
+
+# ``accessor(poi, images) -> value`` for one registry entry.
+Accessor = Callable[[Any, List[Any]], Any]
+
+
+class FieldPlan(NamedTuple):
+    """Precompiled serialization plan for one ``(poi_type, tier)``."""
+
+    # ``(key, accessor)`` in registry order, tier-gated, structural keys removed.
+    fields: Tuple[Tuple[str, Accessor], ...]
+    # Subtype- and image-sourced keys the detail endpoint surfaces nested.
+    structural_keys: frozenset
+
+
+def _compile_accessor(entry: Dict[str, Any]) -> Accessor:
+    """Resolve ``entry["source"]`` once into a closure (same rules as ``_read_source``)."""
+    source = entry.get("source") or ""
+    key = entry["key"]
+
+    if source.startswith("images:"):
+        image_type = source.split(":", 1)[1]
+
+        def read_images(poi, images):
+            return [_serialize_image(img) for img in images if _image_type_of(img) == image_type]
+        return read_images
+
+    head, _, col = source.partition(".")
+    if head == "computed" or not col or (head != "poi" and head not in _SUBTYPES):
+        # computed.<fn> reads the stored column by key; unknown sources fall
+        # back to the key on the POI row.
+        head, col = "poi", key
+
+    if head == "poi":
+        def read_column(poi, images):
+            return _coerce(getattr(poi, col, None))
+        return read_column
+
+    def read_subtype_column(poi, images):
+        sub = getattr(poi, head, None)
+        return None if sub is None else _coerce(getattr(sub, col, None))
+    return read_subtype_column
+
+
+def _structural_keys(entries) -> frozenset:
+    keys = set()
+    for entry in entries:
+        source = entry.get("source") or ""
+        prefix = source.split(".", 1)[0].split(":", 1)[0]
+        if source.startswith("images:") or prefix in _SUBTYPES:
+            keys.add(entry["key"])
+    return frozenset(keys)
+
+
+def _compile_plan(poi_type: str, is_paid: bool) -> FieldPlan:
+    entries = public_fields_for(poi_type)
+    fields = tuple(
+        (entry["key"], _compile_accessor(entry))
+        for entry in entries
+        if (is_paid or entry.get("tier") != "paid")
+        and entry["key"] not in ("location", "id")
+    )
+    return FieldPlan(fields, _structural_keys(entries))
+
+
+def _compile_card_fields(poi_type: str) -> Tuple[Tuple[str, Accessor], ...]:
+    return tuple(
+        (entry["key"], _compile_accessor(entry))
+        for entry in public_fields_for(poi_type)
+        if entry.get("card")
+        and entry["key"] in _CARD_SCHEMA_KEYS
+        and entry["key"] not in ("id", "location")
+        and not (entry.get("source") or "").startswith("images:")
+    )
+
+
+def _registry_poi_types() -> List[str]:
+    return sorted({poi_type for entry in all_entries() for poi_type in entry.get("applies_to", [])})
+
+
+_DETAIL_PLANS: Dict[Tuple[str, bool], FieldPlan] = {}
+_CARD_PLANS: Dict[str, Tuple[Tuple[str, Accessor], ...]] = {}
+
+
+def detail_plan(poi_type: str, is_paid: bool) -> FieldPlan:
+    """The compiled detail plan for ``(poi_type, tier)`` (compiled on first use
+    for a type the registry does not list)."""
+    plan = _DETAIL_PLANS.get((poi_type, is_paid))
+    if plan is None:
+        plan = _DETAIL_PLANS[(poi_type, is_paid)] = _compile_plan(poi_type, is_paid)
+    return plan
+
+
+def _card_plan(poi_type: str) -> Tuple[Tuple[str, Accessor], ...]:
+    plan = _CARD_PLANS.get(poi_type)
+    if plan is None:
+        plan = _CARD_PLANS[poi_type] = _compile_card_fields(poi_type)
+    return plan
+
+
 def serialize_poi_detail(
     db,
     poi,
@@ -210,20 +328,11 @@ def serialize_poi_detail(
         endpoint does.
     """
     images = images or []
-    poi_type = _poi_type_str(poi)
-    is_paid = _tier_is_paid(poi)
-
-    out: Dict[str, Any] = {}
-    for entry in public_fields_for(poi_type):
-        # Server-side tier gate — paid-only fields are dropped for free POIs.
-        if entry.get("tier") == "paid" and not is_paid:
-            continue
-        key = entry["key"]
-        # ``location`` and ``id`` are structural; set them once below with the
-        # exact shapes the legacy endpoint emits (PointGeometry / str(uuid)).
-        if key in ("location", "id"):
-            continue
-        out[key] = _read_source(db, poi, entry, images)
+    # The plan already applies the server-side tier gate (paid-only fields are
+    # dropped for free POIs) and leaves out ``location`` / ``id``, which are set
+    # below with the exact shapes the legacy endpoint emits.
+    plan = detail_plan(_poi_type_str(poi), _tier_is_paid(poi))
+    out: Dict[str, Any] = {key: read(poi, images) for key, read in plan.fields}
 
     # --- Structural keys, emitted exactly as the legacy endpoint does. ---
     out["id"] = str(poi.id)
@@ -249,16 +358,7 @@ def structural_registry_keys_for(poi_type: str) -> frozenset:
     ``images:<type>`` for the given ``poi_type``. This mirrors exactly the
     exclusion logic in ``tests/test_poi_field_contract.py::_expected_public_keys``.
     """
-    keys = set()
-    for entry in public_fields_for(poi_type):
-        source = entry.get("source") or ""
-        if source.startswith("images:"):
-            keys.add(entry["key"])
-            continue
-        prefix = source.split(".", 1)[0].split(":", 1)[0]
-        if prefix in _SUBTYPES:
-            keys.add(entry["key"])
-    return frozenset(keys)
+    return detail_plan(poi_type, False).structural_keys
 
 
 def _build_location(poi):
@@ -323,22 +423,9 @@ def serialize_poi_card(poi, *, images: Optional[List[Any]] = None) -> Dict[str,
     so callers may set it without it being stripped.
     """
     images = images or []
-    poi_type = _poi_type_str(poi)
-
-    out: Dict[str, Any] = {}
-    for entry in public_fields_for(poi_type):
-        if not entry.get("card"):
-            continue
-        key = entry["key"]
-        if key not in _CARD_SCHEMA_KEYS:
-            continue
-        if key in ("id", "location"):
-            continue
-        # images:* entries are not part of the card contract.
-        source = entry.get("source") or ""
-        if source.startswith("images:"):
-            continue
-        out[key] = _read_source(None, poi, entry, images)
+    # The card plan keeps ``card`` entries the schema declares, minus the
+    # structural id/location and images:* entries (not part of the card contract).
+    out: Dict[str, Any] = {key: read(poi, images) for key, read in _card_plan(_poi_type_str(poi))}
 
     # Structural keys for the card.
     out["id"] = poi.id  # POINearbyResult.id is a UUID field (validated)
@@ -347,3 +434,14 @@ def serialize_poi_card(poi, *, images: Optional[List[Any]] = None) -> Dict[str,
         out["featured_image"] = getattr(poi, "featured_image", None)
 
     return out
+
+
+def _compile_all_plans() -> None:
+    for poi_type in _registry_poi_types():
+        for is_paid in (False, True):
+            detail_plan(poi_type, is_paid)
+        _card_plan(poi_type)
+
+
+# Compile every registry type up front so no request pays for it.
+_compile_all_plans()
@@ -0,0 +1,149 @@
+"""Sampled, off-request shadow comparison of the two detail serializers.
+
+With ``POI_SERIALIZER=shadow`` the detail endpoint returns the legacy payload
+and hands the POI id to a :class:`ShadowComparator`. A sampled fraction
+(``POI_SERIALIZER_SHADOW_SAMPLE_RATE``) is rebuilt with BOTH serializers and
+diffed on a single background thread, in its own DB session, so the response
+never waits on the registry build or the diff. At most
+``POI_SERIALIZER_SHADOW_MAX_PENDING`` comparisons are queued; further samples
+are dropped (and counted) rather than growing the queue under load.
+
+Results are aggregated in :class:`ShadowDiffStats` — per-key counts of
+``keys_added`` / ``keys_removed`` / ``value_mismatches`` — and summarized in
+one log line every ``SUMMARY_EVERY`` comparisons instead of a warning per
+request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SHADOW_SAMPLE_RATE = float(os.getenv("POI_SERIALIZER_SHADOW_SAMPLE_RATE", "0.1"))
+SHADOW_MAX_PENDING = int(os.getenv("POI_SERIALIZER_SHADOW_MAX_PENDING", "16"))
+SUMMARY_EVERY = 100
+
+
+class ShadowDiffStats:
+    """Thread-safe aggregate of shadow diff results."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.compared = 0
+            self.mismatched = 0
+            self.failed = 0
+            self.dropped = 0
+            self.keys_added: Counter = Counter()
+            self.keys_removed: Counter = Counter()
+            self.value_mismatches: Counter = Counter()
+
+    def record(self, diff: Dict[str, Any]) -> int:
+        """Count one diff; returns the number of comparisons so far."""
+        with self._lock:
+            self.compared += 1
+            mismatch_keys = [m["key"] for m in diff["value_mismatches"]]
+            if diff["keys_added"] or diff["keys_removed"] or mismatch_keys:
+                self.mismatched += 1
+            self.keys_added.update(diff["keys_added"])
+            self.keys_removed.update(diff["keys_removed"])
+            self.value_mismatches.update(mismatch_keys)
+            return self.compared
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failed += 1
+
+    def record_drop(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "compared": self.compared,
+                "mismatched": self.mismatched,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "keys_added": dict(self.keys_added),
+                "keys_removed": dict(self.keys_removed),
+                "value_mismatches": dict(self.value_mismatches),
+            }
+
+
+class ShadowComparator:
+    """Run ``compare(poi_id) -> diff | None`` for a sample of ids, off-request."""
+
+    def __init__(
+        self,
+        compare: Callable[[Any], Optional[Dict[str, Any]]],
+        sample_rate: float = SHADOW_SAMPLE_RATE,
+        max_pending: int = SHADOW_MAX_PENDING,
+        stats: Optional[ShadowDiffStats] = None,
+    ):
+        self._compare = compare
+        self.sample_rate = sample_rate
+        self.stats = stats or ShadowDiffStats()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="poi-shadow")
+            return self._executor
+
+    def submit(self, poi_id):
+        """Queue a comparison for ``poi_id`` if sampled and a slot is free.
+
+        Returns the ``Future``, or ``None`` when not sampled or dropped.
+        """
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        if not self._slots.acquire(blocking=False):
+            self.stats.record_drop()
+            return None
+        try:
+            return self._get_executor().submit(self._run, poi_id)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _run(self, poi_id) -> None:
+        try:
+            diff = self._compare(poi_id)
+            if diff is None:
+                return
+            compared = self.stats.record(diff)
+            if compared % SUMMARY_EVERY == 0:
+                self.log_summary()
+        except Exception:  # observation must never surface anywhere
+            self.stats.record_failure()
+            logger.exception("POI serializer shadow diff failed poi_id=%s", poi_id)
+        finally:
+            self._slots.release()
+
+    def log_summary(self) -> None:
+        snap = self.stats.snapshot()
+        top = {
+            kind: Counter(snap[kind]).most_common(10)
+            for kind in ("keys_added", "keys_removed", "value_mismatches")
+        }
+        log = logger.warning if snap["mismatched"] else logger.info
+        log(
+            "POI serializer shadow: compared=%d mismatched=%d failed=%d dropped=%d "
+            "keys_added=%s keys_removed=%s value_mismatches=%s",
+            snap["compared"], snap["mismatched"], snap["failed"], snap["dropped"],
+            top["keys_added"], top["keys_removed"], top["value_mismatches"],
+        )
@@ -0,0 +1 @@
+"""Background jobs that run beside the nearby-app API (not on the request path)."""
@@ -0,0 +1,138 @@
+"""Background drain loop for the ``public_document_outbox`` table.
+
+Database triggers queue a POI here whenever its row, subtype row, images,
+categories or venue change (admin migration ``u_public_docs_001``). Each pass
+claims a batch, re-serializes those POIs with the same code the public
+endpoints use (``build_public_documents``), and upserts the encoded detail and
+card JSON into ``public_poi_documents`` — or deletes the documents of POIs that
+are no longer published. The same pass re-resolves the POI's opening hours
+into ``poi_open_intervals`` (``crud_open_hours``) and, when pre-rendering is
+configured, rewrites or deletes the POI's static landing page
+(``app/prerender.py``). ``run_forever`` rolls every POI's open-hours
+horizon forward once a day.
+
+Run it with ``scripts/public_document_worker.py``. Several workers may run side
+by side: claims use ``FOR UPDATE SKIP LOCKED`` and expire after
+``CLAIM_LEASE_SECONDS``. Readers validate every stored document against the
+live data, the ``open_now`` filter resolves a POI's ``hours`` directly
+whenever its stored intervals are out of date or out of range
+(``poi_open_hours_coverage``), and ``serve_spa`` checks each pre-rendered page's
+stamp before sending it, so for all three a stopped worker costs speed, not
+correctness. The exception is pre-rendered pages a CDN serves from S3, which
+are only as current as the worker's last write.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from sqlalchemy.orm import Session
+
+from ..api.endpoints.pois import build_public_documents
+from ..crud import crud_open_hours, crud_public_document
+from ..database import SessionLocal
+from ..prerender import get_prerenderer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_POLL_INTERVAL = 2.0
+# Seconds between open-hours horizon refreshes, and before retrying a failed one.
+OPEN_HOURS_REFRESH_SECONDS = 24 * 60 * 60
+OPEN_HOURS_RETRY_SECONDS = 5 * 60
+
+
+def process_batch(db: Session, batch_size: int = DEFAULT_BATCH_SIZE, prerenderer=None) -> int:
+    """Claim and rebuild one batch in ``db``; returns the number of rows claimed.
+
+    ``prerenderer`` (a ``PagePrerenderer``) also rewrites each POI's static
+    page; a failed page write is retried with the row like any other failure.
+    """
+    claimed = crud_public_document.claim_batch(db, batch_size)
+    if not claimed:
+        return 0
+
+    settled, failed, removed = [], [], 0
+    for poi_id, generation, attempts in claimed:
+        try:
+            documents = build_public_documents(db, poi_id)
+            if documents is None:
+                crud_public_document.delete_documents(db, [poi_id])
+                removed += 1
+            else:
+                crud_public_document.upsert_document(db, poi_id, *documents)
+            if prerenderer is not None:
+                if documents is None:
+                    prerenderer.remove(poi_id)
+                else:
+                    prerenderer.publish(db, poi_id, documents[2], documents[0])
+            crud_open_hours.rebuild_for_poi(db, poi_id)
+            db.commit()
+            settled.append((poi_id, generation))
+        except Exception as exc:  # noqa: BLE001 — retried with backoff
+            logger.warning("public document rebuild failed poi_id=%s: %s", poi_id, exc)
+            db.rollback()
+            failed.append((poi_id, generation, attempts))
+        # Each POI loads its own graph; don't let the identity map grow per batch.
+        db.expunge_all()
+
+    crud_public_document.complete(db, settled)
+    if failed:
+        crud_public_document.fail(db, failed)
+    logger.info(
+        "public document outbox: claimed=%d rebuilt=%d removed=%d failed=%d",
+        len(claimed), len(settled) - removed, removed, len(failed),
+    )
+    return len(claimed)
+
+
+def drain_once(batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Claim and process one batch in a fresh session."""
+    db = SessionLocal()
+    try:
+        return process_batch(db, batch_size, get_prerenderer())
+    finally:
+        db.close()
+
+
+def refresh_open_hours() -> int:
+    """Roll every published POI's open-hours horizon forward in a fresh session."""
+    db = SessionLocal()
+    try:
+        count = crud_open_hours.refresh_all(db)
+    finally:
+        db.close()
+    logger.info("open hours refreshed for %d published POIs", count)
+    return count
+
+
+def run_forever(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> None:
+    """Drain continuously; sleep ``poll_interval`` seconds whenever idle.
+
+    Open hours are refreshed on startup and then every
+    ``OPEN_HOURS_REFRESH_SECONDS``.
+    """
+    logger.info(
+        "public document worker started (batch_size=%d, poll_interval=%.1fs)",
+        batch_size, poll_interval,
+    )
+    next_refresh = 0.0
+    while True:
+        if time.monotonic() >= next_refresh:
+            try:
+                refresh_open_hours()
+                next_refresh = time.monotonic() + OPEN_HOURS_REFRESH_SECONDS
+            except Exception as exc:  # noqa: BLE001 — retried shortly
+                logger.warning("open hours refresh failed: %s", exc)
+                next_refresh = time.monotonic() + OPEN_HOURS_RETRY_SECONDS
+        try:
+            claimed = drain_once(batch_size)
+        except Exception as exc:  # noqa: BLE001 — keep the worker alive (DB blips)
+            logger.warning("public document worker pass failed: %s", exc)
+            claimed = 0
+        if claimed < batch_size:
+            time.sleep(poll_interval)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Microbenchmark: compiled field plans vs per-request registry dispatch.
+
+``serialize_poi_detail`` / ``serialize_poi_card`` run a precompiled
+``(key, accessor)`` plan per ``(poi_type, tier)``. This script times them
+against the previous implementation — filter and sort the registry with
+``public_fields_for`` and dispatch every entry through ``_read_source`` on each
+call — on synthetic in-memory POIs (no database), and checks both produce the
+same payload.
+
+Usage
+-----
+    python scripts/bench_poi_serializer.py [--iterations 2000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+_REPO_ROOT = os.path.dirname(os.path.dirname(_BACKEND_ROOT))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.constants.poi_registry import public_fields_for  # noqa: E402
+from app.serialization.poi_serializer import (  # noqa: E402
+    _CARD_SCHEMA_KEYS,
+    _SUBTYPES,
+    _build_location,
+    _poi_type_str,
+    _read_source,
+    _tier_is_paid,
+    serialize_poi_card,
+    serialize_poi_detail,
+    structural_registry_keys_for,
+)
+
+POI_TYPES = ("BUSINESS", "PARK", "TRAIL", "EVENT")
+
+
+def reference_detail(poi, images):
+    """``serialize_poi_detail`` as it was before field plans."""
+    poi_type = _poi_type_str(poi)
+    is_paid = _tier_is_paid(poi)
+    out = {}
+    for entry in public_fields_for(poi_type):
+        if entry.get("tier") == "paid" and not is_paid:
+            continue
+        if entry["key"] in ("location", "id"):
+            continue
+        out[entry["key"]] = _read_source(None, poi, entry, images)
+    out["id"] = str(poi.id)
+    out["location"] = _build_location(poi)
+    return out
+
+
+def reference_structural_keys(poi_type):
+    keys = set()
+    for entry in public_fields_for(poi_type):
+        source = entry.get("source") or ""
+        if source.startswith("images:") or source.split(".", 1)[0] in _SUBTYPES:
+            keys.add(entry["key"])
+    return frozenset(keys)
+
+
+def reference_card(poi, images):
+    out = {}
+    for entry in public_fields_for(_poi_type_str(poi)):
+        key = entry["key"]
+        if not entry.get("card") or key not in _CARD_SCHEMA_KEYS or key in ("id", "location"):
+            continue
+        if (entry.get("source") or "").startswith("images:"):
+            continue
+        out[key] = _read_source(None, poi, entry, images)
+    out["id"] = poi.id
+    out["location"] = _build_location(poi)
+    if "featured_image" not in out:
+        out["featured_image"] = getattr(poi, "featured_image", None)
+    return out
+
+
+def synthetic_poi(poi_type):
+    """A paid POI with every registry-sourced column set to a sample value."""
+    poi = SimpleNamespace(id="00000000-0000-0000-0000-000000000001", location=None)
+    subtypes = {name: SimpleNamespace() for name in _SUBTYPES}
+    for entry in public_fields_for(poi_type):
+        head, _, col = (entry.get("source") or "").partition(".")
+        target = subtypes.get(head, poi)
+        setattr(target, col if col and head != "computed" else entry["key"], f"value-{entry['key']}")
+    for name, sub in subtypes.items():
+        setattr(poi, name, sub)
+    poi.poi_type = poi_type
+    poi.listing_type = "paid"
+    poi.is_sponsor = True
+    images = [{"id": "img-1", "type": "main", "url": "https://example.test/main.webp"},
+              {"id": "img-2", "type": "gallery", "url": "https://example.test/g.webp"}]
+    return poi, images
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'type':<10} {'payload':<8} {'reference µs':>13} {'plan µs':>9} {'speedup':>8}")
+    for poi_type in POI_TYPES:
+        poi, images = synthetic_poi(poi_type)
+        assert serialize_poi_detail(None, poi, images=images) == reference_detail(poi, images)
+        assert serialize_poi_card(poi) == reference_card(poi, [])
+        assert structural_registry_keys_for(poi_type) == reference_structural_keys(poi_type)
+
+        cases = (
+            ("detail", lambda: reference_detail(poi, images),
+             lambda: serialize_poi_detail(None, poi, images=images)),
+            ("card", lambda: reference_card(poi, []), lambda: serialize_poi_card(poi)),
+            ("strip", lambda: reference_structural_keys(poi_type),
+             lambda: structural_registry_keys_for(poi_type)),
+        )
+        for name, reference, planned in cases:
+            ref = min(timeit.repeat(reference, number=args.iterations, repeat=3)) / args.iterations
+            new = min(timeit.repeat(planned, number=args.iterations, repeat=3)) / args.iterations
+            print(f"{poi_type:<10} {name:<8} {ref * 1e6:>13.1f} {new * 1e6:>9.1f} {ref / new:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
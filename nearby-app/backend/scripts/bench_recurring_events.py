@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Microbenchmark: window-anchored recurrence expansion vs walking from dtstart.
+
+``expand_recurring_dates`` now restarts the rrule on its period grid just
+before ``date_from`` and pre-parses excluded/manual dates once per event
+(``compile_recurrence``). This script times it against the previous
+implementation — iterate the rrule from ``start_datetime`` and filter every
+occurrence against the window, re-parsing exclusions per call — for
+long-running events and a one-week window late in the series, and checks both
+return the same datetimes.
+
+Usage
+-----
+    python scripts/bench_recurring_events.py [--iterations 200] [--events 500]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+_REPO_ROOT = os.path.dirname(os.path.dirname(_BACKEND_ROOT))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from dateutil.parser import isoparse  # noqa: E402
+from dateutil.rrule import rrule  # noqa: E402
+
+from shared.utils.recurring_events import (  # noqa: E402
+    _DAY_MAP,
+    _FREQ_MAP,
+    _MAX_MONTHS,
+    compile_recurrence,
+    expand_recurring_batch,
+    expand_recurring_dates,
+)
+
+START = datetime(2022, 1, 3, 18, 0, tzinfo=timezone.utc)
+# One week, four and a half years into the series.
+WINDOW = (
+    datetime(2026, 6, 1, tzinfo=timezone.utc),
+    datetime(2026, 6, 7, 23, 59, 59, tzinfo=timezone.utc),
+)
+EXCLUDED = [(START + timedelta(weeks=w)).strftime("%Y-%m-%d") for w in range(0, 260, 5)]
+MANUAL = ["2026-06-03T12:00:00Z", "2024-02-29T09:00:00Z"]
+
+CASES = (
+    ("daily", {"frequency": "daily", "interval": 1}),
+    ("weekly", {"frequency": "weekly", "interval": 1}),
+    ("weekly MO/WE/FR", {"frequency": "weekly", "interval": 1, "days": ["MO", "WE", "FR"]}),
+    ("monthly", {"frequency": "monthly", "interval": 1}),
+)
+
+
+def reference_expand(start_datetime, repeat_pattern, date_from, date_to,
+                     excluded_dates=None, manual_dates=None, recurrence_end_date=None):
+    """``expand_recurring_dates`` as it was before window anchoring."""
+    freq = _FREQ_MAP[repeat_pattern["frequency"].lower()]
+    effective_end = min(date_to, start_datetime + timedelta(days=_MAX_MONTHS * 30))
+    if recurrence_end_date and recurrence_end_date < effective_end:
+        effective_end = recurrence_end_date
+    kwargs = {"freq": freq, "dtstart": start_datetime,
+              "interval": repeat_pattern.get("interval", 1), "until": effective_end}
+    days = repeat_pattern.get("days")
+    if days:
+        kwargs["byweekday"] = [_DAY_MAP[d] for d in days if d in _DAY_MAP]
+    occurrences = set()
+    for dt in rrule(**kwargs):
+        if dt > effective_end:
+            break
+        if date_from <= dt <= date_to:
+            occurrences.add(dt)
+    excluded = {datetime.strptime(d, "%Y-%m-%d").date() for d in excluded_dates or ()}
+    occurrences = {dt for dt in occurrences if dt.date() not in excluded}
+    for m_str in manual_dates or ():
+        manual_dt = isoparse(m_str)
+        if date_from <= manual_dt <= date_to:
+            occurrences.add(manual_dt)
+    return sorted(occurrences)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--events", type=int, default=500,
+                        help="Events per batch in the batch case (default: 500)")
+    args = parser.parse_args()
+    date_from, date_to = WINDOW
+    kwargs = {"excluded_dates": EXCLUDED, "manual_dates": MANUAL}
+
+    print(f"{'pattern':<16} {'reference µs':>13} {'anchored µs':>12} {'speedup':>8}")
+    for name, pattern in CASES:
+        expected = reference_expand(START, pattern, date_from, date_to, **kwargs)
+        assert expand_recurring_dates(START, pattern, date_from, date_to, **kwargs) == expected
+
+        ref = min(timeit.repeat(
+            lambda: reference_expand(START, pattern, date_from, date_to, **kwargs),
+            number=args.iterations, repeat=3)) / args.iterations
+        new = min(timeit.repeat(
+            lambda: expand_recurring_dates(START, pattern, date_from, date_to, **kwargs),
+            number=args.iterations, repeat=3)) / args.iterations
+        print(f"{name:<16} {ref * 1e6:>13.1f} {new * 1e6:>12.1f} {ref / new:>7.1f}x")
+
+    # Calendar-style batch: many weekly events, compiled once, one window.
+    starts = [START + timedelta(hours=i) for i in range(args.events)]
+    pattern = {"frequency": "weekly", "interval": 1}
+    compiled = {i: compile_recurrence(s, pattern, **kwargs) for i, s in enumerate(starts)}
+    expected = {}
+    for i, s in enumerate(starts):
+        found = reference_expand(s, pattern, date_from, date_to, **kwargs)
+        if found:
+            expected[i] = found
+    assert expand_recurring_batch(compiled, date_from, date_to) == expected
+
+    batch_iterations = max(args.iterations // 50, 1)
+    ref = min(timeit.repeat(
+        lambda: [reference_expand(s, pattern, date_from, date_to, **kwargs) for s in starts],
+        number=batch_iterations, repeat=3)) / batch_iterations
+    new = min(timeit.repeat(
+        lambda: expand_recurring_batch(compiled, date_from, date_to),
+        number=batch_iterations, repeat=3)) / batch_iterations
+    print(f"{f'batch x{args.events}':<16} {ref * 1e3:>11.1f}ms {new * 1e3:>10.1f}ms {ref / new:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
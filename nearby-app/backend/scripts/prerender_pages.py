@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Regenerate every pre-rendered POI landing page (run on each deploy).
+
+Pages are stored per frontend build (a hash of ``static/index.html``), so a
+new frontend starts with no pages and ``serve_spa`` renders meta tags per
+request until this script has filled the new build's directory. Between
+deploys the public document worker keeps the pages current on its own (see
+``app/prerender.py``).
+
+Usage
+-----
+    python scripts/prerender_pages.py [--embed-detail] [--prune]
+
+Options
+-------
+    --embed-detail       Embed each POI's stored detail JSON in its page
+                         (default: PRERENDER_EMBED_DETAIL).
+    --prune              Afterwards delete the pages of every other build
+                         (local PRERENDER_DIR only).
+
+Environment
+-----------
+    DATABASE_URL         nearby-app DB connection (via app.core.config.settings).
+    PRERENDER_DIR        Directory pages are written to (served by serve_spa), or
+    PRERENDER_S3_PREFIX  key prefix in AWS_S3_BUCKET (see app/core/s3.py).
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Backend root for `app`, repo root for a top-level `shared/` in local dev.
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+_REPO_ROOT = os.path.dirname(os.path.dirname(_BACKEND_ROOT))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from app.database import SessionLocal  # noqa: E402
+from app.prerender import (  # noqa: E402
+    INDEX_FILE,
+    PRERENDER_EMBED_DETAIL,
+    LocalPageStore,
+    PagePrerenderer,
+    configured_store,
+    regenerate_all,
+)
+from app.seo import SpaShell  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Regenerate the pre-rendered page of every published POI"
+    )
+    parser.add_argument("--embed-detail", action="store_true", default=PRERENDER_EMBED_DETAIL,
+                        help="Embed the stored detail JSON in each page")
+    parser.add_argument("--prune", action="store_true",
+                        help="Delete the pages of every other frontend build")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    store = configured_store()
+    if store is None:
+        print("[ERROR] Set PRERENDER_DIR or PRERENDER_S3_PREFIX (with S3 configured)")
+        return 1
+    if not INDEX_FILE.is_file():
+        print(f"[ERROR] {INDEX_FILE} not found; build the frontend first")
+        return 1
+
+    shell = SpaShell(INDEX_FILE)
+    prerenderer = PagePrerenderer(store, shell, embed_detail=args.embed_detail)
+    print(f"[INFO] Rendering build {shell.build_id}")
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        written = regenerate_all(db, prerenderer)
+    finally:
+        db.close()
+    print(f"[DONE] Wrote {written} pages in {time.perf_counter() - started:.1f}s")
+
+    if args.prune:
+        if isinstance(store, LocalPageStore):
+            print(f"[INFO] Pruned {store.prune(shell.build_id)} old builds")
+        else:
+            print("[INFO] --prune only applies to PRERENDER_DIR; skipped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
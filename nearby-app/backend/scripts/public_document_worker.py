@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Drain the ``public_document_outbox`` table: rebuild stored public POI JSON.
+
+Database triggers queue a POI whenever its data, images, categories or venue
+change; this long-running worker re-serializes it into ``public_poi_documents``
+(see ``app/services/public_document_worker.py``), which the public detail and
+nearby endpoints serve as pre-encoded bytes. It also keeps the resolved
+opening hours in ``poi_open_intervals`` current (rolled forward on startup and
+daily), which the listings' ``open_now`` filter reads.
+
+Usage
+-----
+    python scripts/public_document_worker.py [--batch-size 50] [--poll-interval 2]
+                                             [--once] [--rebuild-all]
+
+Options
+-------
+    --batch-size N       Outbox rows claimed per pass (default: 50).
+    --poll-interval S    Seconds to sleep when the outbox is idle (default: 2).
+    --once               Refresh open hours, drain until the outbox has
+                         nothing due, then exit (run daily if used from cron).
+    --rebuild-all        First queue every published POI (after the initial
+                         deploy, or a serializer / field registry change).
+
+Environment
+-----------
+    DATABASE_URL         nearby-app DB connection (via app.core.config.settings).
+    POI_SERIALIZER       Must match the API's; detail bodies are only stored for
+                         the default ``registry`` serializer.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Backend root for `app`, repo root for a top-level `shared/` in local dev.
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+_REPO_ROOT = os.path.dirname(os.path.dirname(_BACKEND_ROOT))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from app.crud import crud_public_document  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.services.public_document_worker import (  # noqa: E402
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_POLL_INTERVAL,
+    drain_once,
+    refresh_open_hours,
+    run_forever,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Rebuild stored public POI documents from the outbox"
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Rows claimed per pass (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f"Idle sleep in seconds (default: {DEFAULT_POLL_INTERVAL:g})")
+    parser.add_argument("--once", action="store_true",
+                        help="Refresh open hours, drain everything currently due, then exit")
+    parser.add_argument("--rebuild-all", action="store_true",
+                        help="Queue every published POI before draining")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    if args.rebuild_all:
+        db = SessionLocal()
+        try:
+            queued = crud_public_document.enqueue_all_published(db)
+        finally:
+            db.close()
+        print(f"[INFO] Queued {queued} published POIs for rebuild")
+
+    if args.once:
+        refresh_open_hours()
+        total = 0
+        while True:
+            claimed = drain_once(args.batch_size)
+            total += claimed
+            if claimed == 0:
+                break
+        print(f"[DONE] Processed {total} outbox rows")
+        return 0
+
+    run_forever(args.batch_size, args.poll_interval)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,20 +9,24 @@ from shared.embeddings.text_builder import (
     build_searchable_text,
     build_searchable_text_from_orm,
     create_searchable_text,
+    searchable_text_hash,
 )
 from shared.embeddings.client import (
     DOCUMENT_PREFIX,
     QUERY_PREFIX,
     EmbeddingClient,
     get_embedding_client,
+    get_shadow_embedding_client,
 )
 
 __all__ = [
     "build_searchable_text",
     "create_searchable_text",
     "build_searchable_text_from_orm",
+    "searchable_text_hash",
     "EmbeddingClient",
     "get_embedding_client",
+    "get_shadow_embedding_client",
     "QUERY_PREFIX",
     "DOCUMENT_PREFIX",
 ]
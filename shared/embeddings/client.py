@@ -203,6 +203,17 @@ class EmbeddingClient:
             return None
         return self._normalize_vector(data[0])
 
+    def probe_dim(self) -> int | None:
+        """Return the dimension of the vectors the server produces, or ``None``.
+
+        Unlike ``embed`` this does not enforce ``expected_dim``; it is how a
+        caller finds out whether a model fits a fixed-size vector column.
+        """
+        data = self._post_embed([DOCUMENT_PREFIX + "probe"])
+        if not data or not isinstance(data[0], (list, tuple)):
+            return None
+        return len(data[0])
+
     def embed_batch(self, texts: list[str], kind: str) -> list[list[float] | None]:
         """Embed a batch of strings, preserving order.
 
@@ -266,3 +277,40 @@ def get_embedding_client() -> EmbeddingClient:
                     base_url=base_url, model=model, backend=backend, timeout=timeout
                 )
     return _singleton
+
+
+_shadow_singleton: EmbeddingClient | None = None
+
+
+def get_shadow_embedding_client() -> EmbeddingClient:
+    """Return the singleton client for the SHADOW embedding model.
+
+    Used only while migrating to a new embedding model side by side (see
+    ``shared/embeddings/versions.py``). Reads ``EMBEDDING_SHADOW_SERVICE_URL``
+    and ``EMBEDDING_SHADOW_MODEL``; backend and timeout fall back to
+    ``EMBEDDING_SHADOW_BACKEND`` / ``EMBEDDING_SHADOW_TIMEOUT`` and then to the
+    primary settings. Disabled (no network I/O) when the URL is unset, which is
+    the normal state outside a migration.
+    """
+    global _shadow_singleton
+    if _shadow_singleton is None:
+        with _singleton_lock:
+            if _shadow_singleton is None:
+                base_url = os.environ.get("EMBEDDING_SHADOW_SERVICE_URL")
+                model = os.environ.get("EMBEDDING_SHADOW_MODEL", DEFAULT_MODEL)
+                backend = os.environ.get(
+                    "EMBEDDING_SHADOW_BACKEND",
+                    os.environ.get("EMBEDDING_BACKEND", "tei"),
+                )
+                try:
+                    timeout = float(
+                        os.environ.get("EMBEDDING_SHADOW_TIMEOUT")
+                        or os.environ.get("EMBEDDING_TIMEOUT", "5")
+                        or "5"
+                    )
+                except ValueError:
+                    timeout = 5.0
+                _shadow_singleton = EmbeddingClient(
+                    base_url=base_url, model=model, backend=backend, timeout=timeout
+                )
+    return _shadow_singleton
@@ -19,6 +19,8 @@ Two entry points:
   raw-row path for the same POI.
 """
 
+import hashlib
+
 
 def _json_list(val) -> list:
     """Safely extract a list from a JSONB value (may be list, dict, str, or None)."""
@@ -294,3 +296,22 @@ def build_searchable_text_from_orm(poi) -> str:
         business=business,
         park=None,
     )
+
+
+# --- Content hash ----------------------------------------------------------
+#
+# A stored vector is a pure function of (searchable text, embedding model). We
+# persist a fingerprint of both next to ``points_of_interest.embedding`` so the
+# embed-on-write path and the backfill can skip the TEI round-trip entirely when
+# neither changed — which is the common case for routine admin edits (hours,
+# contact info, images ...) that don't touch any embedded field.
+
+def searchable_text_hash(searchable_text: str, model: str = None) -> str:
+    """Return the hex sha256 fingerprint of ``searchable_text`` under ``model``.
+
+    The model id is folded in so switching ``EMBEDDING_MODEL`` invalidates every
+    stored hash (old vectors are not comparable with the new model's queries).
+    The result is 64 hex chars, matching ``points_of_interest.embedding_hash``.
+    """
+    payload = f"{model or ''}\n{searchable_text or ''}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
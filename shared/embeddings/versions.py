@@ -0,0 +1,53 @@
+"""Which store holds the vectors of a given embedding model.
+
+Stored vectors are only comparable with query vectors from the SAME model, so
+switching ``EMBEDDING_MODEL`` is done side by side instead of in place:
+
+* ``points_of_interest.embedding`` is the LIVE store (HNSW-indexed, tagged per
+  row with ``embedding_model``);
+* ``poi_embedding_shadow`` is the SHADOW store, one row per POI, backfilled
+  for the next model while the live model keeps serving queries;
+* ``embedding_models`` (``role`` -> ``model``) records which model owns each
+  store. The admin cutover swaps the two stores and their roles in ONE
+  transaction, so the old model's vectors become the shadow and a rollback is
+  just another cutover.
+
+Writers (admin embed worker, backfill) and the reader (nearby-app
+``_signal_semantic``) resolve their client's model through
+``resolve_embedding_store`` so each always reads/writes the vectors of its own
+model, before, during, and after a cutover. With no registered models
+(versioning never used) everything is the live store, exactly as before.
+
+Raw SQL only — both backends import this and the tables are owned by admin's
+Alembic migration ``p_embedding_versions_001``.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+
+LIVE = "live"
+SHADOW = "shadow"
+
+
+def registered_models(db) -> dict:
+    """Return ``{role: model}`` from ``embedding_models`` (may be empty)."""
+    rows = db.execute(text("SELECT role, model FROM embedding_models")).fetchall()
+    return {role: model for role, model in rows}
+
+
+def resolve_embedding_store(db, model: str | None, roles: dict | None = None) -> str | None:
+    """Return ``LIVE``, ``SHADOW``, or ``None`` for vectors of ``model``.
+
+    ``None`` means no store holds (or accepts) vectors of that model: a reader
+    must not compare its query vector against anything, a writer must skip.
+    Pass ``roles`` (from ``registered_models``) to avoid a second lookup.
+    """
+    if roles is None:
+        roles = registered_models(db)
+    if not roles:
+        return LIVE
+    for role, registered in roles.items():
+        if registered == model:
+            return role
+    return None
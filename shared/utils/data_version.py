@@ -0,0 +1,81 @@
+"""Public-data version watermark and a cache keyed on it.
+
+``data_version`` is a one-row table whose ``version`` is bumped by
+statement-level triggers on every INSERT/UPDATE/DELETE/TRUNCATE of the tables
+public responses are built from (``DATA_VERSION_TABLES``). Updates of
+``points_of_interest`` that change only its embedding columns do not bump it
+(``x_data_version_embeddings_001``): no public response cached on the version
+includes them. The bump is part of the writing transaction, so a reader never
+sees a new version before the data that produced it. Admin's Alembic
+migrations ``r_data_version_001`` and ``x_data_version_embeddings_001`` own the
+table and triggers; raw SQL only, so both backends can import this.
+
+Read-heavy endpoints that aggregate over the whole catalog (category counts,
+type counts, ...) read the version first — a single-row primary-key lookup —
+and reuse their last result while it is unchanged, so each result is computed
+at most once per data change instead of once per visitor. The version also
+makes a cheap validator for ``ETag`` headers. When the version moves, the
+requests that arrive together share one recomputation (``SingleFlight``), so a
+data change is not followed by a herd of identical aggregate queries.
+
+The initial version is a microsecond timestamp, not 1, so versions from a
+restored or rebuilt database never collide with values cached by a running
+process.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from sqlalchemy import text
+
+from .single_flight import DEFAULT_WAIT_SECONDS, SingleFlight
+
+# Tables whose writes bump the version (kept in sync with r_data_version_001).
+DATA_VERSION_TABLES = (
+    "points_of_interest",
+    "businesses",
+    "parks",
+    "trails",
+    "events",
+    "categories",
+    "poi_categories",
+    "images",
+)
+
+
+def current_data_version(db) -> int:
+    """Return the current public-data version."""
+    return db.execute(text("SELECT version FROM data_version WHERE id = 1")).scalar_one()
+
+
+class DataVersionCache:
+    """Thread-safe ``key -> value`` cache invalidated by the data version.
+
+    Each key holds one value, tagged with the version it was computed at; a
+    lookup with any other version recomputes and replaces it. Meant for a small,
+    fixed set of keys (nothing is evicted). Concurrent misses for the same key
+    and version share one computation; a miss that waits longer than
+    ``wait_timeout`` seconds computes on its own.
+    """
+
+    def __init__(self, wait_timeout: float = DEFAULT_WAIT_SECONDS) -> None:
+        self._entries: Dict[Hashable, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+        self._flights = SingleFlight(wait_timeout)
+
+    def get(self, version: int, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the value cached for ``key`` at ``version``, computing it on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = self._flights.do((key, version), compute)
+        with self._lock:
+            self._entries[key] = (version, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -5,12 +5,16 @@ Hours resolution engine with override precedence:
   2. Holiday hours    — named US holidays, computed by formula
   3. Seasonal hours   — spring/summer/fall/winter with optional custom date ranges
   4. Regular hours    — fallback (Mon–Sun per-day schedule)
+
+``compile_hours`` pre-parses one POI's hours for resolving many dates.
 """
 from __future__ import annotations
 
-import math
-from datetime import date, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 
 # ── Day helpers ──────────────────────────────────────────────────────────────
@@ -94,143 +98,238 @@ HOLIDAY_CALCULATORS = {
 }
 
 
-# ── Internal resolution helpers ─────────────────────────────────────────────
+@lru_cache(maxsize=64)
+def holiday_dates(year: int) -> Mapping[str, date]:
+    """``{holiday id: date}`` for every ``HOLIDAY_CALCULATORS`` entry in *year* (memoized)."""
+    return MappingProxyType({holiday_id: calc(year) for holiday_id, calc in HOLIDAY_CALCULATORS.items()})
 
-def _matches_recurring_exception(d: date, exception: dict) -> bool:
-    """Check if *d* matches a recurring monthly exception pattern."""
-    if not exception or exception.get("type") != "recurring":
-        return False
-    pattern = exception.get("pattern")
-    if not pattern:
-        return False
 
-    day_of_week = d.isoweekday() % 7  # 0=Sun
-    month = d.month  # 1-12
+# ── Compiled hours ──────────────────────────────────────────────────────────
 
-    # Check month filter
-    months = pattern.get("months", [])
-    if months:
-        if str(month) not in months:
-            return False
-
-    # Check day of week
-    target_day_name = pattern.get("dayOfWeek", "")
-    target_day = DAY_NAME_TO_NUM.get(target_day_name.lower())
-    if target_day is None or day_of_week != target_day:
-        return False
-
-    ordinal_str = pattern.get("ordinal", "")
-    ordinal_val = ORDINAL_MAP.get(ordinal_str)
-    if ordinal_val is None:
-        return False
-
-    if ordinal_val == "last":
-        next_week = d + timedelta(days=7)
-        return next_week.month != d.month
+SEASON_MONTHS = {
+    "spring": (3, 4, 5),
+    "summer": (6, 7, 8),
+    "fall": (9, 10, 11),
+    "winter": (12, 1, 2),
+}
 
-    week_of_month = math.ceil(d.day / 7)
-    return week_of_month == ordinal_val
+SEASON_LABELS = {
+    "spring": "Spring Hours",
+    "summer": "Summer Hours",
+    "fall": "Fall Hours",
+    "winter": "Winter Hours",
+}
 
 
-def _get_exception_for_date(d: date, exceptions: Optional[list]) -> Optional[dict]:
-    """Return the first matching exception for *d*, or None."""
-    if not exceptions:
+def _compile_recurring_rule(exception: dict) -> Optional[Tuple[Optional[frozenset], int, Any]]:
+    """``(months, weekday, ordinal)`` of a recurring exception, or None if it can never match."""
+    pattern = exception.get("pattern")
+    if not pattern:
         return None
-
-    date_str = d.isoformat()
-
-    for exc in exceptions:
-        exc_type = exc.get("type", "one-time")
-        if exc_type == "one-time" or not exc_type:
-            if exc.get("date") == date_str:
-                return {**exc, "type": "one-time"}
-        elif exc_type == "recurring":
-            if _matches_recurring_exception(d, exc):
-                return exc
-
-    return None
-
-
-def _get_holiday_for_date(d: date, holidays: Optional[dict]) -> Optional[dict]:
-    """Return the matching holiday entry for *d*, or None."""
-    if not holidays:
+    weekday = DAY_NAME_TO_NUM.get((pattern.get("dayOfWeek") or "").lower())
+    ordinal = ORDINAL_MAP.get(pattern.get("ordinal", ""))
+    if weekday is None or ordinal is None:
         return None
+    # Months are stored as strings ("1".."12"); an empty list means every month.
+    months = frozenset(pattern.get("months") or ()) or None
+    return months, weekday, ordinal
 
-    year = d.year
-
-    for holiday_id, holiday_data in holidays.items():
-        normalized = holiday_id.lower().replace(" ", "_")
-        calc = HOLIDAY_CALCULATORS.get(normalized) or HOLIDAY_CALCULATORS.get(holiday_id)
-
-        if calc:
-            holiday_date = calc(year)
-            if holiday_date == d:
-                return {"id": holiday_id, **(holiday_data if isinstance(holiday_data, dict) else {})}
 
-        # Check fixed date format (MM-DD)
-        if isinstance(holiday_data, dict):
-            fixed_date = holiday_data.get("date", "")
-            if fixed_date and len(fixed_date) == 5 and fixed_date[2] == "-":
-                try:
-                    m, dy = fixed_date.split("-")
-                    hd = date(year, int(m), int(dy))
-                    if hd == d:
-                        return {"id": holiday_id, **holiday_data}
-                except (ValueError, IndexError):
-                    pass
-
-    return None
+def _matches_recurring_rule(d: date, rule: Tuple[Optional[frozenset], int, Any]) -> bool:
+    """Check if *d* matches a compiled recurring monthly exception pattern."""
+    months, weekday, ordinal = rule
+    if months is not None and str(d.month) not in months:
+        return False
+    if d.isoweekday() % 7 != weekday:  # 0=Sun
+        return False
+    if ordinal == "last":
+        return (d + timedelta(days=7)).month != d.month
+    return (d.day - 1) // 7 + 1 == ordinal
 
 
-def _get_active_season(d: date, seasonal: Optional[dict]) -> Optional[str]:
-    """Return the name of the active season, or None."""
-    if not seasonal:
+def _parse_month_day(value: Any) -> Optional[Tuple[int, int]]:
+    """``"MM-DD"`` as ``(month, day)``, or None."""
+    parts = value.split("-") if isinstance(value, str) else ()
+    if len(parts) != 2:
+        return None
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError:
         return None
 
-    month = d.month
-    day_of_month = d.day
 
-    # First pass: custom date ranges (useDateRange flag)
-    for season_name, season_data in seasonal.items():
-        if not isinstance(season_data, dict):
-            continue
-        if season_data.get("useDateRange") and season_data.get("startDate") and season_data.get("endDate"):
-            parts_start = season_data["startDate"].split("-")
-            parts_end = season_data["endDate"].split("-")
-            if len(parts_start) != 2 or len(parts_end) != 2:
-                continue
-            try:
-                start_month, start_day = int(parts_start[0]), int(parts_start[1])
-                end_month, end_day = int(parts_end[0]), int(parts_end[1])
-            except ValueError:
-                continue
+class CompiledHours:
+    """A POI's ``hours`` JSON pre-parsed for repeated ``resolve(date)`` calls.
 
-            # Compare as (month, day) tuples
-            current = (month, day_of_month)
-            start = (start_month, start_day)
-            end = (end_month, end_day)
+    One-time exceptions become a date-keyed dict, recurring ones pre-parsed
+    rules, holidays a per-year ``{date: entry}`` table built on first use,
+    seasons a list of ranges plus a month table, and regular hours a weekday
+    table. Compiling costs about as much as one uncompiled lookup, so compile
+    once per POI and call ``resolve`` for every date (calendars, open-hours
+    horizons).
+    """
 
+    __slots__ = (
+        "_empty", "_regular", "_one_time", "_recurring", "_holidays",
+        "_holidays_by_year", "_season_ranges", "_season_by_month", "_season_days",
+    )
+
+    def __init__(self, hours_data: Optional[dict]):
+        hours_data = hours_data or {}
+        self._empty = not hours_data
+
+        regular = hours_data.get("regular") or {}
+        self._regular = [regular.get(day_name) for day_name in DAY_NAMES]
+
+        # Exceptions keep their list position: the first match wins.
+        self._one_time: Dict[str, Tuple[int, dict]] = {}
+        self._recurring: List[Tuple[int, Tuple, dict]] = []
+        for index, exc in enumerate(hours_data.get("exceptions") or ()):
+            exc_type = exc.get("type", "one-time")
+            if exc_type == "one-time" or not exc_type:
+                exc_date = exc.get("date")
+                if isinstance(exc_date, str) and exc_date not in self._one_time:
+                    self._one_time[exc_date] = (index, exc)
+            elif exc_type == "recurring":
+                rule = _compile_recurring_rule(exc)
+                if rule is not None:
+                    self._recurring.append((index, rule, exc))
+
+        self._holidays = list((hours_data.get("holidays") or {}).items())
+        self._holidays_by_year: Dict[int, Dict[date, int]] = {}
+
+        seasonal = hours_data.get("seasonal") or {}
+        self._season_ranges: List[Tuple[str, Tuple[int, int], Tuple[int, int]]] = []
+        self._season_days: Dict[str, List[Any]] = {}
+        for season_name, season_data in seasonal.items():
+            if not isinstance(season_data, dict) or not season_data:
+                continue
+            self._season_days[season_name] = [season_data.get(day_name) for day_name in DAY_NAMES]
+            if season_data.get("useDateRange") and season_data.get("startDate") and season_data.get("endDate"):
+                start = _parse_month_day(season_data["startDate"])
+                end = _parse_month_day(season_data["endDate"])
+                if start and end:
+                    self._season_ranges.append((season_name, start, end))
+        # Month-based fallback for seasons without a custom range.
+        self._season_by_month: Dict[int, str] = {}
+        for season_name, months in SEASON_MONTHS.items():
+            season_data = seasonal.get(season_name)
+            if season_data and isinstance(season_data, dict) and not season_data.get("useDateRange"):
+                for month in months:
+                    self._season_by_month.setdefault(month, season_name)
+
+    def _exception_for(self, d: date) -> Optional[dict]:
+        one_time = self._one_time.get(d.isoformat())
+        for index, rule, exc in self._recurring:
+            if one_time is not None and index > one_time[0]:
+                break
+            if _matches_recurring_rule(d, rule):
+                return exc
+        return {**one_time[1], "type": "one-time"} if one_time is not None else None
+
+    def _holiday_for(self, d: date) -> Optional[dict]:
+        table = self._holidays_by_year.get(d.year)
+        if table is None:
+            table = self._holidays_by_year[d.year] = self._holiday_table(d.year)
+        index = table.get(d)
+        if index is None:
+            return None
+        holiday_id, holiday_data = self._holidays[index]
+        return {"id": holiday_id, **(holiday_data if isinstance(holiday_data, dict) else {})}
+
+    def _holiday_table(self, year: int) -> Dict[date, int]:
+        """``{date: index into self._holidays}``; earlier holidays win a shared date."""
+        calculated = holiday_dates(year)
+        table: Dict[date, int] = {}
+        for index, (holiday_id, holiday_data) in enumerate(self._holidays):
+            normalized = holiday_id.lower().replace(" ", "_")
+            holiday_date = calculated.get(normalized) or calculated.get(holiday_id)
+            if holiday_date:
+                table.setdefault(holiday_date, index)
+            # Fixed date format (MM-DD)
+            if isinstance(holiday_data, dict):
+                fixed_date = holiday_data.get("date", "")
+                if fixed_date and len(fixed_date) == 5 and fixed_date[2] == "-":
+                    month_day = _parse_month_day(fixed_date)
+                    try:
+                        table.setdefault(date(year, *month_day), index)
+                    except (TypeError, ValueError):
+                        pass
+        return table
+
+    def _season_for(self, d: date) -> Optional[str]:
+        current = (d.month, d.day)
+        for season_name, start, end in self._season_ranges:
             if end < start:
                 # Range wraps around year boundary (e.g. Nov-Feb)
                 if current >= start or current <= end:
                     return season_name
-            else:
-                if start <= current <= end:
-                    return season_name
+            elif start <= current <= end:
+                return season_name
+        return self._season_by_month.get(d.month)
+
+    def resolve(self, d: date) -> Dict[str, Any]:
+        """Effective hours for *d*; see ``get_effective_hours_for_date``."""
+        if self._empty:
+            return {"hours": None, "source": "none", "label": None}
+
+        weekday = d.isoweekday() % 7
+
+        # 1. Exceptions (highest priority)
+        exception = self._exception_for(d)
+        if exception:
+            label = exception.get("reason") or (
+                "Modified Schedule" if exception.get("type") == "recurring" else "Special Hours"
+            )
+            status = exception.get("status")
+            if status == "closed":
+                return {"hours": {"status": "closed"}, "source": "exception", "label": label}
+            if status == "modified" and exception.get("periods"):
+                return {
+                    "hours": {"status": "open", "periods": exception["periods"]},
+                    "source": "exception",
+                    "label": label,
+                }
+            if status == "open":
+                return {"hours": self._regular[weekday], "source": "exception", "label": label}
+
+        # 2. Holiday hours
+        holiday = self._holiday_for(d) if self._holidays else None
+        if holiday:
+            h_status = holiday.get("status")
+            if h_status == "closed":
+                return {"hours": {"status": "closed"}, "source": "holiday", "label": holiday.get("name")}
+            if h_status == "modified" and holiday.get("periods"):
+                return {
+                    "hours": {"status": "open", "periods": holiday["periods"]},
+                    "source": "holiday",
+                    "label": holiday.get("name"),
+                }
+            # status == "open" falls through to regular
+
+        # 3. Seasonal hours
+        active_season = self._season_for(d) if self._season_days else None
+        if active_season:
+            season_day_hours = self._season_days[active_season][weekday]
+            if season_day_hours:
+                return {
+                    "hours": season_day_hours,
+                    "source": "seasonal",
+                    "label": SEASON_LABELS.get(active_season, f"{active_season.title()} Hours"),
+                }
+
+        # 4. Regular hours (fallback)
+        return {"hours": self._regular[weekday], "source": "regular", "label": None}
+
+
+def compile_hours(hours_data: Optional[dict]) -> CompiledHours:
+    """The compiled form of a POI's ``hours`` JSON (shared instance when empty)."""
+    if not hours_data:
+        return _EMPTY_HOURS
+    return CompiledHours(hours_data)
 
-    # Second pass: month-based fallback
-    SEASON_MONTHS = {
-        "spring": [3, 4, 5],
-        "summer": [6, 7, 8],
-        "fall": [9, 10, 11],
-        "winter": [12, 1, 2],
-    }
-    for season_name, months in SEASON_MONTHS.items():
-        sd = seasonal.get(season_name)
-        if sd and isinstance(sd, dict) and not sd.get("useDateRange") and month in months:
-            return season_name
 
-    return None
+_EMPTY_HOURS = CompiledHours(None)
 
 
 # ── Public API ───────────────────────────────────────────────────────────────
@@ -244,61 +343,152 @@ def get_effective_hours_for_date(
 
     Returns ``{"hours": ..., "source": "exception"|"holiday"|"seasonal"|"regular"|"none", "label": ...}``.
     """
-    if not hours_data:
-        return {"hours": None, "source": "none", "label": None}
-
-    day_name = DAY_NAMES[d.isoweekday() % 7]
-
-    # 1. Exceptions (highest priority)
-    exception = _get_exception_for_date(d, hours_data.get("exceptions"))
-    if exception:
-        label = exception.get("reason") or (
-            "Modified Schedule" if exception.get("type") == "recurring" else "Special Hours"
-        )
-        status = exception.get("status")
-        if status == "closed":
-            return {"hours": {"status": "closed"}, "source": "exception", "label": label}
-        if status == "modified" and exception.get("periods"):
-            return {
-                "hours": {"status": "open", "periods": exception["periods"]},
-                "source": "exception",
-                "label": label,
-            }
-        if status == "open":
-            regular_hours = (hours_data.get("regular") or {}).get(day_name)
-            return {"hours": regular_hours, "source": "exception", "label": label}
-
-    # 2. Holiday hours
-    holiday = _get_holiday_for_date(d, hours_data.get("holidays"))
-    if holiday:
-        h_status = holiday.get("status")
-        if h_status == "closed":
-            return {"hours": {"status": "closed"}, "source": "holiday", "label": holiday.get("name")}
-        if h_status == "modified" and holiday.get("periods"):
-            return {
-                "hours": {"status": "open", "periods": holiday["periods"]},
-                "source": "holiday",
-                "label": holiday.get("name"),
-            }
-        # status == "open" falls through to regular
-
-    # 3. Seasonal hours
-    active_season = _get_active_season(d, hours_data.get("seasonal"))
-    if active_season and hours_data.get("seasonal", {}).get(active_season):
-        season_day_hours = hours_data["seasonal"][active_season].get(day_name)
-        if season_day_hours:
-            season_labels = {
-                "spring": "Spring Hours",
-                "summer": "Summer Hours",
-                "fall": "Fall Hours",
-                "winter": "Winter Hours",
-            }
-            return {
-                "hours": season_day_hours,
-                "source": "seasonal",
-                "label": season_labels.get(active_season, f"{active_season.title()} Hours"),
-            }
-
-    # 4. Regular hours (fallback)
-    regular_hours = (hours_data.get("regular") or {}).get(day_name)
-    return {"hours": regular_hours, "source": "regular", "label": None}
+    return compile_hours(hours_data).resolve(d)
+
+
+def get_effective_hours_batch(
+    hours_by_key: Mapping[Hashable, Optional[dict]],
+    d: date,
+) -> Dict[Hashable, Dict[str, Any]]:
+    """``get_effective_hours_for_date`` for many POIs (``{key: hours JSON}``) and one date."""
+    return {key: compile_hours(hours_data).resolve(d) for key, hours_data in hours_by_key.items()}
+
+
+# ── Open intervals ("Open now") ─────────────────────────────────────────────
+
+# Hours are local wall-clock times; HoursSelector stores ``timezone`` and
+# defaults it to Eastern.
+DEFAULT_TIMEZONE = "America/New_York"
+
+MINUTES_PER_DAY = 24 * 60
+
+# Period ends that never count as open (mirrors isCurrentlyOpen).
+_NON_OPEN_PERIOD_TYPES = {"appointment", "call"}
+
+
+def hours_timezone(hours_data: Optional[dict]) -> ZoneInfo:
+    """The zone the POI's hours are written in (``DEFAULT_TIMEZONE`` if unset/unknown)."""
+    name = (hours_data or {}).get("timezone") or DEFAULT_TIMEZONE
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def _period_type(time_obj: Any) -> Optional[str]:
+    return time_obj.get("type") if isinstance(time_obj, dict) else None
+
+
+def _period_minutes(time_obj: Any) -> Optional[int]:
+    """Minutes after midnight of a fixed period end, or None if unresolvable.
+
+    Accepts ``{"type": "fixed", "time": "HH:MM"}`` and the flat ``"HH:MM"``.
+    Solar ends (dawn/dusk) need coordinates and resolve to None, as in
+    ``isCurrentlyOpen`` without lat/lng.
+    """
+    if isinstance(time_obj, dict):
+        if time_obj.get("type") != "fixed":
+            return None
+        time_obj = time_obj.get("time")
+    if not isinstance(time_obj, str):
+        return None
+    try:
+        hh, mm = time_obj.strip().split(":")[:2]
+        minutes = int(hh) * 60 + int(mm)
+    except ValueError:
+        return None
+    return minutes if 0 <= minutes <= MINUTES_PER_DAY else None
+
+
+def open_minutes_for_date(hours_data: Optional[dict], d: date) -> List[Tuple[int, int]]:
+    """``[start, end)`` minute ranges of local day *d* during which the POI is open.
+
+    Same rules as ``isCurrentlyOpen`` in hoursUtils.js applied to every minute
+    of the day: ``24hours`` is open all day; a period whose close is before its
+    open (crosses midnight) is open from midnight to close and from open to
+    midnight; appointment/call periods never count; a period with a solar end
+    makes the rest of the day unknown, i.e. not open.
+    """
+    return _open_minutes(compile_hours(hours_data).resolve(d)["hours"])
+
+
+def _open_minutes(hours: Any) -> List[Tuple[int, int]]:
+    """``open_minutes_for_date`` for an already resolved day of ``hours``."""
+    if not hours:
+        return []
+    if isinstance(hours, list):
+        periods = hours
+    elif isinstance(hours, dict):
+        status = hours.get("status")
+        if status == "24hours":
+            return [(0, MINUTES_PER_DAY)]
+        if status != "open" or not hours.get("periods"):
+            return []
+        periods = hours["periods"]
+    else:
+        return []
+
+    ranges = []
+    for period in periods:
+        if not isinstance(period, dict) or not period.get("open") or not period.get("close"):
+            continue
+        if (_period_type(period["open"]) in _NON_OPEN_PERIOD_TYPES
+                or _period_type(period["close"]) in _NON_OPEN_PERIOD_TYPES):
+            continue
+        opens = _period_minutes(period["open"])
+        closes = _period_minutes(period["close"])
+        if opens is None or closes is None:
+            break
+        if closes < opens:
+            ranges.append((0, closes))
+            ranges.append((opens, MINUTES_PER_DAY))
+        elif opens < closes:
+            ranges.append((opens, closes))
+    return ranges
+
+
+def is_open_at(hours_data: Optional[dict], at: datetime) -> bool:
+    """True when the POI is open at the aware datetime *at* (in its own timezone)."""
+    local = at.astimezone(hours_timezone(hours_data))
+    minute = local.hour * 60 + local.minute
+    return any(start <= minute < end for start, end in open_minutes_for_date(hours_data, local.date()))
+
+
+def open_now_batch(
+    hours_by_key: Mapping[Hashable, Optional[dict]],
+    at: datetime,
+) -> Dict[Hashable, bool]:
+    """``is_open_at`` for many POIs (``{key: hours JSON}``) at one instant."""
+    return {key: is_open_at(hours_data, at) for key, hours_data in hours_by_key.items()}
+
+
+def open_intervals(
+    hours_data: Optional[dict],
+    date_from: date,
+    days: int,
+) -> List[Tuple[datetime, datetime]]:
+    """Aware ``[opens_at, closes_at)`` intervals over ``days`` local days from *date_from*.
+
+    Touching ranges (midnight-crossing periods, consecutive 24-hour days) are
+    merged, so "open at t" is a single interval containment test.
+    """
+    tz = hours_timezone(hours_data)
+    compiled = compile_hours(hours_data)
+    intervals: List[List[datetime]] = []
+    for offset in range(days):
+        d = date_from + timedelta(days=offset)
+        midnight = datetime(d.year, d.month, d.day, tzinfo=tz)
+        for start, end in sorted(_open_minutes(compiled.resolve(d)["hours"])):
+            opens_at = _local_instant(midnight, start)
+            closes_at = _local_instant(midnight, end)
+            if intervals and intervals[-1][1] >= opens_at:
+                intervals[-1][1] = max(intervals[-1][1], closes_at)
+            else:
+                intervals.append([opens_at, closes_at])
+    return [(opens_at, closes_at) for opens_at, closes_at in intervals]
+
+
+def _local_instant(midnight: datetime, minutes: int) -> datetime:
+    """Wall-clock ``midnight + minutes`` in midnight's zone, as a UTC instant."""
+    wall = midnight + timedelta(minutes=minutes)  # aware arithmetic keeps wall time
+    return wall.astimezone(timezone.utc)
@@ -2,10 +2,16 @@
 
 Expands a repeat_pattern JSONB into concrete datetime instances within a given range,
 respecting excluded_dates, manual_dates, and recurrence_end_date.
+
+``compile_recurrence`` parses an event's pattern, excluded dates and manual
+dates once; the resulting ``CompiledRecurrence`` expands into any window
+starting from the window itself rather than from ``start_datetime``, so a
+one-week window years into a series costs the same as one at its start.
+``expand_recurring_batch`` expands many compiled events into one window.
 """
 
-from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from datetime import date, datetime, timezone, timedelta
+from typing import Dict, FrozenSet, Hashable, List, Mapping, Optional, Tuple
 from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY, MO, TU, WE, TH, FR, SA, SU
 from dateutil.parser import isoparse
 
@@ -23,6 +29,155 @@ _DAY_MAP = {
 # Maximum expansion horizon: 60 months from start
 _MAX_MONTHS = 60
 
+# Window covering every representable instant, for whole-series expansion.
+_ALL_TIME = (
+    datetime.min.replace(tzinfo=timezone.utc),
+    datetime.max.replace(tzinfo=timezone.utc),
+)
+
+
+def _parse_excluded(excluded_dates: Optional[List[str]]) -> FrozenSet[date]:
+    excluded = set()
+    for d_str in excluded_dates or ():
+        try:
+            excluded.add(datetime.strptime(d_str, "%Y-%m-%d").date())
+        except ValueError:
+            pass
+    return frozenset(excluded)
+
+
+def _parse_manual(manual_dates: Optional[List[str]]) -> Tuple[datetime, ...]:
+    manual = []
+    for m_str in manual_dates or ():
+        try:
+            manual_dt = isoparse(m_str)
+            if manual_dt.tzinfo is None:
+                manual_dt = manual_dt.replace(tzinfo=timezone.utc)
+            manual.append(manual_dt)
+        except (ValueError, TypeError):
+            pass
+    return tuple(manual)
+
+
+class CompiledRecurrence:
+    """One event's recurrence, parsed once; ``between`` expands it into a window.
+
+    ``freq`` is ``None`` for events that occur once (no or unknown frequency);
+    ``until`` is the earlier of ``recurrence_end_date`` and the 60-month cap.
+    """
+
+    __slots__ = ("start_datetime", "freq", "interval", "byweekday", "until", "excluded", "manual")
+
+    def __init__(self, start_datetime, freq, interval, byweekday, until, excluded, manual):
+        self.start_datetime = start_datetime
+        self.freq = freq
+        self.interval = interval
+        self.byweekday = byweekday
+        self.until = until
+        self.excluded = excluded
+        self.manual = manual
+
+    def _anchored_rule(self, date_from: datetime, until: datetime) -> rrule:
+        """The series' rrule, restarted on its period grid shortly before ``date_from``.
+
+        Occurrences before ``date_from`` are never generated. The restart is one
+        whole period earlier than necessary, so month lengths and time zone
+        offsets can never make it skip an occurrence; monthly and yearly rules
+        pin ``bymonth``/``bymonthday`` to the original start so moving
+        ``dtstart`` to the first of the month does not change the series.
+        """
+        start = self.start_datetime
+        n = self.interval
+        kwargs = {"freq": self.freq, "interval": n, "until": until}
+        if self.byweekday:
+            kwargs["byweekday"] = self.byweekday
+        if date_from <= start:
+            return rrule(dtstart=start, **kwargs)
+
+        if self.freq == DAILY:
+            periods = (date_from - start).days // n - 1
+            anchor = start + timedelta(days=max(periods, 0) * n)
+        elif self.freq == WEEKLY:
+            periods = (date_from - start).days // (7 * n) - 1
+            anchor = start + timedelta(weeks=max(periods, 0) * n)
+        elif self.freq == MONTHLY:
+            months = (date_from.year - start.year) * 12 + date_from.month - start.month
+            month_index = start.month - 1 + max(months // n - 1, 0) * n
+            anchor = start.replace(
+                year=start.year + month_index // 12, month=month_index % 12 + 1, day=1
+            )
+            kwargs["bymonthday"] = start.day
+        else:  # YEARLY
+            years = max((date_from.year - start.year) // n - 1, 0) * n
+            anchor = start.replace(year=start.year + years, month=1, day=1)
+            kwargs["bymonth"] = start.month
+            kwargs["bymonthday"] = start.day
+        return rrule(dtstart=anchor, **kwargs)
+
+    def between(self, date_from: datetime, date_to: datetime) -> List[datetime]:
+        """Sorted occurrences within ``[date_from, date_to]``."""
+        start = self.start_datetime
+        if self.freq is None:
+            return [start] if date_from <= start <= date_to else []
+
+        effective_end = self.until if self.until < date_to else date_to
+        occurrences = set()
+        if date_from <= effective_end:
+            rule = self._anchored_rule(date_from, effective_end)
+            occurrences.update(rule.between(date_from, effective_end, inc=True))
+
+        if self.excluded:
+            occurrences = {dt for dt in occurrences if dt.date() not in self.excluded}
+        for manual_dt in self.manual:
+            if date_from <= manual_dt <= date_to:
+                occurrences.add(manual_dt)
+        return sorted(occurrences)
+
+
+def compile_recurrence(
+    start_datetime: datetime,
+    repeat_pattern: Optional[dict],
+    excluded_dates: Optional[List[str]] = None,
+    manual_dates: Optional[List[str]] = None,
+    recurrence_end_date: Optional[datetime] = None,
+) -> CompiledRecurrence:
+    """Parse an event's recurrence once, for expanding it into many windows.
+
+    Same arguments (minus the window) and semantics as ``expand_recurring_dates``.
+    """
+    freq = None
+    if repeat_pattern and repeat_pattern.get("frequency"):
+        freq = _FREQ_MAP.get(repeat_pattern["frequency"].lower())
+    if freq is None:
+        # Non-repeating (or unknown frequency): only start_datetime, no exclusions.
+        return CompiledRecurrence(start_datetime, None, 1, None, None, frozenset(), ())
+
+    interval = repeat_pattern.get("interval", 1)
+    if not isinstance(interval, int) or interval < 1:
+        # rrule repeats dtstart forever for interval 0; treat bad values as 1.
+        interval = 1
+
+    # Effective end: min of recurrence_end_date and the 60-month cap
+    until = start_datetime + timedelta(days=_MAX_MONTHS * 30)
+    if recurrence_end_date and recurrence_end_date < until:
+        until = recurrence_end_date
+
+    # Weekly with specific days
+    byweekday = None
+    days = repeat_pattern.get("days")
+    if days and freq == WEEKLY:
+        byweekday = [_DAY_MAP[d] for d in days if d in _DAY_MAP] or None
+
+    return CompiledRecurrence(
+        start_datetime,
+        freq,
+        interval,
+        byweekday,
+        until,
+        _parse_excluded(excluded_dates),
+        _parse_manual(manual_dates),
+    )
+
 
 def expand_recurring_dates(
     start_datetime: datetime,
@@ -47,71 +202,64 @@ def expand_recurring_dates(
     Returns:
         Sorted list of datetimes within the requested range.
     """
-    if not repeat_pattern or not repeat_pattern.get("frequency"):
-        # Non-repeating: just return start_datetime if it's in range
-        if date_from <= start_datetime <= date_to:
-            return [start_datetime]
-        return []
-
-    freq_str = repeat_pattern["frequency"].lower()
-    freq = _FREQ_MAP.get(freq_str)
-    if freq is None:
-        return [start_datetime] if date_from <= start_datetime <= date_to else []
+    return compile_recurrence(
+        start_datetime,
+        repeat_pattern,
+        excluded_dates=excluded_dates,
+        manual_dates=manual_dates,
+        recurrence_end_date=recurrence_end_date,
+    ).between(date_from, date_to)
 
-    interval = repeat_pattern.get("interval", 1)
 
-    # Compute effective end: min of date_to, recurrence_end_date, and 60-month cap
-    max_end = start_datetime + timedelta(days=_MAX_MONTHS * 30)
-    effective_end = date_to
-    if recurrence_end_date and recurrence_end_date < effective_end:
-        effective_end = recurrence_end_date
-    if max_end < effective_end:
-        effective_end = max_end
-
-    # Build rrule kwargs
-    kwargs = {
-        "freq": freq,
-        "dtstart": start_datetime,
-        "interval": interval,
-        "until": effective_end,
-    }
+def expand_recurring_batch(
+    recurrences: Mapping[Hashable, CompiledRecurrence],
+    date_from: datetime,
+    date_to: datetime,
+) -> Dict[Hashable, List[datetime]]:
+    """Expand many compiled events into one window: ``{key: sorted datetimes}``.
 
-    # Weekly with specific days
-    days = repeat_pattern.get("days")
-    if days and freq == WEEKLY:
-        byweekday = [_DAY_MAP[d] for d in days if d in _DAY_MAP]
-        if byweekday:
-            kwargs["byweekday"] = byweekday
-
-    # Generate occurrences
-    rule = rrule(**kwargs)
-    occurrences = set()
-    for dt in rule:
-        if dt > effective_end:
-            break
-        if date_from <= dt <= date_to:
-            occurrences.add(dt)
-
-    # Remove excluded dates
-    if excluded_dates:
-        excluded_set = set()
-        for d_str in excluded_dates:
-            try:
-                excluded_set.add(datetime.strptime(d_str, "%Y-%m-%d").date())
-            except ValueError:
-                pass
-        occurrences = {dt for dt in occurrences if dt.date() not in excluded_set}
-
-    # Add manual dates
-    if manual_dates:
-        for m_str in manual_dates:
-            try:
-                manual_dt = isoparse(m_str)
-                if manual_dt.tzinfo is None:
-                    manual_dt = manual_dt.replace(tzinfo=timezone.utc)
-                if date_from <= manual_dt <= date_to:
-                    occurrences.add(manual_dt)
-            except (ValueError, TypeError):
-                pass
-
-    return sorted(occurrences)
+    Events with no occurrence in the window are left out of the result.
+    """
+    result = {}
+    for key, recurrence in recurrences.items():
+        occurrences = recurrence.between(date_from, date_to)
+        if occurrences:
+            result[key] = occurrences
+    return result
+
+
+def _as_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes as UTC, as a ``timestamptz`` column would store them."""
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def event_occurrences(
+    start_datetime: datetime,
+    is_repeating: Optional[bool],
+    repeat_pattern: Optional[dict],
+    excluded_dates: Optional[List[str]] = None,
+    manual_dates: Optional[List[str]] = None,
+    recurrence_end_date: Optional[datetime] = None,
+) -> List[datetime]:
+    """Every concrete occurrence of one event, for the ``event_occurrences`` table.
+
+    Repeating events expand over their whole series (bounded by
+    ``recurrence_end_date`` and the 60-month horizon); anything else occurs
+    once, at ``start_datetime``. Same rule the calendar endpoint applies, so
+    filtering the result to a window equals expanding into that window.
+    """
+    start_datetime = _as_utc(start_datetime)
+    if not (is_repeating and repeat_pattern):
+        return [start_datetime]
+    date_from, date_to = _ALL_TIME
+    return expand_recurring_dates(
+        start_datetime=start_datetime,
+        repeat_pattern=repeat_pattern,
+        date_from=date_from,
+        date_to=date_to,
+        excluded_dates=excluded_dates,
+        manual_dates=manual_dates,
+        recurrence_end_date=_as_utc(recurrence_end_date),
+    )
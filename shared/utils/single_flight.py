@@ -0,0 +1,77 @@
+"""Request coalescing ("single flight") for identical concurrent reads.
+
+When a POI goes viral or a cached aggregate expires, many requests for the
+same thing arrive together and would each run the same queries and
+serialization. ``SingleFlight.do(key, compute)`` lets the first caller for a
+key (the leader) run ``compute`` while callers arriving before it finishes
+wait for, and return, the leader's result. Nothing is kept afterwards:
+the next call for the key computes again, so freshness is exactly that of a
+request that started alongside the leader.
+
+Waiting is bounded. A follower that has waited ``timeout`` seconds runs
+``compute`` itself, so a stuck leader cannot stall every request for its
+key. An exception raised by the leader is re-raised in its followers (the
+failure usually means the database is struggling, and retrying it from
+every waiting request is the herd this avoids).
+
+Thread-based, for sync endpoints running in the threadpool. ``compute``
+should only use resources of the calling request (e.g. its own session).
+Followers never call the leader's ``compute``.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+# Seconds a follower waits for the leader before computing on its own.
+DEFAULT_WAIT_SECONDS = 5.0
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """Share one in-flight computation among concurrent callers of a key."""
+
+    def __init__(self, timeout: float = DEFAULT_WAIT_SECONDS) -> None:
+        self.timeout = timeout
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return ``compute()``, or the result of a call for ``key`` already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(self.timeout):
+                return compute()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = compute()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    def in_flight(self) -> int:
+        """Number of keys currently being computed."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,49 @@
+"""Bounded in-process cache whose entries are validated by a caller-supplied stamp.
+
+``StampedLRUCache.get(key, stamp, compute)`` returns the value cached for
+``key`` if it was stored under the same ``stamp`` (typically the source row's
+``last_updated``, read with a cheap indexed lookup), and otherwise computes,
+stores and returns a fresh one. The least recently used keys are evicted beyond
+``maxsize``. ``compute`` returning ``None`` (source gone or unpublished) is not
+cached. Cached values are shared between requests and must be treated as
+read-only.
+
+Used for venue fields inherited by events (``venue_inheritance``) and for the
+meta tags of POI pages (nearby-app ``app/seo.py``).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class StampedLRUCache:
+    """Thread-safe LRU of ``key -> (stamp, value)``; a different stamp is a miss."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, stamp: Any, compute: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """Return the value cached for ``key`` at ``stamp``, computing it on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                return entry[1]
+        value = compute()
+        if value is None:
+            return None
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -5,10 +5,15 @@ the venue POI. The venue_inheritance JSONB config specifies per-section behavior
   - "as_is": use venue data directly
   - "use_and_add": merge venue base + event additions
   - "do_not_use": skip venue data, keep event's own data
+
+Many events share one venue, so readers cache the venue's inheritable fields
+in a ``VenueFieldsCache`` keyed by the venue's ``last_updated``.
 """
 
 from typing import Optional
 
+from .stamped_cache import StampedLRUCache
+
 # Map section names to the fields they control
 _SECTION_FIELDS = {
     # public_transit_info removed from parking inheritance — renamed _deprecated_public_transit_info (Migration A #33)
@@ -22,6 +27,24 @@ _SECTION_FIELDS = {
     "drone_policy": ["drone_usage", "drone_policy"],
 }
 
+# Every venue field inheritance can read, in section order.
+INHERITABLE_FIELDS = tuple(
+    field for fields in _SECTION_FIELDS.values() for field in fields
+)
+
+
+class VenueFieldsCache(StampedLRUCache):
+    """Thread-safe LRU of venue ``INHERITABLE_FIELDS`` dicts.
+
+    Each venue id holds one entry tagged with the venue's ``last_updated``; a
+    lookup with any other stamp reloads and replaces it, so an edited venue is
+    picked up by the next event request. ``get(venue_id, stamp, load)``; see
+    ``StampedLRUCache``.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        super().__init__(maxsize)
+
 
 def resolve_venue_inheritance(
     event_data: dict,
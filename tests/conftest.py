@@ -78,6 +78,7 @@ from app.core.permissions import get_current_user_with_role
 # so they can be used to create test data directly for cross-app tests.
 from app.models.poi import PointOfInterest as AdminPOI, Business, Park, Trail, Event
 from app.models.category import Category as AdminCategory, poi_category_association
+from app.crud.crud_event_occurrence import replace_occurrences
 
 # ---------------------------------------------------------------------------
 # 4. Database engine & session (shared between admin and app clients)
@@ -167,6 +168,137 @@ def db_session():
             "ON points_of_interest USING hnsw (embedding vector_cosine_ops) "
             "WITH (m=16, ef_construction=64);"
         ))
+        # Content hash of the text + model that produced ``embedding`` (also
+        # unmapped, written alongside the vector) — matches n_embedding_hash_001.
+        conn.execute(text(
+            "ALTER TABLE points_of_interest "
+            "ADD COLUMN IF NOT EXISTS embedding_hash VARCHAR(64);"
+        ))
+        # Side-by-side model versions (p_embedding_versions_001): the live
+        # vector's model tag and the shadow store (also vector-typed, unmapped).
+        conn.execute(text(
+            "ALTER TABLE points_of_interest "
+            "ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(200);"
+        ))
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS poi_embedding_shadow (
+                poi_id UUID PRIMARY KEY
+                    REFERENCES points_of_interest(id) ON DELETE CASCADE,
+                model VARCHAR(200) NOT NULL,
+                embedding vector(768) NOT NULL,
+                embedding_hash VARCHAR(64),
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            );
+        """))
+        # Public-data watermark (r_data_version_001): one row + bump triggers.
+        from shared.utils.data_version import DATA_VERSION_TABLES
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS data_version (
+                id SMALLINT PRIMARY KEY CHECK (id = 1),
+                version BIGINT NOT NULL,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            );
+            INSERT INTO data_version (id, version)
+            VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint);
+            CREATE OR REPLACE FUNCTION bump_data_version() RETURNS trigger AS $$
+            BEGIN
+                UPDATE data_version SET version = version + 1, updated_at = now()
+                WHERE id = 1;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            -- x_data_version_embeddings_001: embedding-only POI updates don't bump.
+            CREATE OR REPLACE FUNCTION bump_data_version_unless_embedding_only() RETURNS trigger AS $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1
+                    FROM new_rows n
+                    LEFT JOIN old_rows o ON o.id = n.id
+                    WHERE o.id IS NULL
+                       OR to_jsonb(n) - ARRAY['embedding', 'embedding_hash', 'embedding_model']
+                          IS DISTINCT FROM
+                          to_jsonb(o) - ARRAY['embedding', 'embedding_hash', 'embedding_model']
+                ) THEN
+                    UPDATE data_version SET version = version + 1, updated_at = now()
+                    WHERE id = 1;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+        """))
+        for table in DATA_VERSION_TABLES:
+            events = (
+                "INSERT OR DELETE OR TRUNCATE" if table == "points_of_interest"
+                else "INSERT OR UPDATE OR DELETE OR TRUNCATE"
+            )
+            conn.execute(text(
+                f"CREATE TRIGGER {table}_bump_data_version "
+                f"AFTER {events} ON {table} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version();"
+            ))
+        conn.execute(text(
+            "CREATE TRIGGER points_of_interest_bump_data_version_update "
+            "AFTER UPDATE ON points_of_interest "
+            "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version_unless_embedding_only();"
+        ))
+        # Stored public documents (u_public_docs_001): the tables come from
+        # create_all(); the rebuild-enqueue triggers are raw DDL.
+        conn.execute(text("""
+            CREATE OR REPLACE FUNCTION enqueue_public_documents(poi_ids UUID[]) RETURNS void AS $$
+                INSERT INTO public_document_outbox (poi_id)
+                SELECT p.id FROM points_of_interest p WHERE p.id = ANY(poi_ids)
+                ON CONFLICT (poi_id) DO UPDATE
+                    SET generation = public_document_outbox.generation + 1,
+                        next_attempt_at = now(),
+                        attempts = 0
+            $$ LANGUAGE sql;
+            CREATE OR REPLACE FUNCTION public_document_poi_changed() RETURNS trigger AS $$
+            BEGIN
+                PERFORM enqueue_public_documents(
+                    ARRAY[NEW.id] || ARRAY(SELECT e.poi_id FROM events e WHERE e.venue_poi_id = NEW.id)
+                );
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            CREATE OR REPLACE FUNCTION public_document_child_changed() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    PERFORM enqueue_public_documents(ARRAY[OLD.poi_id]);
+                ELSIF TG_OP = 'UPDATE' THEN
+                    PERFORM enqueue_public_documents(ARRAY[OLD.poi_id, NEW.poi_id]);
+                ELSE
+                    PERFORM enqueue_public_documents(ARRAY[NEW.poi_id]);
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            CREATE OR REPLACE FUNCTION public_document_category_changed() RETURNS trigger AS $$
+            BEGIN
+                PERFORM enqueue_public_documents(ARRAY(
+                    SELECT pc.poi_id FROM poi_categories pc WHERE pc.category_id = NEW.id
+                ));
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            CREATE TRIGGER points_of_interest_public_document_insert
+                AFTER INSERT ON points_of_interest
+                FOR EACH ROW EXECUTE FUNCTION public_document_poi_changed();
+            CREATE TRIGGER points_of_interest_public_document_update
+                AFTER UPDATE ON points_of_interest FOR EACH ROW
+                WHEN (OLD.last_updated IS DISTINCT FROM NEW.last_updated
+                      OR OLD.publication_status IS DISTINCT FROM NEW.publication_status)
+                EXECUTE FUNCTION public_document_poi_changed();
+            CREATE TRIGGER categories_public_document
+                AFTER UPDATE ON categories
+                FOR EACH ROW EXECUTE FUNCTION public_document_category_changed();
+        """))
+        for table in ("businesses", "parks", "trails", "events", "images", "poi_categories"):
+            conn.execute(text(
+                f"CREATE TRIGGER {table}_public_document "
+                f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION public_document_child_changed();"
+            ))
         conn.commit()
 
     db = TestingSessionLocal()
@@ -366,6 +498,12 @@ def mock_embedding_client(monkeypatch):
     except Exception:
         # Admin backend not on sys.path (e.g. app-only test context) — fine.
         pass
+    # Same for the outbox worker, which checks ``client.enabled`` before claiming.
+    try:
+        import app.services.embedding_worker as _worker_mod
+        monkeypatch.setattr(_worker_mod, "get_embedding_client", _factory)
+    except Exception:
+        pass
 
     yield mock
 
@@ -587,6 +725,8 @@ def orm_create_event(db, name="Test Event", published=False, slug=None, event_fi
     evt = Event(poi_id=poi_id, **ev_kwargs)
     db.add(evt)
     db.flush()
+    # Same as the admin event write paths: materialize the calendar rows.
+    replace_occurrences(db, poi_id, evt)
     return poi
 
 
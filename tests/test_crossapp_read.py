@@ -9,8 +9,11 @@ that both use the ``app.*`` namespace.
 Only ``app_client`` is used here — no ``admin_client`` needed.
 """
 
+import sys
+import uuid
 import pytest
 from datetime import datetime, timezone
+from sqlalchemy import text
 from conftest import (
     orm_create_business,
     orm_create_park,
@@ -118,6 +121,45 @@ class TestAppNearby:
         nearby_names = [p["name"] for p in nearby]
         assert "Nearby POI 2" in nearby_names
 
+    def test_app_nearby_radius_limit_and_cursor(self, db_session, app_client):
+        """Radius is enforced; pages of ``limit`` chain through X-Next-Cursor."""
+        origin = orm_create_business(
+            db_session, name="Origin Biz", location="POINT(-79.0 35.8)", published=True,
+        )
+        # ~0.7, ~1.4, ~2.1 miles east of the origin, then one ~7 miles out.
+        for name, lon in (("Ring 1", -78.9877), ("Ring 2", -78.9754),
+                          ("Ring 3", -78.9631), ("Outside", -78.877)):
+            orm_create_business(
+                db_session, name=name, location=f"POINT({lon} 35.8)", published=True,
+            )
+        db_session.commit()
+
+        url = f"/api/pois/{origin.id}/nearby"
+        resp = app_client.get(url, params={"radius_miles": 5, "limit": 2})
+        assert resp.status_code == 200
+        assert [p["name"] for p in resp.json()] == ["Ring 1", "Ring 2"]
+        cursor = resp.headers["X-Next-Cursor"]
+
+        resp = app_client.get(url, params={"radius_miles": 5, "limit": 2, "cursor": cursor})
+        assert [p["name"] for p in resp.json()] == ["Ring 3"]
+        assert "X-Next-Cursor" not in resp.headers
+
+        resp = app_client.get(url, params={"radius_miles": 5, "cursor": "nope"})
+        assert resp.status_code == 400
+
+    def test_app_nearby_includes_categories(self, db_session, app_client):
+        cat = orm_create_category(db_session, name="Nearby Cat")
+        origin = orm_create_business(db_session, name="Cat Origin", published=True)
+        other = orm_create_business(
+            db_session, name="Cat Neighbor", location="POINT(-79.001 35.801)", published=True,
+        )
+        orm_assign_main_category(db_session, other.id, cat.id)
+        db_session.commit()
+
+        resp = app_client.get(f"/api/pois/{origin.id}/nearby")
+        neighbor = next(p for p in resp.json() if p["name"] == "Cat Neighbor")
+        assert [c["name"] for c in neighbor["categories"]] == ["Nearby Cat"]
+
 
 class TestAppBySlug:
     def test_app_by_slug(self, db_session, app_client):
@@ -136,6 +178,52 @@ class TestAppBySlug:
         assert resp.json()["name"] == "Slug Test Biz"
 
 
+class TestAppDetailConditionalGet:
+    def test_etag_304_and_cache_control(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Etag Detail Biz", published=True)
+        db_session.commit()
+
+        first = app_client.get(f"/api/pois/{poi.id}")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert "stale-while-revalidate" in first.headers["Cache-Control"]
+
+        resp = app_client.get(f"/api/pois/{poi.id}", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+        by_slug = app_client.get(f"/api/pois/by-slug/{poi.slug}", headers={"If-None-Match": etag})
+        assert by_slug.status_code == 304
+
+    def test_etag_changes_with_subtype_and_categories(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Etag Subtype Biz", published=True)
+        db_session.commit()
+        etag = app_client.get(f"/api/pois/{poi.id}").headers["ETag"]
+
+        # Subtype row only: the POI row itself is untouched.
+        db_session.execute(
+            text("UPDATE businesses SET price_range = '$$$$' WHERE poi_id = :id"),
+            {"id": poi.id},
+        )
+        db_session.commit()
+        resp = app_client.get(f"/api/pois/{poi.id}", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        etag = resp.headers["ETag"]
+
+        cat = orm_create_category(db_session, name="Etag Detail Cat")
+        orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+        resp = app_client.get(f"/api/pois/{poi.id}", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
+    def test_unpublished_is_404_not_304(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Etag Draft Biz", published=False)
+        db_session.commit()
+        resp = app_client.get(f"/api/pois/{poi.id}", headers={"If-None-Match": "*"})
+        assert resp.status_code == 404
+
+
 class TestAppByType:
     def test_app_by_type(self, db_session, app_client):
         """Create BUSINESS, app GET /api/pois/by-type/BUSINESS → found."""
@@ -148,6 +236,110 @@ class TestAppByType:
         names = [r["name"] for r in results]
         assert "Type Test Biz" in names
 
+    def test_app_by_type_card_fields(self, db_session, app_client):
+        """Projected rows still carry location GeoJSON and batched categories."""
+        cat = orm_create_category(db_session, name="Card Cat")
+        poi = orm_create_business(
+            db_session, name="Card Biz", location="POINT(-79.1 35.7)", published=True,
+        )
+        orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+
+        item = app_client.get("/api/pois/by-type/BUSINESS").json()[0]
+        assert item["id"] == str(poi.id)
+        assert item["location"] == {"type": "Point", "coordinates": [-79.1, 35.7]}
+        assert [c["slug"] for c in item["categories"]] == [cat.slug]
+
+    def test_app_by_type_keyset_pages(self, db_session, app_client):
+        for name in ("Charlie Biz", "Alpha Biz", "Bravo Biz"):
+            orm_create_business(db_session, name=name, published=True)
+        db_session.commit()
+
+        resp = app_client.get("/api/pois/by-type/BUSINESS", params={"limit": 2})
+        assert [r["name"] for r in resp.json()] == ["Alpha Biz", "Bravo Biz"]
+        cursor = resp.headers["X-Next-Cursor"]
+
+        resp = app_client.get(
+            "/api/pois/by-type/BUSINESS", params={"limit": 2, "cursor": cursor},
+        )
+        assert [r["name"] for r in resp.json()] == ["Charlie Biz"]
+        assert "X-Next-Cursor" not in resp.headers
+
+        resp = app_client.get("/api/pois/by-type/BUSINESS", params={"cursor": "%%%"})
+        assert resp.status_code == 400
+
+    def test_app_by_category_keyset_pages(self, db_session, app_client):
+        cat = orm_create_category(db_session, name="Paged Cat")
+        for name in ("Bravo Park", "Alpha Park"):
+            poi = orm_create_park(db_session, name=name, published=True)
+            orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+
+        resp = app_client.get(f"/api/pois/by-category/{cat.slug}", params={"limit": 1})
+        data = resp.json()
+        assert data["category"]["slug"] == cat.slug
+        assert [p["name"] for p in data["pois"]] == ["Alpha Park"]
+
+        resp = app_client.get(
+            f"/api/pois/by-category/{cat.slug}",
+            params={"limit": 1, "cursor": resp.headers["X-Next-Cursor"]},
+        )
+        assert [p["name"] for p in resp.json()["pois"]] == ["Bravo Park"]
+
+    def test_app_unpaged_listing_streams_in_batches(self, db_session, app_client, monkeypatch):
+        """Unpaged listings read a yield_per cursor; categories load per batch."""
+        pois = sys.modules["app.api.endpoints.pois"]
+        monkeypatch.setattr(pois, "LISTING_YIELD_PER", 2)
+        cat = orm_create_category(db_session, name="Batched Cat")
+        for name in ("Echo Biz", "Delta Biz", "Foxtrot Biz", "Golf Biz", "Hotel Biz"):
+            poi = orm_create_business(db_session, name=name, published=True)
+            orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+
+        resp = app_client.get("/api/pois/by-type/BUSINESS")
+        assert resp.status_code == 200
+        assert "X-Next-Cursor" not in resp.headers
+        items = resp.json()
+        assert [r["name"] for r in items] == ["Delta Biz", "Echo Biz", "Foxtrot Biz", "Golf Biz", "Hotel Biz"]
+        assert all([c["slug"] for c in r["categories"]] == [cat.slug] for r in items)
+
+        data = app_client.get(f"/api/pois/by-category/{cat.slug}").json()
+        assert [p["name"] for p in data["pois"]] == [r["name"] for r in items]
+
+
+class TestAppImageVariants:
+    def _insert_image(self, db, poi_id, order, variant=None, parent_id=None):
+        image_id = uuid.uuid4()
+        db.execute(
+            text(
+                "INSERT INTO images (id, poi_id, image_type, filename, storage_url, "
+                "image_size_variant, parent_image_id, display_order) "
+                "VALUES (:id, :poi_id, 'gallery', :filename, :url, :variant, :parent, :order)"
+            ),
+            {
+                "id": image_id, "poi_id": poi_id, "filename": f"{variant or 'orig'}.jpg",
+                "url": f"https://cdn.test/{image_id}.jpg", "variant": variant,
+                "parent": parent_id, "order": order,
+            },
+        )
+        return image_id
+
+    def test_detail_images_carry_all_variants(self, db_session, app_client):
+        """Each original lists every size variant URL; variants aren't listed as images."""
+        poi = orm_create_business(db_session, name="Gallery Biz", published=True)
+        first = self._insert_image(db_session, poi.id, order=0)
+        for size in ("thumbnail", "medium", "large", "xlarge"):
+            self._insert_image(db_session, poi.id, order=0, variant=size, parent_id=first)
+        second = self._insert_image(db_session, poi.id, order=1)
+        db_session.commit()
+
+        images = app_client.get(f"/api/pois/{poi.id}").json()["images"]
+        assert [img["id"] for img in images] == [str(first), str(second)]
+        assert set(images[0]["variants"]) == {"thumbnail", "medium", "large", "xlarge"}
+        assert images[0]["thumbnail_url"] == images[0]["variants"]["thumbnail"]
+        assert images[1]["variants"] == {}
+        assert images[1]["thumbnail_url"] is None
+
 
 class TestAppReadsAllFieldTypes:
     def test_app_reads_all_field_types(self, db_session, app_client):
@@ -277,6 +469,51 @@ class TestAppNearbyByCoordinates:
         names = [r["name"] for r in results]
         assert "Coord Nearby Biz" in names
 
+    def _seed_line(self, db_session):
+        # ~0, ~1.1 km and ~11 km east of (35.8, -79.0).
+        for name, lon in (("Near Biz", -79.0), ("Mid Biz", -78.9877), ("Far Biz", -78.877)):
+            orm_create_business(
+                db_session, name=name, location=f"POINT({lon} 35.8)", published=True,
+            )
+        db_session.commit()
+
+    def test_nearest_first_with_exact_distance(self, db_session, app_client):
+        self._seed_line(db_session)
+        resp = app_client.get("/api/nearby", params={"latitude": 35.8, "longitude": -79.0})
+        assert resp.status_code == 200
+        results = resp.json()
+        assert [r["name"] for r in results] == ["Near Biz", "Mid Biz", "Far Biz"]
+        assert results[0]["distance_meters"] < 1
+        assert 1000 < results[1]["distance_meters"] < 1200
+
+    def test_radius_and_limit(self, db_session, app_client):
+        self._seed_line(db_session)
+        resp = app_client.get(
+            "/api/nearby",
+            params={"latitude": 35.8, "longitude": -79.0, "radius_m": 5000},
+        )
+        assert [r["name"] for r in resp.json()] == ["Near Biz", "Mid Biz"]
+
+        resp = app_client.get(
+            "/api/nearby", params={"latitude": 35.8, "longitude": -79.0, "limit": 1},
+        )
+        assert [r["name"] for r in resp.json()] == ["Near Biz"]
+
+    def test_poi_type_filter(self, db_session, app_client):
+        self._seed_line(db_session)
+        resp = app_client.get(
+            "/api/nearby",
+            params={"latitude": 35.8, "longitude": -79.0, "poi_type": "park"},
+        )
+        assert resp.status_code == 200
+        assert resp.json() == []
+
+        resp = app_client.get(
+            "/api/nearby",
+            params={"latitude": 35.8, "longitude": -79.0, "poi_type": "hotel"},
+        )
+        assert resp.status_code == 400
+
 
 class TestAppCategories:
     def test_app_categories(self, db_session, app_client):
@@ -293,6 +530,38 @@ class TestAppCategories:
         assert cat_entry is not None
         assert cat_entry["poi_count"] >= 1
 
+    def test_app_categories_counts_only_published(self, db_session, app_client):
+        cat = orm_create_category(db_session, name="Counted Cat")
+        empty = orm_create_category(db_session, name="Empty Cat")
+        for name, published in (("Pub A", True), ("Pub B", True), ("Draft C", False)):
+            poi = orm_create_business(db_session, name=name, published=published)
+            orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+
+        counts = {c["name"]: c["poi_count"] for c in app_client.get("/api/categories").json()}
+        assert counts["Counted Cat"] == 2
+        assert counts["Empty Cat"] == 0
+
+    def test_app_categories_etag_and_invalidation(self, db_session, app_client):
+        cat = orm_create_category(db_session, name="Etag Cat")
+        db_session.commit()
+
+        first = app_client.get("/api/categories")
+        etag = first.headers["ETag"]
+        resp = app_client.get("/api/categories", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+        # Any catalog write bumps the data version: new ETag, fresh counts.
+        poi = orm_create_business(db_session, name="Etag Biz", published=True)
+        orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+
+        resp = app_client.get("/api/categories", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+        entry = next(c for c in resp.json() if c["name"] == "Etag Cat")
+        assert entry["poi_count"] == 1
+
 
 class TestHybridSearchAPI:
     def test_hybrid_search_returns_results(self, db_session, app_client):
@@ -0,0 +1,122 @@
+"""Direct detail JSON encoding == the POIDetail validate + dump output.
+
+The registry detail path encodes its payload with ``DetailEncoder`` instead of
+``POIDetail.model_validate(...).model_dump(mode="json")`` filtered to
+``model_fields_set``. These tests build that reference output and compare:
+once on a synthetic payload covering every encoder (no database), and once per
+POI type on payloads assembled by the real endpoint code.
+"""
+
+import json
+import os
+import sys
+import uuid
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi.responses import JSONResponse
+
+_MONOREPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_APP_BACKEND = os.path.join(_MONOREPO_ROOT, "nearby-app", "backend")
+if _APP_BACKEND not in sys.path:
+    sys.path.insert(0, _APP_BACKEND)
+
+from conftest import (  # noqa: E402
+    orm_create_business,
+    orm_create_park,
+    orm_create_trail,
+    orm_create_event,
+    orm_create_category,
+    orm_assign_main_category,
+)
+from test_serializer_parity import _load_app_poidetail  # noqa: E402
+
+
+def _reference_body(poi_detail, payload):
+    """The registry detail body as it was produced through POIDetail."""
+    model = poi_detail.model_validate(payload)
+    full = model.model_dump(mode="json")
+    content = {key: value for key, value in full.items() if key in model.model_fields_set}
+    return JSONResponse(content=content).body
+
+
+def test_synthetic_payload_matches_model_dump():
+    from app.serialization.detail_json import DetailEncoder
+
+    poi_detail, point_geometry = _load_app_poidetail()
+    category = SimpleNamespace(id=uuid.uuid4(), name="Coffee")
+    payload = {
+        "poi_type": "EVENT",
+        "name": "Harvest Fair",
+        "slug": "harvest-fair",
+        "listing_type": "paid",
+        "is_verified": True,
+        "hours": {"regular": {"monday": [{"open": "09:00", "close": "17:00"}]}},
+        "amenities": ["Seating", "Shade"],
+        "last_updated": datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc).isoformat(),
+        "created_at": datetime(2026, 9, 1, 8, 0, 0, 250000, tzinfo=timezone(timedelta(hours=-4))).isoformat(),
+        # Undeclared registry keys and markers pass through.
+        "icon_free_wifi": True,
+        "what3words_address": "index.home.raft",
+        "_venue_source": {"hours": "venue"},
+        "id": str(uuid.uuid4()),
+        "location": point_geometry(coordinates=[-79.05, 35.72]),
+        "business": None,
+        "park": SimpleNamespace(drone_usage_policy="Permit required"),
+        "trail": SimpleNamespace(length_text="2 mi", trailhead_latitude=Decimal("35.7"),
+                                 trailhead_longitude=-79, access_points=[{"name": "North"}]),
+        "event": SimpleNamespace(
+            start_datetime=datetime(2026, 11, 1, 14, 0, tzinfo=timezone.utc),
+            end_datetime=datetime(2026, 11, 1, 18, 0),
+            venue_poi_id=uuid.uuid4(),
+            excluded_dates=["2026-11-08"],
+            organizer_social_media={"instagram": "fair"},
+        ),
+        "categories": [category],
+        "main_category": category,
+        "secondary_categories": [],
+        "images": [
+            {"id": "a", "url": "https://example.test/a.webp", "type": "main",
+             "thumbnail_url": "https://example.test/a-t.webp",
+             "variants": {"thumbnail": "https://example.test/a-t.webp"},
+             "alt_text": None, "caption": "Front", "width": 800, "height": 600},
+            {"id": "b", "url": "https://example.test/b.webp", "type": "gallery"},
+        ],
+    }
+
+    encoded = DetailEncoder(poi_detail).encode(payload)
+    assert json.loads(encoded) == json.loads(_reference_body(poi_detail, payload))
+    assert set(json.loads(encoded)) == set(payload)
+
+
+@pytest.mark.parametrize("poi_type", ["BUSINESS", "PARK", "TRAIL", "EVENT"])
+def test_endpoint_payloads_match_model_dump(db_session, app_client, poi_type):
+    venue = orm_create_park(db_session, name="Venue Park", published=True,
+                            parking_notes="Lot B", hours={"regular": {}})
+    creators = {
+        "BUSINESS": lambda: orm_create_business(db_session, name="Parity Biz", published=True,
+                                                 listing_type="paid", amenities=["Wifi"]),
+        "PARK": lambda: orm_create_park(db_session, name="Parity Park", published=True),
+        "TRAIL": lambda: orm_create_trail(db_session, name="Parity Trail", published=True,
+                                          trail_fields={"length_text": "3 mi", "difficulty": "easy"}),
+        "EVENT": lambda: orm_create_event(db_session, name="Parity Event", published=True,
+                                          event_fields={"venue_poi_id": venue.id,
+                                                        "organizer_name": "Friends"}),
+    }
+    poi = creators[poi_type]()
+    category = orm_create_category(db_session, name="Parity Category")
+    orm_assign_main_category(db_session, poi.id, category.id)
+    db_session.commit()
+
+    import app.api.endpoints.pois as pois_module
+    from app import crud
+
+    db_poi = crud.crud_poi.get_poi(db_session, poi_id=str(poi.id))
+    images = pois_module.get_poi_images(db_session, db_poi.id)
+    payload = pois_module._build_registry_detail_dict(db_session, db_poi, images)
+
+    encoded = pois_module._DETAIL_ENCODER.encode(payload)
+    reference = _reference_body(pois_module.schemas.poi.POIDetail, payload)
+    assert json.loads(encoded) == json.loads(reference)
@@ -6,20 +6,32 @@ unset in conftest), so ``client.embed`` returns ``None`` and
 ``write_embedding_best_effort`` no-ops cleanly without touching the (unmapped,
 possibly absent) ``embedding`` column.
 
-The end-to-end "vector actually stored" test belongs to the Shared
-embedding-pipeline phase (pgvector + a mock client) and is intentionally NOT
-here — nothing below requires the ``embedding`` column to exist.
+The write paths only enqueue into ``embedding_outbox``; ``TestEmbeddingOutbox``
+covers the enqueue/claim/settle cycle and the worker's backoff. Ranking-level
+"vector actually stored" checks live in test_embedding_pipeline.py.
 """
 
 import importlib
+from datetime import datetime, timezone
 
 import pytest
+from sqlalchemy import text
 
-from conftest import create_business
+from conftest import create_business, create_category, orm_create_business
 
 
 # The module under test (admin backend is on sys.path via conftest).
 embedding_writer = importlib.import_module("app.crud.embedding_writer")
+crud_embedding_outbox = importlib.import_module("app.crud.crud_embedding_outbox")
+embedding_worker = importlib.import_module("app.services.embedding_worker")
+
+
+def _outbox_rows(db):
+    db.expire_all()
+    return db.execute(text(
+        "SELECT poi_id::text, generation, attempts, last_error, next_attempt_at "
+        "FROM embedding_outbox ORDER BY poi_id"
+    )).fetchall()
 
 
 class TestSaveNeverBreaks:
@@ -35,20 +47,14 @@ class TestSaveNeverBreaks:
         assert data["poi_type"] == "BUSINESS"
         assert "id" in data
 
-    def test_create_succeeds_when_writer_raises(self, admin_client, monkeypatch):
-        """If the embed-on-write hook itself blows up, the POI is STILL created.
-
-        The call site must swallow/contain errors so a writer bug can never break
-        a save. We force the writer to raise and assert the create still 201s.
-        """
+    def test_create_makes_no_embedding_call(self, admin_client, monkeypatch):
+        """The create request never calls TEI itself — it only queues the POI
+        in the outbox; the embedding worker does the round-trip later."""
         def _boom(*args, **kwargs):
-            raise RuntimeError("simulated embedding-writer failure")
+            raise RuntimeError("write path must not embed inline")
 
-        # The hook does a runtime `from app.crud.embedding_writer import ...`, so
-        # patching the attribute on the module is picked up by the call site.
-        monkeypatch.setattr(
-            embedding_writer, "write_embedding_best_effort", _boom
-        )
+        monkeypatch.setattr(embedding_writer, "write_embedding_best_effort", _boom)
+        monkeypatch.setattr(embedding_writer, "embed_pois", _boom)
 
         data = create_business(admin_client, name="Embed Boom Cafe")
         assert data["name"] == "Embed Boom Cafe"
@@ -81,3 +87,185 @@ class TestShouldReembedGate:
 
     def test_empty_set_is_false(self):
         assert embedding_writer.should_reembed(set()) is False
+
+
+class TestEmbeddingOutbox:
+    def test_create_enqueues_in_same_transaction(self, admin_client, db_session):
+        data = create_business(admin_client, name="Outbox Cafe")
+        rows = _outbox_rows(db_session)
+        assert [r[0] for r in rows] == [data["id"]]
+        assert rows[0][1] == 1
+
+    def test_repeated_saves_collapse_into_one_row(self, admin_client, db_session):
+        data = create_business(admin_client, name="Outbox Twice")
+        resp = admin_client.put(f"/api/pois/{data['id']}", json={"name": "Outbox Twice 2"})
+        assert resp.status_code == 200
+        rows = _outbox_rows(db_session)
+        assert len(rows) == 1
+        assert rows[0][1] == 2
+
+    def test_disabled_client_leaves_rows_queued(self, db_session):
+        poi = orm_create_business(db_session, name="Queued POI")
+        crud_embedding_outbox.enqueue_reembed(db_session, [poi.id])
+        db_session.commit()
+
+        assert embedding_worker.drain_once() == 0
+        assert len(_outbox_rows(db_session)) == 1
+
+    def test_drain_embeds_and_deletes_row(self, mock_embedding_client, db_session):
+        poi = orm_create_business(db_session, name="Drained POI")
+        crud_embedding_outbox.enqueue_reembed(db_session, [poi.id])
+        db_session.commit()
+
+        assert embedding_worker.drain_once() == 1
+        assert _outbox_rows(db_session) == []
+        stored = db_session.execute(
+            text("SELECT embedding IS NOT NULL FROM points_of_interest WHERE id = :id"),
+            {"id": str(poi.id)},
+        ).scalar()
+        assert stored is True
+
+    def test_reenqueue_during_flight_survives_completion(self, db_session):
+        poi = orm_create_business(db_session, name="In Flight POI")
+        crud_embedding_outbox.enqueue_reembed(db_session, [poi.id])
+        db_session.commit()
+
+        claimed = crud_embedding_outbox.claim_batch(db_session, 10)
+        assert [c[0] for c in claimed] == [str(poi.id)]
+        # A save lands while the worker is talking to TEI.
+        crud_embedding_outbox.enqueue_reembed(db_session, [poi.id])
+        db_session.commit()
+        crud_embedding_outbox.complete(db_session, [(claimed[0][0], claimed[0][1])])
+
+        rows = _outbox_rows(db_session)
+        assert len(rows) == 1
+        assert rows[0][1] == 2
+
+    def test_failed_embed_backs_off(self, mock_embedding_client, db_session, monkeypatch):
+        poi = orm_create_business(db_session, name="Flaky POI")
+        crud_embedding_outbox.enqueue_reembed(db_session, [poi.id])
+        db_session.commit()
+
+        monkeypatch.setattr(
+            mock_embedding_client, "embed_batch",
+            lambda texts, kind="document": [None for _ in texts],
+        )
+        assert embedding_worker.drain_once() == 1
+
+        rows = _outbox_rows(db_session)
+        assert len(rows) == 1
+        _poi_id, _generation, attempts, last_error, next_attempt_at = rows[0]
+        assert attempts == 1
+        assert last_error
+        assert next_attempt_at > datetime.now(timezone.utc)
+        # Not due yet -> nothing claimed on the next pass.
+        assert embedding_worker.drain_once() == 0
+
+    def test_autosave_burst_is_debounced(self, admin_client, db_session):
+        data = create_business(admin_client, name="Debounce Cafe")
+        # Let the create's job settle so only autosaves are pending.
+        db_session.execute(text("DELETE FROM embedding_outbox"))
+        db_session.commit()
+
+        for i in range(3):
+            resp = admin_client.patch(
+                f"/api/pois/{data['id']}/autosave",
+                json={"description_short": f"typing {i}"},
+            )
+            assert resp.status_code == 200, resp.text
+
+        rows = _outbox_rows(db_session)
+        assert len(rows) == 1
+        assert rows[0][1] == 3
+        # Not due until the quiet window after the LAST autosave.
+        assert rows[0][4] > datetime.now(timezone.utc)
+        assert embedding_worker.drain_once() == 0
+
+    def test_irrelevant_autosave_does_not_enqueue(self, admin_client, db_session):
+        data = create_business(admin_client, name="Irrelevant Cafe")
+        db_session.execute(text("DELETE FROM embedding_outbox"))
+        db_session.commit()
+
+        resp = admin_client.patch(
+            f"/api/pois/{data['id']}/autosave", json={"is_verified": True}
+        )
+        assert resp.status_code == 200, resp.text
+        assert _outbox_rows(db_session) == []
+
+    def test_debounce_is_capped_by_max_staleness(self, db_session):
+        poi = orm_create_business(db_session, name="Long Session POI")
+        crud_embedding_outbox.enqueue_reembed(db_session, [poi.id], debounce=True)
+        db_session.commit()
+        # The first pending change is older than the staleness cap.
+        db_session.execute(text(
+            "UPDATE embedding_outbox SET enqueued_at = now() - interval '1 hour'"
+        ))
+        db_session.commit()
+
+        crud_embedding_outbox.enqueue_reembed(db_session, [poi.id], debounce=True)
+        db_session.commit()
+
+        assert crud_embedding_outbox.claim_batch(db_session, 10) != []
+
+    def test_retry_delay_is_exponential_and_capped(self):
+        delays = [crud_embedding_outbox.retry_delay(n).total_seconds() for n in (1, 2, 3)]
+        assert delays == [5, 10, 20]
+        assert (
+            crud_embedding_outbox.retry_delay(50).total_seconds()
+            == crud_embedding_outbox.RETRY_MAX_SECONDS
+        )
+
+
+class TestCategoryFanOut:
+    def _setup(self, admin_client, db_session):
+        cat = create_category(admin_client, name="Fan Out Cat", applicable_to=["BUSINESS"])
+        other = create_category(admin_client, name="Untouched Cat", applicable_to=["BUSINESS"])
+        linked = create_business(admin_client, name="Linked Biz", main_category_id=cat["id"])
+        unlinked = create_business(admin_client, name="Unlinked Biz", main_category_id=other["id"])
+        db_session.execute(text("DELETE FROM embedding_outbox"))
+        db_session.commit()
+        return cat, linked, unlinked
+
+    def test_rename_enqueues_only_assigned_pois(self, admin_client, db_session):
+        cat, linked, _unlinked = self._setup(admin_client, db_session)
+
+        resp = admin_client.put(f"/api/categories/{cat['id']}", json={"name": "Renamed Cat"})
+        assert resp.status_code == 200, resp.text
+
+        assert [r[0] for r in _outbox_rows(db_session)] == [linked["id"]]
+
+    def test_applicability_change_enqueues(self, admin_client, db_session):
+        cat, linked, _unlinked = self._setup(admin_client, db_session)
+
+        resp = admin_client.put(
+            f"/api/categories/{cat['id']}",
+            json={"applicable_to": ["BUSINESS", "PARK"]},
+        )
+        assert resp.status_code == 200, resp.text
+
+        assert [r[0] for r in _outbox_rows(db_session)] == [linked["id"]]
+
+    def test_unchanged_name_does_not_enqueue(self, admin_client, db_session):
+        cat, _linked, _unlinked = self._setup(admin_client, db_session)
+
+        resp = admin_client.put(f"/api/categories/{cat['id']}", json={"name": "Fan Out Cat"})
+        assert resp.status_code == 200, resp.text
+
+        assert _outbox_rows(db_session) == []
+
+    def test_fan_out_reports_progress_per_batch(self, admin_client, db_session):
+        cat, _linked, _unlinked = self._setup(admin_client, db_session)
+        create_business(admin_client, name="Linked Biz 2", main_category_id=cat["id"])
+        db_session.execute(text("DELETE FROM embedding_outbox"))
+        db_session.commit()
+
+        calls = []
+        count = crud_embedding_outbox.enqueue_category_fan_out(
+            db_session, cat["id"], batch_size=1,
+            progress=lambda done, total: calls.append((done, total)),
+        )
+        db_session.commit()
+
+        assert count == 2
+        assert calls == [(1, 2), (2, 2)]
+        assert len(_outbox_rows(db_session)) == 2
@@ -27,6 +27,7 @@ from conftest import orm_create_business
 
 
 embedding_writer = importlib.import_module("app.crud.embedding_writer")
+crud_embedding_versions = importlib.import_module("app.crud.crud_embedding_versions")
 
 
 def _embedding_is_populated(db, poi_id) -> bool:
@@ -187,3 +188,191 @@ class TestFailSoftWithoutMock:
         assert resp.status_code == 200, resp.text
         names = [r["name"] for r in resp.json()]
         assert "Sunrise Bakery Keyword" in names
+
+
+class TestContentHashGate:
+    """The writer skips the TEI call when the stored ``embedding_hash`` still
+    matches the POI's freshly built searchable text (+ model id)."""
+
+    def test_hash_depends_on_text_and_model(self):
+        from shared.embeddings import searchable_text_hash
+
+        base = searchable_text_hash("Name: Cafe", "model-a")
+        assert len(base) == 64
+        assert searchable_text_hash("Name: Cafe", "model-a") == base
+        assert searchable_text_hash("Name: Cafe!", "model-a") != base
+        assert searchable_text_hash("Name: Cafe", "model-b") != base
+
+    def test_unchanged_text_skips_embed_and_changed_text_reembeds(
+        self, db_session, mock_embedding_client, monkeypatch
+    ):
+        calls = []
+        original_embed = mock_embedding_client.embed
+
+        def _counting_embed(text_value, kind="document"):
+            calls.append(text_value)
+            return original_embed(text_value, kind=kind)
+
+        monkeypatch.setattr(mock_embedding_client, "embed", _counting_embed)
+
+        poi = orm_create_business(
+            db_session,
+            name="Hash Gate Bakery",
+            description_long="Sourdough and croissants.",
+            published=True,
+        )
+        db_session.commit()
+
+        embedding_writer.write_embedding_best_effort(db_session, poi.id)
+        assert len(calls) == 1
+        stored_hash = db_session.execute(
+            text("SELECT embedding_hash FROM points_of_interest WHERE id = :id"),
+            {"id": str(poi.id)},
+        ).scalar()
+        assert stored_hash and len(stored_hash) == 64
+
+        # A field outside the searchable text changes -> no TEI call.
+        poi.phone_number = "555-0100"
+        db_session.commit()
+        embedding_writer.write_embedding_best_effort(db_session, poi.id)
+        assert len(calls) == 1
+
+        # An embedded field changes -> re-embed and a new hash is recorded.
+        poi.description_long = "Sourdough, croissants and espresso."
+        db_session.commit()
+        embedding_writer.write_embedding_best_effort(db_session, poi.id)
+        assert len(calls) == 2
+        db_session.commit()
+        new_hash = db_session.execute(
+            text("SELECT embedding_hash FROM points_of_interest WHERE id = :id"),
+            {"id": str(poi.id)},
+        ).scalar()
+        assert new_hash != stored_hash
+
+    def test_missing_vector_is_never_skipped(
+        self, db_session, mock_embedding_client
+    ):
+        """A hash without a vector (e.g. the vector was cleared) must re-embed."""
+        poi = orm_create_business(db_session, name="Hash No Vector", published=True)
+        db_session.commit()
+        embedding_writer.write_embedding_best_effort(db_session, poi.id)
+        db_session.execute(
+            text("UPDATE points_of_interest SET embedding = NULL WHERE id = :id"),
+            {"id": str(poi.id)},
+        )
+        db_session.commit()
+
+        embedding_writer.write_embedding_best_effort(db_session, poi.id)
+        db_session.commit()
+        assert _embedding_is_populated(db_session, poi.id) is True
+
+
+class TestEmbeddingModelVersions:
+    """Side-by-side model migration: a shadow model is backfilled next to the
+    live one, the cutover swaps them, and search always compares a query with
+    vectors of its own model."""
+
+    @pytest.fixture
+    def two_models(self, db_session, mock_embedding_client, monkeypatch):
+        from conftest import MockEmbeddingClient
+
+        monkeypatch.setattr(mock_embedding_client, "model", "model-a", raising=False)
+        shadow = MockEmbeddingClient()
+        shadow.model = "model-b"
+        monkeypatch.setattr(
+            embedding_writer, "get_shadow_embedding_client", lambda: shadow
+        )
+        return mock_embedding_client, shadow
+
+    def _published_poi(self, db_session, name):
+        poi = orm_create_business(
+            db_session, name=name,
+            description_long="A pet friendly spot for dogs.", published=True,
+        )
+        db_session.commit()
+        return poi
+
+    def test_live_vectors_are_tagged_with_their_model(self, db_session, two_models):
+        poi = self._published_poi(db_session, "Tagged Cafe")
+        embedding_writer.embed_pois([poi.id])
+
+        tag = db_session.execute(
+            text("SELECT embedding_model FROM points_of_interest WHERE id = :id"),
+            {"id": str(poi.id)},
+        ).scalar()
+        assert tag == "model-a"
+        # No shadow registered -> the shadow client is not used.
+        assert db_session.execute(
+            text("SELECT count(*) FROM poi_embedding_shadow")
+        ).scalar() == 0
+
+    def test_shadow_model_fills_shadow_store(self, db_session, two_models):
+        poi = self._published_poi(db_session, "Shadow Cafe")
+        crud_embedding_versions.start_shadow(db_session, "model-b", "model-a")
+
+        settled, failed = embedding_writer.embed_pois([poi.id])
+
+        assert settled == [str(poi.id)] and failed == []
+        stats = crud_embedding_versions.coverage(db_session)
+        assert (stats["live"], stats["shadow"], stats["total"]) == (1, 1, 1)
+
+    def test_start_shadow_rejects_other_dimensions(self, db_session, two_models):
+        assert crud_embedding_versions.shadow_store_dim(db_session) == 768
+        with pytest.raises(ValueError, match="384-dim"):
+            crud_embedding_versions.start_shadow(db_session, "model-b", "model-a", 384)
+        assert crud_embedding_versions.coverage(db_session)["shadow_model"] is None
+
+        crud_embedding_versions.start_shadow(db_session, "model-b", "model-a", 768)
+        assert crud_embedding_versions.coverage(db_session)["shadow_model"] == "model-b"
+
+    def test_probe_reports_the_server_dimension(self):
+        import httpx
+
+        from shared.embeddings import EmbeddingClient
+
+        client = EmbeddingClient("http://tei.invalid")
+        client._client = httpx.Client(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json=[[0.5] * 384])
+        ))
+        assert client.probe_dim() == 384
+        assert client.embed("probe", "document") is None  # outside expected_dim
+
+    def test_cutover_refuses_incomplete_coverage(self, db_session, two_models):
+        self._published_poi(db_session, "Uncovered Cafe")
+        crud_embedding_versions.start_shadow(db_session, "model-b", "model-a")
+
+        with pytest.raises(ValueError):
+            crud_embedding_versions.cutover(db_session)
+
+    def test_cutover_swaps_stores_and_search_follows_query_model(
+        self, db_session, two_models, app_client
+    ):
+        from app.search.search_engine import _signal_semantic
+        from conftest import MockEmbeddingClient
+
+        live_client, shadow_client = two_models
+        poi = self._published_poi(db_session, "Cutover Cafe")
+        embedding_writer.embed_pois([poi.id])
+        crud_embedding_versions.start_shadow(db_session, "model-b", "model-a")
+        embedding_writer.embed_pois([poi.id])
+
+        # Before cutover both models already find the POI in their own store.
+        assert str(poi.id) in _signal_semantic(db_session, "pet friendly", None, live_client)
+        assert str(poi.id) in _signal_semantic(db_session, "pet friendly", None, shadow_client)
+
+        crud_embedding_versions.cutover(db_session)
+
+        tag = db_session.execute(
+            text("SELECT embedding_model FROM points_of_interest WHERE id = :id"),
+            {"id": str(poi.id)},
+        ).scalar()
+        assert tag == "model-b"
+        stats = crud_embedding_versions.coverage(db_session)
+        assert (stats["live_model"], stats["shadow_model"]) == ("model-b", "model-a")
+
+        assert str(poi.id) in _signal_semantic(db_session, "pet friendly", None, shadow_client)
+        assert str(poi.id) in _signal_semantic(db_session, "pet friendly", None, live_client)
+
+        unknown = MockEmbeddingClient()
+        unknown.model = "model-c"
+        assert _signal_semantic(db_session, "pet friendly", None, unknown) == {}
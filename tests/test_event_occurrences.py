@@ -0,0 +1,177 @@
+"""
+Materialized event occurrences behind GET /api/events/in-range.
+
+Event writes store every concrete occurrence in ``event_occurrences``
+(``shared.utils.recurring_events.event_occurrences``); the calendar endpoint is
+a range scan over that table, paged with ``limit`` / ``cursor``.
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from conftest import orm_create_event
+
+
+class TestEventOccurrenceExpansion:
+    """event_occurrences() agrees with windowed expand_recurring_dates()."""
+
+    @pytest.mark.parametrize("pattern,kwargs", [
+        ({"frequency": "daily", "interval": 2}, {}),
+        ({"frequency": "weekly", "days": ["MO", "FR"]}, {"excluded_dates": ["2026-03-06"]}),
+        ({"frequency": "monthly"}, {"manual_dates": ["2026-02-20T17:00:00Z"]}),
+        ({"frequency": "weekly"}, {
+            "recurrence_end_date": datetime(2026, 5, 1, tzinfo=timezone.utc),
+        }),
+    ])
+    def test_window_of_whole_series_matches_window_expansion(self, pattern, kwargs):
+        from shared.utils.recurring_events import event_occurrences, expand_recurring_dates
+
+        start = datetime(2026, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+        series = event_occurrences(start, True, pattern, **kwargs)
+        for date_from, date_to in [
+            (datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 31, tzinfo=timezone.utc)),
+            (datetime(2026, 2, 15, tzinfo=timezone.utc), datetime(2026, 3, 15, tzinfo=timezone.utc)),
+            (datetime(2029, 6, 1, tzinfo=timezone.utc), datetime(2029, 6, 30, tzinfo=timezone.utc)),
+        ]:
+            window = expand_recurring_dates(
+                start_datetime=start, repeat_pattern=pattern,
+                date_from=date_from, date_to=date_to, **kwargs,
+            )
+            assert [dt for dt in series if date_from <= dt <= date_to] == window
+
+    def test_non_repeating_occurs_once(self):
+        from shared.utils.recurring_events import event_occurrences
+
+        start = datetime(2026, 6, 15, 18, 0, 0, tzinfo=timezone.utc)
+        assert event_occurrences(start, False, {"frequency": "daily"}) == [start]
+        assert event_occurrences(start, True, None) == [start]
+
+    def test_naive_datetimes_are_utc(self):
+        from shared.utils.recurring_events import event_occurrences
+
+        result = event_occurrences(
+            datetime(2026, 6, 1, 9, 0), True, {"frequency": "daily"},
+            recurrence_end_date=datetime(2026, 6, 3, 23, 0),
+        )
+        assert result == [
+            datetime(2026, 6, day, 9, 0, tzinfo=timezone.utc) for day in (1, 2, 3)
+        ]
+
+
+class TestEventsInRange:
+    """GET /api/events/in-range reads the materialized occurrences."""
+
+    def test_recurring_event_expanded_in_range(self, db_session, app_client):
+        orm_create_event(
+            db_session, name="Weekly Market", published=True, slug="weekly-market",
+            event_fields={
+                "start_datetime": datetime(2026, 3, 7, 9, 0, 0, tzinfo=timezone.utc),
+                "is_repeating": True,
+                "repeat_pattern": {"frequency": "weekly", "interval": 1},
+                "excluded_dates": ["2026-03-21"],
+            },
+        )
+        orm_create_event(
+            db_session, name="One Night Show", published=True, slug="one-night-show",
+            event_fields={"start_datetime": datetime(2026, 3, 10, 20, 0, 0, tzinfo=timezone.utc)},
+        )
+        db_session.commit()
+
+        resp = app_client.get("/api/events/in-range?date_from=2026-03-01&date_to=2026-03-31")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [(e["slug"], e["occurrence_datetime"][:10]) for e in data] == [
+            ("weekly-market", "2026-03-07"),
+            ("one-night-show", "2026-03-10"),
+            ("weekly-market", "2026-03-14"),
+            ("weekly-market", "2026-03-28"),
+        ]
+
+    def test_drafts_and_cancelled_excluded(self, db_session, app_client):
+        orm_create_event(
+            db_session, name="Draft Gala", published=False, slug="draft-gala",
+            event_fields={"start_datetime": datetime(2026, 4, 2, 18, 0, 0, tzinfo=timezone.utc)},
+        )
+        orm_create_event(
+            db_session, name="Canceled Gala", published=True, slug="canceled-gala",
+            event_fields={
+                "start_datetime": datetime(2026, 4, 3, 18, 0, 0, tzinfo=timezone.utc),
+                "event_status": "Canceled",
+            },
+        )
+        db_session.commit()
+
+        resp = app_client.get("/api/events/in-range?date_from=2026-04-01&date_to=2026-04-30")
+        assert resp.status_code == 200
+        slugs = {e["slug"] for e in resp.json()}
+        assert "draft-gala" not in slugs
+        assert "canceled-gala" not in slugs
+
+    def test_cursor_pages_cover_range_once(self, db_session, app_client):
+        orm_create_event(
+            db_session, name="Daily Yoga", published=True, slug="daily-yoga",
+            event_fields={
+                "start_datetime": datetime(2026, 5, 1, 7, 0, 0, tzinfo=timezone.utc),
+                "is_repeating": True,
+                "repeat_pattern": {"frequency": "daily", "interval": 1},
+            },
+        )
+        db_session.commit()
+
+        url = "/api/events/in-range?date_from=2026-05-01&date_to=2026-05-10"
+        full = app_client.get(url).json()
+        assert len(full) == 10
+
+        paged, cursor = [], None
+        while True:
+            page_url = f"{url}&limit=3" + (f"&cursor={cursor}" if cursor else "")
+            resp = app_client.get(page_url)
+            assert resp.status_code == 200
+            paged.extend(resp.json())
+            cursor = resp.headers.get("x-next-cursor")
+            if not cursor:
+                break
+        assert paged == full
+
+    def test_invalid_cursor_rejected(self, app_client):
+        resp = app_client.get(
+            "/api/events/in-range?date_from=2026-05-01&date_to=2026-05-10&cursor=not-a-cursor"
+        )
+        assert resp.status_code == 400
+
+
+class TestOccurrencesFollowAutosave:
+    """Autosaving schedule fields re-expands the stored occurrences."""
+
+    def test_autosave_schedule_fields_replace_occurrences(self, db_session, admin_client):
+        from sqlalchemy import text
+
+        poi = orm_create_event(
+            db_session, name="Autosave Market", slug="autosave-market",
+            event_fields={
+                "start_datetime": datetime(2026, 3, 7, 9, 0, 0, tzinfo=timezone.utc),
+                "is_repeating": True,
+                "repeat_pattern": {"frequency": "weekly", "interval": 1},
+                "recurrence_end_date": datetime(2026, 3, 31, tzinfo=timezone.utc),
+            },
+        )
+        db_session.commit()
+
+        def stored_days():
+            rows = db_session.execute(
+                text("SELECT occurs_at FROM event_occurrences WHERE poi_id = :id ORDER BY occurs_at"),
+                {"id": str(poi.id)},
+            ).scalars()
+            return [occurs_at.date().isoformat() for occurs_at in rows]
+
+        assert stored_days() == ["2026-03-07", "2026-03-14", "2026-03-21", "2026-03-28"]
+
+        resp = admin_client.patch(
+            f"/api/pois/{poi.id}/autosave",
+            json={
+                "repeat_pattern": {"frequency": "weekly", "interval": 2},
+                "excluded_dates": ["2026-03-21"],
+            },
+        )
+        assert resp.status_code == 200, resp.text
+        assert stored_days() == ["2026-03-07"]
@@ -297,6 +297,59 @@ class TestHoursResolution:
         assert result["hours"] is None
 
 
+class TestCompiledHours:
+    def test_holiday_dates_memoized_per_year(self):
+        from shared.utils.hours_resolution import holiday_dates
+        table = holiday_dates(2026)
+        assert table["thanksgiving"] == date(2026, 11, 26)
+        assert table["easter"] == date(2026, 4, 5)
+        assert holiday_dates(2026) is table
+        assert holiday_dates(2027)["thanksgiving"] == date(2027, 11, 25)
+
+    def test_calendar_matches_expected_sources(self):
+        """One compiled document resolves a whole month with every layer."""
+        from shared.utils.hours_resolution import compile_hours
+        hours = {
+            **REGULAR_HOURS,
+            "holidays": HOLIDAY_HOURS,
+            "seasonal": SEASONAL_HOURS,
+            "exceptions": EXCEPTION_HOURS + [RECURRING_EXCEPTION],
+        }
+        compiled = compile_hours(hours)
+        sources = {
+            day: compiled.resolve(date(2026, 7, day))["source"] for day in range(1, 32)
+        }
+        assert sources[4] == "exception"    # one-time closure
+        assert sources[15] == "exception"   # 3rd Wednesday
+        assert sources[6] == "seasonal"     # summer Monday
+        assert compiled.resolve(date(2026, 9, 8))["source"] == "regular"
+        assert compiled.resolve(date(2026, 11, 26))["source"] == "holiday"
+        assert compiled.resolve(date(2027, 11, 25))["label"] == "Thanksgiving"
+
+    def test_first_listed_exception_wins(self):
+        from shared.utils.hours_resolution import compile_hours
+        one_time = {"type": "one-time", "date": "2026-03-18", "status": "closed", "reason": "One-off"}
+        first_recurring = compile_hours({**REGULAR_HOURS, "exceptions": [RECURRING_EXCEPTION, one_time]})
+        first_one_time = compile_hours({**REGULAR_HOURS, "exceptions": [one_time, RECURRING_EXCEPTION]})
+        assert first_recurring.resolve(date(2026, 3, 18))["label"] == "Monthly team meeting"
+        assert first_one_time.resolve(date(2026, 3, 18))["label"] == "One-off"
+
+    def test_fixed_date_holiday_and_shared_dates(self):
+        from shared.utils.hours_resolution import compile_hours
+        compiled = compile_hours({
+            **REGULAR_HOURS,
+            "holidays": {
+                "founders_day": {"status": "closed", "name": "Founders Day", "date": "07-04"},
+                "independence_day": {"status": "modified", "name": "Fourth", "periods": []},
+                "leap": {"status": "closed", "name": "Leap Day", "date": "02-29"},
+            },
+        })
+        result = compiled.resolve(date(2026, 7, 4))
+        assert (result["source"], result["label"]) == ("holiday", "Founders Day")
+        assert compiled.resolve(date(2028, 2, 29))["label"] == "Leap Day"
+        assert compiled.resolve(date(2026, 3, 1))["source"] == "regular"
+
+
 # ---------------------------------------------------------------------------
 # Effective-hours endpoint tests (nearby-app API)
 # ---------------------------------------------------------------------------
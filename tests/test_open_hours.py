@@ -0,0 +1,246 @@
+"""
+"Open now" resolution for many POIs at once.
+
+- shared.utils.hours_resolution open-interval helpers (port of isCurrentlyOpen)
+- GET /api/pois/effective-hours batch endpoint
+- open_now=true listing filter backed by poi_open_intervals, falling back to
+  the hours JSON where the intervals are missing or stale
+"""
+import sys
+
+import pytest
+from datetime import date, datetime, timedelta, timezone
+
+from conftest import orm_create_business
+from test_hours_system import REGULAR_HOURS
+
+from shared.utils.hours_resolution import (
+    is_open_at,
+    open_intervals,
+    open_minutes_for_date,
+    open_now_batch,
+)
+
+
+def _fixed(open_time, close_time):
+    return {"open": {"type": "fixed", "time": open_time}, "close": {"type": "fixed", "time": close_time}}
+
+
+def _every_day(day_hours, **extra):
+    days = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
+    return {"regular": {day: day_hours for day in days}, **extra}
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestOpenMinutes:
+    def test_fixed_period(self):
+        # 2026-03-02 is a Monday.
+        assert open_minutes_for_date(REGULAR_HOURS, date(2026, 3, 2)) == [(540, 1020)]
+        assert open_minutes_for_date(REGULAR_HOURS, date(2026, 3, 7)) == []
+
+    def test_24_hours(self):
+        hours = _every_day({"status": "24hours"})
+        assert open_minutes_for_date(hours, date(2026, 3, 2)) == [(0, 1440)]
+
+    def test_cross_midnight_period_splits(self):
+        hours = _every_day({"status": "open", "periods": [_fixed("18:00", "02:00")]})
+        assert open_minutes_for_date(hours, date(2026, 3, 2)) == [(0, 120), (1080, 1440)]
+
+    def test_appointment_and_solar_periods_not_open(self):
+        appointment = {"open": {"type": "appointment"}, "close": {"type": "fixed", "time": "17:00"}}
+        solar = {"open": {"type": "fixed", "time": "08:00"}, "close": {"type": "sunset"}}
+        assert open_minutes_for_date(
+            _every_day({"status": "open", "periods": [appointment, _fixed("18:00", "20:00")]}),
+            date(2026, 3, 2),
+        ) == [(1080, 1200)]
+        assert open_minutes_for_date(
+            _every_day({"status": "open", "periods": [solar, _fixed("18:00", "20:00")]}),
+            date(2026, 3, 2),
+        ) == []
+
+    def test_exception_closes_the_day(self):
+        hours = {**REGULAR_HOURS, "exceptions": [{"date": "2026-03-02", "status": "closed"}]}
+        assert open_minutes_for_date(hours, date(2026, 3, 2)) == []
+
+    def test_no_hours(self):
+        assert open_minutes_for_date(None, date(2026, 3, 2)) == []
+
+
+class TestOpenIntervals:
+    def test_local_hours_become_utc_instants(self):
+        # Eastern default: 09:00-17:00 EST on Monday 2026-03-02.
+        assert open_intervals(REGULAR_HOURS, date(2026, 3, 2), 1) == [
+            (_utc(2026, 3, 2, 14), _utc(2026, 3, 2, 22)),
+        ]
+
+    def test_dst_change_keeps_wall_clock(self):
+        # US DST starts Sunday 2026-03-08; Monday 09:00 EDT is 13:00 UTC.
+        intervals = open_intervals(REGULAR_HOURS, date(2026, 3, 6), 4)
+        assert intervals == [
+            (_utc(2026, 3, 6, 14), _utc(2026, 3, 6, 22)),
+            (_utc(2026, 3, 9, 13), _utc(2026, 3, 9, 21)),
+        ]
+
+    def test_touching_ranges_merge(self):
+        hours = _every_day({"status": "24hours"}, timezone="UTC")
+        assert open_intervals(hours, date(2026, 3, 2), 3) == [
+            (_utc(2026, 3, 2), _utc(2026, 3, 5)),
+        ]
+        late = _every_day({"status": "open", "periods": [_fixed("18:00", "02:00")]}, timezone="UTC")
+        assert open_intervals(late, date(2026, 3, 2), 2) == [
+            (_utc(2026, 3, 2), _utc(2026, 3, 2, 2)),
+            (_utc(2026, 3, 2, 18), _utc(2026, 3, 3, 2)),
+            (_utc(2026, 3, 3, 18), _utc(2026, 3, 4)),
+        ]
+
+    def test_unknown_timezone_falls_back_to_default(self):
+        hours = {**REGULAR_HOURS, "timezone": "Nowhere/Special"}
+        assert open_intervals(hours, date(2026, 3, 2), 1) == open_intervals(REGULAR_HOURS, date(2026, 3, 2), 1)
+
+
+class TestIsOpenAt:
+    def test_uses_poi_timezone(self):
+        # 14:30 UTC is 09:30 EST (open) but 06:30 in Los Angeles (closed).
+        at = _utc(2026, 3, 2, 14, 30)
+        assert is_open_at(REGULAR_HOURS, at) is True
+        assert is_open_at({**REGULAR_HOURS, "timezone": "America/Los_Angeles"}, at) is False
+
+    def test_close_is_exclusive(self):
+        assert is_open_at(REGULAR_HOURS, _utc(2026, 3, 2, 21, 59)) is True
+        assert is_open_at(REGULAR_HOURS, _utc(2026, 3, 2, 22, 0)) is False
+
+    def test_agrees_with_intervals(self):
+        hours = _every_day({"status": "open", "periods": [_fixed("18:00", "02:00")]})
+        intervals = open_intervals(hours, date(2026, 3, 1), 3)
+        at = _utc(2026, 3, 2)
+        while at < _utc(2026, 3, 3):
+            expected = any(opens <= at < closes for opens, closes in intervals)
+            assert is_open_at(hours, at) is expected, at
+            at += timedelta(minutes=30)
+
+    def test_batch(self):
+        at = _utc(2026, 3, 2, 15)
+        result = open_now_batch({"a": REGULAR_HOURS, "b": None}, at)
+        assert result == {"a": True, "b": False}
+
+
+class TestEffectiveHoursBatchEndpoint:
+    def test_date_batch(self, db_session, app_client):
+        open_biz = orm_create_business(db_session, name="Batch Open Biz", published=True, hours=REGULAR_HOURS)
+        closed_biz = orm_create_business(
+            db_session, name="Batch Exception Biz", published=True,
+            hours={**REGULAR_HOURS, "exceptions": [{"date": "2026-03-02", "status": "closed"}]},
+        )
+        draft = orm_create_business(db_session, name="Batch Draft Biz", published=False, hours=REGULAR_HOURS)
+        db_session.commit()
+
+        resp = app_client.get(
+            "/api/pois/effective-hours",
+            params={"ids": [str(open_biz.id), str(closed_biz.id), str(draft.id)], "date": "2026-03-02"},
+        )
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert set(data) == {str(open_biz.id), str(closed_biz.id)}
+        assert data[str(open_biz.id)]["source"] == "regular"
+        assert data[str(closed_biz.id)]["source"] == "exception"
+
+    def test_at_adds_is_open(self, db_session, app_client):
+        biz = orm_create_business(db_session, name="Batch Now Biz", published=True, hours=REGULAR_HOURS)
+        db_session.commit()
+
+        resp = app_client.get(
+            "/api/pois/effective-hours",
+            params={"ids": [str(biz.id)], "at": "2026-03-02T14:30:00Z"},
+        )
+        assert resp.status_code == 200, resp.text
+        entry = resp.json()[str(biz.id)]
+        assert entry["is_open"] is True
+        assert entry["source"] == "regular"
+
+    def test_too_many_ids_rejected(self, app_client):
+        import uuid
+
+        ids = [str(uuid.uuid4()) for _ in range(201)]
+        resp = app_client.get("/api/pois/effective-hours", params={"ids": ids})
+        assert resp.status_code == 400
+
+
+class TestOpenNowListing:
+    def _cover(self, db, poi, now, **overrides):
+        from app.models.poi_open_interval import PoiOpenHoursCoverage
+
+        db.refresh(poi)
+        db.add(PoiOpenHoursCoverage(**{
+            "poi_id": poi.id,
+            "poi_last_updated": poi.last_updated,
+            "covered_from": now - timedelta(hours=12),
+            "covered_until": now + timedelta(days=7),
+            **overrides,
+        }))
+
+    def test_open_now_filters_by_intervals(self, db_session, app_client):
+        from app.models.poi_open_interval import PoiOpenInterval
+
+        now = datetime.now(timezone.utc)
+        open_biz = orm_create_business(db_session, name="Listing Open Biz", published=True)
+        closed_biz = orm_create_business(db_session, name="Listing Closed Biz", published=True)
+        db_session.flush()
+        db_session.add(PoiOpenInterval(
+            poi_id=open_biz.id, opens_at=now - timedelta(hours=1), closes_at=now + timedelta(hours=1),
+        ))
+        db_session.add(PoiOpenInterval(
+            poi_id=closed_biz.id, opens_at=now + timedelta(hours=2), closes_at=now + timedelta(hours=3),
+        ))
+        self._cover(db_session, open_biz, now)
+        self._cover(db_session, closed_biz, now)
+        db_session.commit()
+
+        resp = app_client.get("/api/pois/by-type/BUSINESS?open_now=true")
+        assert resp.status_code == 200, resp.text
+        names = {p["name"] for p in resp.json()}
+        assert "Listing Open Biz" in names
+        assert "Listing Closed Biz" not in names
+
+        everything = {p["name"] for p in app_client.get("/api/pois/by-type/BUSINESS").json()}
+        assert {"Listing Open Biz", "Listing Closed Biz"} <= everything
+
+    def test_stale_or_missing_intervals_fall_back_to_hours(self, db_session, app_client):
+        from app.models.poi_open_interval import PoiOpenInterval
+
+        now = datetime.now(timezone.utc)
+        always = _every_day({"status": "24hours"})
+        never = _every_day({"status": "closed"})
+        unindexed = orm_create_business(db_session, name="Unindexed Biz", published=True, hours=always)
+        edited = orm_create_business(db_session, name="Edited Biz", published=True, hours=never)
+        expired = orm_create_business(db_session, name="Expired Biz", published=True, hours=never)
+        db_session.flush()
+        for poi in (edited, expired):
+            db_session.add(PoiOpenInterval(
+                poi_id=poi.id, opens_at=now - timedelta(hours=1), closes_at=now + timedelta(hours=1),
+            ))
+        # Resolved before the last edit, and past the end of its horizon.
+        self._cover(db_session, edited, now, poi_last_updated=now - timedelta(days=30))
+        self._cover(db_session, expired, now, covered_until=now - timedelta(minutes=1))
+        db_session.commit()
+
+        for url in ("/api/pois/by-type/BUSINESS?open_now=true",
+                    "/api/pois/by-type/BUSINESS?open_now=true&limit=50"):
+            names = {p["name"] for p in app_client.get(url).json()}
+            assert "Unindexed Biz" in names
+            assert "Edited Biz" not in names
+            assert "Expired Biz" not in names
+
+    def test_rebuild_stamps_coverage(self, db_session, app_client):
+        crud_open_hours = sys.modules["app.api.endpoints.pois"].crud.crud_open_hours
+        biz = orm_create_business(
+            db_session, name="Rebuilt Biz", published=True, hours=_every_day({"status": "24hours"}),
+        )
+        db_session.commit()
+        crud_open_hours.rebuild_for_poi(db_session, biz.id)
+        db_session.commit()
+
+        names = {p["name"] for p in app_client.get("/api/pois/by-type/BUSINESS?open_now=true").json()}
+        assert "Rebuilt Biz" in names
@@ -7,11 +7,16 @@ counted.  Routes are exercised via the nearby-app TestClient (app_client).
 """
 
 import pytest
+from sqlalchemy import text
+
 from conftest import (
     orm_create_business,
     orm_create_park,
     orm_create_trail,
     orm_create_event,
+    orm_create_category,
+    orm_assign_main_category,
+    poi_category_association,
 )
 
 
@@ -147,3 +152,94 @@ class TestPoiCountsByAmenity:
         data = resp.json()
 
         assert data["by_amenity"]["pet_friendly"] == 3
+
+
+class TestPoiCountsBreakdown:
+    def test_breakdown_by_city_in_same_response(self, db_session, app_client):
+        """?breakdown=city adds per-city counts next to the unchanged totals."""
+        orm_create_business(db_session, name="Pitt Biz", published=True,
+                            address_city="Pittsboro", icon_pet_friendly=True)
+        orm_create_park(db_session, name="Pitt Park", published=True,
+                        address_city="Pittsboro")
+        orm_create_business(db_session, name="Siler Biz", published=True,
+                            address_city="Siler City")
+        orm_create_business(db_session, name="Siler Draft", published=False,
+                            address_city="Siler City")
+        db_session.commit()
+
+        resp = app_client.get("/api/pois/counts", params={"breakdown": "city"})
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+
+        assert data["by_type"]["BUSINESS"] == 2
+        assert data["by_city"]["Pittsboro"]["by_type"]["BUSINESS"] == 1
+        assert data["by_city"]["Pittsboro"]["by_type"]["PARK"] == 1
+        assert data["by_city"]["Pittsboro"]["by_amenity"]["pet_friendly"] == 1
+        assert data["by_city"]["Siler City"]["by_type"]["BUSINESS"] == 1
+
+    def test_breakdown_by_category_counts_each_poi_once_in_totals(self, db_session, app_client):
+        food = orm_create_category(db_session, name="Food")
+        coffee = orm_create_category(db_session, name="Coffee")
+        poi = orm_create_business(db_session, name="Cafe", published=True)
+        orm_assign_main_category(db_session, poi.id, food.id)
+        db_session.execute(
+            poi_category_association.insert().values(
+                poi_id=poi.id, category_id=coffee.id, is_main=False
+            )
+        )
+        db_session.commit()
+
+        data = app_client.get("/api/pois/counts", params={"breakdown": "category"}).json()
+        assert data["by_type"]["BUSINESS"] == 1
+        assert data["by_category"][food.slug]["by_type"]["BUSINESS"] == 1
+        assert data["by_category"][coffee.slug]["by_type"]["BUSINESS"] == 1
+
+    def test_invalid_breakdown_rejected(self, db_session, app_client):
+        resp = app_client.get("/api/pois/counts", params={"breakdown": "zipcode"})
+        assert resp.status_code == 400
+
+
+class TestPoiCountsCaching:
+    def test_etag_revalidation_and_invalidation(self, db_session, app_client):
+        """Counts are served with a version ETag and refresh after a write."""
+        first = app_client.get("/api/pois/counts")
+        etag = first.headers["ETag"]
+        assert app_client.get(
+            "/api/pois/counts", headers={"If-None-Match": etag}
+        ).status_code == 304
+
+        orm_create_business(db_session, name="New Biz", published=True)
+        db_session.commit()
+
+        resp = app_client.get("/api/pois/counts", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["by_type"]["BUSINESS"] == first.json()["by_type"]["BUSINESS"] + 1
+
+    def test_embedding_only_update_keeps_etag(self, db_session, app_client):
+        """Re-embedding a POI does not invalidate the cached counts."""
+        poi = orm_create_business(db_session, name="Embedded Biz", published=True)
+        db_session.commit()
+        etag = app_client.get("/api/pois/counts").headers["ETag"]
+
+        db_session.execute(
+            text(
+                "UPDATE points_of_interest "
+                "SET embedding = CAST(:embedding AS vector), "
+                "embedding_hash = 'h', embedding_model = 'model-a' "
+                "WHERE id = :id"
+            ),
+            {"embedding": "[" + ",".join(["0.1"] * 768) + "]", "id": str(poi.id)},
+        )
+        db_session.commit()
+        assert app_client.get(
+            "/api/pois/counts", headers={"If-None-Match": etag}
+        ).status_code == 304
+
+        db_session.execute(
+            text("UPDATE points_of_interest SET name = 'Renamed Biz' WHERE id = :id"),
+            {"id": str(poi.id)},
+        )
+        db_session.commit()
+        assert app_client.get(
+            "/api/pois/counts", headers={"If-None-Match": etag}
+        ).status_code == 200
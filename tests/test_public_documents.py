@@ -0,0 +1,216 @@
+"""Stored public POI documents (public_poi_documents + its rebuild outbox).
+
+Triggers queue a rebuild on every relevant write; the nearby-app worker
+serializes the POI with the endpoint code; the detail and nearby endpoints
+serve the stored bytes only while they are still current.
+"""
+
+import json
+import sys
+
+from sqlalchemy import text
+from conftest import (
+    orm_create_business,
+    orm_create_category,
+    orm_assign_main_category,
+)
+
+
+def _outbox_ids(db):
+    return {row[0] for row in db.execute(text("SELECT poi_id FROM public_document_outbox"))}
+
+
+def _rebuild(db):
+    from app.services.public_document_worker import process_batch
+
+    while process_batch(db):
+        pass
+
+
+def _tamper(db, poi_id, column, payload):
+    db.execute(
+        text(f"UPDATE public_poi_documents SET {column} = :body WHERE poi_id = :poi_id"),
+        {"body": json.dumps(payload).encode(), "poi_id": poi_id},
+    )
+    db.commit()
+
+
+class TestRebuildQueue:
+    def test_poi_and_child_writes_enqueue(self, db_session):
+        poi = orm_create_business(db_session, name="Queued Cafe", published=True)
+        db_session.commit()
+        assert _outbox_ids(db_session) == {poi.id}
+
+        db_session.execute(text("DELETE FROM public_document_outbox"))
+        db_session.execute(
+            text("UPDATE businesses SET price_range = '$$$' WHERE poi_id = :poi_id"),
+            {"poi_id": poi.id},
+        )
+        db_session.commit()
+        assert _outbox_ids(db_session) == {poi.id}
+
+    def test_category_rename_enqueues_its_pois(self, db_session):
+        poi = orm_create_business(db_session, name="Category Cafe", published=True)
+        other = orm_create_business(db_session, name="Uncategorized Cafe", published=True)
+        cat = orm_create_category(db_session, name="Coffee")
+        orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+        db_session.execute(text("DELETE FROM public_document_outbox"))
+        db_session.commit()
+
+        db_session.execute(
+            text("UPDATE categories SET name = 'Coffee Shops' WHERE id = :id"), {"id": cat.id}
+        )
+        db_session.commit()
+        assert _outbox_ids(db_session) == {poi.id}
+        assert other.id not in _outbox_ids(db_session)
+
+    def test_embedding_writes_do_not_enqueue(self, db_session):
+        poi = orm_create_business(db_session, name="Embedded Cafe", published=True)
+        db_session.commit()
+        db_session.execute(text("DELETE FROM public_document_outbox"))
+        db_session.execute(
+            text("UPDATE points_of_interest SET embedding_hash = 'abc' WHERE id = :id"),
+            {"id": poi.id},
+        )
+        db_session.commit()
+        assert _outbox_ids(db_session) == set()
+
+
+class TestStoredDetail:
+    def test_worker_stores_the_live_detail_bytes(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Stored Cafe", published=True)
+        db_session.commit()
+        poi_id = poi.id
+
+        live = app_client.get(f"/api/pois/{poi_id}")
+        assert live.status_code == 200
+        _rebuild(db_session)
+
+        row = db_session.execute(
+            text("SELECT etag, detail_json FROM public_poi_documents WHERE poi_id = :id"),
+            {"id": poi_id},
+        ).one()
+        assert row.etag == live.headers["etag"]
+        assert bytes(row.detail_json) == live.content
+        assert _outbox_ids(db_session) == set()
+
+    def test_current_document_is_served(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Served Cafe", published=True)
+        db_session.commit()
+        poi_id = poi.id
+        _rebuild(db_session)
+        _tamper(db_session, poi_id, "detail_json", {"name": "From the store"})
+
+        resp = app_client.get(f"/api/pois/{poi_id}")
+        assert resp.status_code == 200
+        assert resp.json() == {"name": "From the store"}
+
+    def test_stale_document_falls_back_to_live(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Stale Cafe", published=True)
+        db_session.commit()
+        poi_id = poi.id
+        _rebuild(db_session)
+
+        db_session.execute(
+            text("UPDATE points_of_interest SET name = 'Fresh Cafe', last_updated = clock_timestamp() "
+                 "WHERE id = :id"),
+            {"id": poi_id},
+        )
+        db_session.commit()
+
+        resp = app_client.get(f"/api/pois/{poi_id}")
+        assert resp.status_code == 200
+        assert resp.json()["name"] == "Fresh Cafe"
+        assert _outbox_ids(db_session) == {poi_id}
+
+    def test_format_version_bump_retires_stored_documents(self, db_session, app_client, monkeypatch):
+        pois = sys.modules["app.api.endpoints.pois"]
+        poi = orm_create_business(db_session, name="Versioned Cafe", published=True)
+        db_session.commit()
+        poi_id = poi.id
+        _rebuild(db_session)
+        _tamper(db_session, poi_id, "detail_json", {"name": "Old format"})
+
+        serializer_mode, version, registry = pois._DETAIL_ETAG_SALT
+        monkeypatch.setattr(pois, "_DETAIL_ETAG_SALT", (serializer_mode, version + 1, registry))
+
+        resp = app_client.get(f"/api/pois/{poi_id}")
+        assert resp.status_code == 200
+        assert resp.json()["name"] == "Versioned Cafe"
+
+    def test_unpublished_document_is_removed(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Withdrawn Cafe", published=True)
+        db_session.commit()
+        poi_id = poi.id
+        _rebuild(db_session)
+
+        db_session.execute(
+            text("UPDATE points_of_interest SET publication_status = 'draft' WHERE id = :id"),
+            {"id": poi_id},
+        )
+        db_session.commit()
+        _rebuild(db_session)
+
+        count = db_session.execute(text("SELECT count(*) FROM public_poi_documents")).scalar()
+        assert count == 0
+        assert app_client.get(f"/api/pois/{poi_id}").status_code == 404
+
+    def test_by_slug_matches_by_id_and_stored_body(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Slug Cafe", published=True, slug="slug-cafe")
+        cat = orm_create_category(db_session, name="Bakeries")
+        orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+        poi_id = poi.id
+
+        by_slug = app_client.get("/api/pois/by-slug/slug-cafe")
+        by_id = app_client.get(f"/api/pois/{poi_id}")
+        assert by_slug.headers["etag"] == by_id.headers["etag"]
+        assert by_slug.content == by_id.content
+        assert by_slug.json()["main_category"]["name"] == "Bakeries"
+
+        _rebuild(db_session)
+        assert app_client.get("/api/pois/by-slug/slug-cafe").content == by_slug.content
+
+
+class TestStoredCards:
+    def test_nearby_serves_current_cards(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Card Cafe", published=True)
+        db_session.commit()
+        poi_id = poi.id
+        params = {"latitude": 35.8, "longitude": -79.0}
+
+        live = app_client.get("/api/nearby", params=params).json()
+        _rebuild(db_session)
+        assert app_client.get("/api/nearby", params=params).json() == live
+
+        _tamper(db_session, poi_id, "card_json", {"id": str(poi_id), "name": "From the store"})
+        stored = app_client.get("/api/nearby", params=params).json()
+        assert stored[0]["name"] == "From the store"
+        assert stored[0]["distance_meters"] == live[0]["distance_meters"]
+
+        # A newer POI row invalidates the card until the worker rebuilds it.
+        db_session.execute(
+            text("UPDATE points_of_interest SET last_updated = clock_timestamp() WHERE id = :id"),
+            {"id": poi_id},
+        )
+        db_session.commit()
+        assert app_client.get("/api/nearby", params=params).json()[0]["name"] == "Card Cafe"
+
+    def test_category_rename_invalidates_card(self, db_session, app_client):
+        poi = orm_create_business(db_session, name="Renamed Card Cafe", published=True)
+        cat = orm_create_category(db_session, name="Tea Rooms")
+        orm_assign_main_category(db_session, poi.id, cat.id)
+        db_session.commit()
+        poi_id = poi.id
+        params = {"latitude": 35.8, "longitude": -79.0}
+        _rebuild(db_session)
+        _tamper(db_session, poi_id, "card_json", {"id": str(poi_id), "name": "From the store"})
+        assert app_client.get("/api/nearby", params=params).json()[0]["name"] == "From the store"
+
+        # points_of_interest.last_updated does not move on a category rename.
+        db_session.execute(
+            text("UPDATE categories SET name = 'Tea Houses' WHERE id = :id"), {"id": cat.id}
+        )
+        db_session.commit()
+        assert app_client.get("/api/nearby", params=params).json()[0]["name"] == "Renamed Card Cafe"
@@ -193,3 +193,126 @@ class TestExpandRecurringDates:
         )
         for i in range(len(results) - 1):
             assert results[i] <= results[i + 1]
+
+
+def _reference_expand(start, pattern, date_from, date_to, excluded=(), manual=(), end=None):
+    """The original expansion: walk the rrule from dtstart, filter to the window."""
+    from dateutil.parser import isoparse
+    from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY, MO, TU, WE, TH, FR, SA, SU
+
+    freq = {"daily": DAILY, "weekly": WEEKLY, "monthly": MONTHLY, "yearly": YEARLY}[pattern["frequency"]]
+    effective_end = min(date_to, start + timedelta(days=60 * 30), *( [end] if end else []))
+    kwargs = {"freq": freq, "dtstart": start, "interval": pattern.get("interval", 1), "until": effective_end}
+    days = {"MO": MO, "TU": TU, "WE": WE, "TH": TH, "FR": FR, "SA": SA, "SU": SU}
+    if pattern.get("days") and freq == WEEKLY:
+        kwargs["byweekday"] = [days[d] for d in pattern["days"]]
+    found = {dt for dt in rrule(**kwargs) if date_from <= dt <= date_to}
+    found = {dt for dt in found if dt.strftime("%Y-%m-%d") not in excluded}
+    for m in manual:
+        manual_dt = isoparse(m)
+        if date_from <= manual_dt <= date_to:
+            found.add(manual_dt)
+    return sorted(found)
+
+
+class TestWindowAnchoredExpansion:
+    """Windows far into a series start from the window, with identical results."""
+
+    PATTERNS = [
+        {"frequency": "daily", "interval": 1},
+        {"frequency": "daily", "interval": 3},
+        {"frequency": "weekly", "interval": 1},
+        {"frequency": "weekly", "interval": 2, "days": ["TU", "SA"]},
+        {"frequency": "monthly", "interval": 1},
+        {"frequency": "monthly", "interval": 5},
+        {"frequency": "yearly", "interval": 1},
+        {"frequency": "yearly", "interval": 2},
+    ]
+    STARTS = [
+        datetime(2024, 1, 31, 18, 30, tzinfo=timezone.utc),  # month-end day
+        datetime(2024, 2, 29, 9, 0, tzinfo=timezone.utc),  # leap day
+        datetime(2025, 6, 1, 0, 0, tzinfo=timezone.utc),  # midnight on the 1st
+    ]
+
+    def test_matches_reference_across_windows(self):
+        import random
+        from shared.utils.recurring_events import expand_recurring_dates
+
+        rng = random.Random(50)
+        for start in self.STARTS:
+            for pattern in self.PATTERNS:
+                for _ in range(25):
+                    date_from = start + timedelta(days=rng.randint(-40, 1900), hours=rng.randint(0, 23))
+                    date_to = date_from + timedelta(days=rng.choice([0, 1, 6, 30, 400]))
+                    assert expand_recurring_dates(
+                        start_datetime=start, repeat_pattern=pattern,
+                        date_from=date_from, date_to=date_to,
+                    ) == _reference_expand(start, pattern, date_from, date_to), (start, pattern, date_from)
+
+    def test_exclusions_manual_and_end_far_into_series(self):
+        from shared.utils.recurring_events import expand_recurring_dates
+
+        start = datetime(2022, 1, 3, 19, 0, tzinfo=timezone.utc)
+        pattern = {"frequency": "weekly", "days": ["MO", "TH"]}
+        kwargs = dict(
+            excluded=("2026-03-05",),
+            manual=("2026-03-07T10:00:00+00:00",),
+            end=datetime(2026, 3, 12, tzinfo=timezone.utc),
+        )
+        date_from = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        date_to = datetime(2026, 3, 31, 23, 59, 59, tzinfo=timezone.utc)
+        result = expand_recurring_dates(
+            start_datetime=start, repeat_pattern=pattern, date_from=date_from, date_to=date_to,
+            excluded_dates=list(kwargs["excluded"]), manual_dates=list(kwargs["manual"]),
+            recurrence_end_date=kwargs["end"],
+        )
+        assert result == _reference_expand(start, pattern, date_from, date_to, **kwargs)
+        assert [dt.strftime("%m-%d") for dt in result] == ["03-02", "03-07", "03-09"]
+
+    def test_zero_interval_does_not_hang(self):
+        from shared.utils.recurring_events import expand_recurring_dates
+
+        start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        result = expand_recurring_dates(
+            start_datetime=start, repeat_pattern={"frequency": "daily", "interval": 0},
+            date_from=start, date_to=start + timedelta(days=2),
+        )
+        assert len(result) == 3
+
+
+class TestCompiledRecurrenceBatch:
+    """compile_recurrence() parses once; expand_recurring_batch() expands many."""
+
+    def test_compiled_reuse_matches_single_calls(self):
+        from shared.utils.recurring_events import compile_recurrence, expand_recurring_dates
+
+        start = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+        pattern = {"frequency": "weekly"}
+        excluded = ["2026-02-02"]
+        compiled = compile_recurrence(start, pattern, excluded_dates=excluded)
+        for month in range(1, 13):
+            date_from = datetime(2026, month, 1, tzinfo=timezone.utc)
+            date_to = date_from + timedelta(days=27)
+            assert compiled.between(date_from, date_to) == expand_recurring_dates(
+                start_datetime=start, repeat_pattern=pattern,
+                date_from=date_from, date_to=date_to, excluded_dates=excluded,
+            )
+
+    def test_batch_omits_events_without_occurrences(self):
+        from shared.utils.recurring_events import compile_recurrence, expand_recurring_batch
+
+        date_from = datetime(2026, 4, 1, tzinfo=timezone.utc)
+        date_to = datetime(2026, 4, 7, 23, 59, 59, tzinfo=timezone.utc)
+        result = expand_recurring_batch({
+            "daily": compile_recurrence(
+                datetime(2026, 1, 1, 8, 0, tzinfo=timezone.utc), {"frequency": "daily"}
+            ),
+            "one-off": compile_recurrence(datetime(2026, 4, 3, 20, 0, tzinfo=timezone.utc), None),
+            "ended": compile_recurrence(
+                datetime(2025, 1, 1, 8, 0, tzinfo=timezone.utc), {"frequency": "weekly"},
+                recurrence_end_date=datetime(2025, 12, 31, tzinfo=timezone.utc),
+            ),
+        }, date_from, date_to)
+        assert set(result) == {"daily", "one-off"}
+        assert len(result["daily"]) == 7
+        assert result["one-off"] == [datetime(2026, 4, 3, 20, 0, tzinfo=timezone.utc)]
@@ -0,0 +1,103 @@
+"""Compiled field plans produce exactly the per-request registry dispatch output.
+
+``serialize_poi_detail`` / ``serialize_poi_card`` / ``structural_registry_keys_for``
+run precompiled ``(poi_type, tier)`` plans. For every registry type and both
+tiers, compare them against the original loop over ``public_fields_for`` +
+``_read_source`` on an in-memory POI whose every sourced attribute is set. No
+database is needed.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+_MONOREPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_APP_BACKEND = os.path.join(_MONOREPO_ROOT, "nearby-app", "backend")
+if _APP_BACKEND not in sys.path:
+    sys.path.insert(0, _APP_BACKEND)
+
+from shared.constants.poi_registry import all_entries, public_fields_for  # noqa: E402
+
+POI_TYPES = sorted({t for entry in all_entries() for t in entry.get("applies_to", [])})
+SUBTYPES = ("business", "park", "trail", "event")
+
+
+def _serializer():
+    # Lazy for the same sys.modules reason as test_serializer_parity.
+    from app.serialization import poi_serializer
+    return poi_serializer
+
+
+def _poi(poi_type, paid):
+    poi = SimpleNamespace(id="00000000-0000-0000-0000-000000000001", location=None)
+    subtypes = {name: SimpleNamespace() for name in SUBTYPES}
+    for entry in public_fields_for(poi_type):
+        head, _, col = (entry.get("source") or "").partition(".")
+        target = subtypes.get(head, poi)
+        setattr(target, col if col and head != "computed" else entry["key"], f"v:{entry['key']}")
+    for name, sub in subtypes.items():
+        setattr(poi, name, sub)
+    poi.poi_type = poi_type
+    poi.listing_type = "paid" if paid else "free"
+    poi.is_sponsor = paid
+    return poi
+
+
+IMAGES = [
+    {"id": "a", "type": "main", "url": "https://example.test/a.webp"},
+    {"id": "b", "type": "gallery", "url": "https://example.test/b.webp"},
+]
+
+
+@pytest.mark.parametrize("poi_type", POI_TYPES)
+@pytest.mark.parametrize("paid", [False, True])
+def test_detail_plan_matches_registry_dispatch(poi_type, paid):
+    ser = _serializer()
+    poi = _poi(poi_type, paid)
+
+    expected = {}
+    for entry in public_fields_for(poi_type):
+        if entry.get("tier") == "paid" and not paid:
+            continue
+        if entry["key"] not in ("location", "id"):
+            expected[entry["key"]] = ser._read_source(None, poi, entry, IMAGES)
+    expected["id"] = poi.id
+    expected["location"] = None
+
+    result = ser.serialize_poi_detail(None, poi, images=IMAGES)
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+@pytest.mark.parametrize("poi_type", POI_TYPES)
+def test_card_plan_matches_registry_dispatch(poi_type):
+    ser = _serializer()
+    poi = _poi(poi_type, paid=True)
+
+    expected = {
+        entry["key"]: ser._read_source(None, poi, entry, [])
+        for entry in public_fields_for(poi_type)
+        if entry.get("card")
+        and entry["key"] in ser._CARD_SCHEMA_KEYS
+        and entry["key"] not in ("id", "location")
+        and not (entry.get("source") or "").startswith("images:")
+    }
+    result = ser.serialize_poi_card(poi)
+    for key in ("id", "location", "featured_image"):
+        result.pop(key)
+    expected.pop("featured_image", None)
+    assert result == expected
+
+
+@pytest.mark.parametrize("poi_type", POI_TYPES)
+def test_structural_keys_match_registry(poi_type):
+    ser = _serializer()
+    expected = {
+        entry["key"]
+        for entry in public_fields_for(poi_type)
+        if (entry.get("source") or "").startswith("images:")
+        or (entry.get("source") or "").split(".", 1)[0] in SUBTYPES
+    }
+    assert ser.structural_registry_keys_for(poi_type) == expected
@@ -0,0 +1,79 @@
+"""Sampled, off-request shadow serializer diffing (``ShadowComparator``).
+
+No database: the comparison callable is a stand-in, so these cover sampling,
+the bounded queue and the per-key aggregation only.
+"""
+
+import os
+import sys
+import threading
+
+_MONOREPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_APP_BACKEND = os.path.join(_MONOREPO_ROOT, "nearby-app", "backend")
+if _APP_BACKEND not in sys.path:
+    sys.path.insert(0, _APP_BACKEND)
+
+
+def _shadow():
+    # Lazy for the same sys.modules reason as test_serializer_parity.
+    from app.serialization import shadow
+    return shadow
+
+
+def _diff(added=(), removed=(), mismatched=()):
+    return {
+        "keys_added": list(added),
+        "keys_removed": list(removed),
+        "value_mismatches": [{"key": k, "legacy": 1, "registry": 2} for k in mismatched],
+    }
+
+
+def test_sample_rate_zero_never_compares():
+    calls = []
+    comparator = _shadow().ShadowComparator(calls.append, sample_rate=0)
+    assert comparator.submit("poi-1") is None
+    assert calls == []
+
+
+def test_diffs_are_aggregated_per_key():
+    shadow = _shadow()
+    diffs = iter([_diff(added=["a"], mismatched=["name"]), _diff(added=["a"]), _diff()])
+    comparator = shadow.ShadowComparator(lambda poi_id: next(diffs), sample_rate=1.0)
+    for poi_id in ("p1", "p2", "p3"):
+        comparator.submit(poi_id).result(timeout=5)
+
+    snap = comparator.stats.snapshot()
+    assert snap["compared"] == 3
+    assert snap["mismatched"] == 2
+    assert snap["keys_added"] == {"a": 2}
+    assert snap["value_mismatches"] == {"name": 1}
+    assert snap["keys_removed"] == {}
+
+
+def test_full_queue_drops_instead_of_blocking():
+    shadow = _shadow()
+    release = threading.Event()
+
+    def slow_compare(poi_id):
+        release.wait(timeout=5)
+        return _diff()
+
+    comparator = shadow.ShadowComparator(slow_compare, sample_rate=1.0, max_pending=1)
+    first = comparator.submit("p1")
+    assert comparator.submit("p2") is None
+    assert comparator.stats.snapshot()["dropped"] == 1
+
+    release.set()
+    first.result(timeout=5)
+    assert comparator.submit("p3").result(timeout=5) is None
+    assert comparator.stats.snapshot()["compared"] == 2
+
+
+def test_compare_errors_are_counted_not_raised():
+    def broken(poi_id):
+        raise RuntimeError("boom")
+
+    comparator = _shadow().ShadowComparator(broken, sample_rate=1.0, max_pending=1)
+    comparator.submit("p1").result(timeout=5)
+    comparator.submit("p2").result(timeout=5)
+    assert comparator.stats.snapshot()["failed"] == 2
@@ -0,0 +1,188 @@
+"""
+Request coalescing for identical concurrent reads (shared/utils/single_flight.py).
+
+Callers of one key that overlap a computation in flight share its result (or
+its exception); waiting is bounded by the timeout; nothing is cached once
+the flight lands. DataVersionCache coalesces concurrent misses the same way,
+and the POI detail routes coalesce per route.
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from conftest import orm_create_business
+from shared.utils.data_version import DataVersionCache
+from shared.utils.single_flight import SingleFlight
+
+
+def _run_concurrently(flights, key, leader_compute, follower_compute, followers=8):
+    """Start a leader blocked in ``leader_compute``, then ``followers`` callers."""
+    results, errors = [], []
+
+    def call(compute):
+        try:
+            results.append(flights.do(key, compute))
+        except Exception as exc:  # noqa: BLE001 — collected for the assertions
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call, args=(leader_compute,))]
+    threads[0].start()
+    while flights.in_flight() == 0:
+        time.sleep(0.001)
+    for _ in range(followers):
+        threads.append(threading.Thread(target=call, args=(follower_compute,)))
+        threads[-1].start()
+    return threads, results, errors
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_computation(self):
+        flights = SingleFlight(timeout=10)
+        release = threading.Event()
+        calls = []
+
+        def leader():
+            calls.append("leader")
+            release.wait(10)
+            return {"slug": "viral-park"}
+
+        def follower():
+            calls.append("follower")
+            return {"slug": "follower"}
+
+        threads, results, errors = _run_concurrently(flights, "viral-park", leader, follower)
+        time.sleep(0.2)  # let the followers reach their wait
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+        assert calls == ["leader"]
+        assert not errors
+        assert len(results) == 9
+        assert all(result is results[0] for result in results)
+        assert flights.in_flight() == 0
+
+    def test_leader_error_reaches_followers(self):
+        flights = SingleFlight(timeout=10)
+        release = threading.Event()
+
+        def leader():
+            release.wait(10)
+            raise RuntimeError("database unavailable")
+
+        threads, results, errors = _run_concurrently(
+            flights, "categories", leader, lambda: "unused", followers=3,
+        )
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+        assert results == []
+        assert len(errors) == 4
+        assert all(str(error) == "database unavailable" for error in errors)
+
+    def test_wait_is_bounded(self):
+        flights = SingleFlight(timeout=0.05)
+        release = threading.Event()
+
+        def stuck():
+            release.wait(10)
+            return "late"
+
+        threads, results, errors = _run_concurrently(
+            flights, "slow", stuck, lambda: "own", followers=2,
+        )
+        for thread in threads[1:]:
+            thread.join(10)
+        assert results == ["own", "own"]
+
+        release.set()
+        threads[0].join(10)
+        assert results[-1] == "late"
+        assert not errors
+
+    def test_nothing_cached_after_landing(self):
+        flights = SingleFlight()
+        assert flights.do("key", lambda: 1) == 1
+        assert flights.do("key", lambda: 2) == 2
+        with pytest.raises(ValueError):
+            flights.do("key", lambda: int("x"))
+        assert flights.do("key", lambda: 3) == 3
+        assert flights.in_flight() == 0
+
+
+class TestDataVersionCacheCoalescing:
+    def test_concurrent_misses_compute_once(self):
+        cache = DataVersionCache(wait_timeout=10)
+        started, release = threading.Event(), threading.Event()
+        computed = []
+
+        def compute():
+            computed.append(1)
+            started.set()
+            release.wait(10)
+            return b"[]"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get(7, "categories", compute)))
+            for _ in range(6)
+        ]
+        threads[0].start()
+        started.wait(10)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+        assert computed == [1]
+        assert results == [b"[]"] * 6
+        assert cache.get(7, "categories", lambda: b"unused") == b"[]"
+
+
+class TestDetailRouteCoalescing:
+    def test_by_id_and_by_slug_do_not_share_bodies(self, db_session, app_client, monkeypatch):
+        pois = sys.modules["app.api.endpoints.pois"]
+        poi = orm_create_business(db_session, name="Flight Cafe", published=True, slug="flight-cafe")
+        db_session.commit()
+        poi_id = poi.id
+
+        real_payload = pois._detail_payload
+        entered, release = threading.Event(), threading.Event()
+        builds = []
+
+        def payload(db, pid, etag, load_poi):
+            builds.append(load_poi)
+            if len(builds) == 1:  # hold the by-id build in flight
+                entered.set()
+                release.wait(10)
+            return real_payload(db, pid, etag, load_poi)
+
+        monkeypatch.setattr(pois, "_detail_payload", payload)
+        # Long enough that joining the by-id flight would block by-slug below.
+        monkeypatch.setattr(pois, "_read_flights", SingleFlight(timeout=30))
+        responses = {}
+        by_id = threading.Thread(
+            target=lambda: responses.update(by_id=app_client.get(f"/api/pois/{poi_id}"))
+        )
+        by_slug = threading.Thread(
+            target=lambda: responses.update(by_slug=app_client.get("/api/pois/by-slug/flight-cafe"))
+        )
+        by_id.start()
+        assert entered.wait(10)
+        by_slug.start()
+        by_slug.join(10)
+        assert not by_slug.is_alive(), "by-slug waited on the by-id body build"
+        release.set()
+        by_id.join(10)
+
+        assert len(builds) == 2
+        assert responses["by_id"].status_code == responses["by_slug"].status_code == 200
+        assert responses["by_id"].headers["etag"] == responses["by_slug"].headers["etag"]
+        assert responses["by_id"].content == responses["by_slug"].content
@@ -0,0 +1,108 @@
+"""
+Streamed, numbered and conditionally cached POI sitemaps.
+
+GET /sitemap.xml lists one file per section, numbered past SITEMAP_MAX_URLS;
+section files carry ETag / Last-Modified from the section's newest
+last_updated and answer revalidation with 304.
+"""
+
+import sys
+from datetime import datetime, timezone
+
+from conftest import orm_create_business, orm_create_event, orm_create_park
+
+
+class TestSectionSitemaps:
+    def test_places_sitemap_lists_published_with_lastmod(self, db_session, app_client):
+        orm_create_business(db_session, name="Sitemap Cafe", published=True, slug="sitemap-cafe")
+        orm_create_business(db_session, name="Draft Cafe", published=False, slug="draft-cafe")
+        db_session.commit()
+
+        resp = app_client.get("/sitemap-places.xml")
+        assert resp.status_code == 200
+        assert "application/xml" in resp.headers["content-type"]
+        body = resp.text
+        assert body.startswith('<?xml version="1.0" encoding="UTF-8"?>')
+        assert body.endswith("</urlset>")
+        assert "https://nearbynearby.com/places/sitemap-cafe" in body
+        assert "draft-cafe" not in body
+        assert "<lastmod>" in body
+        assert resp.headers["etag"]
+        assert resp.headers["last-modified"].endswith("GMT")
+
+    def test_past_events_get_low_priority(self, db_session, app_client):
+        orm_create_event(
+            db_session, name="Old Fair", published=True, slug="old-fair",
+            event_fields={"start_datetime": datetime(2020, 5, 1, 10, 0, 0, tzinfo=timezone.utc)},
+        )
+        db_session.commit()
+
+        body = app_client.get("/sitemap-events.xml").text
+        entry = body.split("/events/old-fair</loc>", 1)[1].split("</url>", 1)[0]
+        assert "<priority>0.4</priority>" in entry
+        assert "<changefreq>monthly</changefreq>" in entry
+
+    def test_unknown_section_404(self, app_client):
+        assert app_client.get("/sitemap-widgets.xml").status_code == 404
+        assert app_client.get("/sitemap-places-1.xml").status_code == 404
+
+
+class TestSitemapCaching:
+    def test_if_none_match_returns_304(self, db_session, app_client):
+        orm_create_park(db_session, name="Etag Park", published=True, slug="etag-park")
+        db_session.commit()
+
+        first = app_client.get("/sitemap-parks.xml")
+        etag = first.headers["etag"]
+        resp = app_client.get("/sitemap-parks.xml", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+
+    def test_if_modified_since_returns_304(self, db_session, app_client):
+        orm_create_park(db_session, name="Dated Park", published=True, slug="dated-park")
+        db_session.commit()
+
+        first = app_client.get("/sitemap-parks.xml")
+        resp = app_client.get(
+            "/sitemap-parks.xml", headers={"If-Modified-Since": first.headers["last-modified"]}
+        )
+        assert resp.status_code == 304
+        resp = app_client.get(
+            "/sitemap-parks.xml", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+        )
+        assert resp.status_code == 200
+
+    def test_etag_changes_when_section_changes(self, db_session, app_client):
+        orm_create_park(db_session, name="First Park", published=True, slug="first-park")
+        db_session.commit()
+        before = app_client.get("/sitemap-parks.xml").headers["etag"]
+
+        orm_create_park(db_session, name="Second Park", published=True, slug="second-park")
+        db_session.commit()
+        after = app_client.get("/sitemap-parks.xml", headers={"If-None-Match": before})
+        assert after.status_code == 200
+        assert after.headers["etag"] != before
+        assert "second-park" in after.text
+
+
+class TestSitemapPagination:
+    def test_sections_split_into_numbered_files(self, db_session, app_client, monkeypatch):
+        sitemap = sys.modules["app.api.endpoints.sitemap"]
+        monkeypatch.setattr(sitemap, "SITEMAP_MAX_URLS", 2)
+        for i in range(5):
+            orm_create_business(db_session, name=f"Paged Biz {i}", published=True, slug=f"paged-biz-{i}")
+        db_session.commit()
+
+        index = app_client.get("/sitemap.xml").text
+        assert "<sitemapindex" in index
+        for name in ("sitemap-pages.xml", "sitemap-places.xml", "sitemap-places-2.xml",
+                     "sitemap-places-3.xml", "sitemap-parks.xml", "sitemap-events.xml"):
+            assert f"https://nearbynearby.com/{name}</loc>" in index
+        assert "sitemap-places-4.xml" not in index
+
+        slugs = []
+        for path in ("/sitemap-places.xml", "/sitemap-places-2.xml", "/sitemap-places-3.xml"):
+            body = app_client.get(path).text
+            slugs += [part.split("</loc>")[0] for part in body.split("/places/")[1:]]
+        assert sorted(slugs) == [f"paged-biz-{i}" for i in range(5)]
+        assert app_client.get("/sitemap-places-4.xml").status_code == 404
@@ -0,0 +1,256 @@
+"""SPA shell caching and per-POI meta tags for ``serve_spa`` (``app/seo.py``).
+
+``SpaShell`` parses index.html once and renders ``prefix + meta + suffix``;
+``MetaTagCache`` keeps rendered tags per path under the POI's
+``last_updated``; ``app/prerender.py`` writes finished pages per
+published POI, which ``serve_spa`` sends while their stamp is current.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from conftest import orm_create_park
+
+_MONOREPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_APP_BACKEND = os.path.join(_MONOREPO_ROOT, "nearby-app", "backend")
+if _APP_BACKEND not in sys.path:
+    sys.path.insert(0, _APP_BACKEND)
+
+INDEX_HTML = """<!doctype html>
+<html lang="en">
+  <head>
+    <meta charset="UTF-8" />
+    <meta name="description" content="Default description" />
+    <meta property="og:title" content="Default" />
+    <meta name="twitter:card" content="summary" />
+    <title>NearbyNearby</title>
+  </head>
+  <body><div id="root"></div></body>
+</html>
+"""
+
+
+def _seo():
+    # Lazy for the same sys.modules reason as test_serializer_parity.
+    from app import seo
+    return seo
+
+
+def _prerender():
+    from app import prerender
+    return prerender
+
+
+def _poi(**overrides):
+    fields = dict(
+        id="1b4e28ba-2fa1-11d2-883f-0016d3cca427", slug="mill-park", poi_type="PARK",
+        name="Mill Park", teaser_paragraph=None, description_short="A <b>quiet</b> park",
+        description_long=None, address_city="Pittsboro", featured_image=None,
+        last_updated=datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc),
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestSpaShell:
+    def test_render_matches_inject_meta_tags(self, tmp_path):
+        seo = _seo()
+        index = tmp_path / "index.html"
+        index.write_text(INDEX_HTML)
+        meta = seo.generate_og_meta_tags(_poi(), "https://nearbynearby.com")
+
+        rendered = seo.SpaShell(index).render(meta)
+        assert rendered == seo.inject_meta_tags(INDEX_HTML, meta)
+        assert "Default description" not in rendered
+        assert '<meta property="og:title" content="Mill Park | NearbyNearby" />' in rendered
+        assert '<meta name="description" content="A quiet park" />' in rendered
+
+    def test_rebuilt_index_is_reloaded(self, tmp_path):
+        seo = _seo()
+        index = tmp_path / "index.html"
+        index.write_text(INDEX_HTML)
+        shell = seo.SpaShell(index)
+        shell.render("<!-- a -->")
+
+        index.write_text(INDEX_HTML.replace('<div id="root">', '<div id="app">'))
+        stat = index.stat()
+        os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert '<div id="app">' in shell.render("<!-- b -->")
+
+    def test_without_head_nothing_is_injected(self, tmp_path):
+        seo = _seo()
+        index = tmp_path / "index.html"
+        index.write_text("<html><body></body></html>")
+        assert seo.SpaShell(index).render("<title>x</title>") == "<html><body></body></html>"
+
+
+class TestMetaTagCache:
+    def test_same_stamp_hits_new_stamp_rerenders(self):
+        cache = _seo().MetaTagCache()
+        renders = []
+
+        def render(text):
+            def _render():
+                renders.append(text)
+                return text
+            return _render
+
+        assert cache.get("parks/a", 1, render("v1")) == "v1"
+        assert cache.get("parks/a", 1, render("ignored")) == "v1"
+        assert cache.get("parks/a", 2, render("v2")) == "v2"
+        assert renders == ["v1", "v2"]
+
+    def test_missing_poi_not_cached_and_lru_evicts(self):
+        cache = _seo().MetaTagCache(maxsize=2)
+        assert cache.get("parks/gone", 1, lambda: None) is None
+        assert cache.get("parks/gone", 1, lambda: "back") == "back"
+
+        cache.get("parks/b", 1, lambda: "b")
+        cache.get("parks/c", 1, lambda: "c")
+        assert cache.get("parks/gone", 1, lambda: "reloaded") == "reloaded"
+
+
+class TestPrerenderedPages:
+    def _prerenderer(self, tmp_path, **kwargs):
+        prerender = _prerender()
+        index = tmp_path / "index.html"
+        index.write_text(INDEX_HTML)
+        store = prerender.LocalPageStore(tmp_path / "pages")
+        return prerender.PagePrerenderer(store, _seo().SpaShell(index), **kwargs)
+
+    def test_page_written_at_canonical_path(self, tmp_path):
+        prerenderer = self._prerenderer(tmp_path)
+        assert prerenderer.write(_poi()) == "parks/mill-park"
+
+        page = prerenderer.store.page_file(prerenderer.shell.build_id, "parks/mill-park")
+        html = page.read_text()
+        assert html == prerenderer.shell.render(
+            _seo().generate_og_meta_tags(_poi(), "https://nearbynearby.com")
+            + '    <meta name="nearby:prerender" content="poi:2026-03-02T12:00:00+00:00" />\n'
+        )
+        assert 'id="poi-detail"' not in html
+        assert _prerender().page_stamp(page.read_bytes()) == "poi:2026-03-02T12:00:00+00:00"
+
+    def test_embedded_detail_is_stamped_with_its_etag(self, tmp_path):
+        prerender = _prerender()
+        prerenderer = self._prerenderer(tmp_path, embed_detail=True)
+
+        page = prerenderer.render(_poi(), b'{"name":"Mill Park"}', '"poi-abc"')
+        assert 'id="poi-detail"' in page.decode()
+        assert prerender.page_stamp(page) == 'detail:"poi-abc"'
+
+        # Without its ETag the body cannot be validated, so it is left out.
+        page = prerenderer.render(_poi(), b'{"name":"Mill Park"}')
+        assert 'id="poi-detail"' not in page.decode()
+        assert prerender.page_stamp(page).startswith("poi:")
+
+    def test_slug_change_and_removal_delete_old_page(self, tmp_path):
+        prerenderer = self._prerenderer(tmp_path)
+        store, build_id = prerenderer.store, prerenderer.shell.build_id
+        prerenderer.write(_poi())
+        prerenderer.write(_poi(slug="mill-park-pittsboro"))
+        assert store.page_file(build_id, "parks/mill-park") is None
+        assert store.page_file(build_id, "parks/mill-park-pittsboro") is not None
+
+        prerenderer.remove(_poi().id)
+        assert store.page_file(build_id, "parks/mill-park-pittsboro") is None
+
+    def test_embedded_detail_cannot_close_script(self, tmp_path):
+        import json
+
+        prerenderer = self._prerenderer(tmp_path, embed_detail=True)
+        detail = json.dumps({"name": "</script><b>x</b>"}).encode()
+        html = prerenderer.render(_poi(), detail, '"poi-abc"').decode()
+
+        payload = html.split('<script type="application/json" id="poi-detail">', 1)[1]
+        payload = payload.split("</script>", 1)[0]
+        assert json.loads(payload) == {"name": "</script><b>x</b>"}
+
+    def test_new_frontend_build_has_no_pages(self, tmp_path):
+        prerenderer = self._prerenderer(tmp_path)
+        prerenderer.write(_poi())
+        old_build = prerenderer.shell.build_id
+
+        index = tmp_path / "index.html"
+        index.write_text(INDEX_HTML.replace("NearbyNearby", "Nearby"))
+        stat = index.stat()
+        os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert prerenderer.shell.build_id != old_build
+        assert prerenderer.store.page_file(prerenderer.shell.build_id, "parks/mill-park") is None
+        assert prerenderer.store.prune(prerenderer.shell.build_id) == 1
+
+    def test_only_page_paths_map_to_files(self, tmp_path):
+        prerenderer = self._prerenderer(tmp_path)
+        prerenderer.write(_poi())
+        build_id = prerenderer.shell.build_id
+        assert prerenderer.store.page_file(build_id, "parks/../parks/mill-park") is None
+        assert prerenderer.store.page_file(build_id, f"_poi/{_poi().id}") is None
+        assert prerenderer.write(_poi(slug="a/b")) is None
+
+
+class TestServeSpaMeta:
+    def test_poi_page_gets_meta_and_follows_edits(self, db_session, app_client, tmp_path, monkeypatch):
+        main = sys.modules["app.main"]
+        seo = sys.modules["app.seo"]
+        (tmp_path / "index.html").write_text(INDEX_HTML)
+        monkeypatch.setattr(main, "STATIC_DIR", tmp_path)
+        monkeypatch.setattr(main, "_spa_shell", seo.SpaShell(tmp_path / "index.html"))
+        monkeypatch.setattr(main, "_meta_cache", seo.MetaTagCache())
+
+        park = orm_create_park(db_session, name="Meta Park", published=True, slug="meta-park")
+        db_session.commit()
+
+        resp = app_client.get("/parks/meta-park")
+        assert resp.status_code == 200
+        assert '<meta property="og:title" content="Meta Park | NearbyNearby" />' in resp.text
+
+        park.name = "Renamed Park"
+        park.last_updated = datetime.now(timezone.utc) + timedelta(seconds=1)
+        db_session.commit()
+        assert "Renamed Park | NearbyNearby" in app_client.get("/parks/meta-park").text
+
+        unknown = app_client.get("/parks/no-such-park")
+        assert unknown.status_code == 200
+        assert "Default description" in unknown.text
+
+    def test_prerendered_page_served_only_while_current(self, db_session, app_client, tmp_path, monkeypatch):
+        main = sys.modules["app.main"]
+        seo = sys.modules["app.seo"]
+        prerender = sys.modules["app.prerender"]
+        (tmp_path / "index.html").write_text(INDEX_HTML)
+        shell = seo.SpaShell(tmp_path / "index.html")
+        store = prerender.LocalPageStore(tmp_path / "pages")
+        monkeypatch.setattr(main, "STATIC_DIR", tmp_path)
+        monkeypatch.setattr(main, "_spa_shell", shell)
+        monkeypatch.setattr(main, "_page_store", store)
+        monkeypatch.setattr(main, "_meta_cache", seo.MetaTagCache())
+
+        park = orm_create_park(db_session, name="Static Park", published=True, slug="static-park")
+        db_session.commit()
+        prerender.PagePrerenderer(store, shell).publish(db_session, park.id)
+
+        rendered = []
+        real_meta_tags = main._poi_meta_tags
+        monkeypatch.setattr(
+            main, "_poi_meta_tags", lambda path: rendered.append(path) or real_meta_tags(path)
+        )
+        resp = app_client.get("/parks/static-park")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/html")
+        assert "Static Park | NearbyNearby" in resp.text
+        assert rendered == []  # the stored page was current
+
+        # Edited but the page was never rewritten (worker stopped): render live.
+        park.name = "Renamed Static Park"
+        park.last_updated = datetime.now(timezone.utc) + timedelta(seconds=1)
+        db_session.commit()
+        assert "Renamed Static Park | NearbyNearby" in app_client.get("/parks/static-park").text
+        assert rendered == ["parks/static-park"]
+
+        park.publication_status = "draft"
+        db_session.commit()
+        unpublished = app_client.get("/parks/static-park").text
+        assert "Static Park" not in unpublished
+        assert "Default description" in unpublished
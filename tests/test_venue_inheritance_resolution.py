@@ -142,3 +142,48 @@ class TestVenueInheritanceResolution:
         result = resolve_venue_inheritance(event_data, venue_data, config)
         assert "_venue_source" in result
         assert result["_venue_source"]["parking"] == "as_is"
+
+
+class TestVenueFieldsCache:
+    """VenueFieldsCache reuses venue fields until the venue's last_updated moves."""
+
+    def test_inheritable_fields_cover_every_section(self):
+        from shared.utils.venue_inheritance import INHERITABLE_FIELDS, _SECTION_FIELDS
+
+        for fields in _SECTION_FIELDS.values():
+            assert set(fields) <= set(INHERITABLE_FIELDS)
+        assert len(INHERITABLE_FIELDS) == len(set(INHERITABLE_FIELDS))
+
+    def test_hit_until_stamp_changes(self):
+        from shared.utils.venue_inheritance import VenueFieldsCache
+
+        cache = VenueFieldsCache()
+        loads = []
+
+        def load():
+            loads.append(1)
+            return {"hours": {"regular": len(loads)}}
+
+        assert cache.get("venue", 1, load) == {"hours": {"regular": 1}}
+        assert cache.get("venue", 1, load) == {"hours": {"regular": 1}}
+        assert len(loads) == 1
+        assert cache.get("venue", 2, load) == {"hours": {"regular": 2}}
+        assert len(loads) == 2
+
+    def test_missing_venue_not_cached(self):
+        from shared.utils.venue_inheritance import VenueFieldsCache
+
+        cache = VenueFieldsCache()
+        assert cache.get("venue", 1, lambda: None) is None
+        assert cache.get("venue", 1, lambda: {"hours": None}) == {"hours": None}
+
+    def test_evicts_least_recently_used(self):
+        from shared.utils.venue_inheritance import VenueFieldsCache
+
+        cache = VenueFieldsCache(maxsize=2)
+        cache.get("a", 1, lambda: {"v": "a"})
+        cache.get("b", 1, lambda: {"v": "b"})
+        cache.get("a", 1, lambda: {"v": "reloaded"})  # hit: "a" becomes most recent
+        cache.get("c", 1, lambda: {"v": "c"})  # evicts "b"
+        assert cache.get("a", 1, lambda: {"v": "reloaded"}) == {"v": "a"}
+        assert cache.get("b", 1, lambda: {"v": "reloaded"}) == {"v": "reloaded"}